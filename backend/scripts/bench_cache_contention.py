@@ -0,0 +1,115 @@
+"""
+Cache Contention Benchmark
+ChatCache 백엔드 동시성 벤치마크 (단일 전역 락 vs 스트라이프 락 + 락 없는 읽기)
+
+여러 스레드가 서로 다른 세션에 대해 대화 이력 조회/추가를 반복할 때의
+처리량(ops/s)을 비교합니다.
+
+Usage:
+    python scripts/bench_cache_contention.py
+    python scripts/bench_cache_contention.py --threads 32 --ops 20000 --history 40
+"""
+
+import sys
+import argparse
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app.cache.backends import InMemoryCacheBackend
+
+
+class GlobalLockBackend:
+    """
+    비교 기준: 기존 ChatCache 방식 (전역 락 1개, 읽을 때마다 리스트 복사)
+    """
+
+    def __init__(self):
+        self._store: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def append(self, key: str, item: Any, ttl: Optional[int] = None) -> None:
+        with self._lock:
+            self._store.setdefault(key, []).append(item)
+
+    def get_list(self, key: str) -> List[Any]:
+        with self._lock:
+            return self._store.get(key, []).copy()
+
+
+def run(backend: Any, threads: int, ops: int, sessions: int, history: int, read_ratio: float) -> float:
+    """
+    벤치마크 실행
+
+    Args:
+        backend: append/get_list를 제공하는 백엔드
+        threads: 스레드 수
+        ops: 스레드당 연산 수
+        sessions: 세션 수
+        history: 사전 적재할 세션별 메시지 수
+        read_ratio: 읽기 비율 (0~1)
+
+    Returns:
+        float: 초당 연산 수
+    """
+    message = {"role": "user", "content": "청년 월세 지원 신청 자격이 어떻게 되나요?"}
+    for s in range(sessions):
+        for _ in range(history):
+            backend.append(f"chat:{s}", message, ttl=86400)
+
+    write_every = max(1, round(1 / (1 - read_ratio))) if read_ratio < 1 else 0
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(tid: int):
+        barrier.wait()
+        for i in range(ops):
+            key = f"chat:{(tid * 7919 + i) % sessions}"
+            if write_every and i % write_every == 0:
+                backend.append(key, message, ttl=86400)
+            else:
+                len(backend.get_list(key))
+
+    pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - started
+    return threads * ops / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ChatCache contention benchmark")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=10000, help="스레드당 연산 수")
+    parser.add_argument("--sessions", type=int, default=256)
+    parser.add_argument("--history", type=int, default=20, help="세션별 사전 적재 메시지 수")
+    parser.add_argument("--read-ratio", type=float, default=0.9)
+    args = parser.parse_args()
+
+    print(
+        f"threads={args.threads} ops/thread={args.ops} sessions={args.sessions} "
+        f"history={args.history} read_ratio={args.read_ratio}"
+    )
+
+    results = {}
+    for name, factory in (
+        ("global_lock", GlobalLockBackend),
+        ("striped", InMemoryCacheBackend),
+    ):
+        results[name] = run(
+            factory(), args.threads, args.ops, args.sessions, args.history, args.read_ratio
+        )
+        print(f"  {name:<12} {results[name]:>12,.0f} ops/s")
+
+    print(f"  speedup      {results['striped'] / results['global_lock']:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
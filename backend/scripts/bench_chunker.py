@@ -0,0 +1,143 @@
+"""
+Chunker Benchmark
+문자 기반 기존 청커 vs 토큰 기반 오프셋 청커 처리량 비교
+
+data.json의 정책 문서 필드(개요/대상/지원내용/절차)를 입력으로
+기존 구현(문자 수 기준, 문자열 누적), 새 구현(단일 프로세스), 새 구현(프로세스 풀)의
+처리량과 청크 토큰 수 분포(임베딩 토크나이저 기준 초과 여부)를 측정합니다.
+
+Usage:
+    python scripts/bench_chunker.py
+    python scripts/bench_chunker.py --repeat 5 --workers 8
+    python scripts/bench_chunker.py --data ../data.json --json
+"""
+
+import sys
+import argparse
+import json
+import re
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app.config import get_settings
+from app.vector_store.chunker import TextChunker, _TokenIndex, _get_tokenizer, chunk_documents
+
+DOC_FIELDS = ("program_overview", "apply_target", "support_description", "biz_process")
+
+
+def legacy_split_text(text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
+    """기존 TextChunker.split_text 동작 재현 (비교 기준)"""
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\n+', '\n', text).strip()
+    sentences = [s.strip() for s in re.split(r'[.!?。]', text) if s.strip()]
+
+    chunks: List[str] = []
+    current_chunk = ""
+    current_length = 0
+    for sentence in sentences:
+        if current_length + len(sentence) > chunk_size and current_chunk:
+            chunks.append(current_chunk.strip())
+            overlap_text = current_chunk if len(current_chunk) <= chunk_overlap else current_chunk[-chunk_overlap:]
+            current_chunk = overlap_text + " " + sentence
+            current_length = len(current_chunk)
+        else:
+            current_chunk = current_chunk + " " + sentence if current_chunk else sentence
+            current_length += len(sentence)
+    if current_chunk.strip():
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+def load_documents(path: Path, multiply: int) -> List[str]:
+    """data.json 정책 필드를 문서 리스트로 (multiply배 복제)"""
+    with open(path, "r", encoding="utf-8") as f:
+        policies = json.load(f)
+    docs = [p[field] for p in policies for field in DOC_FIELDS if p.get(field) and str(p[field]).strip()]
+    return docs * multiply
+
+
+def measure(name: str, run: Callable[[], List[List[str]]], total_chars: int, repeat: int) -> Tuple[Dict[str, Any], List[List[str]]]:
+    """repeat회 실행 중 중앙값 시간으로 처리량 계산"""
+    timings = []
+    result: List[List[str]] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        timings.append(time.perf_counter() - started)
+    seconds = statistics.median(timings)
+    return {
+        "name": name,
+        "seconds": round(seconds, 3),
+        "docs_per_sec": round(len(result) / seconds, 1) if seconds else None,
+        "mb_per_sec": round(total_chars * 3 / 1e6 / seconds, 2) if seconds else None,  # UTF-8 한글 ≈ 3바이트
+        "chunks": sum(len(chunks) for chunks in result),
+    }, result
+
+
+def token_stats(chunks: List[List[str]], limit: int) -> Dict[str, Any]:
+    """청크 내용의 실제 토큰 수 분포 (임베딩 토크나이저, 없으면 근사치)"""
+    tokenizer = _get_tokenizer(get_settings().embedding_model)
+    counts = [
+        _TokenIndex(chunk, tokenizer).span_tokens(0, len(chunk))
+        for doc_chunks in chunks for chunk in doc_chunks
+    ]
+    if not counts:
+        return {}
+    return {
+        "tokenizer": "embedding" if tokenizer is not None else "estimate",
+        "mean": round(statistics.mean(counts), 1),
+        "max": max(counts),
+        "over_limit": sum(1 for c in counts if c > limit),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chunker throughput benchmark")
+    parser.add_argument("--data", default=str(Path(__file__).parent.parent.parent / "data.json"), help="data.json 경로")
+    parser.add_argument("--multiply", type=int, default=1, help="문서 복제 배수 (부하 키우기)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 풀 크기 (기본: CPU 수)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    docs = load_documents(Path(args.data), args.multiply)
+    total_chars = sum(len(doc) for doc in docs)
+    chunker = TextChunker()
+
+    runs = [
+        ("legacy (chars)", lambda: [legacy_split_text(doc, settings.chunk_size, settings.chunk_overlap) for doc in docs]),
+        ("offset (tokens)", lambda: [[c["content"] for c in chunker.split_text(doc)] for doc in docs]),
+        ("offset (tokens, pool)", lambda: [
+            [c["content"] for c in chunks]
+            for chunks in chunk_documents([(doc, None) for doc in docs], workers=args.workers)
+        ]),
+    ]
+
+    report = {"documents": len(docs), "chars": total_chars, "chunk_size": settings.chunk_size, "results": []}
+    for name, run in runs:
+        result, chunks = measure(name, run, total_chars, args.repeat)
+        result["tokens"] = token_stats(chunks, settings.chunk_size)
+        report["results"].append(result)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print(f"documents={report['documents']} chars={report['chars']} chunk_size={report['chunk_size']}")
+    print(f"{'implementation':<24}{'sec':>8}{'docs/s':>10}{'MB/s':>8}{'chunks':>8}{'tok mean':>10}{'tok max':>9}{'over':>6}")
+    for r in report["results"]:
+        t = r["tokens"]
+        print(
+            f"{r['name']:<24}{r['seconds']:>8}{r['docs_per_sec']:>10}{r['mb_per_sec']:>8}{r['chunks']:>8}"
+            f"{t.get('mean', '-'):>10}{t.get('max', '-'):>9}{t.get('over_limit', '-'):>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
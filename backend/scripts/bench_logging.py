@@ -0,0 +1,181 @@
+"""
+Logging Overhead Benchmark
+요청 스레드에서 로깅이 차지하는 시간(p50/p99) 측정
+
+채팅 요청 1건과 비슷한 로그 패턴(INFO 6건: 큰 extra 포함, DEBUG 4건)을 반복 실행하며
+다음 구성을 비교합니다. 출력은 임시 파일(또는 --stdout)로 보냅니다.
+
+- sync: 기존 방식 (StreamHandler가 요청 스레드에서 JSON 포맷 + 쓰기)
+- queue: BoundedQueueHandler + QueueListener (요청 스레드는 큐에 넣기만)
+- queue small: 작은 큐 → 가득 차면 버리고 요청 지연은 유지되는지 확인
+- queue + rate limit: 같은 메시지 초당 한도 적용
+
+요청 사이에는 --io-ms 만큼 대기합니다 (LLM/검색 I/O 대기 흉내, 측정 구간 밖).
+--io-ms 0이면 CPU만 쓰는 최악 조건으로, 리스너 스레드가 GIL을 거의 못 얻어 큐가 차고 버립니다.
+마지막 열(drain_ms)은 측정 종료 후 리스너가 큐를 비우는 데 걸린 시간입니다.
+
+Usage:
+    python scripts/bench_logging.py
+    python scripts/bench_logging.py --requests 5000 --threads 8
+    python scripts/bench_logging.py --io-ms 0
+    python scripts/bench_logging.py --json
+"""
+
+import sys
+import argparse
+import json
+import logging
+import queue
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app.config.logger import BoundedQueueHandler, CustomJsonFormatter, LogQueueListener, RateLimitFilter
+
+PROMPT = "당신은 정부 지원사업 상담 도우미입니다. 아래 공고문을 바탕으로 답변하세요.\n" + "예비창업패키지 지원 내용 " * 200
+
+
+def make_formatter() -> CustomJsonFormatter:
+    return CustomJsonFormatter("%(timestamp)s %(level)s %(name)s %(message)s", rename_fields={"timestamp": "@timestamp"})
+
+
+def build_logger(name: str, stream: Any, mode: str, queue_size: int, rate: float) -> Dict[str, Any]:
+    """구성별 로거 생성 (sync | queue)"""
+    logger = logging.getLogger(f"bench.{name}")
+    logger.handlers.clear()
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(make_formatter())
+
+    listener: Optional[LogQueueListener] = None
+    queue_handler: Optional[BoundedQueueHandler] = None
+    if mode == "queue":
+        queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size))
+        listener = LogQueueListener(queue_handler.queue, handler, respect_handler_level=True)
+        listener.start()
+        logger.addHandler(queue_handler)
+    else:
+        logger.addHandler(handler)
+
+    rate_filter = None
+    if rate > 0:
+        rate_filter = RateLimitFilter({logger.name: rate}, burst=20)
+        logger.handlers[0].addFilter(rate_filter)
+    return {"logger": logger, "listener": listener, "queue_handler": queue_handler, "rate_filter": rate_filter}
+
+
+def simulate_request(logger: logging.Logger, i: int) -> None:
+    """채팅 요청 1건의 로그 패턴"""
+    session_id = f"sess-{i}"
+    logger.info("Starting stream", extra={"session_id": session_id, "policy_id": 507})
+    logger.debug("Policy context cache hit", extra={"session_id": session_id, "policy_id": 507})
+    logger.info("Query classified", extra={"session_id": session_id, "query_type": "POLICY_QA", "method": "keyword"})
+    logger.debug("Sufficiency detail", extra={"session_id": session_id, "coverage": 0.82})
+    logger.info("Prompt generated", extra={
+        "session_id": session_id,
+        "template_name": "policy_qa_docs_only_prompt.jinja2",
+        "retrieved_docs_count": 12,
+        "prompt_tokens": 5400,
+    })
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Prompt preview", extra={"session_id": session_id, "prompt_preview": PROMPT[:500]})
+    logger.info("LLM call completed", extra={"latency_ms": 812.4, "prompt_tokens": 5400, "completion_tokens": 230})
+    logger.info("Evidence extracted", extra={
+        "session_id": session_id,
+        "evidence_count": 3,
+        "evidence": [{"policy_id": 507, "text": PROMPT[:300], "score": 0.9}] * 3,
+    })
+    logger.debug("Evidence detail", extra={"session_id": session_id})
+    logger.info("Streaming query completed", extra={"session_id": session_id, "prompt_tokens": 5400})
+
+
+def run_config(name: str, mode: str, args: argparse.Namespace, stream: Any, queue_size: int, rate: float = 0.0) -> Dict[str, Any]:
+    built = build_logger(name.replace(" ", "_"), stream, mode, queue_size, rate)
+    logger = built["logger"]
+
+    for i in range(min(200, args.requests)):  # warm-up
+        simulate_request(logger, i)
+    if built["listener"] is not None:
+        built["listener"].stop()
+        built["listener"].start()
+        built["queue_handler"].dropped.clear()
+
+    def timed(i: int) -> float:
+        if args.io_ms:
+            time.sleep(args.io_ms / 1000)
+        started = time.perf_counter()
+        simulate_request(logger, i)
+        return (time.perf_counter() - started) * 1e6
+
+    if args.threads > 1:
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            latencies = list(executor.map(timed, range(args.requests)))
+    else:
+        latencies = [timed(i) for i in range(args.requests)]
+
+    drain_started = time.perf_counter()
+    dropped = 0
+    if built["listener"] is not None:
+        built["listener"].stop()
+        dropped = sum(built["queue_handler"].dropped.values())
+    drain_ms = (time.perf_counter() - drain_started) * 1000
+
+    ordered = sorted(latencies)
+    return {
+        "name": name,
+        "p50_us": round(statistics.median(ordered), 1),
+        "p99_us": round(ordered[int(len(ordered) * 0.99) - 1], 1),
+        "mean_us": round(statistics.mean(ordered), 1),
+        "dropped": dropped,
+        "rate_limited": built["rate_filter"].suppressed_total if built["rate_filter"] else 0,
+        "drain_ms": round(drain_ms, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Logging overhead benchmark")
+    parser.add_argument("--requests", type=int, default=3000, help="구성당 요청 수")
+    parser.add_argument("--threads", type=int, default=1, help="동시 실행 스레드 수")
+    parser.add_argument("--io-ms", type=float, default=1.0, help="요청 사이 대기 시간 (밀리초, 0 = CPU만)")
+    parser.add_argument("--stdout", action="store_true", help="임시 파일 대신 stdout으로 출력")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results: List[Dict[str, Any]] = []
+        configs = [
+            ("sync", "sync", 10000, 0.0),
+            ("queue", "queue", 10000, 0.0),
+            ("queue small (500)", "queue", 500, 0.0),
+            ("queue + rate limit 50/s", "queue", 10000, 50.0),
+        ]
+        for name, mode, queue_size, rate in configs:
+            if args.stdout:
+                results.append(run_config(name, mode, args, sys.stdout, queue_size, rate))
+                continue
+            with open(Path(tmp) / f"{mode}.log", "w", encoding="utf-8") as stream:
+                results.append(run_config(name, mode, args, stream, queue_size, rate))
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"requests={args.requests} threads={args.threads} io={args.io_ms}ms logs/request=6 INFO + 4 DEBUG (disabled)")
+    print(f"{'config':<26}{'p50_us':>9}{'p99_us':>9}{'mean_us':>9}{'dropped':>9}{'limited':>9}{'drain_ms':>10}")
+    for r in results:
+        print(
+            f"{r['name']:<26}{r['p50_us']:>9}{r['p99_us']:>9}{r['mean_us']:>9}"
+            f"{r['dropped']:>9}{r['rate_limited']:>9}{r['drain_ms']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
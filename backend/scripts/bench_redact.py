@@ -0,0 +1,167 @@
+"""
+PII Redaction Benchmark
+기존 3패스 재귀 마스킹 vs 단일 패턴 반복 순회 마스킹 처리량 비교
+
+트레이스 payload와 비슷한 채팅 요청/상태(대화 이력, 검색 문서, 웹 검색 결과,
+LLM 메시지 리스트)를 만들어 payload당 처리 시간을 측정합니다.
+PII 비율을 바꿔가며 빠른 사전 검사('@'/숫자 없음)의 효과도 확인할 수 있고,
+리스트 안 문자열처럼 기존 구현이 놓치던 항목 수도 함께 보고합니다.
+
+Usage:
+    python scripts/bench_redact.py
+    python scripts/bench_redact.py --payloads 2000 --pii-ratio 0.05
+    python scripts/bench_redact.py --json
+"""
+
+import sys
+import argparse
+import json
+import random
+import re
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app.observability.redact import redact_pii
+
+SENTENCES = [
+    "예비창업패키지 지원 금액은 최대 1억원이며 사업화 자금으로 사용할 수 있습니다.",
+    "신청 자격은 공고일 기준 창업 경험이 없는 예비창업자입니다.",
+    "K-Startup 누리집(www.k-startup.go.kr)에서 온라인으로 신청하세요.",
+    "사업공고(‘25.12월), 신청·접수(‘26.1월), 선정평가 및 협약(‘26.2월~3월) 순으로 진행됩니다.",
+    "제 사업장은 서울에 있고 직원은 5명입니다. 청년 창업 지원 대상인가요?",
+    "중소기업 기술개발 지원사업의 평가 기준과 가점 항목을 알려주세요.",
+    "지원 내용: 시제품 제작, 지식재산권 출원, 마케팅 비용 지원",
+]
+PII_SENTENCES = [
+    "연락처는 010-1234-5678 이고 메일은 founder.kim@example.com 입니다.",
+    "주민등록번호 900101-1234567 로 본인 확인 부탁드립니다.",
+    "담당자 전화 02-2100-1234, 이메일 support@startup.or.kr",
+]
+
+
+def legacy_redact_pii(data: Dict[str, Any]) -> Dict[str, Any]:
+    """기존 구현 재현 (패턴 3개 인라인, dict만 재귀, 리스트 내 문자열 건너뜀)"""
+    if not isinstance(data, dict):
+        return data
+
+    def email(text):
+        return re.sub(r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', lambda m: m.group(1)[0] + "***@" + m.group(2), text)
+
+    def phone(text):
+        return re.sub(r'(\d{2,3})-?(\d{3,4})-?(\d{4})', lambda m: f"{m.group(1)}-****-{m.group(3)}", text)
+
+    def resident(text):
+        return re.sub(r'(\d{6})-?(\d{7})', lambda m: f"{m.group(1)}-*******", text)
+
+    redacted = {}
+    for key, value in data.items():
+        if isinstance(value, str):
+            value = resident(phone(email(value)))
+        elif isinstance(value, dict):
+            value = legacy_redact_pii(value)
+        elif isinstance(value, list):
+            value = [legacy_redact_pii(item) if isinstance(item, dict) else item for item in value]
+        redacted[key] = value
+    return redacted
+
+
+def make_payload(rng: random.Random, pii_ratio: float) -> Dict[str, Any]:
+    """채팅 트레이스 payload 1개 생성"""
+    def text(sentences: int) -> str:
+        return " ".join(
+            rng.choice(PII_SENTENCES) if rng.random() < pii_ratio else rng.choice(SENTENCES)
+            for _ in range(sentences)
+        )
+
+    history = [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": text(rng.randint(1, 4))}
+        for i in range(rng.randint(2, 10))
+    ]
+    return {
+        "session_id": f"sess-{rng.randint(1, 10**6)}",
+        "policy_id": 507,
+        "query": text(1),
+        "state": {
+            "conversation_history": history,
+            "retrieved_docs": [
+                {"policy_id": rng.randint(1, 508), "score": rng.random(), "content": text(6)}
+                for _ in range(rng.randint(3, 8))
+            ],
+            "web_sources": [{"title": "정책 공지", "url": "https://www.k-startup.go.kr", "snippet": text(2)}],
+        },
+        # LLM 호출 입력: (role, content) 튜플/문자열 리스트 — 기존 구현은 건너뜀
+        "messages": [("system", "당신은 정책 상담 도우미입니다."), ("user", text(2))],
+        "tags": ["qa", "policy-507", text(1)],
+    }
+
+
+def count_unredacted(data: Any) -> int:
+    """마스킹되지 않고 남은 PII 문자열 수"""
+    pattern = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}|\d{3}-\d{4}-\d{4}|\d{6}-\d{7}")
+    stack, found = [data], 0
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            found += len([m for m in pattern.findall(value) if "***" not in m])
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return found
+
+
+def measure(name: str, func: Callable[[Any], Any], payloads: List[Dict[str, Any]], repeat: int) -> Dict[str, Any]:
+    timings = []
+    outputs: List[Any] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        outputs = [func(p) for p in payloads]
+        timings.append(time.perf_counter() - started)
+    seconds = statistics.median(timings)
+    return {
+        "name": name,
+        "seconds": round(seconds, 4),
+        "us_per_payload": round(seconds / len(payloads) * 1e6, 1),
+        "payloads_per_sec": round(len(payloads) / seconds),
+        "unredacted_pii": sum(count_unredacted(o) for o in outputs),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PII redaction benchmark")
+    parser.add_argument("--payloads", type=int, default=1000, help="payload 수")
+    parser.add_argument("--pii-ratio", type=float, default=0.1, help="문장 중 PII 포함 비율")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    payloads = [make_payload(rng, args.pii_ratio) for _ in range(args.payloads)]
+    report = {
+        "payloads": args.payloads,
+        "pii_ratio": args.pii_ratio,
+        "input_pii": sum(count_unredacted(p) for p in payloads),
+        "results": [
+            measure("legacy (3 passes, recursive)", legacy_redact_pii, payloads, args.repeat),
+            measure("single pass, iterative", redact_pii, payloads, args.repeat),
+        ],
+    }
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print(f"payloads={report['payloads']} pii_ratio={report['pii_ratio']} input_pii={report['input_pii']}")
+    print(f"{'implementation':<32}{'sec':>9}{'us/payload':>12}{'payload/s':>11}{'unredacted':>12}")
+    for r in report["results"]:
+        print(f"{r['name']:<32}{r['seconds']:>9}{r['us_per_payload']:>12}{r['payloads_per_sec']:>11}{r['unredacted_pii']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Offline Retrieval Benchmark
+고정 코퍼스 스냅샷으로 검색 모드별 품질(recall@k, MRR, nDCG)과 지연 시간(p50/p95/p99, QPS) 측정
+
+네트워크/Qdrant/MySQL 없이 실행됩니다. 임베딩 모델은 스냅샷을 만들 때만 필요합니다.
+
+1) snapshot: data.json → 청킹(적재와 같은 설정) + BGE-M3 임베딩 → 스냅샷 디렉터리
+   - 질의: 사업명 known-item 질의(띄어쓰기 유지/제거) + --queries JSONL 라벨 질의
+     JSONL 한 줄: {"query": "...", "relevant": [program_id, ...] 또는 {program_id: 등급}, "tags": [...]}
+   - policy_id는 program_id (숫자가 아니면 data.json 순번)
+2) run: 스냅샷 로드 → dense / sparse / hybrid_rrf / hybrid_weighted 실행 → 표 또는 JSON 보고서
+   - --baseline 이전 보고서와 비교해 품질 하락/지연 증가가 기준을 넘으면 종료 코드 1
+
+Usage:
+    python scripts/bench_retrieval.py snapshot --data ../data.json --out bench/snapshot
+    python scripts/bench_retrieval.py snapshot --queries bench/labeled_queries.jsonl --no-known-items
+    python scripts/bench_retrieval.py run --snapshot bench/snapshot
+    python scripts/bench_retrieval.py run --mode hybrid_rrf --mode dense -k 1 -k 10 --repeat 5
+    python scripts/bench_retrieval.py run --output reports/$(git rev-parse --short HEAD).json --label $(git rev-parse --short HEAD)
+    python scripts/bench_retrieval.py run --baseline reports/main.json --max-latency-increase 0.3
+"""
+
+import sys
+import argparse
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app.config.logger import get_logger
+from app.evaluation.retrieval_bench import (
+    DEFAULT_KS,
+    MODES,
+    CorpusSnapshot,
+    LabeledQuery,
+    build_snapshot,
+    compare_reports,
+    known_item_queries,
+    run_benchmark,
+)
+
+DEFAULT_DATA = Path(__file__).parent.parent.parent / "data.json"
+DEFAULT_SNAPSHOT = Path(__file__).parent.parent / "bench" / "snapshot"
+
+
+def policy_id_of(i: int, policy: Dict[str, Any]) -> int:
+    program_id = str(policy.get("program_id", ""))
+    return int(program_id) if program_id.isdigit() else i
+
+
+def load_queries(path: Path) -> List[LabeledQuery]:
+    queries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if line.strip():
+                queries.append(LabeledQuery.from_dict(json.loads(line), default_id=f"{path.stem}-{line_no}"))
+    return queries
+
+
+def cmd_snapshot(args: argparse.Namespace) -> int:
+    from app.vector_store import get_embedder
+
+    with open(args.data, "r", encoding="utf-8") as f:
+        policies = json.load(f)
+    if args.limit:
+        policies = policies[:args.limit]
+
+    queries: List[LabeledQuery] = []
+    if not args.no_known_items:
+        queries.extend(known_item_queries(policies, policy_id_of))
+    if args.queries:
+        queries.extend(load_queries(args.queries))
+    if not queries:
+        print("No queries: enable known-item queries or pass --queries", file=sys.stderr)
+        return 2
+
+    snapshot = build_snapshot(
+        policies,
+        embedder=get_embedder(),
+        queries=queries,
+        id_of=policy_id_of,
+        chunk_workers=args.chunk_workers,
+        batch_size=args.batch_size,
+        meta={"source": Path(args.data).name, "policies": len(policies)},
+    )
+    fingerprint = snapshot.save(args.out)
+    print(f"snapshot saved: {args.out} chunks={len(snapshot.chunks)} queries={len(queries)} fingerprint={fingerprint}")
+    return 0
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    snapshot = report["snapshot"]
+    ks = report["config"]["ks"]
+    print(
+        f"snapshot={snapshot['fingerprint']} chunks={snapshot['chunks']} policies={snapshot['policies']} "
+        f"queries={snapshot['queries']} repeat={report['config']['repeat']}"
+    )
+    quality_columns = [f"recall@{k}" for k in ks] + ["mrr"] + [f"ndcg@{ks[-1]}"]
+    header = f"{'mode':<17}" + "".join(f"{c:>11}" for c in quality_columns)
+    header += f"{'p50_ms':>9}{'p95_ms':>9}{'p99_ms':>9}{'qps':>9}"
+    print(header)
+    for mode, result in report["modes"].items():
+        row = f"{mode:<17}" + "".join(f"{result['quality'][c]:>11.4f}" for c in quality_columns)
+        latency = result["latency_ms"]
+        row += f"{latency['p50']:>9.2f}{latency['p95']:>9.2f}{latency['p99']:>9.2f}{result['throughput_qps']:>9.1f}"
+        print(row)
+
+    print()
+    print("stage means (ms) / recall by tag")
+    for mode, result in report["modes"].items():
+        stages = " ".join(f"{stage}={ms}" for stage, ms in result["stages_ms"].items())
+        tags = " ".join(
+            f"{tag}={values[f'recall@{ks[-1]}']:.3f}({values['queries']})" for tag, values in result["by_tag"].items()
+        )
+        print(f"  {mode:<17}{stages:<48}{tags}")
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    if args.json:
+        get_logger().setLevel(logging.WARNING)  # stdout에는 보고서 JSON만 출력
+    snapshot = CorpusSnapshot.load(args.snapshot)
+    ks = sorted(set(args.k or DEFAULT_KS))
+    report = run_benchmark(
+        snapshot,
+        modes=args.mode,
+        ks=ks,
+        repeat=args.repeat,
+        score_threshold=args.score_threshold,
+        label=args.label,
+    )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    regressions: List[str] = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_reports(
+            report,
+            baseline,
+            max_quality_drop=args.max_quality_drop,
+            max_latency_increase=args.max_latency_increase,
+            latency_metric=args.latency_metric,
+        )
+        report["regressions"] = regressions
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+        if args.baseline:
+            print()
+            if regressions:
+                print(f"REGRESSIONS vs {args.baseline}:")
+                for regression in regressions:
+                    print(f"  - {regression}")
+            else:
+                print(f"no regressions vs {args.baseline}")
+
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline retrieval benchmark")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    snap = subparsers.add_parser("snapshot", help="data.json → 코퍼스 스냅샷 생성 (임베딩 모델 필요)")
+    snap.add_argument("--data", type=Path, default=DEFAULT_DATA, help="정책 데이터 JSON")
+    snap.add_argument("--out", type=Path, default=DEFAULT_SNAPSHOT, help="스냅샷 디렉터리")
+    snap.add_argument("--queries", type=Path, help="라벨 질의 JSONL (선택)")
+    snap.add_argument("--no-known-items", action="store_true", help="사업명 known-item 질의 제외")
+    snap.add_argument("--limit", type=int, default=0, help="정책 수 제한 (0 = 전체)")
+    snap.add_argument("--chunk-workers", type=int, default=None, help="청킹 프로세스 수")
+    snap.add_argument("--batch-size", type=int, default=32, help="임베딩 배치 크기")
+    snap.set_defaults(func=cmd_snapshot)
+
+    run = subparsers.add_parser("run", help="스냅샷으로 벤치마크 실행")
+    run.add_argument("--snapshot", type=Path, default=DEFAULT_SNAPSHOT, help="스냅샷 디렉터리")
+    run.add_argument("--mode", action="append", choices=list(MODES), help="실행할 모드 (반복 가능, 기본값: 전체)")
+    run.add_argument("-k", type=int, action="append", help="recall/nDCG 컷오프 (반복 가능, 기본값: 1 5 10)")
+    run.add_argument("--repeat", type=int, default=3, help="지연 시간 측정 반복 횟수")
+    run.add_argument("--score-threshold", type=float, default=None, help="Dense 유사도 임계값 (기본값: 검색 설정)")
+    run.add_argument("--label", default="", help="보고서 라벨 (예: 커밋 해시)")
+    run.add_argument("--output", type=Path, help="JSON 보고서 저장 경로")
+    run.add_argument("--json", action="store_true", help="JSON으로 출력")
+    run.add_argument("--baseline", type=Path, help="비교할 이전 보고서 (회귀 시 종료 코드 1)")
+    run.add_argument("--max-quality-drop", type=float, default=0.01, help="허용 품질 하락 (절대값)")
+    run.add_argument("--max-latency-increase", type=float, default=0.25, help="허용 지연 증가 비율")
+    run.add_argument("--latency-metric", default="p95", choices=["p50", "p95", "p99", "mean"], help="비교할 지연 지표")
+    run.set_defaults(func=cmd_run)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
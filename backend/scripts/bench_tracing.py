@@ -0,0 +1,178 @@
+"""
+Tracing Overhead Benchmark
+샘플링 트레이서의 요청 지연 영향(p50/p99) 측정
+
+실제 trace_workflow 데코레이터로 감싼 가짜 요청(루트 1 + 노드 3 + 노드당 LLM/도구 2 = span 10개,
+span마다 CPU 작업, LLM span은 네트워크 대기 흉내 sleep)을 반복 실행하며 다음 구성을 비교합니다.
+--io-ms 0이면 CPU만 쓰는 최악 조건(백그라운드 exporter가 GIL을 거의 못 얻어 큐가 차고 버림)입니다.
+
+- off: 데코레이터 없음 (기준)
+- sample=0: span 기록 후 전부 버림 (tail 조건 미충족)
+- sample=0.1: 10% head 샘플링 + 파일 exporter
+- sample=1.0: 전부 파일 exporter로 내보내기
+- sample=1.0 slow: 느린 exporter(배치당 지연) + 작은 큐 → 큐가 차면 버리고 요청 지연은 유지되는지 확인
+
+Usage:
+    python scripts/bench_tracing.py
+    python scripts/bench_tracing.py --requests 5000 --work-us 100
+    python scripts/bench_tracing.py --threads 8 --json
+    python scripts/bench_tracing.py --io-ms 0
+"""
+
+import sys
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app.observability import tracer as tracer_module
+from app.observability.exporters import FileTraceExporter, NullTraceExporter, TraceExporter
+from app.observability.tracer import Tracer
+from app.observability.tracing import trace_workflow
+
+
+class SlowExporter(TraceExporter):
+    """배치마다 지연되는 exporter (원격 수집기 장애/지연 흉내)"""
+
+    name = "slow"
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def export(self, traces) -> None:
+        time.sleep(self.delay)
+
+
+def burn(work_us: float) -> int:
+    """약 work_us 마이크로초 CPU 작업"""
+    deadline = time.perf_counter() + work_us / 1e6
+    n = 0
+    while time.perf_counter() < deadline:
+        n += 1
+    return n
+
+
+def build_request(work_us: float, io_ms: float, traced: bool) -> Callable[[int], Dict[str, Any]]:
+    """요청 함수 생성 (traced=True면 현재 트레이서로 데코레이트)"""
+    def decorate(name: str, run_type: str = "chain") -> Callable:
+        return trace_workflow(name=name, tags=["bench"], run_type=run_type) if traced else (lambda f: f)
+
+    @decorate("llm_call", "llm")
+    def llm_call(state: Dict[str, Any]) -> str:
+        burn(work_us)
+        if io_ms:
+            time.sleep(io_ms / 1000)
+        return "답변 " * 20
+
+    @decorate("tool_call", "tool")
+    def tool_call(state: Dict[str, Any]) -> List[Dict[str, str]]:
+        burn(work_us)
+        return [{"title": "정책 공지", "content": "문의 010-1234-5678"}]
+
+    @decorate("node")
+    def node(state: Dict[str, Any]) -> Dict[str, Any]:
+        burn(work_us)
+        return {"answer": llm_call(state), "web": tool_call(state)}
+
+    @decorate("bench_request")
+    def request(i: int) -> Dict[str, Any]:
+        state = {"session_id": f"s{i}", "query": "예비창업패키지 지원 금액은?", "messages": [{"role": "user", "content": "안녕"}]}
+        for _ in range(3):
+            state.update(node(state))
+        return state
+
+    return request
+
+
+def run_config(
+    name: str,
+    tracer: Optional[Tracer],
+    requests: int,
+    threads: int,
+    work_us: float,
+    io_ms: float
+) -> Dict[str, Any]:
+    if tracer is not None:
+        tracer_module._tracer = tracer
+    request = build_request(work_us, io_ms, traced=tracer is not None)
+
+    for i in range(min(200, requests)):  # warm-up
+        request(i)
+
+    def timed(i: int) -> float:
+        started = time.perf_counter()
+        request(i)
+        return (time.perf_counter() - started) * 1e6
+
+    if threads > 1:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            latencies = list(executor.map(timed, range(requests)))
+    else:
+        latencies = [timed(i) for i in range(requests)]
+
+    stats: Dict[str, Any] = {}
+    if tracer is not None:
+        stats = tracer.get_stats()
+        tracer.shutdown(timeout=10)
+
+    ordered = sorted(latencies)
+    return {
+        "name": name,
+        "p50_us": round(statistics.median(ordered), 1),
+        "p99_us": round(ordered[int(len(ordered) * 0.99) - 1], 1),
+        "mean_us": round(statistics.mean(ordered), 1),
+        "exported": stats.get("exported"),
+        "queue_dropped": stats.get("queue_dropped"),
+        "discarded": stats.get("discarded"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tracing overhead benchmark")
+    parser.add_argument("--requests", type=int, default=3000, help="구성당 요청 수")
+    parser.add_argument("--threads", type=int, default=1, help="동시 실행 스레드 수")
+    parser.add_argument("--work-us", type=float, default=50.0, help="span당 CPU 작업 (마이크로초)")
+    parser.add_argument("--io-ms", type=float, default=1.0, help="LLM span당 대기 시간 (밀리초, 0 = CPU만)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        def tracer(rate: float, exporter: TraceExporter, queue_size: int = 1000) -> Tracer:
+            return Tracer(exporter=exporter, sample_rate=rate, tail_latency_ms=0, queue_size=queue_size)
+
+        configs = [
+            ("off", None),
+            ("sample=0 (discard)", tracer(0.0, NullTraceExporter())),
+            ("sample=0.1 file", tracer(0.1, FileTraceExporter(f"{tmp}/traces_01.jsonl"))),
+            ("sample=1.0 file", tracer(1.0, FileTraceExporter(f"{tmp}/traces_10.jsonl"))),
+            ("sample=1.0 slow export", tracer(1.0, SlowExporter(0.05), queue_size=100)),
+        ]
+        results = [run_config(name, t, args.requests, args.threads, args.work_us, args.io_ms) for name, t in configs]
+
+    baseline = results[0]
+    for r in results:
+        r["p50_overhead_us"] = round(r["p50_us"] - baseline["p50_us"], 1)
+        r["p99_overhead_us"] = round(r["p99_us"] - baseline["p99_us"], 1)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"requests={args.requests} threads={args.threads} spans/request=10 work/span={args.work_us}us io/llm={args.io_ms}ms")
+    print(f"{'config':<24}{'p50_us':>9}{'p99_us':>9}{'Δp50':>8}{'Δp99':>8}{'exported':>10}{'dropped':>9}{'discarded':>11}")
+    for r in results:
+        print(
+            f"{r['name']:<24}{r['p50_us']:>9}{r['p99_us']:>9}{r['p50_overhead_us']:>8}{r['p99_overhead_us']:>8}"
+            f"{str(r['exported']):>10}{str(r['queue_dropped']):>9}{str(r['discarded']):>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+BM25 Tokenizer Comparison
+BM25 토크나이저(whitespace / morpheme / ngram)별 검색 재현율과 지연 시간 비교
+
+data.json 정책의 본문 필드(개요/대상/지원내용/절차)로 BM25 인덱스를 만들고,
+각 정책의 사업명을 질의로 해당 정책을 찾는 known-item 평가를 수행합니다.
+사업명은 인덱스에 넣지 않으므로 본문 표현과의 어휘 일치만으로 찾아야 하며,
+띄어쓰기를 제거한 사업명 질의("청년창업사관학교")로 복합명사 처리 능력도 함께 봅니다.
+
+측정 항목:
+- recall@k, MRR (질의 유형별)
+- 인덱스 구축 시간 (문서 토큰화 1회 + fit)
+- 질의 지연 시간 p50/p95 (캐시 미스 / 캐시 히트)
+
+Usage:
+    python scripts/compare_tokenizers.py
+    python scripts/compare_tokenizers.py --tokenizer morpheme --tokenizer whitespace -k 1 -k 5 -k 10
+    python scripts/compare_tokenizers.py --data ../data.json --json
+"""
+
+import sys
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app.text.tokenizers import TOKENIZERS, create_tokenizer
+from app.vector_store.sparse_search import BM25Index
+
+DOC_FIELDS = ("program_overview", "apply_target", "support_description", "biz_process")
+
+
+def load_corpus(path: Path) -> Tuple[List[Dict[str, Any]], Dict[str, List[Tuple[str, int]]]]:
+    """
+    data.json → BM25 문서 목록 + 질의 유형별 (질의, 정답 id) 목록
+
+    Returns:
+        Tuple: (documents, {"spaced": [...], "unspaced": [...]})
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        policies = json.load(f)
+
+    documents: List[Dict[str, Any]] = []
+    queries: Dict[str, List[Tuple[str, int]]] = {"spaced": [], "unspaced": []}
+    for i, policy in enumerate(policies, 1):
+        content = "\n".join(str(policy[field]) for field in DOC_FIELDS if policy.get(field))
+        name = (policy.get("program_name") or "").strip()
+        if not content.strip() or not name:
+            continue
+        doc_id = int(policy["program_id"]) if str(policy.get("program_id", "")).isdigit() else i
+        documents.append({"id": doc_id, "content": content})
+        queries["spaced"].append((name, doc_id))
+        if " " in name:
+            queries["unspaced"].append((name.replace(" ", ""), doc_id))
+    return documents, queries
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def evaluate(
+    name: str,
+    documents: List[Dict[str, Any]],
+    queries: Dict[str, List[Tuple[str, int]]],
+    ks: List[int]
+) -> Dict[str, Any]:
+    """토크나이저 1개 평가"""
+    index = BM25Index(tokenizer=create_tokenizer(name, cache_size=8192))
+    started = time.perf_counter()
+    index.build_index(documents)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    top_k = max(ks)
+    quality: Dict[str, Dict[str, float]] = {}
+    cold_us: List[float] = []
+    warm_us: List[float] = []
+    for query_type, pairs in queries.items():
+        hits = {k: 0 for k in ks}
+        reciprocal_ranks = 0.0
+        for query, expected in pairs:
+            started = time.perf_counter()
+            index.tokenizer.tokenize_query(query)
+            cold_us.append((time.perf_counter() - started) * 1e6)
+            started = time.perf_counter()
+            results = index.search(query, top_k=top_k)
+            warm_us.append((time.perf_counter() - started) * 1e6)
+
+            ranked = [doc_id for doc_id, _ in results]
+            if expected in ranked:
+                rank = ranked.index(expected) + 1
+                reciprocal_ranks += 1 / rank
+                for k in ks:
+                    hits[k] += rank <= k
+
+        count = len(pairs) or 1
+        quality[query_type] = {
+            "queries": len(pairs),
+            **{f"recall@{k}": round(hits[k] / count, 3) for k in ks},
+            "mrr": round(reciprocal_ranks / count, 3),
+        }
+
+    return {
+        "tokenizer": name,
+        "terms": len(index.inverted_index),
+        "avg_doc_tokens": round(index.avg_doc_length, 1),
+        "build_ms": round(build_ms, 1),
+        # 질의 토큰화(캐시 미스) / 검색 전체(토큰화는 캐시 히트)
+        "tokenize_p50_us": round(percentile(cold_us, 0.5), 1),
+        "search_p50_us": round(percentile(warm_us, 0.5), 1),
+        "search_p95_us": round(percentile(warm_us, 0.95), 1),
+        "quality": quality,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare BM25 tokenizers (recall@k / latency)")
+    parser.add_argument("--data", default=str(Path(__file__).parent.parent.parent / "data.json"), help="data.json 경로")
+    parser.add_argument("--tokenizer", action="append", choices=list(TOKENIZERS), help="비교 대상 (반복 가능, 기본: 전체)")
+    parser.add_argument("-k", type=int, action="append", help="recall@k (반복 가능, 기본: 1, 5, 10)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    ks = sorted(set(args.k or [1, 5, 10]))
+    documents, queries = load_corpus(Path(args.data))
+    report = [evaluate(name, documents, queries, ks) for name in (args.tokenizer or list(TOKENIZERS))]
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print(f"documents={len(documents)} " + " ".join(f"{t}_queries={len(q)}" for t, q in queries.items()))
+    print(f"{'tokenizer':<12}{'terms':>8}{'doc_tok':>9}{'build_ms':>10}{'tok_p50us':>11}{'srch_p50us':>12}{'srch_p95us':>12}")
+    for r in report:
+        print(
+            f"{r['tokenizer']:<12}{r['terms']:>8}{r['avg_doc_tokens']:>9}{r['build_ms']:>10}"
+            f"{r['tokenize_p50_us']:>11}{r['search_p50_us']:>12}{r['search_p95_us']:>12}"
+        )
+    for query_type in queries:
+        print(f"\n[{query_type}]")
+        metrics = [f"recall@{k}" for k in ks] + ["mrr"]
+        print(f"{'tokenizer':<12}" + "".join(f"{m:>11}" for m in metrics))
+        for r in report:
+            print(f"{r['tokenizer']:<12}" + "".join(f"{r['quality'][query_type][m]:>11}" for m in metrics))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Query Classifier Evaluation
+질문 유형 분류 오프라인 평가 (키워드 → 로컬 분류기 → LLM)
+
+라벨이 있는 질문(예시 질문 + 평가 데이터셋, 선택적으로 JSONL 추가)에 대해
+로컬 최근접 중심 분류기의 정확도/커버리지/지연시간을 leave-one-out으로 측정하고,
+기존 경로(키워드 → LLM)와 비교합니다.
+
+Usage:
+    python scripts/eval_query_classifier.py
+    python scripts/eval_query_classifier.py --margins 0,0.02,0.04,0.08 --with-llm
+    python scripts/eval_query_classifier.py --extra labeled_queries.jsonl  # {"query": ..., "label": ...}
+"""
+
+import sys
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app.agent.nodes.classify_node import classify_by_keywords, classify_with_llm
+from app.agent.query_classifier import training_examples
+from app.vector_store.embedder_bge_m3 import get_embedder
+
+
+def load_examples(extra_path: Optional[str]) -> List[Tuple[str, str]]:
+    """기본 예시 + 추가 JSONL 라벨 데이터"""
+    examples = training_examples()
+    if extra_path:
+        with open(extra_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    examples.append((row["query"], row["label"]))
+    return examples
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def leave_one_out(vectors: np.ndarray, labels: List[str]) -> List[Tuple[str, float]]:
+    """
+    각 예시를 제외한 중심으로 예측 (학습 데이터로 평가하지 않도록)
+
+    Returns:
+        List[Tuple[str, float]]: (예측 라벨, margin)
+    """
+    classes = sorted(set(labels))
+    label_arr = np.array(labels)
+    sums = {c: vectors[label_arr == c].sum(axis=0) for c in classes}
+    counts = {c: int((label_arr == c).sum()) for c in classes}
+
+    predictions = []
+    for i, vector in enumerate(vectors):
+        centroids = []
+        for c in classes:
+            total, count = sums[c], counts[c]
+            if labels[i] == c:
+                total, count = total - vector, count - 1
+            centroid = total / max(count, 1)
+            centroids.append(centroid / (np.linalg.norm(centroid) or 1.0))
+        sims = np.stack(centroids) @ vector
+        order = np.argsort(sims)[::-1]
+        predictions.append((classes[order[0]], float(sims[order[0]] - sims[order[1]])))
+    return predictions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query classifier offline evaluation")
+    parser.add_argument("--margins", default="0,0.02,0.04,0.06,0.1", help="평가할 margin 임계값 목록")
+    parser.add_argument("--with-llm", action="store_true", help="LLM 분류도 호출하여 비교 (API 비용 발생)")
+    parser.add_argument("--extra", default=None, help="추가 라벨 데이터 JSONL 경로")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    examples = load_examples(args.extra)
+    texts = [text for text, _ in examples]
+    labels = [label for _, label in examples]
+    margins = [float(m) for m in args.margins.split(",") if m.strip()]
+
+    report = {"examples": len(examples)}
+
+    # 1) 키워드 단계
+    keyword_preds = [classify_by_keywords(text) for text in texts]
+    matched = [(p, l) for p, l in zip(keyword_preds, labels) if p is not None]
+    report["keyword"] = {
+        "coverage": round(len(matched) / len(examples), 4),
+        "accuracy_on_matched": round(sum(p == l for p, l in matched) / len(matched), 4) if matched else None,
+    }
+
+    # 2) 로컬 분류기 (leave-one-out)
+    model = get_embedder().model
+    start = time.perf_counter()
+    vectors = np.asarray(model.encode(texts, normalize_embeddings=True, show_progress_bar=False), dtype=np.float32)
+    fit_ms = (time.perf_counter() - start) * 1000
+
+    latencies = []
+    for text in texts[: min(len(texts), 50)]:
+        t0 = time.perf_counter()
+        model.encode([text], normalize_embeddings=True, show_progress_bar=False)
+        latencies.append((time.perf_counter() - t0) * 1000)
+
+    loo = leave_one_out(vectors, labels)
+    sweep = []
+    for margin in margins:
+        confident = [(p, l) for (p, m), l in zip(loo, labels) if m >= margin]
+        sweep.append({
+            "margin": margin,
+            "coverage": round(len(confident) / len(examples), 4),
+            "accuracy_on_covered": round(sum(p == l for p, l in confident) / len(confident), 4) if confident else None,
+        })
+    report["local"] = {
+        "accuracy": round(sum(p == l for (p, _), l in zip(loo, labels)) / len(labels), 4),
+        "embed_all_ms": round(fit_ms, 1),
+        "latency_ms_p50": round(percentile(latencies, 50), 2),
+        "latency_ms_p95": round(percentile(latencies, 95), 2),
+        "margin_sweep": sweep,
+    }
+
+    # 3) LLM (선택)
+    llm_preds: Optional[List[str]] = None
+    if args.with_llm:
+        llm_preds, llm_latencies = [], []
+        for text in texts:
+            t0 = time.perf_counter()
+            llm_preds.append(classify_with_llm(text))
+            llm_latencies.append((time.perf_counter() - t0) * 1000)
+        report["llm"] = {
+            "accuracy": round(sum(p == l for p, l in zip(llm_preds, labels)) / len(labels), 4),
+            "latency_ms_p50": round(percentile(llm_latencies, 50), 1),
+            "latency_ms_p95": round(percentile(llm_latencies, 95), 1),
+            "latency_ms_mean": round(statistics.mean(llm_latencies), 1),
+        }
+
+    # 4) 전체 파이프라인 비교 (키워드 → 로컬(margin) → LLM)
+    pipelines = []
+    for margin in margins:
+        correct = llm_calls = 0
+        for i, label in enumerate(labels):
+            if keyword_preds[i] is not None:
+                pred = keyword_preds[i]
+            elif loo[i][1] >= margin:
+                pred = loo[i][0]
+            else:
+                llm_calls += 1
+                pred = llm_preds[i] if llm_preds else None
+            correct += int(pred == label)
+        pipelines.append({
+            "margin": margin,
+            "llm_call_rate": round(llm_calls / len(labels), 4),
+            "accuracy": round(correct / len(labels), 4) if llm_preds else None,
+        })
+    report["pipeline"] = pipelines
+    if llm_preds:
+        current = [kw if kw is not None else llm for kw, llm in zip(keyword_preds, llm_preds)]
+        report["current_path"] = {
+            "llm_call_rate": round(sum(kw is None for kw in keyword_preds) / len(labels), 4),
+            "accuracy": round(sum(p == l for p, l in zip(current, labels)) / len(labels), 4),
+        }
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    print(f"examples: {report['examples']}")
+    print(f"keyword  coverage={report['keyword']['coverage']:.2%} accuracy={report['keyword']['accuracy_on_matched']}")
+    local = report["local"]
+    print(
+        f"local    LOO accuracy={local['accuracy']:.2%} "
+        f"latency p50={local['latency_ms_p50']}ms p95={local['latency_ms_p95']}ms"
+    )
+    for row in local["margin_sweep"]:
+        print(f"  margin>={row['margin']:<5} coverage={row['coverage']:.2%} accuracy={row['accuracy_on_covered']}")
+    if "llm" in report:
+        llm = report["llm"]
+        print(f"llm      accuracy={llm['accuracy']:.2%} latency p50={llm['latency_ms_p50']}ms p95={llm['latency_ms_p95']}ms")
+        print(f"current  (keyword → LLM) {report['current_path']}")
+    for row in report["pipeline"]:
+        print(f"pipeline margin>={row['margin']:<5} llm_call_rate={row['llm_call_rate']:.2%} accuracy={row['accuracy']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,14 @@ data.json → MySQL + Qdrant 적재
 
 Usage:
     python scripts/ingest_data.py
+    python scripts/ingest_data.py --conditions-only --conditions-workers 8
+    python scripts/ingest_data.py --skip-conditions
+    python scripts/ingest_data.py --chunk-workers 8
 """
 
 import sys
 import json
+import argparse
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any
@@ -20,7 +24,9 @@ from app.config import get_settings
 from app.config.logger import get_logger
 from app.db.engine import get_db, init_db
 from app.db.models import Policy, Document, DocTypeEnum
-from app.vector_store import get_qdrant_manager, get_embedder, chunk_text
+from app.vector_store import get_qdrant_manager, get_embedder
+from app.vector_store.chunker import chunk_documents
+from app.agent.condition_store import get_condition_store
 
 from qdrant_client.models import PointStruct
 
@@ -148,10 +154,13 @@ def ingest_to_mysql(policies_data: List[Dict[str, Any]]) -> List[int]:
     return policy_ids
 
 
-def ingest_to_qdrant() -> int:
+def ingest_to_qdrant(chunk_workers: int = None) -> int:
     """
     Qdrant에 문서 임베딩 적재
     
+    Args:
+        chunk_workers: 청킹 프로세스 수 (기본값: CPU 수)
+    
     Returns:
         int: 적재된 청크 개수
     """
@@ -175,19 +184,24 @@ def ingest_to_qdrant() -> int:
                 logger.warning("No documents found in MySQL")
                 return 0
             
-            # Prepare chunks
+            # Prepare chunks (프로세스 풀에서 문서별 청킹)
+            chunked = chunk_documents(
+                [
+                    (
+                        doc.content,
+                        {
+                            "policy_id": doc.policy_id,
+                            "doc_type": doc.doc_type.value,
+                            **(doc.doc_metadata if doc.doc_metadata else {})
+                        }
+                    )
+                    for doc in documents
+                ],
+                workers=chunk_workers
+            )
+            
             all_chunks = []
-            for doc in documents:
-                # Chunk document content
-                chunks = chunk_text(
-                    text=doc.content,
-                    metadata={
-                        "policy_id": doc.policy_id,
-                        "doc_type": doc.doc_type.value,
-                        **(doc.doc_metadata if doc.doc_metadata else {})
-                    }
-                )
-                
+            for doc, chunks in zip(documents, chunked):
                 all_chunks.extend([
                     {
                         "content": chunk["content"],
@@ -248,8 +262,44 @@ def ingest_to_qdrant() -> int:
         raise
 
 
+def precompute_conditions(max_workers: int = 4, force: bool = False) -> Dict[str, int]:
+    """
+    정책별 자격 조건 사전 파싱 + 질문 뱅크 생성 (policy_conditions 적재)
+    
+    Args:
+        max_workers: 최대 동시 LLM 호출 수
+        force: 이미 파싱된 정책도 다시 파싱
+    
+    Returns:
+        Dict[str, int]: parsed/skipped/failed 개수
+    """
+    with get_db() as db:
+        policies = [
+            (policy_id, apply_target, program_name)
+            for policy_id, apply_target, program_name in db.query(
+                Policy.id, Policy.apply_target, Policy.program_name
+            ).all()
+        ]
+    
+    logger.info(f"Found {len(policies)} policies for condition precompute")
+    return get_condition_store().precompute(policies, max_workers=max_workers, force=force)
+
+
+def parse_args() -> argparse.Namespace:
+    """CLI 인자 파싱"""
+    parser = argparse.ArgumentParser(description="data.json → MySQL + Qdrant 적재")
+    parser.add_argument("--skip-conditions", action="store_true", help="자격 조건 사전 파싱 생략")
+    parser.add_argument("--conditions-only", action="store_true", help="자격 조건 사전 파싱만 실행")
+    parser.add_argument("--conditions-workers", type=int, default=4, help="조건 파싱 최대 동시 LLM 호출 수")
+    parser.add_argument("--force-conditions", action="store_true", help="이미 파싱된 조건도 다시 파싱")
+    parser.add_argument("--chunk-workers", type=int, default=None, help="청킹 프로세스 수 (기본: CPU 수)")
+    return parser.parse_args()
+
+
 def main():
     """Main ingestion workflow"""
+    args = parse_args()
+    
     try:
         logger.info("=" * 60)
         logger.info("Starting data ingestion")
@@ -259,6 +309,12 @@ def main():
         logger.info("Initializing database...")
         init_db()
         
+        if args.conditions_only:
+            logger.info("Precomputing eligibility conditions...")
+            stats = precompute_conditions(args.conditions_workers, args.force_conditions)
+            logger.info(f"Condition precompute complete: {stats}")
+            return
+        
         # Load data
         data_path = Path(__file__).parent.parent / "data.json"
         if not data_path.exists():
@@ -278,13 +334,22 @@ def main():
         
         # Ingest to Qdrant
         logger.info("Ingesting to Qdrant...")
-        chunk_count = ingest_to_qdrant()
+        chunk_count = ingest_to_qdrant(chunk_workers=args.chunk_workers)
         logger.info(f"Qdrant ingestion complete: {chunk_count} chunks")
         
+        # Precompute eligibility conditions
+        condition_stats = None
+        if not args.skip_conditions:
+            logger.info("Precomputing eligibility conditions...")
+            condition_stats = precompute_conditions(args.conditions_workers, args.force_conditions)
+            logger.info(f"Condition precompute complete: {condition_stats}")
+        
         logger.info("=" * 60)
         logger.info("Data ingestion completed successfully!")
         logger.info(f"Total policies: {len(policy_ids)}")
         logger.info(f"Total chunks: {chunk_count}")
+        if condition_stats:
+            logger.info(f"Eligibility conditions: {condition_stats}")
         logger.info("=" * 60)
         
     except Exception as e:
@@ -0,0 +1,332 @@
+"""
+Fake Upstreams for Load Testing
+부하 테스트용 가짜 OpenAI 호환 서버 + 가짜 Tavily 서버 (한 프로세스, 한 포트)
+
+실제 API 대신 지연 시간/토큰 속도를 설정할 수 있는 응답을 돌려줍니다.
+애플리케이션은 base URL만 바꿔서 연결합니다 (API 키는 아무 값이나 가능).
+
+    OPENAI_BASE_URL=http://127.0.0.1:8900/v1
+    TAVILY_BASE_URL=http://127.0.0.1:8900
+    TAVILY_API_KEY=fake
+
+엔드포인트:
+- POST /v1/chat/completions: 비스트리밍(JSON) / 스트리밍(SSE, stream_options.include_usage 지원)
+  프롬프트 유형별 응답 (파싱 경로가 실제와 같게 동작하도록)
+  - 질문 분류 프롬프트(POLICY_QA / WEB_ONLY) → "POLICY_QA"
+  - 자격 조건 파싱 프롬프트("conditions") → 조건 JSON
+  - 자격 판정 프롬프트("status") → {"status": "PASS", ...}
+  - 그 외 → --completion-tokens 길이의 한국어 답변
+- POST /search: Tavily 검색 결과 (--tavily-results 건)
+- GET /stats: 요청 수, 동시 처리 최대치, 주입한 오류 수
+- POST /stats/reset: 통계 초기화
+
+지연 모델:
+- 비스트리밍: ttft + completion_tokens / tokens_per_sec
+- 스트리밍: ttft 후 토큰마다 1 / tokens_per_sec 간격
+- --jitter 비율만큼 균등 분포로 흔들고, --slow-rate 확률로 --slow-ms를 더함 (꼬리 지연 재현)
+- --error-rate 확률로 429(Retry-After) 또는 500 반환 (재시도/헤지 경로 확인)
+
+Usage:
+    python scripts/loadtest/fake_upstreams.py
+    python scripts/loadtest/fake_upstreams.py --port 8900 --ttft-ms 600 --tokens-per-sec 40 --completion-tokens 300
+    python scripts/loadtest/fake_upstreams.py --tavily-latency-ms 1200 --error-rate 0.02 --slow-rate 0.01 --slow-ms 8000
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+ANSWER_SENTENCES = [
+    "해당 사업은 예비창업자와 창업 3년 이내 기업을 대상으로 합니다.",
+    "지원 금액은 최대 1억 원이며 사업화 자금과 멘토링이 함께 제공됩니다.",
+    "신청은 K-Startup 누리집에서 온라인으로 접수합니다.",
+    "제출 서류는 사업계획서와 대표자 신분증 사본입니다.",
+    "선정 평가는 서류 평가와 발표 평가로 진행됩니다.",
+    "자세한 내용은 공고문과 운영기관 문의처를 확인하시기 바랍니다.",
+]
+
+CONDITIONS_RESPONSE = {
+    "conditions": [
+        {"type": "Age", "name": "나이", "description": "만 39세 이하 청년", "value": "39세 이하", "logic": "AND", "status": "UNKNOWN"},
+        {"type": "Region", "name": "지역", "description": "서울 소재 기업", "value": "서울", "logic": "AND", "status": "UNKNOWN"},
+        {"type": "Business Status", "name": "창업 상태", "description": "예비창업자", "value": "예비창업자", "logic": "OR", "status": "UNKNOWN"},
+    ],
+    "extra_requirements": None,
+}
+
+JUDGE_RESPONSE = {"status": "PASS", "reason": "답변 내용이 조건을 충족합니다."}
+
+
+class UpstreamConfig:
+    """가짜 업스트림 지연/오류 설정"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.ttft_ms = args.ttft_ms
+        self.tokens_per_sec = max(1.0, args.tokens_per_sec)
+        self.completion_tokens = args.completion_tokens
+        self.jitter = args.jitter
+        self.slow_rate = args.slow_rate
+        self.slow_ms = args.slow_ms
+        self.error_rate = args.error_rate
+        self.tavily_latency_ms = args.tavily_latency_ms
+        self.tavily_results = args.tavily_results
+        self.seed = args.seed
+
+
+class UpstreamStats:
+    """엔드포인트별 요청 수 / 동시 처리 수"""
+
+    def __init__(self):
+        self.in_flight: Dict[str, int] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """누적 값 초기화 (진행 중인 요청 수는 유지 — 측정 중간에 호출됨)"""
+        self.started = time.time()
+        self.requests: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.max_in_flight: Dict[str, int] = dict(self.in_flight)
+        self.completion_tokens = 0
+
+    def enter(self, name: str) -> None:
+        self.requests[name] = self.requests.get(name, 0) + 1
+        self.in_flight[name] = self.in_flight.get(name, 0) + 1
+        self.max_in_flight[name] = max(self.max_in_flight.get(name, 0), self.in_flight[name])
+
+    def leave(self, name: str) -> None:
+        self.in_flight[name] -= 1
+
+    def error(self, name: str, status: int) -> None:
+        key = f"{name}:{status}"
+        self.errors[key] = self.errors.get(key, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "injected_errors": self.errors,
+            "completion_tokens": self.completion_tokens,
+        }
+
+
+def prompt_text(messages: List[Dict[str, Any]]) -> str:
+    return "\n".join(str(message.get("content") or "") for message in messages)
+
+
+def scripted_reply(messages: List[Dict[str, Any]], completion_tokens: int) -> str:
+    """프롬프트 유형에 맞는 응답 (애플리케이션의 파싱 경로를 실제와 같게 통과)"""
+    text = prompt_text(messages)
+    if "POLICY_QA" in text and "WEB_ONLY" in text:
+        return "POLICY_QA"
+    if '"conditions"' in text:
+        return json.dumps(CONDITIONS_RESPONSE, ensure_ascii=False)
+    if '"status"' in text and "PASS" in text:
+        return json.dumps(JUDGE_RESPONSE, ensure_ascii=False)
+    return answer_text(completion_tokens)
+
+
+def answer_text(tokens: int) -> str:
+    """대략 tokens개의 토큰(어절)으로 된 답변"""
+    words = " ".join(itertools.islice(itertools.cycle(ANSWER_SENTENCES), max(1, tokens // 6 + 1))).split(" ")
+    return " ".join(words[:max(1, tokens)])
+
+
+def split_tokens(text: str) -> List[str]:
+    """스트리밍용 토큰 분할 (어절 단위, 공백 유지)"""
+    words = text.split(" ")
+    return [words[0]] + [" " + word for word in words[1:]]
+
+
+def create_app(config: UpstreamConfig) -> FastAPI:
+    """가짜 OpenAI + Tavily FastAPI 앱"""
+    app = FastAPI(title="Fake Upstreams", docs_url=None, redoc_url=None)
+    stats = UpstreamStats()
+    rng = random.Random(config.seed)
+
+    def delay(base_ms: float) -> float:
+        """지터 + 꼬리 지연이 반영된 지연 시간 (초)"""
+        ms = base_ms * (1 + rng.uniform(-config.jitter, config.jitter))
+        if config.slow_rate and rng.random() < config.slow_rate:
+            ms += config.slow_ms
+        return max(0.0, ms) / 1000
+
+    def injected_error(name: str) -> Optional[JSONResponse]:
+        if not config.error_rate or rng.random() >= config.error_rate:
+            return None
+        status = 429 if rng.random() < 0.5 else 500
+        stats.error(name, status)
+        headers = {"Retry-After": "0.2"} if status == 429 else {}
+        return JSONResponse(
+            status_code=status,
+            content={"error": {"message": "injected failure", "type": "fake_upstream"}},
+            headers=headers
+        )
+
+    def usage(messages: List[Dict[str, Any]], completion: int) -> Dict[str, int]:
+        prompt = max(1, len(prompt_text(messages)) // 2)  # 한국어 대략 2자당 1토큰
+        return {"prompt_tokens": prompt, "completion_tokens": completion, "total_tokens": prompt + completion}
+
+    async def stream_completion(
+        model: str,
+        messages: List[Dict[str, Any]],
+        reply: str,
+        include_usage: bool
+    ) -> AsyncIterator[str]:
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        tokens = split_tokens(reply)
+        try:
+            await asyncio.sleep(delay(config.ttft_ms))
+            for i, token in enumerate(tokens):
+                if i:
+                    await asyncio.sleep(1 / config.tokens_per_sec)
+                delta = {"content": token} if i else {"role": "assistant", "content": token}
+                chunk = {
+                    "id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": None}],
+                }
+                yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+            stats.completion_tokens += len(tokens)
+
+            final = {
+                "id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            }
+            yield f"data: {json.dumps(final)}\n\n"
+            if include_usage:
+                usage_chunk = {
+                    "id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                    "choices": [], "usage": usage(messages, len(tokens)),
+                }
+                yield f"data: {json.dumps(usage_chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+        finally:
+            stats.leave("chat.stream")
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        messages = body.get("messages") or []
+        model = body.get("model", "fake-model")
+        completion_tokens = min(config.completion_tokens, body.get("max_tokens") or config.completion_tokens)
+        reply = scripted_reply(messages, completion_tokens)
+
+        if body.get("stream"):
+            error = injected_error("chat.stream")
+            if error is not None:
+                return error
+            stats.enter("chat.stream")
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            return StreamingResponse(
+                stream_completion(model, messages, reply, include_usage),
+                media_type="text/event-stream"
+            )
+
+        error = injected_error("chat")
+        if error is not None:
+            return error
+        stats.enter("chat")
+        try:
+            tokens = len(split_tokens(reply))
+            await asyncio.sleep(delay(config.ttft_ms) + tokens / config.tokens_per_sec)
+            stats.completion_tokens += tokens
+            return {
+                "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": reply}, "finish_reason": "stop"}],
+                "usage": usage(messages, tokens),
+            }
+        finally:
+            stats.leave("chat")
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "fake-model", "object": "model", "owned_by": "loadtest"}]}
+
+    @app.post("/search")
+    async def tavily_search(request: Request):
+        body = await request.json()
+        error = injected_error("tavily")
+        if error is not None:
+            return error
+        stats.enter("tavily")
+        try:
+            started = time.perf_counter()
+            await asyncio.sleep(delay(config.tavily_latency_ms))
+            query = body.get("query", "")
+            limit = min(config.tavily_results, body.get("max_results") or config.tavily_results)
+            results = [
+                {
+                    "title": f"{query} 관련 공고 {i + 1}",
+                    "url": f"https://example.go.kr/notice/{abs(hash((query, i))) % 100000}",
+                    "content": " ".join(ANSWER_SENTENCES[: 3 + i % 3]),
+                    "score": round(0.9 - i * 0.05, 3),
+                    "published_date": "2025-01-15",
+                }
+                for i in range(limit)
+            ]
+            response: Dict[str, Any] = {
+                "query": query,
+                "results": results,
+                "response_time": round(time.perf_counter() - started, 3),
+            }
+            if body.get("include_answer"):
+                response["answer"] = ANSWER_SENTENCES[0]
+            return response
+        finally:
+            stats.leave("tavily")
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats.to_dict()
+
+    @app.post("/stats/reset")
+    async def reset_stats():
+        stats.reset()
+        return {"status": "reset"}
+
+    return app
+
+
+def parse_args() -> Tuple[argparse.Namespace, UpstreamConfig]:
+    parser = argparse.ArgumentParser(description="Fake OpenAI + Tavily upstreams for load testing")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=8900, help="포트")
+    parser.add_argument("--ttft-ms", type=float, default=500.0, help="첫 토큰까지 지연 (밀리초)")
+    parser.add_argument("--tokens-per-sec", type=float, default=50.0, help="토큰 생성 속도")
+    parser.add_argument("--completion-tokens", type=int, default=200, help="일반 답변 토큰 수")
+    parser.add_argument("--jitter", type=float, default=0.2, help="지연 시간 균등 지터 비율 (0.2 = ±20%%)")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="꼬리 지연 발생 확률")
+    parser.add_argument("--slow-ms", type=float, default=5000.0, help="꼬리 지연 추가 시간 (밀리초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="429/500 주입 확률")
+    parser.add_argument("--tavily-latency-ms", type=float, default=800.0, help="Tavily 응답 지연 (밀리초)")
+    parser.add_argument("--tavily-results", type=int, default=5, help="Tavily 결과 수")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드 (재현용)")
+    args = parser.parse_args()
+    return args, UpstreamConfig(args)
+
+
+def main():
+    args, config = parse_args()
+    print(
+        f"fake upstreams on http://{args.host}:{args.port} "
+        f"(OPENAI_BASE_URL=http://{args.host}:{args.port}/v1 TAVILY_BASE_URL=http://{args.host}:{args.port})"
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,497 @@
+"""
+Load Test Client
+채팅 / 검색 / 자격 확인 API 동시 부하 테스트
+
+가상 사용자 N명이 시나리오 비율(--mix)에 따라 요청을 반복하고,
+단계별 처리량과 지연 시간(p50/p95/p99/max), SSE 첫 이벤트/첫 답변 청크까지 시간을 보고합니다.
+OpenAI / Tavily 비용 없이 돌리려면 fake_upstreams.py를 먼저 띄우고 애플리케이션을 그쪽으로 연결합니다.
+
+    python scripts/loadtest/fake_upstreams.py --ttft-ms 500 --tokens-per-sec 50
+    OPENAI_API_KEY=fake OPENAI_BASE_URL=http://127.0.0.1:8900/v1 \\
+    TAVILY_API_KEY=fake TAVILY_BASE_URL=http://127.0.0.1:8900 \\
+        uvicorn app.main:app --app-dir src --port 8000
+    python scripts/loadtest/run_load.py --users 20 --duration 60 --upstream-url http://127.0.0.1:8900
+
+시나리오:
+- chat: /chat/init-policy → /chat/stream (--chat-turns 회) → /chat/cleanup
+- search: /policies/search
+- eligibility: /eligibility/start → /eligibility/answer (완료 또는 --eligibility-answers 회) → 세션 삭제
+- batch: /eligibility/batch (검색어 기반 일괄 판정)
+
+이벤트 루프 블로킹 감지:
+부하와 별도로 /health를 --probe-interval-ms 간격으로 호출합니다. /health는 즉시 응답하는
+async 핸들러이므로, 지연이 --stall-ms를 넘으면 이벤트 루프가 동기 작업에 막혀 있었다는 신호입니다.
+(stalls 수와 max 지연이 부하에 따라 커지면 async 핸들러 안의 동기 I/O / CPU 작업을 의심)
+
+정책 ID는 --policy-id로 지정하거나, 없으면 /policies 목록에서 가져옵니다.
+
+Usage:
+    python scripts/loadtest/run_load.py
+    python scripts/loadtest/run_load.py --users 50 --duration 120 --ramp-up 10 --mix chat=6,search=3,eligibility=1
+    python scripts/loadtest/run_load.py --mix search=1 --users 100 --think-ms 0
+    python scripts/loadtest/run_load.py --json --output reports/load.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+API = "/api/v1"
+
+DEFAULT_QUERIES = [
+    "청년 창업 지원금",
+    "소상공인 운영 자금",
+    "예비창업패키지",
+    "R&D 사업화 지원",
+    "서울 스타트업 사무실 지원",
+    "여성 기업 지원사업",
+    "수출 바우처",
+    "1인 창조기업",
+]
+
+DEFAULT_MESSAGES = [
+    "지원 금액은 얼마인가요?",
+    "신청 대상이 어떻게 되나요?",
+    "신청 방법과 제출 서류를 알려주세요.",
+    "선정 평가는 어떻게 진행되나요?",
+]
+
+DEFAULT_ANSWERS = [
+    "서울에 거주하는 만 29세 예비창업자입니다.",
+    "네, 해당됩니다.",
+    "아직 사업자 등록은 하지 않았습니다.",
+]
+
+DEFAULT_PROFILE = {"age": 29, "region": "서울", "business_status": "예비창업자"}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """초 단위 표본 → 밀리초 요약"""
+    if not values:
+        return {}
+    return {
+        "p50": round(percentile(values, 0.50) * 1000, 1),
+        "p95": round(percentile(values, 0.95) * 1000, 1),
+        "p99": round(percentile(values, 0.99) * 1000, 1),
+        "max": round(max(values) * 1000, 1),
+        "mean": round(sum(values) / len(values) * 1000, 1),
+    }
+
+
+class StepStats:
+    """단계(엔드포인트)별 측정값"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.first_event: List[float] = []
+        self.first_chunk: List[float] = []
+        self.status: Dict[str, int] = {}
+        self.errors = 0
+        self.error_samples: List[str] = []
+
+    def to_dict(self, elapsed: float) -> Dict[str, Any]:
+        count = len(self.latencies)
+        result: Dict[str, Any] = {
+            "count": count,
+            "errors": self.errors,
+            "rps": round(count / elapsed, 2) if elapsed else 0.0,
+            "latency_ms": summarize(self.latencies),
+            "status": self.status,
+        }
+        if self.first_event:
+            result["first_event_ms"] = summarize(self.first_event)
+        if self.first_chunk:
+            result["first_chunk_ms"] = summarize(self.first_chunk)
+        if self.error_samples:
+            result["error_samples"] = self.error_samples
+        return result
+
+
+class Recorder:
+    """측정 구간(워밍업 이후)의 결과 수집"""
+
+    def __init__(self):
+        self.steps: Dict[str, StepStats] = {}
+        self.scenarios: Dict[str, Dict[str, int]] = {}
+        self.probe: List[float] = []
+        self.probe_errors = 0
+        self.active = False
+
+    def step(
+        self,
+        name: str,
+        latency: float,
+        status: Any,
+        ok: bool,
+        error: Optional[str] = None,
+        first_event: Optional[float] = None,
+        first_chunk: Optional[float] = None
+    ) -> None:
+        if not self.active:
+            return
+        stats = self.steps.setdefault(name, StepStats())
+        stats.latencies.append(latency)
+        stats.status[str(status)] = stats.status.get(str(status), 0) + 1
+        if first_event is not None:
+            stats.first_event.append(first_event)
+        if first_chunk is not None:
+            stats.first_chunk.append(first_chunk)
+        if not ok:
+            stats.errors += 1
+            if error and len(stats.error_samples) < 5:
+                stats.error_samples.append(error[:200])
+
+    def scenario(self, name: str, ok: bool) -> None:
+        if not self.active:
+            return
+        counts = self.scenarios.setdefault(name, {"completed": 0, "failed": 0})
+        counts["completed" if ok else "failed"] += 1
+
+
+class ScenarioError(Exception):
+    """시나리오 중단 (앞 단계 실패)"""
+
+
+class LoadRunner:
+    """가상 사용자 시나리오 실행기"""
+
+    def __init__(self, client: httpx.AsyncClient, args: argparse.Namespace, recorder: Recorder, policy_ids: List[int]):
+        self.client = client
+        self.args = args
+        self.recorder = recorder
+        self.policy_ids = policy_ids
+        self.queries = args.query or DEFAULT_QUERIES
+        self.messages = args.message or DEFAULT_MESSAGES
+
+    async def request(self, step: str, method: str, url: str, **kwargs: Any) -> Dict[str, Any]:
+        """JSON 요청 1건 (실패 시 ScenarioError)"""
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.recorder.step(step, time.perf_counter() - started, type(e).__name__, False, repr(e))
+            raise ScenarioError(step) from e
+        latency = time.perf_counter() - started
+        ok = response.status_code < 400
+        self.recorder.step(step, latency, response.status_code, ok, None if ok else response.text)
+        if not ok:
+            raise ScenarioError(step)
+        return response.json()
+
+    async def stream(self, step: str, url: str, payload: Dict[str, Any]) -> None:
+        """
+        SSE 요청 1건
+
+        first_event: 첫 SSE 이벤트(status)까지 시간 = 요청 수락 + 루프 지연
+        first_chunk: 첫 답변 청크까지 시간 = 사용자가 체감하는 첫 글자
+        """
+        started = time.perf_counter()
+        first_event = first_chunk = None
+        status: Any = None
+        error: Optional[str] = None
+        done = False
+        try:
+            async with self.client.stream("POST", url, json=payload) as response:
+                status = response.status_code
+                if status >= 400:
+                    error = (await response.aread()).decode("utf-8", "replace")
+                else:
+                    event = None
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        now = time.perf_counter()
+                        if first_event is None:
+                            first_event = now - started
+                        if line.startswith("event:"):
+                            event = line[6:].strip()
+                            if event == "chunk" and first_chunk is None:
+                                first_chunk = now - started
+                        elif line.startswith("data:") and event == "error":
+                            error = line[5:].strip()
+                        elif event == "done":
+                            done = True
+        except httpx.HTTPError as e:
+            status = status or type(e).__name__
+            error = repr(e)
+
+        ok = done and error is None
+        if not ok and error is None:
+            error = "stream ended without done event"
+        self.recorder.step(step, time.perf_counter() - started, status, ok, error, first_event, first_chunk)
+        if not ok:
+            raise ScenarioError(step)
+
+    async def chat(self, rng: random.Random) -> None:
+        session_id = f"load-{uuid.uuid4()}"
+        policy_id = rng.choice(self.policy_ids)
+        await self.request(
+            "chat.init", "POST", f"{API}/chat/init-policy",
+            json={"session_id": session_id, "policy_id": policy_id}
+        )
+        try:
+            for _ in range(self.args.chat_turns):
+                await self.stream(
+                    "chat.stream", f"{API}/chat/stream",
+                    {"session_id": session_id, "policy_id": policy_id, "message": rng.choice(self.messages)}
+                )
+        finally:
+            await self.request("chat.cleanup", "POST", f"{API}/chat/cleanup", json={"session_id": session_id})
+
+    async def search(self, rng: random.Random) -> None:
+        await self.request("search", "GET", f"{API}/policies/search", params={"query": rng.choice(self.queries)})
+
+    async def eligibility(self, rng: random.Random) -> None:
+        started = await self.request(
+            "eligibility.start", "POST", f"{API}/eligibility/start",
+            json={"policy_id": rng.choice(self.policy_ids)}
+        )
+        session_id = started["session_id"]
+        try:
+            for _ in range(self.args.eligibility_answers):
+                answered = await self.request(
+                    "eligibility.answer", "POST", f"{API}/eligibility/answer",
+                    json={"session_id": session_id, "answer": rng.choice(DEFAULT_ANSWERS)}
+                )
+                if answered.get("completed"):
+                    break
+        finally:
+            await self.request("eligibility.delete", "DELETE", f"{API}/eligibility/session/{session_id}")
+
+    async def batch(self, rng: random.Random) -> None:
+        await self.request(
+            "eligibility.batch", "POST", f"{API}/eligibility/batch",
+            json={"profile": DEFAULT_PROFILE, "query": rng.choice(self.queries), "limit": self.args.batch_limit}
+        )
+
+    async def user(self, index: int, mix: List[Tuple[str, float]], start_at: float, deadline: float) -> None:
+        """가상 사용자 1명: 시나리오 반복 (ramp-up 동안 시작 시각 분산)"""
+        rng = random.Random(None if self.args.seed is None else self.args.seed + index)
+        await asyncio.sleep(max(0.0, start_at - time.perf_counter()))
+        names = [name for name, _ in mix]
+        weights = [weight for _, weight in mix]
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            try:
+                await getattr(self, name)(rng)
+                self.recorder.scenario(name, True)
+            except ScenarioError:
+                self.recorder.scenario(name, False)
+            except Exception as e:  # 응답 형식 오류 등 — 부하 테스트는 계속 진행
+                self.recorder.scenario(name, False)
+                self.recorder.step(f"{name}.unexpected", 0.0, type(e).__name__, False, repr(e))
+            if self.args.think_ms:
+                await asyncio.sleep(rng.uniform(0.5, 1.5) * self.args.think_ms / 1000)
+
+    async def probe(self, deadline: float) -> None:
+        """/health 주기 호출 (이벤트 루프 블로킹 감지)"""
+        interval = self.args.probe_interval_ms / 1000
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await self.client.get("/health", timeout=30)
+                if self.recorder.active:
+                    self.recorder.probe.append(time.perf_counter() - started)
+                    if response.status_code >= 400:
+                        self.recorder.probe_errors += 1
+            except httpx.HTTPError:
+                if self.recorder.active:
+                    self.recorder.probe_errors += 1
+            await asyncio.sleep(max(0.0, interval - (time.perf_counter() - started)))
+
+
+def parse_mix(value: str) -> List[Tuple[str, float]]:
+    """"chat=6,search=3" → [("chat", 6.0), ("search", 3.0)]"""
+    mix = []
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ("chat", "search", "eligibility", "batch"):
+            raise argparse.ArgumentTypeError(f"unknown scenario: {name}")
+        if float(weight or 1) > 0:
+            mix.append((name, float(weight or 1)))
+    if not mix:
+        raise argparse.ArgumentTypeError("empty scenario mix")
+    return mix
+
+
+async def discover_policy_ids(client: httpx.AsyncClient, limit: int) -> List[int]:
+    response = await client.get(f"{API}/policies", params={"limit": min(limit, 100)})
+    response.raise_for_status()
+    return [p["id"] for p in response.json().get("policies", []) if isinstance(p.get("id"), int)]
+
+
+async def upstream_call(args: argparse.Namespace, method: str, path: str) -> Optional[Dict[str, Any]]:
+    if not args.upstream_url:
+        return None
+    try:
+        async with httpx.AsyncClient(base_url=args.upstream_url, timeout=5) as client:
+            response = await client.request(method, path)
+            return response.json()
+    except httpx.HTTPError as e:
+        print(f"upstream stats unavailable: {e!r}", file=sys.stderr)
+        return None
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.users * 2 + 10, max_keepalive_connections=args.users * 2 + 10)
+    timeout = httpx.Timeout(args.timeout, connect=10)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=timeout, limits=limits) as client:
+        health = await client.get("/health")
+        health.raise_for_status()
+
+        policy_ids = args.policy_id or []
+        if not policy_ids and any(name in ("chat", "eligibility") for name, _ in args.mix):
+            policy_ids = await discover_policy_ids(client, args.policies)
+            if not policy_ids:
+                raise SystemExit("No policies found: ingest data first or pass --policy-id")
+
+        recorder = Recorder()
+        runner = LoadRunner(client, args, recorder, policy_ids)
+
+        now = time.perf_counter()
+        measure_from = now + args.ramp_up + args.warmup
+        deadline = measure_from + args.duration
+        tasks = [
+            asyncio.create_task(runner.user(i, args.mix, now + args.ramp_up * i / args.users, deadline))
+            for i in range(args.users)
+        ]
+        tasks.append(asyncio.create_task(runner.probe(deadline)))
+
+        await asyncio.sleep(max(0.0, measure_from - time.perf_counter()))
+        await upstream_call(args, "POST", "/stats/reset")
+        recorder.active = True
+        measured_started = time.perf_counter()
+        await asyncio.sleep(max(0.0, deadline - time.perf_counter()))
+        elapsed = time.perf_counter() - measured_started
+        recorder.active = False  # 진행 중인 시나리오가 끝날 때까지 기다리되 집계에서는 제외
+        upstream = await upstream_call(args, "GET", "/stats")
+        await asyncio.gather(*tasks)
+
+    steps = {name: stats.to_dict(elapsed) for name, stats in sorted(recorder.steps.items())}
+    total_requests = sum(step["count"] for step in steps.values())
+    total_errors = sum(step["errors"] for step in steps.values())
+    completed = sum(counts["completed"] for counts in recorder.scenarios.values())
+    stall_seconds = args.stall_ms / 1000
+
+    return {
+        "config": {
+            "base_url": args.base_url,
+            "users": args.users,
+            "duration_s": args.duration,
+            "ramp_up_s": args.ramp_up,
+            "warmup_s": args.warmup,
+            "think_ms": args.think_ms,
+            "mix": dict(args.mix),
+            "chat_turns": args.chat_turns,
+            "policies": len(policy_ids),
+        },
+        "elapsed_s": round(elapsed, 2),
+        "totals": {
+            "requests": total_requests,
+            "errors": total_errors,
+            "rps": round(total_requests / elapsed, 2) if elapsed else 0.0,
+            "scenarios_per_sec": round(completed / elapsed, 2) if elapsed else 0.0,
+        },
+        "scenarios": recorder.scenarios,
+        "steps": steps,
+        "loop_probe": {
+            "count": len(recorder.probe),
+            "errors": recorder.probe_errors,
+            "latency_ms": summarize(recorder.probe),
+            "stalls": sum(1 for value in recorder.probe if value > stall_seconds),
+            "stall_threshold_ms": args.stall_ms,
+        },
+        "upstream": upstream,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    config = report["config"]
+    totals = report["totals"]
+    print(
+        f"users={config['users']} measured={report['elapsed_s']}s mix={config['mix']} "
+        f"requests={totals['requests']} errors={totals['errors']} rps={totals['rps']} "
+        f"scenarios/s={totals['scenarios_per_sec']}"
+    )
+    print(f"{'step':<22}{'count':>7}{'err':>6}{'rps':>8}{'p50_ms':>9}{'p95_ms':>9}{'p99_ms':>9}{'max_ms':>9}{'1st_evt_p95':>12}{'1st_chunk_p50':>14}{'1st_chunk_p95':>14}")
+    for name, step in report["steps"].items():
+        latency = step["latency_ms"]
+        first_event = step.get("first_event_ms", {})
+        first_chunk = step.get("first_chunk_ms", {})
+        print(
+            f"{name:<22}{step['count']:>7}{step['errors']:>6}{step['rps']:>8}"
+            f"{latency.get('p50', '-'):>9}{latency.get('p95', '-'):>9}{latency.get('p99', '-'):>9}{latency.get('max', '-'):>9}"
+            f"{first_event.get('p95', '-'):>12}{first_chunk.get('p50', '-'):>14}{first_chunk.get('p95', '-'):>14}"
+        )
+
+    probe = report["loop_probe"]
+    latency = probe["latency_ms"]
+    print(
+        f"\nloop probe (/health): n={probe['count']} p50={latency.get('p50', '-')}ms p99={latency.get('p99', '-')}ms "
+        f"max={latency.get('max', '-')}ms stalls(>{probe['stall_threshold_ms']}ms)={probe['stalls']} errors={probe['errors']}"
+    )
+    if report.get("upstream"):
+        upstream = report["upstream"]
+        print(f"upstream: requests={upstream.get('requests')} max_in_flight={upstream.get('max_in_flight')} errors={upstream.get('injected_errors')}")
+    for name, step in report["steps"].items():
+        for sample in step.get("error_samples", [])[:2]:
+            print(f"  ! {name}: {sample}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for chat / search / eligibility APIs")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="애플리케이션 주소")
+    parser.add_argument("--users", type=int, default=10, help="동시 가상 사용자 수")
+    parser.add_argument("--duration", type=float, default=30.0, help="측정 시간 (초)")
+    parser.add_argument("--ramp-up", type=float, default=5.0, help="사용자 시작 분산 시간 (초, 측정 제외)")
+    parser.add_argument("--warmup", type=float, default=5.0, help="ramp-up 이후 측정 전 워밍업 (초)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("chat=5,search=3,eligibility=1,batch=1"),
+                        help="시나리오 비율 (chat,search,eligibility,batch)")
+    parser.add_argument("--think-ms", type=float, default=500.0, help="시나리오 사이 평균 대기 (밀리초)")
+    parser.add_argument("--chat-turns", type=int, default=2, help="chat 시나리오당 질문 수")
+    parser.add_argument("--eligibility-answers", type=int, default=4, help="eligibility 시나리오당 최대 답변 수")
+    parser.add_argument("--batch-limit", type=int, default=200, help="batch 시나리오 검색 정책 수")
+    parser.add_argument("--policy-id", type=int, action="append", help="사용할 정책 ID (반복 가능)")
+    parser.add_argument("--policies", type=int, default=50, help="자동 조회할 정책 수")
+    parser.add_argument("--query", action="append", help="검색어 (반복 가능, 기본값: 내장 목록)")
+    parser.add_argument("--message", action="append", help="채팅 질문 (반복 가능, 기본값: 내장 목록)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="요청 타임아웃 (초)")
+    parser.add_argument("--probe-interval-ms", type=float, default=100.0, help="/health 프로브 간격 (밀리초)")
+    parser.add_argument("--stall-ms", type=float, default=100.0, help="프로브 지연이 이 값을 넘으면 루프 정체로 집계")
+    parser.add_argument("--upstream-url", default=None, help="fake_upstreams.py 주소 (측정 구간 업스트림 통계 수집)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드 (재현용)")
+    parser.add_argument("--output", type=Path, help="JSON 보고서 저장 경로")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Import Time Profile
+모듈 import 시간 측정 및 무거운 의존성 유입 회귀 검사 (python -X importtime)
+
+각 대상 모듈을 새 인터프리터에서 import하여 누적 import 시간과 상위 모듈을 보고하고,
+금지된 무거운 패키지(torch, sentence_transformers 등)가 끌려오면 실패(exit 1)합니다.
+CI나 리팩터링 후 "가벼운 경로가 다시 무거워지지 않았는지" 확인하는 용도입니다.
+
+Usage:
+    python scripts/profile_imports.py
+    python scripts/profile_imports.py --module app.vector_store --top 20
+    python scripts/profile_imports.py --budget-ms 1500 --json
+"""
+
+import sys
+import argparse
+import json
+import os
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+HEAVY_MODULES = ("torch", "sentence_transformers", "transformers")
+
+# 대상 모듈 → import되면 안 되는 패키지
+DEFAULT_TARGETS: Dict[str, Tuple[str, ...]] = {
+    "app.vector_store": HEAVY_MODULES + ("qdrant_client",),
+    "app.vector_store.sparse_search": HEAVY_MODULES + ("qdrant_client",),
+    "app.vector_store.chunker": HEAVY_MODULES + ("qdrant_client",),
+    "app.agent.context_packer": HEAVY_MODULES,
+    "app.api.routes_admin": HEAVY_MODULES,
+    "app.main": HEAVY_MODULES,
+}
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def profile_module(module: str) -> Dict:
+    """
+    새 인터프리터에서 모듈 import 시간 측정
+
+    Args:
+        module: 모듈 경로 (예: app.vector_store)
+
+    Returns:
+        Dict: {"module", "ok", "error", "cumulative_ms", "imports": [(name, self_us, cumulative_us)]}
+    """
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(SRC_DIR),
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    imports: List[Tuple[str, int, int]] = []
+    errors: List[str] = []
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            imports.append((match.group(4), int(match.group(1)), int(match.group(2))))
+        elif not line.startswith("import time:"):
+            errors.append(line)
+
+    cumulative = next((cum for name, _, cum in imports if name == module), None)
+    return {
+        "module": module,
+        "ok": proc.returncode == 0,
+        "error": "\n".join(errors[-5:]) if proc.returncode else None,
+        "cumulative_ms": round(cumulative / 1000, 1) if cumulative is not None else None,
+        "imports": imports,
+    }
+
+
+def find_forbidden(imports: List[Tuple[str, int, int]], forbidden: Tuple[str, ...]) -> List[str]:
+    """금지 패키지(및 하위 모듈) 중 import된 최상위 이름"""
+    loaded = {name.split(".")[0] for name, _, _ in imports}
+    return sorted(name for name in forbidden if name in loaded)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time profile / heavy dependency regression check")
+    parser.add_argument("--module", action="append", help="대상 모듈 (반복 가능, 기본: 내장 대상 목록)")
+    parser.add_argument("--forbid", default=",".join(HEAVY_MODULES), help="--module 사용 시 금지 패키지 (쉼표 구분)")
+    parser.add_argument("--top", type=int, default=10, help="self 시간 상위 N개 모듈 출력")
+    parser.add_argument("--budget-ms", type=float, default=None, help="대상 모듈 누적 import 시간 상한 (ms)")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+
+    if args.module:
+        forbid = tuple(name.strip() for name in args.forbid.split(",") if name.strip())
+        targets = {module: forbid for module in args.module}
+    else:
+        targets = DEFAULT_TARGETS
+
+    report = []
+    failed = False
+    for module, forbidden in targets.items():
+        result = profile_module(module)
+        violations: List[str] = []
+        if not result["ok"]:
+            violations.append("import failed")
+        bad = find_forbidden(result["imports"], forbidden)
+        if bad:
+            violations.append(f"heavy imports: {', '.join(bad)}")
+        budget: Optional[float] = args.budget_ms
+        if budget is not None and result["cumulative_ms"] is not None and result["cumulative_ms"] > budget:
+            violations.append(f"over budget ({result['cumulative_ms']}ms > {budget}ms)")
+        failed = failed or bool(violations)
+
+        top = sorted(result["imports"], key=lambda item: item[1], reverse=True)[:args.top]
+        report.append({
+            "module": module,
+            "cumulative_ms": result["cumulative_ms"],
+            "modules_imported": len(result["imports"]),
+            "violations": violations,
+            "error": result["error"],
+            "top_self_ms": [(name, round(self_us / 1000, 1)) for name, self_us, _ in top],
+        })
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        for entry in report:
+            status = "FAIL" if entry["violations"] else "OK"
+            print(f"[{status}] {entry['module']}: {entry['cumulative_ms']}ms, {entry['modules_imported']} modules")
+            for violation in entry["violations"]:
+                print(f"    ! {violation}")
+            if entry["error"]:
+                print("    " + entry["error"].replace("\n", "\n    "))
+            for name, ms in entry["top_self_ms"]:
+                print(f"    {ms:>8.1f}ms  {name}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,451 @@
+"""
+Eligibility Condition Store
+정책별 자격 조건 사전 파싱 결과 저장소
+
+apply_target 텍스트는 사용자와 무관하게 동일하므로, 적재 시점에 한 번만
+LLM으로 파싱하여 (정책 ID, 원문 해시, 프롬프트 버전) 키로 저장합니다.
+자격 확인 시작 시에는 프로세스 내 캐시 → DB 순으로 조회만 합니다.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from ..config import get_settings
+from ..config.logger import get_logger
+from ..prompts import TEMPLATE_DIR, render_template
+from .question_bank import attach_questions
+
+logger = get_logger()
+
+CONDITION_PROMPT_TEMPLATE = "eligibility_prompt.jinja2"
+CONDITION_SYSTEM_PROMPT = "당신은 정책 자격 조건 분석 전문가입니다. 오직 JSON만 응답합니다."
+
+
+@lru_cache(maxsize=1)
+def get_prompt_version() -> str:
+    """
+    조건 파싱 프롬프트 버전 (템플릿 내용 해시)
+
+    프롬프트가 바뀌면 버전이 바뀌어 기존 파싱 결과는 자동으로 무시됩니다.
+
+    Returns:
+        str: 12자리 버전 문자열
+    """
+    template_path = Path(TEMPLATE_DIR) / CONDITION_PROMPT_TEMPLATE
+    source = template_path.read_bytes() if template_path.exists() else b""
+    return hashlib.sha256(source).hexdigest()[:12]
+
+
+def compute_content_hash(apply_target: str) -> str:
+    """
+    apply_target 원문 해시 (공백 정규화 후 SHA-256)
+
+    Args:
+        apply_target: 신청 대상 텍스트
+
+    Returns:
+        str: 64자리 hex 해시
+    """
+    normalized = " ".join((apply_target or "").split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def parse_apply_target(apply_target: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    apply_target 텍스트를 14대 표준 스키마 조건 리스트로 파싱 (LLM 1회 호출)
+
+    Args:
+        apply_target: 신청 대상 텍스트
+
+    Returns:
+        Tuple[List[Dict], Optional[str]]: (조건 리스트, 추가 요구사항)
+
+    Raises:
+        json.JSONDecodeError: LLM 응답이 JSON이 아닌 경우
+    """
+    # 순환 import 방지 (eligibility_nodes → condition_store)
+    from ..llm import get_openai_client
+    from .nodes.eligibility_nodes import _extract_json_from_llm_response, _safe_json_loads
+
+    prompt = render_template(CONDITION_PROMPT_TEMPLATE, {"apply_target": apply_target})
+
+    llm_client = get_openai_client()
+    response = llm_client.generate(
+        messages=[
+            {"role": "system", "content": CONDITION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
+        temperature=0.0,
+        cache_version=get_prompt_version(),
+    )
+    content = response if isinstance(response, str) else response.content
+
+    parsed = _safe_json_loads(_extract_json_from_llm_response(content))
+
+    conditions: Any = []
+    extra_requirements = None
+
+    # 리스트나 딕셔너리 모두 처리
+    if isinstance(parsed, list):
+        conditions = parsed
+    elif isinstance(parsed, dict):
+        conditions = parsed.get("conditions", [])
+        extra_requirements = parsed.get("extra_requirements", None)
+    else:
+        logger.warning("Parsed JSON is neither list nor dict")
+
+    if not isinstance(conditions, list):
+        conditions = []
+
+    # status/reason 표준 필드 부여
+    valid_conditions = []
+    for c in conditions:
+        if isinstance(c, dict):
+            c["status"] = "UNKNOWN"
+            c["reason"] = None
+            valid_conditions.append(c)
+
+    return valid_conditions, extra_requirements
+
+
+class ConditionStore:
+    """
+    자격 조건 저장소 (프로세스 내 read-through 캐시 + MySQL policy_conditions)
+
+    키: (policy_id, content_hash, prompt_version)
+    """
+
+    def __init__(self):
+        self._cache: Dict[Tuple[int, str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "db_hits": 0, "misses": 0, "parsed": 0}
+
+    @staticmethod
+    def _key(policy_id: int, apply_target: str) -> Tuple[int, str, str]:
+        return (policy_id, compute_content_hash(apply_target), get_prompt_version())
+
+    @staticmethod
+    def _fresh(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """세션이 조건을 제자리 수정하므로 항상 복사본 반환"""
+        return {
+            "conditions": copy.deepcopy(entry["conditions"]),
+            "extra_requirements": entry.get("extra_requirements"),
+        }
+
+    def get(self, policy_id: int, apply_target: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 조건 조회 (메모리 → DB, LLM 호출 없음)
+
+        Args:
+            policy_id: 정책 ID
+            apply_target: 신청 대상 텍스트 (해시 검증용)
+
+        Returns:
+            Optional[Dict]: {"conditions", "extra_requirements"} 또는 None
+        """
+        key = self._key(policy_id, apply_target)
+
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._stats["memory_hits"] += 1
+            return self._fresh(entry)
+
+        entry = self._load_from_db(*key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        self._stats["db_hits"] += 1
+        with self._lock:
+            self._cache[key] = entry
+        return self._fresh(entry)
+
+    def get_many(self, policies: Iterable[Tuple[int, str]]) -> Dict[int, Dict[str, Any]]:
+        """
+        여러 정책의 저장된 조건 일괄 조회 (메모리 미스는 DB 쿼리 1회)
+
+        일괄 판정용 읽기 전용 조회이므로 복사하지 않습니다. 반환값을 수정하지 마세요.
+
+        Args:
+            policies: (policy_id, apply_target) 목록
+
+        Returns:
+            Dict[int, Dict]: policy_id → {"conditions", "extra_requirements"} (저장된 정책만)
+        """
+        result: Dict[int, Dict[str, Any]] = {}
+        missing: Dict[Tuple[int, str], Tuple[int, str, str]] = {}
+
+        for policy_id, apply_target in policies:
+            if not apply_target:
+                continue
+            key = self._key(policy_id, apply_target)
+            entry = self._cache.get(key)
+            if entry is not None:
+                result[policy_id] = entry
+            else:
+                missing[(policy_id, key[1])] = key
+
+        self._stats["memory_hits"] += len(result)
+        if not missing:
+            return result
+
+        loaded = self._load_many_from_db(list(missing.values()))
+        with self._lock:
+            for key in missing.values():
+                entry = loaded.get((key[0], key[1]))
+                if entry is not None:
+                    self._cache[key] = entry
+                    result[key[0]] = entry
+
+        self._stats["db_hits"] += len(loaded)
+        self._stats["misses"] += len(missing) - len(loaded)
+        return result
+
+    def get_or_parse(self, policy_id: int, apply_target: str) -> Dict[str, Any]:
+        """
+        저장된 조건 조회, 없으면 LLM으로 파싱 후 저장 (사전 계산 누락 대비)
+
+        Args:
+            policy_id: 정책 ID
+            apply_target: 신청 대상 텍스트
+
+        Returns:
+            Dict: {"conditions", "extra_requirements"}
+        """
+        stored = self.get(policy_id, apply_target)
+        if stored is not None:
+            return stored
+
+        logger.info(
+            "Eligibility conditions not precomputed, parsing on demand",
+            extra={"policy_id": policy_id}
+        )
+        # 요청 경로에서는 질문을 미리 만들지 않음 (질문 시점에 템플릿 → LLM fallback)
+        conditions, extra_requirements = parse_apply_target(apply_target)
+        self.put(policy_id, apply_target, conditions, extra_requirements)
+        return self._fresh({"conditions": conditions, "extra_requirements": extra_requirements})
+
+    def put(
+        self,
+        policy_id: int,
+        apply_target: str,
+        conditions: List[Dict[str, Any]],
+        extra_requirements: Optional[str]
+    ) -> None:
+        """
+        파싱 결과 저장 (DB upsert + 메모리 캐시)
+
+        Args:
+            policy_id: 정책 ID
+            apply_target: 신청 대상 텍스트
+            conditions: 조건 리스트
+            extra_requirements: 추가 요구사항
+        """
+        from ..db.engine import get_db
+        from ..db.models import PolicyCondition
+
+        policy_id_, content_hash, prompt_version = key = self._key(policy_id, apply_target)
+        if extra_requirements is not None and not isinstance(extra_requirements, str):
+            extra_requirements = json.dumps(extra_requirements, ensure_ascii=False)
+
+        values = {
+            "conditions": conditions,
+            "extra_requirements": extra_requirements,
+            "model": get_settings().openai_model,
+        }
+
+        # 같은 키를 동시에 파싱한 요청이 겹쳐도 unique 제약 위반이 나지 않도록 upsert
+        with get_db() as db:
+            if db.get_bind().dialect.name == "mysql":
+                from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+                stmt = mysql_insert(PolicyCondition).values(
+                    policy_id=policy_id_, content_hash=content_hash, prompt_version=prompt_version, **values
+                )
+                stmt = stmt.on_duplicate_key_update(**{name: stmt.inserted[name] for name in values})
+                db.execute(stmt)
+            else:
+                query = db.query(PolicyCondition).filter(
+                    PolicyCondition.policy_id == policy_id_,
+                    PolicyCondition.content_hash == content_hash,
+                    PolicyCondition.prompt_version == prompt_version
+                )
+                row = query.first()
+                if row is None:
+                    try:
+                        with db.begin_nested():
+                            db.add(PolicyCondition(
+                                policy_id=policy_id_,
+                                content_hash=content_hash,
+                                prompt_version=prompt_version,
+                                **values
+                            ))
+                    except IntegrityError:
+                        # 다른 요청이 먼저 저장 → 그 행을 다시 읽어 갱신
+                        row = query.first()
+                if row is not None:
+                    for name, value in values.items():
+                        setattr(row, name, value)
+
+        self._stats["parsed"] += 1
+        with self._lock:
+            self._cache[key] = {
+                "conditions": copy.deepcopy(conditions),
+                "extra_requirements": extra_requirements,
+            }
+
+    def _load_from_db(self, policy_id: int, content_hash: str, prompt_version: str) -> Optional[Dict[str, Any]]:
+        from ..db.engine import get_db
+        from ..db.models import PolicyCondition
+
+        try:
+            with get_db() as db:
+                row = db.query(PolicyCondition).filter(
+                    PolicyCondition.policy_id == policy_id,
+                    PolicyCondition.content_hash == content_hash,
+                    PolicyCondition.prompt_version == prompt_version
+                ).first()
+                if row is None:
+                    return None
+                return {
+                    "conditions": row.conditions or [],
+                    "extra_requirements": row.extra_requirements,
+                }
+        except Exception as e:
+            logger.warning(
+                "Failed to load eligibility conditions from DB",
+                extra={"policy_id": policy_id, "error": str(e)}
+            )
+            return None
+
+    def _load_many_from_db(self, keys: List[Tuple[int, str, str]]) -> Dict[Tuple[int, str], Dict[str, Any]]:
+        from ..db.engine import get_db
+        from ..db.models import PolicyCondition
+
+        wanted = {(policy_id, content_hash) for policy_id, content_hash, _ in keys}
+        loaded: Dict[Tuple[int, str], Dict[str, Any]] = {}
+
+        try:
+            with get_db() as db:
+                rows = db.query(
+                    PolicyCondition.policy_id,
+                    PolicyCondition.content_hash,
+                    PolicyCondition.conditions,
+                    PolicyCondition.extra_requirements
+                ).filter(
+                    PolicyCondition.policy_id.in_({policy_id for policy_id, _ in wanted}),
+                    PolicyCondition.prompt_version == get_prompt_version()
+                ).all()
+        except Exception as e:
+            logger.warning(
+                "Failed to bulk load eligibility conditions from DB",
+                extra={"policies": len(keys), "error": str(e)}
+            )
+            return loaded
+
+        for policy_id, content_hash, conditions, extra_requirements in rows:
+            if (policy_id, content_hash) in wanted:
+                loaded[(policy_id, content_hash)] = {
+                    "conditions": conditions or [],
+                    "extra_requirements": extra_requirements,
+                }
+        return loaded
+
+    def precompute(
+        self,
+        policies: Iterable[Tuple[int, str, str]],
+        max_workers: int = 4,
+        force: bool = False
+    ) -> Dict[str, int]:
+        """
+        정책별 조건 + 질문 뱅크 일괄 사전 생성 (동시 LLM 호출 수 제한)
+
+        Args:
+            policies: (policy_id, apply_target, policy_name) 목록
+            max_workers: 최대 동시 파싱 수
+            force: 이미 저장된 버전도 다시 파싱
+
+        Returns:
+            Dict: parsed/skipped/failed 개수
+        """
+        candidates = [(pid, text, name) for pid, text, name in policies if text and text.strip()]
+        if force:
+            targets = candidates
+        else:
+            targets = [(pid, text, name) for pid, text, name in candidates if self.get(pid, text) is None]
+
+        result = {"parsed": 0, "skipped": len(candidates) - len(targets), "failed": 0}
+
+        logger.info(
+            "Precomputing eligibility conditions",
+            extra={"policies": len(targets), "max_workers": max_workers, "prompt_version": get_prompt_version()}
+        )
+
+        def _work(policy_id: int, apply_target: str, policy_name: str) -> int:
+            conditions, extra_requirements = parse_apply_target(apply_target)
+            attach_questions(conditions, policy_name=policy_name or "", allow_llm=True)
+            self.put(policy_id, apply_target, conditions, extra_requirements)
+            return len(conditions)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(_work, pid, text, name): pid
+                for pid, text, name in targets
+            }
+            for future in as_completed(futures):
+                policy_id = futures[future]
+                try:
+                    count = future.result()
+                    result["parsed"] += 1
+                    logger.debug(
+                        "Eligibility conditions precomputed",
+                        extra={"policy_id": policy_id, "conditions": count}
+                    )
+                except Exception as e:
+                    result["failed"] += 1
+                    logger.error(
+                        "Failed to precompute eligibility conditions",
+                        extra={"policy_id": policy_id, "error": str(e)}
+                    )
+
+        logger.info("Eligibility condition precompute finished", extra=result)
+        return result
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        조회 통계 (모니터링용)
+
+        Returns:
+            Dict: memory_hits/db_hits/misses/parsed/cached
+        """
+        return {**self._stats, "cached": len(self._cache)}
+
+
+# 싱글톤 인스턴스
+_condition_store_instance: Optional[ConditionStore] = None
+_condition_store_lock = threading.Lock()
+
+
+def get_condition_store() -> ConditionStore:
+    """
+    ConditionStore 싱글톤 인스턴스 반환
+
+    Returns:
+        ConditionStore: 조건 저장소
+    """
+    global _condition_store_instance
+
+    if _condition_store_instance is None:
+        with _condition_store_lock:
+            if _condition_store_instance is None:
+                _condition_store_instance = ConditionStore()
+
+    return _condition_store_instance
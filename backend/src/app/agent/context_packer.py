@@ -0,0 +1,280 @@
+"""
+Context Packer
+토큰 예산 기반 프롬프트 컨텍스트 구성
+
+캐시된 정책 문서 청크를 현재 질문 기준 BM25로 순위화하고,
+오래된 대화 턴은 잘라내어 설정된 토큰 예산 안에서 프롬프트를 채웁니다.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..config import get_settings
+from ..config.logger import get_logger
+from ..vector_store.sparse_search import BM25Index
+
+logger = get_logger()
+
+TRUNCATION_MARK = " …(생략)"
+
+
+# ============================================================
+# Token Counting
+# ============================================================
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """
+    tiktoken 인코딩 로드
+
+    모델명 → cl100k_base 순으로 시도하고, 모두 실패하면 None(문자 수 추정)을 반환합니다.
+    구버전 tiktoken은 신규 모델명(KeyError)이나 o200k_base(ValueError)를 모르므로
+    실패 결과도 캐시해 매 호출마다 다시 조회하지 않습니다.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except (KeyError, ValueError):
+        pass
+
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except (KeyError, ValueError) as e:
+        logger.warning(
+            "tiktoken encoding unavailable, using character estimate",
+            extra={"model": model, "error": str(e)},
+        )
+        return None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    텍스트 토큰 수 계산
+
+    tiktoken이 없으면 보수적으로 추정합니다
+    (한글 등 비ASCII 1자 ≈ 1토큰, ASCII 4자 ≈ 1토큰).
+
+    Args:
+        text: 입력 텍스트
+        model: 모델명 (기본값: settings.openai_model)
+
+    Returns:
+        int: 토큰 수
+    """
+    if not text:
+        return 0
+
+    encoding = _get_encoding(model or get_settings().openai_model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: Optional[str] = None) -> str:
+    """
+    텍스트를 최대 토큰 수에 맞게 자르기
+
+    Args:
+        text: 입력 텍스트
+        max_tokens: 최대 토큰 수
+        model: 모델명
+
+    Returns:
+        str: 잘린 텍스트 (잘린 경우 생략 표시 포함)
+    """
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    encoding = _get_encoding(model or get_settings().openai_model)
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        return encoding.decode(tokens[:max_tokens]) + TRUNCATION_MARK
+
+    # 추정치 기준 이분 탐색
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if count_tokens(text[:mid], model) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + TRUNCATION_MARK
+
+
+# ============================================================
+# Packing
+# ============================================================
+
+@dataclass
+class PackedContext:
+    """토큰 예산에 맞춰 선택된 프롬프트 컨텍스트"""
+    docs: List[Dict[str, Any]] = field(default_factory=list)
+    chat_history: List[Dict[str, Any]] = field(default_factory=list)
+    context_tokens: int = 0
+    dropped_docs: int = 0
+    dropped_turns: int = 0
+    truncated_turns: int = 0
+
+
+class ContextPacker:
+    """
+    토큰 예산 기반 컨텍스트 패커
+
+    1. 대화 이력: 최근 N개 메시지는 원문, 그 이전은 턴별로 잘라서
+       이력 예산(budget * history_ratio) 안에서 최신순으로 채움
+    2. 문서: 질문 기준 BM25 순위로 남은 예산을 채움 (들어가지 않는 청크는 건너뜀)
+
+    Attributes:
+        budget_tokens: 문서 + 대화 이력에 쓸 수 있는 토큰 수
+    """
+
+    def __init__(
+        self,
+        budget_tokens: Optional[int] = None,
+        history_ratio: Optional[float] = None,
+        recent_messages: Optional[int] = None,
+        old_turn_max_tokens: Optional[int] = None,
+        model: Optional[str] = None
+    ):
+        """
+        Initialize packer
+
+        Args:
+            budget_tokens: 컨텍스트 토큰 예산 (기본값: settings.prompt_token_budget)
+            history_ratio: 예산 중 대화 이력 최대 비율
+            recent_messages: 원문 유지할 최근 메시지 수
+            old_turn_max_tokens: 오래된 메시지당 최대 토큰 수
+            model: 토큰 계산 모델명
+        """
+        settings = get_settings()
+        self.budget_tokens = budget_tokens if budget_tokens is not None else settings.prompt_token_budget
+        self.history_ratio = history_ratio if history_ratio is not None else settings.prompt_history_token_ratio
+        self.recent_messages = recent_messages if recent_messages is not None else settings.prompt_recent_messages
+        self.old_turn_max_tokens = (
+            old_turn_max_tokens if old_turn_max_tokens is not None else settings.prompt_old_turn_max_tokens
+        )
+        self.model = model or settings.openai_model
+
+    def pack(
+        self,
+        query: str,
+        docs: Sequence[Dict[str, Any]],
+        chat_history: Sequence[Dict[str, Any]],
+        reserved_tokens: int = 0
+    ) -> PackedContext:
+        """
+        예산 안에서 문서와 대화 이력 선택
+
+        Args:
+            query: 현재 사용자 질문
+            docs: 캐시된 문서 청크
+            chat_history: 전체 대화 이력 (오래된 순)
+            reserved_tokens: 템플릿 고정 부분 등 이미 사용한 토큰 수
+
+        Returns:
+            PackedContext: 선택된 문서/이력과 토큰 수
+        """
+        budget = max(0, self.budget_tokens - reserved_tokens)
+        packed = PackedContext()
+
+        history_tokens = self._pack_history(chat_history, int(budget * self.history_ratio), packed)
+        doc_tokens = self._pack_docs(query, docs, budget - history_tokens, packed)
+        packed.context_tokens = history_tokens + doc_tokens
+
+        return packed
+
+    def _pack_history(
+        self,
+        chat_history: Sequence[Dict[str, Any]],
+        budget: int,
+        packed: PackedContext
+    ) -> int:
+        """최신 메시지부터 이력 예산을 채움 (오래된 메시지는 잘라서 포함)"""
+        used = 0
+        selected: List[Dict[str, Any]] = []
+        total = len(chat_history)
+
+        for age, msg in enumerate(reversed(chat_history)):
+            content = msg.get("content", "") or ""
+            if age >= self.recent_messages:
+                shortened = truncate_to_tokens(content, self.old_turn_max_tokens, self.model)
+                if shortened != content:
+                    packed.truncated_turns += 1
+                    content = shortened
+
+            tokens = count_tokens(content, self.model) + 4  # role 표기 등
+            if used + tokens > budget:
+                break
+
+            used += tokens
+            selected.append({**msg, "content": content} if content != msg.get("content") else msg)
+
+        selected.reverse()
+        packed.chat_history = selected
+        packed.dropped_turns = total - len(selected)
+        return used
+
+    def _pack_docs(
+        self,
+        query: str,
+        docs: Sequence[Dict[str, Any]],
+        budget: int,
+        packed: PackedContext
+    ) -> int:
+        """BM25 순위대로 문서 예산을 채움"""
+        if not docs:
+            return 0
+
+        used = 0
+        selected: List[Dict[str, Any]] = []
+
+        for doc in self._rank_docs(query, docs):
+            tokens = count_tokens(doc.get("content", ""), self.model) + 12  # 문서 헤더
+            if used + tokens <= budget:
+                selected.append(doc)
+                used += tokens
+            elif not selected and budget > 12:
+                # 최상위 문서가 예산보다 크면 잘라서라도 포함
+                content = truncate_to_tokens(doc.get("content", ""), budget - 12, self.model)
+                selected.append({**doc, "content": content})
+                used += count_tokens(content, self.model) + 12
+
+        packed.docs = selected
+        packed.dropped_docs = len(docs) - len(selected)
+        return used
+
+    @staticmethod
+    def _rank_docs(query: str, docs: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        질문 기준 BM25 순위화 (매칭 없는 문서는 원래 순서로 뒤에 배치)
+
+        Args:
+            query: 사용자 질문
+            docs: 문서 청크
+
+        Returns:
+            List[Dict]: 순위화된 문서
+        """
+        if len(docs) <= 1:
+            return list(docs)
+
+        index = BM25Index()
+        # BM25Index는 truthy id가 필요하므로 1부터 부여
+        index.build_index([
+            {"id": idx + 1, "content": doc.get("content", "")}
+            for idx, doc in enumerate(docs)
+        ])
+        ranked_ids = [doc_id for doc_id, _ in index.search(query, top_k=len(docs))]
+
+        seen = set(ranked_ids)
+        order = ranked_ids + [idx + 1 for idx in range(len(docs)) if idx + 1 not in seen]
+        return [docs[doc_id - 1] for doc_id in order]
@@ -0,0 +1,270 @@
+"""
+Batch Eligibility Screening
+여러 정책 일괄 자격 판정 (LLM 없음)
+
+사전 계산된 조건(ConditionStore)을 규칙으로 컴파일한 뒤,
+숫자 범위 조건은 슬롯별로 배열에 모아 numpy로 한 번에 비교하고
+정책 단위 AND/OR 집계도 배열 연산으로 처리합니다.
+"""
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config.logger import get_logger
+from .condition_store import get_condition_store
+from .eligibility_rules import (
+    SLOT_NORMALIZERS,
+    RangeRule,
+    RegionRule,
+    YesNoRule,
+    compile_condition,
+    normalize_regions,
+    normalize_yes_no,
+)
+from .question_bank import TYPE_QUESTION_TEMPLATES, shares_slot_answer
+
+logger = get_logger()
+
+# min/max로 3치 논리를 계산할 수 있도록 FAIL < UNKNOWN < PASS 순서로 인코딩
+FAIL, UNKNOWN, PASS = 0, 1, 2
+STATUS_NAMES = {FAIL: "FAIL", UNKNOWN: "UNKNOWN", PASS: "PASS"}
+
+
+@dataclass
+class ScreeningResult:
+    """정책별 일괄 판정 결과"""
+    policy_id: int
+    policy_name: Optional[str]
+    status: str
+    reason: str
+    missing_slots: List[str] = field(default_factory=list)
+    failed_conditions: List[str] = field(default_factory=list)
+    needs_review: bool = False
+
+
+def normalize_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    사용자 프로필을 슬롯별 정규화 값으로 변환 (요청당 1회)
+
+    Args:
+        profile: 슬롯 키(또는 조건 타입) → 답변
+
+    Returns:
+        Dict[str, Any]: 슬롯 키 → 숫자 / 지역 집합 / bool (정규화 실패 시 원문 유지)
+    """
+    from .nodes.eligibility_nodes import TYPE_TO_SLOT_KEY
+
+    normalized: Dict[str, Any] = {}
+    for key, answer in (profile or {}).items():
+        if answer in (None, ""):
+            continue
+        slot = TYPE_TO_SLOT_KEY.get(key, key)
+        text = str(answer)
+
+        if slot in SLOT_NORMALIZERS:
+            value = SLOT_NORMALIZERS[slot](text)
+        elif slot == "location":
+            value = normalize_regions(text) or None
+        else:
+            value = normalize_yes_no(text)
+        normalized[slot] = value if value is not None else text
+
+    return normalized
+
+
+def _slot_questions() -> Dict[str, str]:
+    from .nodes.eligibility_nodes import TYPE_TO_SLOT_KEY
+    return {TYPE_TO_SLOT_KEY[ctype]: q for ctype, q in TYPE_QUESTION_TEMPLATES.items() if ctype in TYPE_TO_SLOT_KEY}
+
+
+def _evaluate_ranges(
+    codes: np.ndarray,
+    range_rows: Dict[str, List[Tuple[int, RangeRule]]],
+    values: Dict[str, Any]
+) -> None:
+    """슬롯별 숫자 범위 조건을 배열 비교로 일괄 판정 (codes 제자리 갱신)"""
+    for slot, rows in range_rows.items():
+        value = values.get(slot)
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            continue
+
+        idx = np.fromiter((row for row, _ in rows), dtype=np.int64, count=len(rows))
+        low = np.array([-np.inf if r.low is None else r.low for _, r in rows])
+        high = np.array([np.inf if r.high is None else r.high for _, r in rows])
+        low_inc = np.array([r.low_inclusive for _, r in rows])
+        high_inc = np.array([r.high_inclusive for _, r in rows])
+
+        ok = ((value > low) | ((value == low) & low_inc)) & ((value < high) | ((value == high) & high_inc))
+        codes[idx] = np.where(ok, PASS, FAIL)
+
+
+def _evaluate_scalar(rule: Any, value: Any) -> int:
+    """지역/예·아니오 규칙 판정 (정규화된 값 기준)"""
+    if isinstance(rule, RegionRule):
+        if not isinstance(value, frozenset) or len(value) != 1:
+            return UNKNOWN
+        return PASS if value <= rule.regions else FAIL
+    if isinstance(rule, YesNoRule):
+        if not isinstance(value, bool):
+            return UNKNOWN
+        return PASS if value == rule.pass_on_yes else FAIL
+    return UNKNOWN
+
+
+def screen_policies(
+    profile: Dict[str, Any],
+    policies: Sequence[Tuple[int, Optional[str], Optional[str]]]
+) -> List[ScreeningResult]:
+    """
+    여러 정책에 대해 사용자 프로필로 자격 일괄 판정
+
+    Args:
+        profile: 사용자 정보 (슬롯 키 → 답변)
+        policies: (policy_id, policy_name, apply_target) 목록
+
+    Returns:
+        List[ScreeningResult]: 입력 순서대로 정책별 결과
+    """
+    started = time.perf_counter()
+    values = normalize_profile(profile)
+    stored = get_condition_store().get_many((pid, target) for pid, _, target in policies)
+
+    # 1) 조건 평탄화: 행 = (정책, 조건)
+    row_policy: List[int] = []
+    row_is_or: List[bool] = []
+    row_slot: List[Optional[str]] = []
+    row_compiled: List[bool] = []
+    row_names: List[str] = []
+    range_rows: Dict[str, List[Tuple[int, RangeRule]]] = {}
+    scalar_rows: List[Tuple[int, Any]] = []
+
+    for p_idx, (policy_id, _, _) in enumerate(policies):
+        entry = stored.get(policy_id)
+        for condition in (entry or {}).get("conditions") or []:
+            row = len(row_policy)
+            rule = compile_condition(condition)
+            if isinstance(rule, YesNoRule) and not shares_slot_answer(condition):
+                # 조건별 예/아니오 조건은 프로필 플래그 하나로 판정하지 않음 → needs_review
+                rule = None
+            row_policy.append(p_idx)
+            row_is_or.append(condition.get("logic") == "OR")
+            row_slot.append(rule.slot if rule else None)
+            row_compiled.append(rule is not None)
+            row_names.append(condition.get("name") or condition.get("type") or "")
+
+            if isinstance(rule, RangeRule):
+                range_rows.setdefault(rule.slot, []).append((row, rule))
+            elif rule is not None:
+                scalar_rows.append((row, rule))
+
+    # 2) 조건별 판정
+    codes = np.full(len(row_policy), UNKNOWN, dtype=np.int8)
+    _evaluate_ranges(codes, range_rows, values)
+    for row, rule in scalar_rows:
+        codes[row] = _evaluate_scalar(rule, values.get(rule.slot))
+
+    # 3) 정책별 집계: AND는 최솟값, OR 그룹은 최댓값 (OR 조건 없으면 PASS)
+    n = len(policies)
+    policy_idx = np.asarray(row_policy, dtype=np.int64)
+    is_or = np.asarray(row_is_or, dtype=bool)
+
+    and_status = np.full(n, PASS, dtype=np.int8)
+    np.minimum.at(and_status, policy_idx[~is_or], codes[~is_or])
+    or_status = np.full(n, PASS, dtype=np.int8)
+    has_or = np.zeros(n, dtype=bool)
+    has_or[policy_idx[is_or]] = True
+    or_status[has_or] = FAIL
+    np.maximum.at(or_status, policy_idx[is_or], codes[is_or])
+    final = np.minimum(and_status, or_status)
+
+    # 4) 결과 구성 (판정에 영향을 주는 UNKNOWN 조건만 missing 으로 보고)
+    rows_by_policy: Dict[int, List[int]] = {}
+    for row, p_idx in enumerate(row_policy):
+        rows_by_policy.setdefault(p_idx, []).append(row)
+
+    results: List[ScreeningResult] = []
+    for p_idx, (policy_id, policy_name, _) in enumerate(policies):
+        entry = stored.get(policy_id)
+        rows = rows_by_policy.get(p_idx, [])
+
+        if entry is None or not rows:
+            results.append(ScreeningResult(
+                policy_id=policy_id,
+                policy_name=policy_name,
+                status="UNKNOWN",
+                reason="사전 분석된 자격 조건이 없어 개별 자격 확인이 필요합니다.",
+                needs_review=True
+            ))
+            continue
+
+        status = int(final[p_idx])
+        missing: List[str] = []
+        failed: List[str] = []
+        needs_review = False
+
+        for row in rows:
+            code = int(codes[row])
+            if code == FAIL and (not row_is_or[row] or or_status[p_idx] == FAIL):
+                failed.append(row_names[row])
+            elif code == UNKNOWN and status == UNKNOWN:
+                if row_is_or[row] and or_status[p_idx] == PASS:
+                    continue
+                slot = row_slot[row]
+                if row_compiled[row] and slot and slot not in values:
+                    if slot not in missing:
+                        missing.append(slot)
+                else:
+                    needs_review = True
+
+        if status == PASS and entry.get("extra_requirements") not in (None, "", "null", "None"):
+            status = UNKNOWN
+            needs_review = True
+            reason = f"정량 조건은 충족하나, 다음 사항 확인이 필요합니다: {entry['extra_requirements']}"
+        elif status == PASS:
+            reason = "모든 자격 조건을 충족합니다."
+        elif status == FAIL:
+            reason = f"{len(failed)}개의 자격 조건을 충족하지 못합니다."
+        else:
+            reason = "일부 조건은 추가 정보가 필요합니다."
+
+        results.append(ScreeningResult(
+            policy_id=policy_id,
+            policy_name=policy_name,
+            status=STATUS_NAMES[status],
+            reason=reason,
+            missing_slots=missing,
+            failed_conditions=failed,
+            needs_review=needs_review
+        ))
+
+    logger.info(
+        "Batch eligibility screening finished",
+        extra={
+            "policies": n,
+            "conditions": len(row_policy),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+        }
+    )
+    return results
+
+
+def summarize_missing_slots(results: Sequence[ScreeningResult]) -> List[Dict[str, Any]]:
+    """
+    미입력 슬롯을 필요한 정책 수 기준으로 정렬
+
+    Args:
+        results: 정책별 결과
+
+    Returns:
+        List[Dict]: [{"slot", "question", "policy_count"}] (policy_count 내림차순)
+    """
+    counts = Counter(slot for result in results for slot in result.missing_slots)
+    questions = _slot_questions()
+    return [
+        {"slot": slot, "question": questions.get(slot), "policy_count": count}
+        for slot, count in counts.most_common()
+    ]
@@ -0,0 +1,643 @@
+"""
+Eligibility Rule Engine
+자격 조건 규칙 엔진 (LLM 판정 fast path)
+
+파싱된 조건(14대 표준 스키마)을 숫자 범위 / 지역 집합 / 예·아니오 규칙으로
+컴파일하고, 한국어 사용자 답변("만 29세", "서울", "3년차", "3억 5천만원")을
+정규화하여 LLM 없이 PASS/FAIL을 판정합니다.
+규칙으로 판정할 수 없는 자유 형식 조건/답변만 LLM으로 넘깁니다.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Union
+
+from ..config.logger import get_logger
+
+logger = get_logger()
+
+# 예비창업자(아직 사업자 등록 전)는 업력 -1년으로 표현
+PRE_STARTUP_YEARS = -1.0
+
+Judgement = Tuple[str, str]
+
+
+# ============================================================
+# Region Normalization
+# ============================================================
+
+REGION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "서울": ("서울특별시", "서울시", "서울"),
+    "부산": ("부산광역시", "부산시", "부산"),
+    "대구": ("대구광역시", "대구시", "대구"),
+    "인천": ("인천광역시", "인천시", "인천"),
+    "광주": ("광주광역시", "광주시", "광주"),
+    "대전": ("대전광역시", "대전시", "대전"),
+    "울산": ("울산광역시", "울산시", "울산"),
+    "세종": ("세종특별자치시", "세종시", "세종"),
+    "경기": ("경기도", "경기"),
+    "강원": ("강원특별자치도", "강원도", "강원"),
+    "충북": ("충청북도", "충북"),
+    "충남": ("충청남도", "충남"),
+    "전북": ("전북특별자치도", "전라북도", "전북"),
+    "전남": ("전라남도", "전남"),
+    "경북": ("경상북도", "경북"),
+    "경남": ("경상남도", "경남"),
+    "제주": ("제주특별자치도", "제주도", "제주"),
+}
+ALL_REGIONS: FrozenSet[str] = frozenset(REGION_ALIASES)
+CAPITAL_AREA: FrozenSet[str] = frozenset({"서울", "경기", "인천"})
+
+# 긴 별칭부터 매칭 (예: "서울특별시"가 "서울"보다 먼저)
+_REGION_PATTERN = re.compile(
+    "|".join(
+        sorted(
+            (re.escape(alias) for aliases in REGION_ALIASES.values() for alias in aliases),
+            key=len,
+            reverse=True
+        )
+    )
+)
+_ALIAS_TO_REGION = {alias: region for region, aliases in REGION_ALIASES.items() for alias in aliases}
+# 시·도 이하 행정구역 (구/군 단위 조건은 규칙으로 판정하지 않음)
+_SUB_REGION_PATTERN = re.compile(r"[가-힣]{1,5}(?:구|군)(?![가-힣])")
+
+
+def normalize_regions(text: str) -> FrozenSet[str]:
+    """
+    텍스트에서 시·도 단위 지역 추출
+
+    Args:
+        text: 입력 텍스트 (예: "서울 강남구", "수도권 외 지역")
+
+    Returns:
+        FrozenSet[str]: 표준 시·도 약칭 집합
+    """
+    if not text:
+        return frozenset()
+    if "비수도권" in text or "수도권 외" in text or "수도권 제외" in text:
+        return ALL_REGIONS - CAPITAL_AREA
+    regions = {_ALIAS_TO_REGION[m.group(0)] for m in _REGION_PATTERN.finditer(text)}
+    if "수도권" in text:
+        regions |= CAPITAL_AREA
+    if "전국" in text:
+        regions |= ALL_REGIONS
+    return frozenset(regions)
+
+
+# ============================================================
+# Korean Numeric / Date Normalization
+# ============================================================
+
+_BIG_UNITS = {"조": 10 ** 12, "억": 10 ** 8, "만": 10 ** 4}
+_SMALL_UNITS = {"천": 1000, "백": 100, "십": 10}
+# "1억2천"처럼 천/백/십 꼬리 뒤에 생략된 큰 단위
+_ELIDED_UNIT = {"조": "억", "억": "만"}
+_AMOUNT_TOKEN = re.compile(r"\d+(?:\.\d+)?|[조억만천백십]")
+
+
+def parse_korean_amount(text: str) -> Optional[float]:
+    """
+    한국어 단위가 섞인 숫자 파싱
+
+    큰 단위 뒤에 붙은 천/백/십 단위 꼬리는 한 단계 아래 큰 단위가 생략된 것으로 봅니다
+    ("1억2천" = 1억 2천만).
+
+    Examples:
+        "3억 5천만원" → 350000000, "1,200만원" → 12000000, "2.5억" → 250000000,
+        "1억2천" → 120000000
+
+    Args:
+        text: 입력 텍스트
+
+    Returns:
+        Optional[float]: 값 (숫자가 없으면 None)
+    """
+    tokens = _AMOUNT_TOKEN.findall((text or "").replace(",", ""))
+    if not any(t[0].isdigit() for t in tokens):
+        return None
+
+    total = 0.0
+    small = 0.0
+    num: Optional[float] = None
+    last_big: Optional[str] = None
+    has_small_unit = False
+    for token in tokens:
+        if token[0].isdigit():
+            if num is not None:
+                small += num
+            num = float(token)
+        elif token in _SMALL_UNITS:
+            small += (num if num is not None else 1) * _SMALL_UNITS[token]
+            num = None
+            has_small_unit = True
+        else:
+            segment = small + (num or 0)
+            total += (segment or 1) * _BIG_UNITS[token]
+            small, num = 0.0, None
+            last_big = token
+            has_small_unit = False
+
+    tail = small + (num or 0)
+    if has_small_unit and last_big in _ELIDED_UNIT:
+        tail *= _BIG_UNITS[_ELIDED_UNIT[last_big]]
+    return total + tail
+
+
+# 답변 전체가 "매출 없음"/"0원"을 뜻할 때만 0 (예: "100000000원"의 끝 "0원"은 해당 없음)
+_NO_MONEY_ANSWER = re.compile(
+    r"^(?:아직\s*)?(?:(?:연\s*)?(?:매출|수입|소득)액?\s*[은는이가]?\s*)?(?:없\S*|0\s*원?)[.!~\s]*$"
+)
+
+# 숫자+단위 묶음이 이어지는 금액 전체 (예: "3억 5천만원", "1억2천")
+_MONEY_ANSWER = re.compile(r"(?:\d[\d,.]*\s*[조억천백십만]*\s*)+원?")
+
+
+def normalize_money(text: str) -> Optional[float]:
+    """
+    금액 답변 정규화 (원 단위)
+
+    단위(조/억/만/원)가 없는 단순 숫자는 모호하므로 None.
+
+    Args:
+        text: 사용자 답변 (예: "3억", "매출 없음")
+
+    Returns:
+        Optional[float]: 금액 (원)
+    """
+    text = (text or "").strip()
+    if _NO_MONEY_ANSWER.match(text):
+        return 0.0
+    match = _MONEY_ANSWER.search(text)
+    if not match or not re.search(r"[조억만원]", match.group(0)):
+        return None
+    return parse_korean_amount(match.group(0))
+
+
+def normalize_age(text: str) -> Optional[float]:
+    """
+    나이 답변 정규화
+
+    Examples:
+        "만 29세" → 29, "29살" → 29, "1995년생" → (올해 - 1995)
+
+    Args:
+        text: 사용자 답변
+
+    Returns:
+        Optional[float]: 나이
+    """
+    text = (text or "").strip()
+    born = re.search(r"((?:19|20)\d{2})\s*년\s*생", text)
+    if born:
+        return float(date.today().year - int(born.group(1)))
+    match = re.search(r"(\d{1,3})\s*(?:세|살)", text) or re.fullmatch(r"(?:만\s*)?(\d{1,3})", text)
+    if match:
+        return float(match.group(1))
+    return None
+
+
+_DATE_ANSWER = re.compile(r"((?:19|20)\d{2})\s*(?:년|[.\-/])\s*(\d{1,2})?")
+
+
+def _years_since(year: int, month: Optional[int], today: Optional[date] = None) -> float:
+    today = today or date.today()
+    months = (today.year - year) * 12 + (today.month - (month or 1))
+    return max(0.0, months / 12)
+
+
+def normalize_business_years(text: str) -> Optional[float]:
+    """
+    업력 답변 정규화 (년)
+
+    Examples:
+        "3년" → 3, "3년 6개월" → 3.5, "3년차" → 2.5, "18개월" → 1.5,
+        "2021년 3월 창업" → 경과 연수, "예비창업자" → -1
+
+    Args:
+        text: 사용자 답변
+
+    Returns:
+        Optional[float]: 업력 (예비창업자는 PRE_STARTUP_YEARS)
+    """
+    text = (text or "").strip()
+    if re.search(r"예비|창업\s*전|아직|미등록|등록\s*(안|하지)", text):
+        return PRE_STARTUP_YEARS
+
+    # 연도(4자리)가 있으면 설립 시점으로 보고 경과 연수 계산
+    dated = _DATE_ANSWER.search(text)
+    if dated:
+        return _years_since(int(dated.group(1)), int(dated.group(2)) if dated.group(2) else None)
+
+    nth = re.search(r"(\d{1,2})\s*년\s*차", text)
+    if nth:
+        return max(0.0, int(nth.group(1)) - 0.5)
+
+    years = re.search(r"(\d{1,2}(?:\.\d+)?)\s*년", text)
+    months = re.search(r"(\d{1,3})\s*개월", text)
+    if years or months:
+        return (float(years.group(1)) if years else 0.0) + (int(months.group(1)) / 12 if months else 0.0)
+
+    if re.fullmatch(r"\d{1,2}(?:\.\d+)?", text):
+        return float(text)
+    return None
+
+
+def normalize_count(text: str) -> Optional[float]:
+    """
+    인원 답변 정규화
+
+    Args:
+        text: 사용자 답변 (예: "5명", "직원 없음")
+
+    Returns:
+        Optional[float]: 인원 수
+    """
+    text = (text or "").strip()
+    match = re.search(r"(\d{1,6})\s*(?:명|인)", text) or re.fullmatch(r"(\d{1,6})", text)
+    if match:
+        return float(match.group(1))
+    if re.search(r"(직원|근로자|인원)?\s*없", text):
+        return 0.0
+    return None
+
+
+_YES = re.compile(r"^(예|네|넵|응|그렇습니다|맞습니다|맞아요|해당(됩니다|합니다|돼요|해요)?|있습니다|있어요|있음)[.!~ ]*$")
+_NO = re.compile(r"^(아니(요|오|에요)?|아뇨|없습니다|없어요|없음|해당\s*(없|안)[가-힣]*|아닙니다)[.!~ ]*$")
+
+
+def normalize_yes_no(text: str) -> Optional[bool]:
+    """
+    예/아니오 답변 정규화 (명확한 단답만 인정)
+
+    Args:
+        text: 사용자 답변
+
+    Returns:
+        Optional[bool]: True(예) / False(아니오) / None(자유 형식)
+    """
+    text = (text or "").strip()
+    if _NO.match(text):
+        return False
+    if _YES.match(text):
+        return True
+    return None
+
+
+SLOT_NORMALIZERS = {
+    "age": normalize_age,
+    "business_age": normalize_business_years,
+    "financial_status": normalize_money,
+    "employment_status": normalize_count,
+}
+
+
+# ============================================================
+# Compiled Rules
+# ============================================================
+
+@dataclass(frozen=True)
+class RangeRule:
+    """숫자 범위 규칙 (나이, 업력, 매출, 인원)"""
+    slot: str
+    low: Optional[float] = None
+    high: Optional[float] = None
+    low_inclusive: bool = True
+    high_inclusive: bool = True
+    label: str = ""
+
+    kind = "range"
+
+    def check_value(self, value: float) -> bool:
+        """정규화된 값이 범위에 들어가는지"""
+        if self.low is not None and (value < self.low or (value == self.low and not self.low_inclusive)):
+            return False
+        if self.high is not None and (value > self.high or (value == self.high and not self.high_inclusive)):
+            return False
+        return True
+
+    def evaluate(self, answer: str) -> Optional[Judgement]:
+        value = SLOT_NORMALIZERS[self.slot](answer)
+        if value is None:
+            return None
+        shown = "예비창업자" if self.slot == "business_age" and value == PRE_STARTUP_YEARS else answer
+        if self.check_value(value):
+            return "PASS", f"규칙 판정: '{shown}'은(는) 조건({self.label})을 충족합니다."
+        return "FAIL", f"규칙 판정: '{shown}'은(는) 조건({self.label})을 충족하지 않습니다."
+
+
+@dataclass(frozen=True)
+class RegionRule:
+    """지역 집합 규칙"""
+    slot: str
+    regions: FrozenSet[str]
+    label: str = ""
+
+    kind = "region"
+
+    def evaluate(self, answer: str) -> Optional[Judgement]:
+        user_regions = normalize_regions(answer)
+        if len(user_regions) != 1:
+            return None
+        region = next(iter(user_regions))
+        if region in self.regions:
+            return "PASS", f"규칙 판정: 소재지 '{region}'은(는) 조건({self.label})에 해당합니다."
+        return "FAIL", f"규칙 판정: 소재지 '{region}'은(는) 조건({self.label})에 해당하지 않습니다."
+
+
+@dataclass(frozen=True)
+class YesNoRule:
+    """예/아니오 규칙 (pass_on_yes=False면 '아니오'가 충족, 예: 체납 여부)"""
+    slot: str
+    pass_on_yes: bool = True
+    label: str = ""
+
+    kind = "yes_no"
+
+    def evaluate(self, answer: str) -> Optional[Judgement]:
+        yes = normalize_yes_no(answer)
+        if yes is None:
+            return None
+        if yes == self.pass_on_yes:
+            return "PASS", f"규칙 판정: '{answer}' 답변으로 조건({self.label})을 충족합니다."
+        return "FAIL", f"규칙 판정: '{answer}' 답변으로 조건({self.label})을 충족하지 않습니다."
+
+
+Rule = Union[RangeRule, RegionRule, YesNoRule]
+
+
+# ============================================================
+# Condition Compiler
+# ============================================================
+
+_OPS = r"(?P<op>이상|이하|미만|초과|이내|까지|부터|넘는|안\s*된|미만인)?"
+_RANGE_SEP = re.compile(r"^\s*(?:~|-|–|〜|에서|부터)\s*$")
+_SHORT_RANGE = re.compile(
+    r"(?P<a>\d{1,3}(?:\.\d+)?)\s*[~\-–〜]\s*(?P<b>\d{1,3}(?:\.\d+)?)\s*(?P<unit>세|살|년|개월|명|인)"
+)
+_QUANTITY_PATTERNS = {
+    "age": re.compile(r"(?:만\s*)?(?P<q>\d{1,3})\s*(?:세|살)\s*" + _OPS),
+    "business_age": re.compile(r"(?P<q>\d{1,2}(?:\.\d+)?)\s*(?P<unit>년|개월)\s*" + _OPS),
+    "employment_status": re.compile(r"(?P<q>\d{1,6})\s*(?:명|인)\s*" + _OPS),
+    "financial_status": re.compile(r"(?P<q>\d[\d,\.]*\s*(?:[조억천백십만]\s*)+원?|\d[\d,]*\s*원)\s*" + _OPS),
+}
+_LOWER_OPS = {"이상": True, "부터": True, "초과": False, "넘는": False}
+_UPPER_OPS = {"이하": True, "이내": True, "까지": True, "미만": False, "미만인": False, "안된": False}
+# 규칙으로 다루면 위험한 표현 (예외/복합 조건)
+_UNSAFE_MARKERS = re.compile(r"제외|단[,\s]|다만|경우에\s*한|포함하지|불가|가산|입주|투자|겸직")
+
+# 매칭된 숫자/지역 외에 남아도 되는 단어 (그 밖의 단어가 남으면 추가 조건으로 보고 LLM 판정)
+_COMMON_FILLER = frozenset({
+    "만", "연", "연간", "최근", "현재", "기준", "대상", "해당", "및", "또는", "에서", "부터",
+    "이상", "이하", "미만", "초과", "이내", "까지", "자", "인", "기업", "사업자", "신청", "신청일",
+    "공고일", "신청자", "대표", "대표자",
+})
+_SLOT_FILLER = {
+    "age": frozenset({"나이", "연령", "청년", "중장년", "본인"}),
+    "business_age": frozenset({
+        "업력", "창업", "창업자", "창업기업", "예비", "예비창업자", "설립", "개업", "사업", "경과",
+        "개시", "초기",
+    }),
+    "financial_status": frozenset({"매출", "매출액", "연매출", "수입", "소득", "규모", "약"}),
+    "employment_status": frozenset({"직원", "근로자", "상시", "상시근로자", "고용", "인원", "종업원", "수"}),
+    "location": frozenset({
+        "소재", "소재지", "지역", "거주", "거주자", "주소", "주소지", "사업장", "본사", "본점", "내",
+        "외", "전국", "수도권", "비수도권", "지방",
+    }),
+}
+_JOSA = ("으로", "에서", "은", "는", "이", "가", "의", "을", "를", "에", "로", "인")
+
+# 체납/연체 여부를 묻는 납세·신용 조건 (예/아니오 답변의 극성이 고정된 유일한 Compliance 조건)
+_ARREARS_MARKERS = re.compile(r"체납|연체|미납")
+
+YES_NO_TYPES = {
+    "Business Type", "Experience", "Tech & Innovation", "Individual Traits",
+    "Business Objective", "Collaboration", "Legal & Social", "business_status",
+}
+
+
+def _quantity_value(slot: str, match: "re.Match") -> float:
+    raw = match.group("q")
+    if slot == "financial_status":
+        return parse_korean_amount(raw) or 0.0
+    value = float(raw.replace(",", ""))
+    if slot == "business_age" and match.group("unit") == "개월":
+        value /= 12
+    return value
+
+
+def _compile_range(slot: str, text: str) -> Optional[RangeRule]:
+    """텍스트에서 숫자 범위 추출"""
+    short = _SHORT_RANGE.search(text) if slot != "financial_status" else None
+    if short:
+        # "19~34세" 처럼 단위가 뒤에만 붙은 범위
+        scale = 1 / 12 if short.group("unit") == "개월" else 1
+        return RangeRule(
+            slot=slot, low=float(short.group("a")) * scale, high=float(short.group("b")) * scale,
+            label=text.strip()
+        )
+
+    matches = list(_QUANTITY_PATTERNS[slot].finditer(text))
+    if not matches:
+        return None
+
+    low = high = None
+    low_inc = high_inc = True
+    range_open = False
+
+    for i, match in enumerate(matches):
+        value = _quantity_value(slot, match)
+        op = (match.group("op") or "").replace(" ", "")
+        if op in _LOWER_OPS:
+            low, low_inc = value, _LOWER_OPS[op]
+        elif op in _UPPER_OPS:
+            high, high_inc = value, _UPPER_OPS[op]
+        elif i + 1 < len(matches) and _RANGE_SEP.match(text[match.end():matches[i + 1].start()]):
+            # "19세 ~ 39세" 의 시작값
+            low, low_inc = value, True
+            range_open = True
+            continue
+        elif range_open:
+            high, high_inc = value, True
+        else:
+            # 비교 표현 없는 단독 숫자 (예: "39세 청년")는 의미가 모호
+            return None
+        range_open = False
+
+    if low is None and high is None:
+        return None
+    return RangeRule(slot=slot, low=low, high=high, low_inclusive=low_inc, high_inclusive=high_inc, label=text.strip())
+
+
+def _compile_business_age(text: str) -> Optional[RangeRule]:
+    """업력 조건 컴파일 (예비창업자 허용 여부 포함)"""
+    allows_pre = "예비" in text
+    rule = _compile_range("business_age", text)
+
+    if rule is None:
+        if allows_pre and not re.search(r"\d", text):
+            # 예비창업자만 해당
+            return RangeRule(slot="business_age", high=PRE_STARTUP_YEARS, label=text.strip())
+        return None
+
+    if allows_pre:
+        # 예비창업자 또는 N년 이내 → 하한 제거
+        return RangeRule(
+            slot="business_age", low=None, high=rule.high,
+            high_inclusive=rule.high_inclusive, label=rule.label
+        )
+    if rule.low is None:
+        # 창업기업 대상 → 예비창업자 제외
+        return RangeRule(
+            slot="business_age", low=0.0, high=rule.high,
+            high_inclusive=rule.high_inclusive, label=rule.label
+        )
+    return rule
+
+
+def is_arrears_condition(text: str) -> bool:
+    """
+    체납/연체/미납 여부 조건인지
+
+    Args:
+        text: 조건 값 또는 설명
+
+    Returns:
+        bool: 체납 관련 조건 여부
+    """
+    return bool(_ARREARS_MARKERS.search(text or ""))
+
+
+def _is_filler(word: str, fillers: FrozenSet[str]) -> bool:
+    if word in fillers:
+        return True
+    return any(word.endswith(josa) and word[:-len(josa)] in fillers for josa in _JOSA)
+
+
+def _leftover_is_filler(slot: str, text: str) -> bool:
+    """숫자/지역 매칭을 뺀 나머지가 알려진 수식어뿐인지 (예: "부산 소재 센터 입주기업" → False)"""
+    if slot == "location":
+        remainder = _REGION_PATTERN.sub(" ", text)
+    else:
+        remainder = _QUANTITY_PATTERNS[slot].sub(" ", _SHORT_RANGE.sub(" ", text))
+    fillers = _COMMON_FILLER | _SLOT_FILLER[slot]
+    return all(_is_filler(word, fillers) for word in re.findall(r"[가-힣A-Za-z]+", remainder))
+
+
+@lru_cache(maxsize=4096)
+def _compile(ctype: str, value: str, description: str) -> Optional[Rule]:
+    from .nodes.eligibility_nodes import TYPE_TO_SLOT_KEY
+
+    slot = TYPE_TO_SLOT_KEY.get(ctype)
+    if not slot:
+        return None
+
+    # 예외/복합 조건은 value만 깔끔해도 description까지 보고 LLM으로 넘김
+    if any(_UNSAFE_MARKERS.search(text or "") for text in (value, description)):
+        return None
+
+    for text in (value, description):
+        text = (text or "").strip()
+        if not text:
+            continue
+        if slot in _SLOT_FILLER and not _leftover_is_filler(slot, text):
+            continue
+
+        if slot == "business_age":
+            rule = _compile_business_age(text)
+        elif slot in _QUANTITY_PATTERNS:
+            rule = _compile_range(slot, text)
+        elif slot == "location":
+            regions = normalize_regions(text)
+            remainder = _REGION_PATTERN.sub("", text)
+            rule = RegionRule(slot=slot, regions=regions, label=text) if regions and not _SUB_REGION_PATTERN.search(remainder) else None
+        elif slot == "compliance_tax":
+            # "체납 사실이 있나요?"에 '아니오'가 충족인 조건만 (4대보험 가입, 완납 증명 등은 LLM 판정)
+            rule = YesNoRule(slot=slot, pass_on_yes=False, label=text) if is_arrears_condition(text) else None
+        elif ctype in YES_NO_TYPES:
+            rule = YesNoRule(slot=slot, pass_on_yes=True, label=text)
+        else:
+            rule = None
+
+        if rule is not None:
+            return rule
+
+    return None
+
+
+def compile_condition(condition: Dict[str, Any]) -> Optional[Rule]:
+    """
+    파싱된 조건을 규칙으로 컴파일 (결과는 캐시됨)
+
+    Args:
+        condition: 조건 (type, value, description)
+
+    Returns:
+        Optional[Rule]: 규칙 (자유 형식 조건이면 None → LLM 판정)
+    """
+    return _compile(
+        condition.get("type") or "",
+        str(condition.get("value") or ""),
+        str(condition.get("description") or "")
+    )
+
+
+# ============================================================
+# Evaluation + Metrics
+# ============================================================
+
+_stats_lock = threading.Lock()
+_judge_stats: Dict[str, int] = {"rule": 0, "llm": 0}
+
+
+def judge_with_rules(condition: Dict[str, Any], user_answer: str) -> Optional[Judgement]:
+    """
+    규칙 엔진으로 판정
+
+    Args:
+        condition: 조건
+        user_answer: 사용자 답변
+
+    Returns:
+        Optional[Tuple[str, str]]: (status, reason) 또는 None (LLM 필요)
+    """
+    rule = compile_condition(condition)
+    if rule is None:
+        return None
+    try:
+        return rule.evaluate(user_answer)
+    except Exception as e:
+        logger.warning(
+            "Rule evaluation failed",
+            extra={"condition": condition.get("name"), "error": str(e)}
+        )
+        return None
+
+
+def record_judge_source(source: str) -> None:
+    """
+    판정 경로 카운트 증가
+
+    Args:
+        source: "rule" | "llm"
+    """
+    with _stats_lock:
+        _judge_stats[source] = _judge_stats.get(source, 0) + 1
+
+
+def get_judge_stats() -> Dict[str, Any]:
+    """
+    규칙/LLM 판정 비율 (모니터링용)
+
+    Returns:
+        Dict: rule/llm/total/rule_rate
+    """
+    with _stats_lock:
+        stats = dict(_judge_stats)
+    total = stats["rule"] + stats["llm"]
+    stats["total"] = total
+    stats["rule_rate"] = round(stats["rule"] / total, 4) if total else 0.0
+    return stats
@@ -8,13 +8,15 @@ from jinja2 import Template
 from pathlib import Path
 
 from ...config.logger import get_logger
-from ...observability import trace_llm_call
+from ...observability import trace_llm_call, timed
+from ...observability.metrics import GRAPH_NODE_SECONDS
 from ...llm import get_openai_client
 
 logger = get_logger()
 
 
 @trace_llm_call(name="generate_answer_with_docs", tags=["node", "llm", "answer", "docs_only"])
+@timed(GRAPH_NODE_SECONDS, node="generate_answer_with_docs")
 def generate_answer_with_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     문서만으로 답변 생성 (웹 검색 없음)
@@ -103,6 +105,7 @@ def generate_answer_with_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
 
 
 @trace_llm_call(name="generate_answer_web_only", tags=["node", "llm", "answer", "web_only"])
+@timed(GRAPH_NODE_SECONDS, node="generate_answer_web_only")
 def generate_answer_web_only_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     웹 검색 결과만으로 답변 생성 (링크 중심)
@@ -186,6 +189,7 @@ def generate_answer_web_only_node(state: Dict[str, Any]) -> Dict[str, Any]:
 
 
 @trace_llm_call(name="generate_answer_hybrid", tags=["node", "llm", "answer", "hybrid"])
+@timed(GRAPH_NODE_SECONDS, node="generate_answer_hybrid")
 def generate_answer_hybrid_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     문서 + 웹 검색 결합 답변 생성
@@ -3,14 +3,60 @@ Check Sufficiency Node
 검색된 문서의 충분성 판단
 """
 
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Set
+from ...config import get_settings
 from ...config.logger import get_logger
-from ...observability import trace_workflow
+from ...observability import trace_workflow, timed
+from ...observability.metrics import GRAPH_NODE_SECONDS
+from ...vector_store.sparse_search import KoreanTokenizer
 
 logger = get_logger()
+settings = get_settings()
+
+
+def _char_bigrams(tokens: List[str]) -> Set[str]:
+    """토큰별 문자 bigram 집합 (조사가 붙은 한국어 어절도 매칭되도록)"""
+    bigrams = set()
+    for token in tokens:
+        if len(token) < 2:
+            continue
+        bigrams.update(token[i:i + 2] for i in range(len(token) - 1))
+    return bigrams
+
+
+@lru_cache(maxsize=2048)
+def _content_bigrams(content: str) -> FrozenSet[str]:
+    """문서 본문 bigram (캐시 문서는 질문마다 같으므로 본문 기준으로 메모이즈)"""
+    return frozenset(_char_bigrams(KoreanTokenizer.tokenize(content)))
+
+
+def compute_query_coverage(query: str, docs: List[Dict[str, Any]]) -> float:
+    """
+    질문 문자 bigram 중 문서에 등장하는 비율
+    
+    캐시 문서는 score가 모두 1.0이므로, 질문 내용이 실제로
+    문서에 담겨 있는지를 보는 보조 지표로 사용합니다.
+    
+    Args:
+        query: 사용자 질문
+        docs: 문서 리스트
+    
+    Returns:
+        float: 0.0 ~ 1.0 (질문 bigram이 없으면 1.0)
+    """
+    query_bigrams = _char_bigrams(KoreanTokenizer.tokenize(query))
+    if not query_bigrams:
+        return 1.0
+    
+    doc_bigrams = [_content_bigrams(doc.get("content") or "") for doc in docs]
+    covered = sum(1 for bigram in query_bigrams if any(bigram in bigrams for bigrams in doc_bigrams))
+    
+    return covered / len(query_bigrams)
 
 
 @trace_workflow(name="check_sufficiency", tags=["node", "check"])
+@timed(GRAPH_NODE_SECONDS, node="check_sufficiency")
 def check_sufficiency_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     검색된 문서의 충분성 판단
@@ -19,6 +65,9 @@ def check_sufficiency_node(state: Dict[str, Any]) -> Dict[str, Any]:
     1. 검색된 문서가 2개 이상
     2. 평균 스코어가 0.75 이상
     
+    충분하더라도 평균 스코어가 경계 구간이거나 질문 커버리지가 낮으면
+    web_search_borderline=True로 표시 (스트리밍 컨트롤러의 예측 웹 검색용)
+    
     Args:
         state: 현재 상태
     
@@ -71,17 +120,26 @@ def check_sufficiency_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 "need_web_search": True
             }
         
+        query_coverage = compute_query_coverage(state.get("current_query", ""), retrieved_docs)
+        borderline = (
+            avg_score < settings.sufficiency_borderline_score
+            or query_coverage < settings.sufficiency_min_query_coverage
+        )
+        
         logger.info(
             "Documents sufficient",
             extra={
                 "count": len(retrieved_docs),
-                "avg_score": avg_score
+                "avg_score": avg_score,
+                "query_coverage": round(query_coverage, 3),
+                "borderline": borderline
             }
         )
         
         return {
             **state,
-            "need_web_search": False
+            "need_web_search": False,
+            "web_search_borderline": borderline
         }
         
     except Exception as e:
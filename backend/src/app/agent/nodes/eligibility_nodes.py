@@ -1,3 +1,4 @@
+import hashlib
 import json
 import re
 from typing import Dict, Any, Optional, Tuple, List
@@ -5,10 +6,18 @@ from jinja2 import Template
 from pathlib import Path
 
 from ...config.logger import get_logger
-from ...observability import trace_workflow, trace_llm_call
+from ...observability import trace_workflow
 from ...llm import get_openai_client
 from ...db.engine import get_db
 from ...db.models import Policy
+from ..condition_store import get_condition_store
+from ..question_bank import (
+    template_question,
+    generate_question_with_llm,
+    record_question_source,
+    shares_slot_answer,
+)
+from ..eligibility_rules import compile_condition, judge_with_rules, record_judge_source
 
 logger = get_logger()
 
@@ -128,34 +137,65 @@ def _judge_with_llm(condition: Dict[str, Any], user_answer: str) -> Tuple[str, s
         logger.error(f"LLM judgment failed: {e}", exc_info=True)
         return "UNKNOWN", f"LLM 판정 중 오류 발생: {str(e)}"
 
-def _judge_with_slot(condition: Dict[str, Any], user_slots: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+def condition_answer_key(condition: Dict[str, Any]) -> str:
     """
-    condition + user_slots -> PASS/UNKNOWN/FAIL 판정 (LLM 기반)
+    조건 답변을 저장할 user_slots 키
+
+    타입 공통 슬롯 질문으로 물은 조건은 슬롯 키("age", "location" ...)를 공유하고,
+    조건별 질문으로 물은 조건은 조건 내용 해시를 붙인 키("business_type#…")를 사용합니다.
+    (한 Business Type 조건에 한 '예'가 다른 조건/정책까지 통과시키지 않도록)
     """
     ctype = condition.get("type")
-    
-    # slot_key 찾기
-    slot_key = TYPE_TO_SLOT_KEY.get(ctype)
-    if not slot_key:
-        slot_key = ctype or condition.get("name") or "unknown"
+    slot_key = TYPE_TO_SLOT_KEY.get(ctype) or (ctype or condition.get("name") or "unknown")
+    if shares_slot_answer(condition):
+        return slot_key
+
+    fingerprint = "|".join(
+        str(condition.get(field) or "") for field in ("type", "name", "value", "description")
+    )
+    return f"{slot_key}#{hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()[:12]}"
+
+
+def _judge_with_slot(condition: Dict[str, Any], user_slots: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    """
+    condition + user_slots -> PASS/UNKNOWN/FAIL 판정
+
+    숫자 범위/지역/예·아니오로 컴파일되는 조건은 규칙 엔진으로 즉시 판정하고,
+    자유 형식 조건이나 정규화할 수 없는 답변만 LLM으로 판정합니다.
+    예/아니오 규칙은 결정적 템플릿 질문으로 물은 조건에만 적용합니다
+    (정책별/LLM 질문은 부정형일 수 있어 '예'의 의미가 고정되지 않음).
+    """
+    answer_key = condition_answer_key(condition)
 
     # 사용자 답변이 없으면 UNKNOWN
-    if slot_key not in user_slots or user_slots.get(slot_key) in (None, ""):
+    if user_slots.get(answer_key) in (None, ""):
         return "UNKNOWN", None
 
-    user_answer = str(user_slots.get(slot_key))
+    user_answer = str(user_slots.get(answer_key))
+
+    # 규칙 엔진 (fast path)
+    rule = compile_condition(condition)
+    if rule is not None and (rule.kind != "yes_no" or template_question(condition) is not None):
+        judged = judge_with_rules(condition, user_answer)
+        if judged is not None:
+            record_judge_source("rule")
+            return judged
 
     # LLM으로 판정
+    record_judge_source("llm")
     status, reason = _judge_with_llm(condition, user_answer)
     return status, reason
 
 # =========================================================
-# 1) Node: parse_conditions_node (LLM 호출 + 파싱)
+# 1) Node: parse_conditions_node (사전 파싱 조건 조회)
 # =========================================================
-@trace_llm_call(name="parse_conditions", tags=["eligibility", "parse"])
+@trace_workflow(name="parse_conditions", tags=["eligibility", "parse"])
 def parse_conditions_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
-    apply_target 텍스트를 14대 표준 스키마 조건 객체로 파싱
+    apply_target 텍스트를 14대 표준 스키마 조건 객체로 변환
+
+    적재 시 사전 파싱된 조건을 ConditionStore에서 조회합니다 (LLM 호출 없음).
+    사전 파싱되지 않은 정책만 LLM으로 한 번 파싱하여 저장합니다.
     """
     try:
         apply_target = state.get("apply_target", "")
@@ -170,68 +210,8 @@ def parse_conditions_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 "error": "신청 대상 정보가 없습니다.",
             }
 
-        # Load prompt template
-        prompt_path = Path(__file__).parent.parent.parent / "prompts" / "eligibility_prompt.jinja2"
-        if prompt_path.exists():
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                template_str = f.read()
-            template = Template(template_str)
-            prompt = template.render(apply_target=apply_target)
-        else:
-            prompt = f"다음 텍스트에서 지원 자격 조건을 JSON으로 추출하시오: {apply_target}"
-
-        # Call LLM
-        llm_client = get_openai_client()
-        response = llm_client.generate(
-            messages=[
-                {"role": "system", "content": "당신은 정책 자격 조건 분석 전문가입니다. 오직 JSON만 응답합니다."},
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.0,
-        )
-
-        content = response if isinstance(response, str) else response.content
-
-        # Parse JSON response
         try:
-            response_clean = _extract_json_from_llm_response(content)
-            parsed = _safe_json_loads(response_clean)
-
-            conditions = []
-            extra_requirements = None
-
-            # 리스트나 딕셔너리 모두 처리
-            if isinstance(parsed, list):
-                conditions = parsed
-            elif isinstance(parsed, dict):
-                conditions = parsed.get("conditions", [])
-                extra_requirements = parsed.get("extra_requirements", None)
-            else:
-                logger.warning("Parsed JSON is neither list nor dict")
-
-            if not isinstance(conditions, list):
-                conditions = []
-
-            # status/reason 표준 필드 부여
-            valid_conditions = []
-            for c in conditions:
-                if isinstance(c, dict):
-                    c["status"] = c.get("status", "UNKNOWN") or "UNKNOWN"
-                    c["reason"] = c.get("reason", None)
-                    valid_conditions.append(c)
-            
-            conditions = valid_conditions
-
-            logger.info(f"Conditions parsed: {len(conditions)} items", extra={"policy_id": policy_id})
-
-            return {
-                **state,
-                "conditions": conditions,
-                "extra_requirements": extra_requirements,
-                "current_condition_index": 0,
-                "error": None,
-            }
-
+            stored = get_condition_store().get_or_parse(policy_id, apply_target)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse conditions JSON: {e}", exc_info=True)
             return {
@@ -241,6 +221,18 @@ def parse_conditions_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 "error": f"조건 파싱 실패: {str(e)}",
             }
 
+        conditions = stored["conditions"]
+
+        logger.info(f"Conditions loaded: {len(conditions)} items", extra={"policy_id": policy_id})
+
+        return {
+            **state,
+            "conditions": conditions,
+            "extra_requirements": stored["extra_requirements"],
+            "current_condition_index": 0,
+            "error": None,
+        }
+
     except Exception as e:
         logger.error(f"Error in parse_conditions_node: {e}", exc_info=True)
         return {
@@ -335,10 +327,13 @@ def apply_checklist_node(state: Dict[str, Any]) -> Dict[str, Any]:
 # =========================================================
 # 5) Node: generate_question_node (대화형 질문 생성)
 # =========================================================
-@trace_llm_call(name="generate_question", tags=["eligibility", "question"])
+@trace_workflow(name="generate_question", tags=["eligibility", "question"])
 def generate_question_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     다음 UNKNOWN 조건에 대한 질문 생성
+
+    질문 뱅크(정책별 사전 생성 질문, 타입 템플릿)를 우선 사용하고
+    특이 조건만 LLM으로 생성합니다.
     """
     try:
         conditions = state.get("conditions", []) or []
@@ -364,41 +359,28 @@ def generate_question_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 "current_condition_index": len(conditions),
             }
 
-        # Get policy info for context
-        policy_name = ""
-        if policy_id:
-            with get_db() as db:
-                policy = db.query(Policy).filter(Policy.id == policy_id).first()
-                if policy:
-                    policy_name = policy.program_name
-
-        # Load prompt template
-        prompt_path = Path(__file__).parent.parent.parent / "prompts" / "eligibility_question.jinja2"
-        if prompt_path.exists():
-            with open(prompt_path, "r", encoding="utf-8") as f:
-                template_str = f.read()
-            template = Template(template_str)
-            prompt = template.render(
-                policy_name=policy_name,
-                condition_name=next_condition.get("name"),
-                condition_description=next_condition.get("description"),
-                condition_type=next_condition.get("type"),
-                user_slots=user_slots,
-            )
-        else:
-            prompt = f"다음 조건에 대해 사용자에게 물어볼 친절한 질문을 작성해줘. 조건: {next_condition.get('description')}"
-
-        # Generate question
-        llm_client = get_openai_client()
-        question = llm_client.generate(
-            messages=[
-                {"role": "system", "content": "당신은 친절한 정책 상담사입니다."},
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.3,
+        # 1) 규칙으로 판정 가능한 타입 템플릿 → 2) 적재 시 생성된 정책별 질문 → 3) LLM fallback
+        question = template_question(next_condition)
+        source = "type_template"
+        if not question:
+            question = next_condition.get("question")
+            source = "policy_bank"
+        if not question:
+            policy_name = state.get("policy_name") or ""
+            if not policy_name and policy_id:
+                with get_db() as db:
+                    policy = db.query(Policy).filter(Policy.id == policy_id).first()
+                    if policy:
+                        policy_name = policy.program_name
+            question = generate_question_with_llm(next_condition, policy_name, user_slots)
+            source = "llm_fallback"
+
+        record_question_source(source)
+        logger.debug(
+            "Eligibility question selected",
+            extra={"policy_id": policy_id, "condition_type": next_condition.get("type"), "source": source}
         )
-
-        content = question if isinstance(question, str) else question.content
+        content = question
 
         return {
             **state,
@@ -432,11 +414,9 @@ def process_answer_node(state: Dict[str, Any]) -> Dict[str, Any]:
             return state
 
         current_condition = conditions[current_index]
-        ctype = current_condition.get("type")
-        slot_key = TYPE_TO_SLOT_KEY.get(ctype) or (ctype or current_condition.get("name") or "unknown_slot")
 
-        # Save user answer to slots
-        user_slots[slot_key] = user_answer
+        # Save user answer to slots (공통 슬롯 질문이 아니면 조건별 키)
+        user_slots[condition_answer_key(current_condition)] = user_answer
 
         # Re-judge with updated slot
         status, reason = _judge_with_slot(current_condition, user_slots)
@@ -5,7 +5,8 @@ Retrieve Node
 
 from typing import Dict, Any, List
 from ...config.logger import get_logger
-from ...observability import trace_retrieval
+from ...observability import trace_retrieval, timed
+from ...observability.metrics import GRAPH_NODE_SECONDS
 from ...cache import get_policy_cache
 
 logger = get_logger()
@@ -16,6 +17,7 @@ policy_cache = get_policy_cache()
     name="load_cached_docs",
     tags=["node", "retrieval", "cache"]
 )
+@timed(GRAPH_NODE_SECONDS, node="load_cached_docs")
 def load_cached_docs_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     캐시에서 정책 문서 조회 (벡터 검색 없음!)
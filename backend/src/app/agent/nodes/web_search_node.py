@@ -7,7 +7,8 @@ from typing import Dict, Any, List
 from datetime import date
 from ...config.logger import get_logger
 from ...config import get_settings
-from ...observability import trace_tool
+from ...observability import trace_tool, timed
+from ...observability.metrics import GRAPH_NODE_SECONDS
 from ...web_search.clients.tavily_client import get_tavily_client
 
 logger = get_logger()
@@ -15,6 +16,7 @@ settings = get_settings()
 
 
 @trace_tool(name="web_search", tags=["node", "web-search"])
+@timed(GRAPH_NODE_SECONDS, node="web_search")
 def web_search_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     웹 검색 수행 (Tavily 우선, DuckDuckGo 대체)
@@ -45,7 +47,6 @@ def web_search_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 results = tavily_client.search(
                     query=current_query,
                     max_results=5,
-                    search_depth="advanced",
                     days=365  # Q&A 중 추가 검색은 1년 범위로 (이미 선택한 정책 관련 정보)
                 )
                 
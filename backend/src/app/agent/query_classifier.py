@@ -0,0 +1,224 @@
+"""
+Local Query Classifier
+질문 유형(POLICY_QA / WEB_ONLY) 로컬 분류기
+
+이미 로드된 BGE-M3 임베딩으로 클래스별 예시 질문의 중심(centroid)을 만들고,
+질문 임베딩과 가장 가까운 중심을 선택합니다 (CPU 수 ms).
+두 클래스 유사도 차이(margin)가 임계값보다 작으면 None을 반환하여 LLM에 위임합니다.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config import get_settings
+from ..config.logger import get_logger
+
+logger = get_logger()
+
+POLICY_QA = "POLICY_QA"
+WEB_ONLY = "WEB_ONLY"
+
+# 클래스별 예시 질문 (키워드로 잡히지 않는 애매한 질문 위주)
+SEED_EXAMPLES: Dict[str, List[str]] = {
+    POLICY_QA: [
+        "창조기업",
+        "1인 창업",
+        "예비창업패키지",
+        "청년 창업 사관학교",
+        "사업화 자금은 어디에 쓸 수 있나요?",
+        "멘토링도 받을 수 있어요?",
+        "중복 수혜 가능한가요?",
+        "제출 서류가 뭐가 필요해?",
+        "선정되면 의무 사항이 있나요?",
+        "평가는 어떻게 진행돼?",
+        "자부담 비율",
+        "협약 기간 끝나면 어떻게 돼?",
+        "개인사업자도 되나요?",
+        "법인 설립 전이어도 괜찮아?",
+        "이 사업 경쟁률 높아?",
+        "교육 프로그램 포함돼?",
+        "사무공간 제공해줘?",
+        "정산은 어떻게 해",
+        "사업계획서 양식",
+        "선정 후 취소되는 경우",
+    ],
+    WEB_ONLY: [
+        "전주한옥마을은 어디야?",
+        "AI는 뭐야?",
+        "오늘 날씨 어때?",
+        "중소벤처기업부 장관이 누구야?",
+        "부가가치세 신고 기한",
+        "법인세율 알려줘",
+        "근처 맛집 추천",
+        "챗GPT 사용법",
+        "환율 얼마야",
+        "사업자등록증 발급하는 곳",
+        "4대보험 가입 방법",
+        "최근 스타트업 투자 동향",
+        "스마트스토어 개설",
+        "세무사 수수료 평균",
+        "창업 관련 뉴스",
+        "엑셀 함수 사용법",
+        "서울 공유오피스 가격",
+        "유튜브 채널 키우는 법",
+        "주식회사 설립 비용",
+        "노란우산공제가 뭐야",
+    ],
+}
+
+
+def training_examples() -> List[Tuple[str, str]]:
+    """
+    학습 예시 (예시 질문 + 평가 데이터셋 질문)
+
+    Returns:
+        List[Tuple[str, str]]: (질문, 라벨)
+    """
+    examples = [(text, label) for label, texts in SEED_EXAMPLES.items() for text in texts]
+
+    from ..evaluation.datasets import QA_EVALUATION_DATASET
+    for item in QA_EVALUATION_DATASET:
+        query = item.get("input", {}).get("current_query")
+        expected = item.get("expected_output", {}).get("query_type")
+        category = item.get("metadata", {}).get("category", "")
+        label = expected or (POLICY_QA if category.startswith("policy_qa") else None)
+        if query and label:
+            examples.append((query, label))
+
+    return examples
+
+
+@dataclass
+class Prediction:
+    """분류 결과"""
+    label: str
+    confidence: float  # 1위와 2위 클래스 유사도 차이
+    scores: Dict[str, float]
+
+
+class CentroidQueryClassifier:
+    """
+    임베딩 최근접 중심 분류기
+
+    Attributes:
+        labels: 클래스 라벨
+        centroids: (클래스 수, 차원) 정규화된 중심 벡터
+        min_margin: 이보다 확신이 낮으면 None 반환
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], List[List[float]]],
+        min_margin: Optional[float] = None
+    ):
+        """
+        Initialize classifier
+
+        Args:
+            embed_batch: 텍스트 리스트 → 정규화된 임베딩 리스트
+            min_margin: 위임 임계값 (기본값: settings.query_classifier_min_margin)
+        """
+        self.embed_batch = embed_batch
+        self.min_margin = min_margin if min_margin is not None else get_settings().query_classifier_min_margin
+        self.labels: List[str] = []
+        self.centroids: Optional[np.ndarray] = None
+
+    def fit(self, examples: Sequence[Tuple[str, str]]) -> "CentroidQueryClassifier":
+        """
+        예시로 클래스별 중심 계산
+
+        Args:
+            examples: (질문, 라벨) 목록
+
+        Returns:
+            CentroidQueryClassifier: self
+        """
+        texts = [text for text, _ in examples]
+        vectors = np.asarray(self.embed_batch(texts), dtype=np.float32)
+
+        self.labels = sorted({label for _, label in examples})
+        label_of = np.array([label for _, label in examples])
+        centroids = np.stack([vectors[label_of == label].mean(axis=0) for label in self.labels])
+        self.centroids = centroids / np.linalg.norm(centroids, axis=1, keepdims=True)
+        return self
+
+    def predict(self, query: str) -> Prediction:
+        """
+        가장 가까운 중심으로 분류 (임계값 적용 없음)
+
+        Args:
+            query: 사용자 질문
+
+        Returns:
+            Prediction: 라벨, 확신도, 클래스별 유사도
+        """
+        vector = np.asarray(self.embed_batch([query])[0], dtype=np.float32)
+        sims = self.centroids @ vector
+        order = np.argsort(sims)[::-1]
+        margin = float(sims[order[0]] - sims[order[1]]) if len(order) > 1 else 1.0
+        return Prediction(
+            label=self.labels[order[0]],
+            confidence=margin,
+            scores={label: float(sim) for label, sim in zip(self.labels, sims)}
+        )
+
+    def classify(self, query: str) -> Optional[Prediction]:
+        """
+        확신도가 임계값 이상일 때만 분류 결과 반환
+
+        Args:
+            query: 사용자 질문
+
+        Returns:
+            Optional[Prediction]: 결과 (확신이 낮으면 None → LLM 위임)
+        """
+        prediction = self.predict(query)
+        return prediction if prediction.confidence >= self.min_margin else None
+
+
+# 싱글톤 인스턴스
+_classifier_instance: Optional[CentroidQueryClassifier] = None
+_classifier_lock = threading.Lock()
+_classifier_failed = False
+
+
+def get_query_classifier() -> Optional[CentroidQueryClassifier]:
+    """
+    CentroidQueryClassifier 싱글톤 반환 (첫 호출 시 예시 임베딩으로 학습)
+
+    Returns:
+        Optional[CentroidQueryClassifier]: 분류기 (비활성/임베딩 모델 로드 실패 시 None)
+    """
+    global _classifier_instance, _classifier_failed
+
+    if not get_settings().query_classifier_enabled or _classifier_failed:
+        return None
+
+    if _classifier_instance is None:
+        with _classifier_lock:
+            if _classifier_instance is None and not _classifier_failed:
+                try:
+                    from ..vector_store.embedder_bge_m3 import get_embedder
+                    model = get_embedder().model
+
+                    def _encode(texts: List[str]) -> List[List[float]]:
+                        # embed_batch는 호출마다 info 로그를 남기므로 모델 직접 호출
+                        return model.encode(texts, normalize_embeddings=True, show_progress_bar=False)
+
+                    _classifier_instance = CentroidQueryClassifier(_encode).fit(training_examples())
+                    logger.info(
+                        "Query classifier initialized",
+                        extra={"labels": _classifier_instance.labels, "min_margin": _classifier_instance.min_margin}
+                    )
+                except Exception as e:
+                    _classifier_failed = True
+                    logger.warning(
+                        "Query classifier unavailable, falling back to LLM",
+                        extra={"error": str(e)}
+                    )
+                    return None
+
+    return _classifier_instance
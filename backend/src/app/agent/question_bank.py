@@ -0,0 +1,212 @@
+"""
+Eligibility Question Bank
+자격 확인 질문 템플릿 뱅크
+
+대부분의 조건은 14대 표준 타입 중 몇 가지(나이, 지역, 업력, 매출 등)로 수렴하므로
+타입별 질문 템플릿으로 즉시 질문을 만들고, 특이한 조건만 LLM으로 생성합니다.
+정책별 질문은 적재 시 조건 파싱과 함께 미리 생성되어 ConditionStore에 저장됩니다.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+from ..config.logger import get_logger
+from .eligibility_rules import compile_condition, is_arrears_condition
+
+logger = get_logger()
+
+# 값과 무관하게 같은 정보를 묻는 타입 (답변을 규칙으로 판정하기 쉬운 형태로 질문)
+# RULE_BACKED_TYPES는 조건이 같은 슬롯의 규칙으로 컴파일될 때만 사용
+TYPE_QUESTION_TEMPLATES: Dict[str, str] = {
+    "Age": "현재 만 나이가 어떻게 되시나요? (예: 만 29세)",
+    "Business Age": "창업(사업자 등록)한 지 얼마나 되셨나요? 아직 창업 전이라면 '예비창업자'라고 답해주세요. (예: 3년)",
+    "Location": "사업장(또는 거주지) 소재지가 어디인가요? (예: 서울 강남구)",
+    "Financial Status": "최근 1년 매출액은 얼마인가요? (예: 3억원)",
+    "Employment Status": "현재 상시 근로자 수는 몇 명인가요? (예: 5명)",
+    "Compliance & Tax": "국세·지방세 체납이나 금융기관 연체 사실이 있으신가요? (예/아니오)",
+    "Application Type": "현재 신청하시는 분은 어떤 신분인가요? (예: 예비창업자, 중소기업, 소상공인)",
+}
+RULE_BACKED_TYPES = frozenset({
+    "Age", "Business Age", "Location", "Financial Status", "Employment Status", "Compliance & Tax",
+})
+
+# 조건 값/설명을 넣어 "해당 여부"를 묻는 타입
+TYPE_YES_NO_TEMPLATES: Dict[str, str] = {
+    "Business Type": "사업 분야가 '{target}'에 해당하나요? (예/아니오)",
+    "Experience": "'{target}'에 해당하시나요? (예/아니오)",
+    "Tech & Innovation": "보유하신 기술·아이템이 '{target}'에 해당하나요? (예/아니오)",
+    "Individual Traits": "'{target}'에 해당하시나요? (예/아니오)",
+    "Business Objective": "'{target}' 계획이 있으신가요? (예/아니오)",
+    "Collaboration": "'{target}'에 해당하시나요? (예/아니오)",
+    "Legal & Social": "'{target}'에 해당하시나요? (예/아니오)",
+    "business_status": "'{target}'에 해당하시나요? (예/아니오)",
+}
+
+# 이보다 긴 조건 설명은 템플릿에 넣으면 어색하므로 LLM으로 생성
+MAX_TEMPLATE_TARGET_LENGTH = 40
+
+# 질문 출처별 카운터 (fallback 비율 측정용)
+_stats_lock = threading.Lock()
+_stats: Dict[str, int] = {"policy_bank": 0, "type_template": 0, "llm_fallback": 0}
+
+
+def template_question(condition: Dict[str, Any]) -> Optional[str]:
+    """
+    조건 타입 템플릿으로 질문 생성 (결정적, LLM 없음)
+
+    나이/업력/매출 등 슬롯 질문은 조건이 해당 슬롯 규칙으로 컴파일될 때만 사용합니다.
+    "투자 유치액", "겸직 금지", "4대보험 가입"처럼 같은 타입이지만 다른 정보를 묻는 조건은 None.
+
+    Args:
+        condition: 조건 (type, name, description, value)
+
+    Returns:
+        Optional[str]: 질문 (템플릿으로 만들 수 없는 특이 조건이면 None)
+    """
+    ctype = condition.get("type") or ""
+
+    if ctype in RULE_BACKED_TYPES:
+        from .nodes.eligibility_nodes import TYPE_TO_SLOT_KEY
+
+        if ctype == "Compliance & Tax" and not any(
+            is_arrears_condition(condition.get(field) or "") for field in ("value", "description")
+        ):
+            # 체납/연체 질문은 체납 조건에만 (4대보험 가입, 완납 증명 등은 정책별 질문)
+            return None
+        rule = compile_condition(condition)
+        if rule is None or rule.slot != TYPE_TO_SLOT_KEY.get(ctype):
+            return None
+        return TYPE_QUESTION_TEMPLATES[ctype]
+
+    if ctype in TYPE_QUESTION_TEMPLATES:
+        return TYPE_QUESTION_TEMPLATES[ctype]
+
+    if ctype in TYPE_YES_NO_TEMPLATES:
+        target = (condition.get("description") or condition.get("value") or condition.get("name") or "").strip()
+        if target and len(target) <= MAX_TEMPLATE_TARGET_LENGTH:
+            return TYPE_YES_NO_TEMPLATES[ctype].format(target=target)
+
+    return None
+
+
+def shares_slot_answer(condition: Dict[str, Any]) -> bool:
+    """
+    조건 질문이 타입 공통 슬롯 질문(TYPE_QUESTION_TEMPLATES)인지
+
+    공통 질문의 답(나이, 소재지, 매출 등)은 같은 타입의 다른 조건에도 재사용할 수 있지만,
+    조건별 질문(예/아니오 템플릿, 정책별 질문, LLM 질문)의 답은 그 조건에만 유효합니다.
+
+    Args:
+        condition: 조건
+
+    Returns:
+        bool: 슬롯 공통 질문 여부
+    """
+    ctype = condition.get("type") or ""
+    return ctype in TYPE_QUESTION_TEMPLATES and template_question(condition) == TYPE_QUESTION_TEMPLATES[ctype]
+
+
+def attach_questions(
+    conditions: List[Dict[str, Any]],
+    policy_name: str = "",
+    allow_llm: bool = True
+) -> int:
+    """
+    정책 조건 리스트에 질문을 미리 생성하여 "question" 필드로 부착 (적재 시 사용)
+
+    템플릿으로 만들 수 있는 조건은 질문 시점에 템플릿을 쓰므로 저장하지 않습니다
+    (저장된 질문은 정책별로 생성한 질문만 → policy_bank 통계가 템플릿과 섞이지 않음).
+
+    Args:
+        conditions: 조건 리스트 (제자리 수정)
+        policy_name: 정책명 (LLM 질문 생성 컨텍스트)
+        allow_llm: 템플릿이 없는 조건에 LLM 사용 여부 (False면 아무것도 부착하지 않음)
+
+    Returns:
+        int: LLM으로 생성한 질문 수
+    """
+    if not allow_llm:
+        return 0
+
+    llm_count = 0
+    for condition in conditions:
+        if condition.get("question") or template_question(condition) is not None:
+            continue
+
+        try:
+            condition["question"] = generate_question_with_llm(condition, policy_name)
+            llm_count += 1
+        except Exception as e:
+            logger.warning(
+                "Failed to pregenerate eligibility question",
+                extra={"condition": condition.get("name"), "error": str(e)}
+            )
+
+    return llm_count
+
+
+def generate_question_with_llm(
+    condition: Dict[str, Any],
+    policy_name: str = "",
+    user_slots: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    LLM으로 질문 생성 (특이 조건용 fallback)
+
+    Args:
+        condition: 조건
+        policy_name: 정책명
+        user_slots: 사용자가 이미 제공한 정보
+
+    Returns:
+        str: 질문
+    """
+    from ..llm import get_openai_client
+    from ..prompts import render_template
+
+    prompt = render_template("eligibility_question.jinja2", {
+        "policy_name": policy_name,
+        "condition_name": condition.get("name"),
+        "condition_description": condition.get("description"),
+        "condition_type": condition.get("type"),
+        "user_slots": user_slots or {},
+    })
+
+    llm_client = get_openai_client()
+    question = llm_client.generate(
+        messages=[
+            {"role": "system", "content": "당신은 친절한 정책 상담사입니다."},
+            {"role": "user", "content": prompt},
+        ],
+        temperature=0.3,
+    )
+
+    content = question if isinstance(question, str) else question.content
+    return content.strip()
+
+
+def record_question_source(source: str) -> None:
+    """
+    질문 출처 카운트 증가
+
+    Args:
+        source: "policy_bank" | "type_template" | "llm_fallback"
+    """
+    with _stats_lock:
+        _stats[source] = _stats.get(source, 0) + 1
+
+
+def get_question_stats() -> Dict[str, Any]:
+    """
+    질문 출처 통계 (모니터링용)
+
+    Returns:
+        Dict: 출처별 개수 + llm_fallback_rate
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+
+    total = sum(stats.values())
+    stats["total"] = total
+    stats["llm_fallback_rate"] = round(stats["llm_fallback"] / total, 4) if total else 0.0
+    return stats
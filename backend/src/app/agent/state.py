@@ -21,6 +21,7 @@ class QAState(TypedDict):
         web_sources: 웹 검색 결과
         answer: 생성된 답변
         need_web_search: 웹 검색 필요 여부 (POLICY_QA에서 보완용)
+        web_search_borderline: 충분하지만 경계 구간인지 여부 (예측 웹 검색용)
         evidence: 근거 목록
         error: 에러 메시지 (선택)
     """
@@ -38,6 +39,7 @@ class QAState(TypedDict):
     web_sources: List[Dict[str, Any]]
     answer: str
     need_web_search: bool  # POLICY_QA에서 웹 검색 보완 필요 여부
+    web_search_borderline: bool  # 경계 구간 → 스트리밍 시 웹 검색 미리 시작
     evidence: List[Dict[str, Any]]
     error: Optional[str]
 
@@ -54,6 +56,7 @@ class EligibilityState(TypedDict, total=False):
     Attributes:
         session_id: 세션 ID
         policy_id: 정책 ID
+        policy_name: 정책명 (질문 생성 컨텍스트, DB 재조회 방지)
         apply_target: 신청 대상 텍스트
         conditions: 조건 리스트
         user_slots: 사용자 입력 슬롯
@@ -71,6 +74,7 @@ class EligibilityState(TypedDict, total=False):
     # ===== 필수로 쓰는 핵심 상태 =====
     session_id: str
     policy_id: int
+    policy_name: str
     apply_target: str
     conditions: List[Dict[str, Any]]           # [{"name":..., "description":..., "status":...}, ...]
     user_slots: Dict[str, Any]                 # {"age": 25, "region": "서울", ...}
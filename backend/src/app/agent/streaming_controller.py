@@ -3,20 +3,29 @@ Streaming QA Controller
 스트리밍 방식 Q&A 처리 컨트롤러
 """
 
+import asyncio
 import json
-from typing import Dict, Any, AsyncGenerator
+import logging
+from typing import Dict, Any, AsyncGenerator, List, Optional
 
+from fastapi.concurrency import run_in_threadpool
+
+from ..config import get_settings
 from ..config.logger import get_logger
 from ..cache import get_chat_cache, get_policy_cache
-from ..llm.openai_client import get_openai_client
+from ..llm import get_openai_client
+from ..observability import current_trace_id, get_tracer
 from ..prompts import render_template
+from .context_packer import ContextPacker, count_tokens
 from .nodes import classify_query_type_node, load_cached_docs_node, check_sufficiency_node
-from ..web_search.clients.tavily_client import TavilyClient
+from ..text import get_keyword_matcher
+from ..text.keywords import INSUFFICIENT_ANSWER
+from ..web_search.clients.tavily_client import get_tavily_client
 
 logger = get_logger()
+settings = get_settings()
 chat_cache = get_chat_cache()
 policy_cache = get_policy_cache()
-llm_client = get_openai_client()
 
 
 class StreamingQAController:
@@ -28,25 +37,53 @@ class StreamingQAController:
     
     def __init__(self):
         """Initialize streaming controller"""
-        self.tavily_client = TavilyClient()
+        self.tavily_client = get_tavily_client()
+        self.context_packer = ContextPacker()
     
     async def process_query_stream(
         self,
         session_id: str,
         policy_id: int,
-        user_query: str
+        user_query: str,
+        trace_id: Optional[str] = None
     ) -> AsyncGenerator[str, None]:
         """
         사용자 질문을 스트리밍 방식으로 처리
         
+        스트림 전체가 하나의 루트 span("chat_stream")이며, 노드/LLM/웹 검색 span과
+        백그라운드 태스크(예측 검색, 보충 답변)도 같은 트레이스에 기록됩니다.
+        
         Args:
             session_id: 세션 ID
             policy_id: 정책 ID
             user_query: 사용자 질문
+            trace_id: 트레이스 ID (응답 헤더와 동일, 없으면 생성)
         
         Yields:
-            str: SSE 형식의 JSON 데이터
+            str: SSE 형식의 JSON 데이터 (data에 trace_id 포함)
         """
+        with get_tracer().span(
+            "chat_stream",
+            tags=["stream", "feature:Q&A"],
+            metadata={"session_id": session_id, "policy_id": policy_id},
+            trace_id=trace_id
+        ):
+            async for event in self._process_query_stream(session_id, policy_id, user_query):
+                yield event
+    
+    async def _process_query_stream(
+        self,
+        session_id: str,
+        policy_id: int,
+        user_query: str
+    ) -> AsyncGenerator[str, None]:
+        """process_query_stream 본문 (트레이스 컨텍스트 안에서 실행)"""
+        # 예측(speculative) 웹 검색 태스크: 경계 구간이면 첫 답변 생성과 동시에 시작
+        web_task: Optional[asyncio.Task] = None
+        # 보충 답변 태스크: 본 답변 스트리밍 중 불충분 표현이 감지되면 시작
+        supplement_task: Optional[asyncio.Task] = None
+        supplement_queue: Optional[asyncio.Queue] = None
+        
         try:
             # 1. 초기 상태 생성
             state = {
@@ -57,12 +94,14 @@ class StreamingQAController:
                 "retrieved_docs": [],
                 "web_results": [],
                 "query_type": "POLICY_QA",
-                "need_web_search": False
+                "need_web_search": False,
+                "prompt_tokens": 0
             }
             
             # 2. 쿼리 분류
             yield self._format_sse("status", {"step": "classifying", "message": "질문 분류 중..."})
-            state = classify_query_type_node(state)
+            # 임베딩 분류기 encode/fit, LLM 분류 호출이 동기라 워커 스레드에서 실행
+            state = await run_in_threadpool(classify_query_type_node, state)
             query_type = state.get("query_type", "POLICY_QA")
             
             # 3. 문서 로드 또는 웹 검색
@@ -104,6 +143,13 @@ class StreamingQAController:
                         template_name = "policy_qa_web_only_prompt.jinja2"
                     else:
                         template_name = "policy_qa_docs_only_prompt.jinja2"
+                        
+                        if settings.speculative_web_search and state.get("web_search_borderline"):
+                            web_task = asyncio.create_task(self._search_web(user_query))
+                            logger.info(
+                                "Speculative web search started",
+                                extra={"session_id": session_id, "query": user_query}
+                            )
             
             # 4. 프롬프트 생성
             yield self._format_sse("status", {"step": "generating", "message": "답변 생성 중..."})
@@ -115,67 +161,81 @@ class StreamingQAController:
                     "template_name": template_name,
                     "context_type": state.get("context_type", "policy"),
                     "retrieved_docs_count": len(state.get("retrieved_docs", [])),
-                    "prompt_preview": prompt[:500] + "..." if len(prompt) > 500 else prompt
+                    "context_docs_count": len(state.get("context_docs", [])),
+                    "prompt_tokens": state["prompt_tokens"]
                 }
             )
+            # 프롬프트 미리보기는 DEBUG에서만 (비활성이면 슬라이싱/레코드 생성 없음)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Prompt preview",
+                    extra={
+                        "session_id": session_id,
+                        "prompt_preview": prompt[:500] + "..." if len(prompt) > 500 else prompt
+                    }
+                )
             
             # 5. 스트리밍 답변 생성
-            full_answer = ""
-            async for chunk in llm_client.generate_with_system_stream(
+            # 불충분 표현은 청크가 들어올 때마다 증분 매칭 (전체 답변 재스캔 없음)
+            # 감지 즉시 웹 검색 + 보충 답변 생성을 백그라운드로 시작하고 본 답변은 계속 스트리밍
+            insufficiency_scanner = get_keyword_matcher().stream(categories={INSUFFICIENT_ANSWER})
+            can_supplement = template_name == "policy_qa_docs_only_prompt.jinja2"
+            answer_parts: List[str] = []
+            async for chunk in get_openai_client().generate_with_system_stream(
                 system_prompt=prompt,
                 user_message=user_query,
                 temperature=0.0
             ):
-                full_answer += chunk
+                answer_parts.append(chunk)
+                if can_supplement and supplement_task is None and insufficiency_scanner.feed(chunk):
+                    logger.info(
+                        "Answer insufficient, performing web search",
+                        extra={
+                            "session_id": session_id,
+                            "query": user_query,
+                            "detected_at_char": insufficiency_scanner.length,
+                            "speculative": web_task is not None
+                        }
+                    )
+                    if web_task is None:
+                        web_task = asyncio.create_task(self._search_web(user_query))
+                    supplement_queue = asyncio.Queue()
+                    supplement_task = asyncio.create_task(
+                        self._generate_supplement(state, user_query, web_task, supplement_queue)
+                    )
                 yield self._format_sse("chunk", {"content": chunk})
             
-            # 5.5. 답변 불충분 체크 및 웹 검색 추가
-            insufficient_keywords = [
-                "정보가 포함되어 있지 않습니다", 
-                "확인이 어렵습니다", 
-                "정보가 부족", 
-                "문서로는", 
-                "찾을 수 없습니다",
-                "명시되어 있지 않습니다",  # 추가
-                "명시되어 있지 않",  # 추가
-                "명시되지 않",  # 추가
-                "포함되어 있지 않",  # 추가
-                "제공되지 않",  # 추가
-                "나와 있지 않"  # 추가
-            ]
-            is_insufficient = any(keyword in full_answer for keyword in insufficient_keywords)
-            
-            if is_insufficient and template_name == "policy_qa_docs_only_prompt.jinja2":
-                logger.info(
-                    "Answer insufficient, performing web search",
-                    extra={"session_id": session_id, "query": user_query}
-                )
-                
-                # 웹 검색 수행
-                yield self._format_sse("status", {"step": "searching", "message": "추가 정보 검색 중..."})
-                web_results = await self._search_web(user_query)
-                state["web_results"] = web_results
-                
-                # 하이브리드 프롬프트로 재생성
-                hybrid_prompt = self._build_prompt(state, "policy_qa_hybrid_prompt.jinja2")
-                
-                # 기존 답변에 웹 검색 결과 추가
+            # 5.5. 답변 불충분 시 웹 검색 기반 보충 답변 (이미 생성 중인 결과를 이어서 전송)
+            if supplement_task is not None:
                 yield self._format_sse("status", {"step": "enhancing", "message": "웹 검색 결과 추가 중..."})
                 
                 # 헤더 먼저 전송
                 header_text = "\n\n**추가 정보 (웹 검색):**\n"
                 yield self._format_sse("chunk", {"content": header_text})
+                answer_parts.append(header_text)
                 
-                additional_answer = header_text
-                async for chunk in llm_client.generate_with_system_stream(
-                    system_prompt=hybrid_prompt,
-                    user_message=user_query,
-                    temperature=0.0
-                ):
-                    additional_answer += chunk
+                while True:
+                    chunk = await supplement_queue.get()
+                    if chunk is None:
+                        break
+                    answer_parts.append(chunk)
                     yield self._format_sse("chunk", {"content": chunk})
                 
-                full_answer += additional_answer
+                # 보충 생성 중 발생한 예외 전파
+                await supplement_task
+                supplement_task = None
+                web_task = None
+            
+            # 예측 검색이 필요 없었으면 취소
+            if web_task is not None:
+                web_task.cancel()
+                web_task = None
+                logger.info(
+                    "Speculative web search cancelled (answer sufficient)",
+                    extra={"session_id": session_id}
+                )
+            
+            full_answer = "".join(answer_parts)
             
             # 6. Evidence 추출 및 전송
             evidence = self._extract_evidence(state, full_answer)
@@ -183,18 +243,25 @@ class StreamingQAController:
                 "Evidence extracted",
                 extra={
                     "session_id": session_id,
-                    "evidence_count": len(evidence),
-                    "evidence": evidence
+                    "evidence_count": len(evidence)
                 }
             )
+            logger.debug("Evidence detail", extra={"session_id": session_id, "evidence": evidence})
             yield self._format_sse("evidence", {"evidence": evidence})
             
             # 7. 대화 히스토리 저장
             chat_cache.add_message(session_id, "USER", user_query)
             chat_cache.add_message(session_id, "ASSISTANT", full_answer)
             
-            # 8. 완료 신호
-            yield self._format_sse("done", {"message": "완료"})
+            # 8. 완료 신호 (요청당 프롬프트 토큰 수 포함)
+            logger.info(
+                "Streaming query completed",
+                extra={"session_id": session_id, "prompt_tokens": state["prompt_tokens"]}
+            )
+            yield self._format_sse("done", {
+                "message": "완료",
+                "usage": {"prompt_tokens": state["prompt_tokens"]}
+            })
             
         except Exception as e:
             logger.error(
@@ -203,36 +270,126 @@ class StreamingQAController:
                 exc_info=True
             )
             yield self._format_sse("error", {"message": str(e)})
+        finally:
+            # 에러/클라이언트 연결 종료 시에도 예측 검색/보충 답변 정리
+            for task in (supplement_task, web_task):
+                if task is not None and not task.done():
+                    task.cancel()
+    
+    async def _generate_supplement(
+        self,
+        state: Dict[str, Any],
+        user_query: str,
+        web_task: "asyncio.Task",
+        queue: "asyncio.Queue"
+    ) -> None:
+        """
+        웹 검색 결과로 보충 답변 생성 (본 답변 스트리밍과 병렬 실행)
+        
+        생성된 청크는 queue에 넣고, 끝나면(예외 포함) None을 넣습니다.
+        
+        Args:
+            state: 현재 상태 (web_results, context_docs 갱신)
+            user_query: 사용자 질문
+            web_task: 진행 중인 웹 검색 태스크
+            queue: 청크 전달 큐
+        """
+        try:
+            web_results = await web_task
+            state["web_results"] = web_results
+            logger.info(
+                "Web search for supplement finished",
+                extra={"session_id": state["session_id"], "results_count": len(web_results)}
+            )
+            
+            # 하이브리드 프롬프트로 보충 답변 생성
+            hybrid_prompt = self._build_prompt(state, "policy_qa_hybrid_prompt.jinja2")
+            async for chunk in get_openai_client().generate_with_system_stream(
+                system_prompt=hybrid_prompt,
+                user_message=user_query,
+                temperature=0.0
+            ):
+                queue.put_nowait(chunk)
+        finally:
+            queue.put_nowait(None)
     
     async def _search_web(self, query: str) -> list:
-        """웹 검색 수행"""
+        """웹 검색 수행 (비동기 HTTP, 이벤트 루프를 막지 않음)"""
         try:
-            results = self.tavily_client.search(query, max_results=5)
-            return results.get("results", [])
+            return await self.tavily_client.asearch(
+                query,
+                max_results=5,
+                days=None
+            )
         except Exception as e:
             logger.error(f"Web search failed: {e}")
             return []
     
     def _build_prompt(self, state: Dict[str, Any], template_name: str) -> str:
-        """프롬프트 생성"""
+        """
+        프롬프트 생성 (토큰 예산 기반 컨텍스트 구성)
+        
+        템플릿 고정 부분의 토큰 수를 먼저 계산한 뒤, 남은 예산 안에서
+        질문과 관련도 높은 문서 청크와 최근 대화 이력을 채웁니다.
+        선택된 문서는 state["context_docs"]에, 누적 프롬프트 토큰은
+        state["prompt_tokens"]에 기록합니다.
+        
+        Args:
+            state: 현재 상태
+            template_name: 템플릿 파일명
+        
+        Returns:
+            str: 렌더링된 프롬프트
+        """
         policy_context = policy_cache.get_policy_context(state["session_id"])
         policy_info = policy_context.get("policy_info", {}) if policy_context else {}
         context_type = state.get("context_type", "policy")  # "policy" or "web"
+        user_question = state.get("current_query", "")
         
         context = {
             "policy_name": policy_info.get("name", "정책"),
             "policy_overview": policy_info.get("overview", ""),
             "apply_target": policy_info.get("apply_target", ""),
             "support_description": policy_info.get("support_description", ""),
-            "retrieved_docs": state.get("retrieved_docs", []),
+            "retrieved_docs": [],
             "web_results": state.get("web_results", []),
-            "chat_history": state.get("chat_history", []),
-            "user_question": state.get("current_query", ""),
+            "chat_history": [],
+            "user_question": user_question,
             "context_type": context_type  # 웹/정책 구분 추가
         }
         
+        # 고정 부분(템플릿 + 정책 정보 + 웹 결과 + 질문) 토큰 수
+        reserved_tokens = count_tokens(render_template(template_name, context)) + count_tokens(user_question)
+        
+        packed = self.context_packer.pack(
+            query=user_question,
+            docs=state.get("retrieved_docs", []),
+            chat_history=state.get("chat_history", []),
+            reserved_tokens=reserved_tokens
+        )
+        context["retrieved_docs"] = packed.docs
+        context["chat_history"] = packed.chat_history
         
         prompt = render_template(template_name, context)
+        prompt_tokens = count_tokens(prompt) + count_tokens(user_question)
+        
+        state["context_docs"] = packed.docs
+        state["prompt_tokens"] = state.get("prompt_tokens", 0) + prompt_tokens
+        
+        logger.info(
+            "Prompt context packed",
+            extra={
+                "session_id": state["session_id"],
+                "template_name": template_name,
+                "prompt_tokens": prompt_tokens,
+                "budget_tokens": self.context_packer.budget_tokens,
+                "docs_used": len(packed.docs),
+                "docs_dropped": packed.dropped_docs,
+                "turns_used": len(packed.chat_history),
+                "turns_dropped": packed.dropped_turns,
+                "turns_truncated": packed.truncated_turns
+            }
+        )
         
         return prompt
     
@@ -240,8 +397,8 @@ class StreamingQAController:
         """답변에서 evidence 추출"""
         evidence = []
         
-        # 정책 문서 또는 웹 공고 evidence
-        docs = state.get("retrieved_docs", [])
+        # 정책 문서 또는 웹 공고 evidence (프롬프트에 실제 포함된 문서 순서 기준)
+        docs = state.get("context_docs") or state.get("retrieved_docs", [])
         for idx, doc in enumerate(docs[:5], 1):
             doc_type = doc.get("doc_type", "")
             
@@ -285,11 +442,14 @@ class StreamingQAController:
         
         Args:
             event_type: 이벤트 타입 (status, chunk, evidence, done, error)
-            data: 전송할 데이터
+            data: 전송할 데이터 (현재 트레이스 ID가 trace_id로 추가됨)
         
         Returns:
             str: SSE 형식 문자열
         """
+        trace_id = current_trace_id()
+        if trace_id:
+            data = {**data, "trace_id": trace_id}
         return f"event: {event_type}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
 
 
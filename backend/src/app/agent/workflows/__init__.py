@@ -1,9 +1,10 @@
 """Workflows module"""
 
-from .qa_workflow import create_qa_workflow, run_qa_workflow
+from .qa_workflow import create_qa_workflow, get_qa_app, run_qa_workflow
 
 __all__ = [
     "create_qa_workflow",
+    "get_qa_app",
     "run_qa_workflow",
 ]
 
@@ -3,6 +3,7 @@ Eligibility Workflow
 자격 확인 워크플로우
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Literal
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
@@ -149,6 +150,17 @@ def create_eligibility_answer_workflow() -> StateGraph:
         raise
 
 
+@lru_cache(maxsize=1)
+def get_eligibility_start_app():
+    """
+    컴파일된 자격 확인 시작 그래프 (프로세스당 1회 컴파일)
+    
+    Returns:
+        CompiledStateGraph: 컴파일된 그래프
+    """
+    return create_eligibility_start_workflow().compile()
+
+
 @trace_workflow(
     name="run_eligibility_start",
     tags=get_feature_tags("EC"),
@@ -157,7 +169,8 @@ def create_eligibility_answer_workflow() -> StateGraph:
 def run_eligibility_start(
     session_id: str,
     policy_id: int,
-    apply_target: str
+    apply_target: str,
+    policy_name: str = ""
 ) -> Dict[str, Any]:
     """
     자격 확인 시작
@@ -166,21 +179,20 @@ def run_eligibility_start(
         session_id: 세션 ID
         policy_id: 정책 ID
         apply_target: 신청 대상 텍스트
+        policy_name: 정책명 (선택)
     
     Returns:
         Dict: 첫 번째 질문 포함
     """
     try:
-        # Create start workflow
-        workflow = create_eligibility_start_workflow()
-        
-        # Compile (no memory needed for start)
-        app = workflow.compile()
+        # Compiled start workflow (no memory needed for start)
+        app = get_eligibility_start_app()
         
         # Initial state
         initial_state: EligibilityState = {
             "session_id": session_id,
             "policy_id": policy_id,
+            "policy_name": policy_name,
             "apply_target": apply_target,
             "conditions": [],
             "user_slots": {},
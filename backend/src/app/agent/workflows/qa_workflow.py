@@ -3,9 +3,9 @@ Q&A Workflow
 LangGraph 기반 정책 Q&A 워크플로우 (개선된 버전)
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Literal
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
 
 from ...config.logger import get_logger
 from ...observability import trace_workflow, get_feature_tags
@@ -165,6 +165,19 @@ def create_qa_workflow() -> StateGraph:
         raise
 
 
+@lru_cache(maxsize=1)
+def get_qa_app():
+    """
+    컴파일된 Q&A 그래프 (프로세스당 1회 컴파일)
+    
+    대화 이력은 세션 캐시에서 매 호출 state로 전달하므로 체크포인터 없이 컴파일해 재사용합니다.
+    
+    Returns:
+        CompiledStateGraph: 컴파일된 그래프
+    """
+    return create_qa_workflow().compile()
+
+
 @trace_workflow(
     name="run_qa_workflow",
     tags=get_feature_tags("QA"),
@@ -189,12 +202,7 @@ def run_qa_workflow(
         Dict: 워크플로우 실행 결과 (answer, evidence 포함)
     """
     try:
-        # Create workflow
-        workflow = create_qa_workflow()
-        
-        # Compile with memory
-        memory = MemorySaver()
-        app = workflow.compile(checkpointer=memory)
+        app = get_qa_app()
         
         # Initial state
         initial_state: QAState = {
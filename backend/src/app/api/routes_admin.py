@@ -4,12 +4,14 @@ Admin API Routes
 """
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from ..db.engine import get_db_session
 from ..vector_store import get_qdrant_manager
 from ..config import get_settings
 from ..config.logger import get_logger
+from ..startup import get_startup_status
 
 logger = get_logger()
 settings = get_settings()
@@ -35,6 +37,46 @@ async def health_check():
     }
 
 
+@router.get(
+    "/health/live",
+    summary="Liveness 체크",
+    description="프로세스가 살아 있는지 확인합니다 (웜업 여부와 무관).",
+    tags=["Admin"]
+)
+async def liveness_check():
+    """
+    Liveness 체크
+    
+    이벤트 루프가 응답하면 항상 200 (재시작 판단용)
+    """
+    return {"status": "alive"}
+
+
+@router.get(
+    "/health/ready",
+    summary="Readiness 체크",
+    description="워커가 트래픽을 받을 준비가 되었는지 확인합니다 (웜업 완료 여부).",
+    tags=["Admin"]
+)
+async def readiness_check():
+    """
+    Readiness 체크
+    
+    웜업이 끝나 ready/degraded 상태면 200, 시작 중·필수 단계 실패·종료 중이면 503.
+    로드밸런서/오케스트레이터는 200인 워커에만 트래픽을 보내야 합니다.
+    """
+    status = get_startup_status()
+    return JSONResponse(
+        status_code=200 if status["ready"] else 503,
+        content={
+            "status": "ready" if status["ready"] else "not_ready",
+            "phase": status["phase"],
+            "uptime_seconds": status["uptime_seconds"],
+            "steps": {name: step.get("status") for name, step in status["steps"].items()},
+        }
+    )
+
+
 @router.get(
     "/health/db",
     summary="데이터베이스 헬스체크",
@@ -110,6 +152,13 @@ async def get_stats(db: Session = Depends(get_db_session)):
     """
     try:
         from ..db.models import Policy, Session as DBSession, ChatHistory
+        from ..agent.condition_store import get_condition_store
+        from ..agent.question_bank import get_question_stats
+        from ..agent.eligibility_rules import get_judge_stats
+        from ..llm import get_openai_client
+        from ..web_search.clients import get_tavily_client
+        from ..observability import get_tracer
+        from ..config.logger import get_logging_stats
         
         policies_count = db.query(Policy).count()
         sessions_count = db.query(DBSession).count()
@@ -139,7 +188,17 @@ async def get_stats(db: Session = Depends(get_db_session)):
             },
             "chats": {
                 "total": chats_count
-            }
+            },
+            "eligibility": {
+                "questions": get_question_stats(),
+                "conditions": get_condition_store().get_stats(),
+                "judgements": get_judge_stats()
+            },
+            "llm": get_openai_client().get_stats(),
+            "web_search": get_tavily_client().get_stats(),
+            "startup": get_startup_status(),
+            "tracing": get_tracer().get_stats(),
+            "logging": get_logging_stats()
         }
         
     except Exception as e:
@@ -3,8 +3,12 @@ Chat API Routes
 Q&A 멀티턴 대화 엔드포인트 (스트리밍 지원)
 """
 
+import re
 import uuid
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
@@ -12,6 +16,7 @@ from ..agent import AgentController
 from ..agent.streaming_controller import get_streaming_controller
 from ..domain.chat import ChatRequest, ChatResponse, SessionResetResponse
 from ..config.logger import get_logger
+from ..observability import new_trace_id
 from ..cache import get_policy_cache, get_chat_cache
 from ..vector_store import get_qdrant_manager
 from ..db.engine import get_db
@@ -20,6 +25,9 @@ from ..db.models import Policy
 logger = get_logger()
 router = APIRouter()
 
+# 외부에서 전달한 트레이스 ID (OTLP trace id 형식: 32자리 hex)
+_TRACE_ID = re.compile(r"^[0-9a-fA-F]{32}$")
+
 # 캐시 인스턴스
 policy_cache = get_policy_cache()
 chat_cache = get_chat_cache()
@@ -102,8 +110,9 @@ async def chat(request: ChatRequest):
         # Generate session_id if not provided
         session_id = request.session_id or str(uuid.uuid4())
         
-        # Run Q&A workflow
-        result = AgentController.run_qa(
+        # Run Q&A workflow (동기 워크플로우이므로 워커 스레드에서 실행)
+        result = await run_in_threadpool(
+            AgentController.run_qa,
             session_id=session_id,
             policy_id=request.policy_id,
             user_message=request.message
@@ -414,7 +423,7 @@ async def reset_session(session_id: str):
     description="스트리밍 방식으로 실시간 답변 생성",
     tags=["Chat"]
 )
-async def chat_stream(request: ChatRequest):
+async def chat_stream(request: ChatRequest, x_trace_id: Optional[str] = Header(None)):
     """
     스트리밍 Q&A 엔드포인트
     
@@ -426,18 +435,23 @@ async def chat_stream(request: ChatRequest):
     - evidence: 근거 자료
     - done: 완료
     - error: 오류
+    
+    모든 이벤트 data와 X-Trace-Id 응답 헤더에 트레이스 ID가 포함됩니다
+    (요청 X-Trace-Id 헤더가 32자리 hex면 그대로 사용).
     """
     try:
         session_id = request.session_id or str(uuid.uuid4())
         policy_id = request.policy_id
         user_query = request.message
+        trace_id = x_trace_id.lower() if x_trace_id and _TRACE_ID.match(x_trace_id) else new_trace_id()
         
         logger.info(
             "Starting streaming Q&A",
             extra={
                 "session_id": session_id,
                 "policy_id": policy_id,
-                "query": user_query
+                "query": user_query,
+                "trace_id": trace_id
             }
         )
         
@@ -446,12 +460,13 @@ async def chat_stream(request: ChatRequest):
         
         # 스트리밍 응답 생성
         return StreamingResponse(
-            controller.process_query_stream(session_id, policy_id, user_query),
+            controller.process_query_stream(session_id, policy_id, user_query, trace_id=trace_id),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
-                "X-Accel-Buffering": "no"  # Nginx 버퍼링 비활성화
+                "X-Accel-Buffering": "no",  # Nginx 버퍼링 비활성화
+                "X-Trace-Id": trace_id
             }
         )
         
@@ -7,8 +7,10 @@ from typing import Dict, Any
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 
+from ..config import get_settings
 from ..config.logger import get_logger
 from ..db.engine import get_db_session
+from ..db.write_behind import get_write_behind_writer
 from ..db.models import Policy, ChecklistResult, Session as DBSession, WorkflowTypeEnum
 from ..domain.eligibility import (
     EligibilityStartRequest,
@@ -16,14 +18,21 @@ from ..domain.eligibility import (
     EligibilityAnswerRequest,
     EligibilityAnswerResponse,
     EligibilityResult,
-    ConditionResult
+    ConditionResult,
+    EligibilityBatchRequest,
+    EligibilityBatchResponse,
+    PolicyScreeningResult,
+    MissingSlot
 )
+from ..agent.eligibility_batch import screen_policies, summarize_missing_slots
 from ..agent.workflows.eligibility_workflow import (
     run_eligibility_start,
     run_eligibility_answer,
     run_eligibility_result
 )
+import time
 import uuid
+from collections import Counter
 from datetime import datetime
 
 router = APIRouter(prefix="/eligibility", tags=["eligibility"])
@@ -76,7 +85,8 @@ async def start_eligibility_check(
         result = run_eligibility_start(
             session_id=session_id,
             policy_id=request.policy_id,
-            apply_target=policy.apply_target
+            apply_target=policy.apply_target,
+            policy_name=policy.program_name
         )
         
         # Save session to DB
@@ -146,6 +156,8 @@ async def answer_eligibility_question(
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
 
         current_state = _eligibility_sessions[session_id]
+        # 노드가 user_slots를 제자리 갱신하므로 변경 비교용 스냅샷 보관
+        previous_slots = dict(current_state.get("user_slots") or {})
 
         # Run workflow with answer
         result = run_eligibility_answer(
@@ -157,6 +169,13 @@ async def answer_eligibility_question(
         # Update session
         _eligibility_sessions[session_id] = result
 
+        # Persist changed slots (write-behind, 요청 경로 DB 대기 없음)
+        if get_settings().chat_persist_enabled:
+            writer = get_write_behind_writer()
+            for slot_name, slot_value in (result.get("user_slots") or {}).items():
+                if previous_slots.get(slot_name) != slot_value:
+                    writer.enqueue_slot(session_id, slot_name, slot_value)
+
         # Calculate progress
         conditions = result.get("conditions", [])
         total_conditions = len(conditions)
@@ -193,6 +212,70 @@ async def answer_eligibility_question(
         raise HTTPException(status_code=500, detail=f"답변 처리 실패: {str(e)}")
 
 
+@router.post("/batch", response_model=EligibilityBatchResponse)
+def batch_eligibility_check(
+    request: EligibilityBatchRequest,
+    db: Session = Depends(get_db_session)
+):
+    """
+    여러 정책 일괄 자격 확인 (사전 분석된 조건 + 규칙 엔진, LLM 없음)
+    
+    CPU 작업이므로 동기 함수로 두어 스레드풀에서 실행됩니다.
+    
+    Args:
+        request: 사용자 프로필 + 정책 ID 목록 또는 검색어
+        db: DB 세션
+    
+    Returns:
+        EligibilityBatchResponse: 정책별 PASS/FAIL/UNKNOWN + 미입력 정보
+    """
+    if not request.policy_ids and not request.query:
+        raise HTTPException(status_code=400, detail="policy_ids 또는 query 중 하나가 필요합니다.")
+    
+    try:
+        started = time.perf_counter()
+        
+        q = db.query(Policy.id, Policy.program_name, Policy.apply_target)
+        if request.policy_ids:
+            rows = q.filter(Policy.id.in_(set(request.policy_ids))).all()
+            # 요청 순서 유지
+            by_id = {row.id: row for row in rows}
+            rows = [by_id[pid] for pid in dict.fromkeys(request.policy_ids) if pid in by_id]
+        else:
+            from ..db.repositories.policy_repo import PolicyRepository
+            rows = PolicyRepository(db).search(
+                region=request.region,
+                category=request.category,
+                query=request.query,
+                limit=request.limit
+            )
+        
+        results = screen_policies(
+            request.profile,
+            [(row.id, row.program_name, row.apply_target) for row in rows]
+        )
+        
+        summary = Counter({"PASS": 0, "FAIL": 0, "UNKNOWN": 0})
+        summary.update(result.status for result in results)
+        
+        return EligibilityBatchResponse(
+            results=[PolicyScreeningResult(**vars(result)) for result in results],
+            summary=dict(summary),
+            missing_slots=[MissingSlot(**slot) for slot in summarize_missing_slots(results)],
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 2)
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(
+            "Error in batch eligibility check",
+            extra={"error": str(e), "policy_count": len(request.policy_ids or [])},
+            exc_info=True
+        )
+        raise HTTPException(status_code=500, detail=f"일괄 자격 확인 실패: {str(e)}")
+
+
 @router.get("/result/{session_id}", response_model=EligibilityResult)
 async def get_eligibility_result_endpoint(
     session_id: str,
@@ -5,6 +5,7 @@ Policy API Routes
 
 from typing import Optional, List, Dict, Any
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
@@ -215,7 +216,9 @@ async def search_policies_with_agent(
         )
 
         # Run search via AgentController (uses SimpleSearchService)
-        result = AgentController.run_search(
+        # 벡터 검색/웹 검색이 동기 호출이므로 워커 스레드에서 실행 (이벤트 루프 블로킹 방지)
+        result = await run_in_threadpool(
+            AgentController.run_search,
             query=query,
             session_id=session_id,
             region=region,
@@ -3,10 +3,20 @@ Cache Module
 대화 이력 및 정책 문서 캐싱
 """
 
+from .backends import (
+    CacheBackend,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    get_cache_backend,
+)
 from .chat_cache import ChatCache, get_chat_cache
 from .policy_cache import PolicyCache, get_policy_cache
 
 __all__ = [
+    "CacheBackend",
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
+    "get_cache_backend",
     "ChatCache",
     "PolicyCache",
     "get_chat_cache",
@@ -0,0 +1,359 @@
+"""
+Cache Backends
+세션 캐시 저장소 백엔드 (메모리 / Redis)
+
+ChatCache, PolicyCache는 이 인터페이스만 사용하므로
+멀티 워커 배포 시 CACHE_BACKEND=redis 로 공유 저장소를 사용할 수 있습니다.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import pickle
+import threading
+import time
+
+from ..config import get_settings
+from ..config.logger import get_logger
+
+logger = get_logger()
+
+# pickle protocol 5: 추가 의존성 없이 dict/list/datetime을 그대로 보존 (msgpack은 변환 필요)
+# 캐시 값은 작은 dict/str 위주라 out-of-band 버퍼는 쓰지 않고 단일 bytes로 저장
+PICKLE_PROTOCOL = 5
+
+
+def _dumps(value: Any) -> bytes:
+    """값 직렬화"""
+    return pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+
+
+def _loads(data: Optional[bytes]) -> Any:
+    """값 역직렬화"""
+    if data is None:
+        return None
+    return pickle.loads(data)
+
+
+class CacheBackend(ABC):
+    """
+    캐시 백엔드 인터페이스
+
+    TTL은 백엔드(저장소)에서 처리합니다.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """단일 키 조회 (없거나 만료 시 None)"""
+
+    @abstractmethod
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키 일괄 조회 (존재하는 키만 반환)"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """값 저장 (ttl: 초)"""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """키 삭제"""
+
+    @abstractmethod
+    def expire(self, key: str, ttl: int) -> bool:
+        """TTL 재설정"""
+
+    @abstractmethod
+    def append(self, key: str, item: Any, ttl: Optional[int] = None) -> None:
+        """리스트 값에 항목 추가 (TTL 갱신)"""
+
+    @abstractmethod
+    def extend(self, key: str, items: Sequence[Any], ttl: Optional[int] = None) -> None:
+        """리스트 값에 여러 항목 추가 (TTL 갱신)"""
+
+    @abstractmethod
+    def get_list(self, key: str) -> Sequence[Any]:
+        """리스트 값 조회 (불변 튜플 스냅샷, 없으면 빈 튜플)"""
+
+    @abstractmethod
+    def scan_keys(self, prefix: str) -> List[str]:
+        """prefix로 시작하는 키 목록"""
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        prefix로 시작하는 모든 키 삭제
+
+        Returns:
+            int: 삭제된 키 수
+        """
+        count = 0
+        for key in self.scan_keys(prefix):
+            if self.delete(key):
+                count += 1
+        return count
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    프로세스 내 메모리 백엔드 (단일 워커 / 개발용)
+
+    - 읽기: 락 없음 (엔트리는 (value, expires_at) 불변 튜플로 통째로 교체)
+    - 쓰기: 키 해시 기반 스트라이프 락 (세션 간 경합 없음)
+    - 리스트: copy-on-write 튜플 (읽는 쪽은 복사 없이 스냅샷 사용)
+    - 만료: 조회 시점에 지연 처리
+    """
+
+    DEFAULT_STRIPES = 64
+
+    def __init__(self, stripes: int = DEFAULT_STRIPES):
+        """
+        Initialize in-memory backend
+
+        Args:
+            stripes: 스트라이프 락 개수 (2의 거듭제곱으로 올림)
+        """
+        size = 1
+        while size < max(1, stripes):
+            size <<= 1
+        self._mask = size - 1
+        self._locks = [threading.Lock() for _ in range(size)]
+        # key -> (value, expires_at | None)
+        self._store: Dict[str, Tuple[Any, Optional[float]]] = {}
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        return self._locks[hash(key) & self._mask]
+
+    def _live_entry(self, key: str, now: float) -> Optional[Tuple[Any, Optional[float]]]:
+        """만료되지 않은 엔트리 반환 (락 없이 조회, 만료 시에만 락 획득 후 제거)"""
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        expires_at = entry[1]
+        if expires_at is not None and now >= expires_at:
+            with self._lock_for(key):
+                # 그 사이 다른 스레드가 갱신했으면 건드리지 않음
+                if self._store.get(key) is entry:
+                    del self._store[key]
+            return None
+        return entry
+
+    @staticmethod
+    def _expiry(ttl: Optional[int]) -> Optional[float]:
+        return time.monotonic() + ttl if ttl else None
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._live_entry(key, time.monotonic())
+        return entry[0] if entry else None
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        now = time.monotonic()
+        result: Dict[str, Any] = {}
+        for key in keys:
+            entry = self._live_entry(key, now)
+            if entry is not None:
+                result[key] = entry[0]
+        return result
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        entry = (value, self._expiry(ttl))
+        with self._lock_for(key):
+            self._store[key] = entry
+
+    def delete(self, key: str) -> bool:
+        with self._lock_for(key):
+            return self._store.pop(key, None) is not None
+
+    def _locked_entry(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        """스트라이프 락을 잡은 상태에서 만료되지 않은 엔트리 조회"""
+        entry = self._store.get(key)
+        if entry is None or (entry[1] is not None and time.monotonic() >= entry[1]):
+            return None
+        return entry
+
+    def expire(self, key: str, ttl: int) -> bool:
+        with self._lock_for(key):
+            entry = self._locked_entry(key)
+            if entry is None:
+                return False
+            self._store[key] = (entry[0], self._expiry(ttl))
+            return True
+
+    def append(self, key: str, item: Any, ttl: Optional[int] = None) -> None:
+        self.extend(key, (item,), ttl)
+
+    def extend(self, key: str, items: Sequence[Any], ttl: Optional[int] = None) -> None:
+        with self._lock_for(key):
+            entry = self._locked_entry(key)
+            current: Tuple[Any, ...] = entry[0] if entry else ()
+            # copy-on-write: 기존 튜플을 읽고 있는 스레드에 영향 없음
+            self._store[key] = (current + tuple(items), self._expiry(ttl))
+
+    def get_list(self, key: str) -> Sequence[Any]:
+        entry = self._live_entry(key, time.monotonic())
+        return entry[0] if entry else ()
+
+    def scan_keys(self, prefix: str) -> List[str]:
+        now = time.monotonic()
+        # list(dict.items())는 GIL 하에서 한 번에 스냅샷 (반복 중 변경 오류 없음)
+        return [
+            key for key, (_, expires_at) in list(self._store.items())
+            if key.startswith(prefix) and (expires_at is None or now < expires_at)
+        ]
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redis 프로토콜 공유 저장소 백엔드 (멀티 워커용)
+
+    - 직렬화: pickle protocol 5
+    - 일괄 조회: MGET / 파이프라인
+    - TTL: SET EX / EXPIRE (저장소에서 만료 처리)
+
+    Attributes:
+        client: redis-py 호환 클라이언트 (테스트 시 tests/fake_redis.py 주입)
+        namespace: 키 네임스페이스 prefix
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        client: Any = None,
+        namespace: str = ""
+    ):
+        """
+        Initialize Redis backend
+
+        Args:
+            url: Redis URL (예: redis://localhost:6379/0)
+            client: 이미 생성된 redis-py 호환 클라이언트 (선택)
+            namespace: 모든 키 앞에 붙일 prefix
+        """
+        self.namespace = namespace
+
+        if client is not None:
+            self.client = client
+        else:
+            try:
+                import redis
+            except ImportError as e:
+                raise ImportError(
+                    "CACHE_BACKEND=redis 사용 시 redis 패키지가 필요합니다 (pip install -r requirements-redis.txt)"
+                ) from e
+
+            if not url:
+                raise ValueError("CACHE_BACKEND=redis 사용 시 REDIS_URL 설정이 필요합니다")
+
+            self.client = redis.Redis.from_url(url, decode_responses=False)
+
+        logger.info(
+            "Redis cache backend initialized",
+            extra={"namespace": namespace}
+        )
+
+    def _k(self, key: str) -> str:
+        return f"{self.namespace}{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        return _loads(self.client.get(self._k(key)))
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        values = self.client.mget([self._k(key) for key in keys])
+        return {
+            key: _loads(value)
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.client.set(self._k(key), _dumps(value), ex=ttl or None)
+
+    def delete(self, key: str) -> bool:
+        return bool(self.client.delete(self._k(key)))
+
+    def expire(self, key: str, ttl: int) -> bool:
+        return bool(self.client.expire(self._k(key), ttl))
+
+    def append(self, key: str, item: Any, ttl: Optional[int] = None) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.rpush(self._k(key), _dumps(item))
+        if ttl:
+            pipe.expire(self._k(key), ttl)
+        pipe.execute()
+
+    def extend(self, key: str, items: Sequence[Any], ttl: Optional[int] = None) -> None:
+        if not items:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        pipe.rpush(self._k(key), *[_dumps(item) for item in items])
+        if ttl:
+            pipe.expire(self._k(key), ttl)
+        pipe.execute()
+
+    def get_list(self, key: str) -> Sequence[Any]:
+        return tuple(_loads(item) for item in self.client.lrange(self._k(key), 0, -1))
+
+    def scan_keys(self, prefix: str) -> List[str]:
+        full_prefix = self._k(prefix)
+        keys = []
+        for raw_key in self.client.scan_iter(match=f"{full_prefix}*", count=500):
+            key = raw_key.decode("utf-8") if isinstance(raw_key, bytes) else raw_key
+            keys.append(key[len(self.namespace):])
+        return keys
+
+    def delete_prefix(self, prefix: str) -> int:
+        keys = self.scan_keys(prefix)
+        if not keys:
+            return 0
+        pipe = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipe.delete(self._k(key))
+        return sum(int(bool(r)) for r in pipe.execute())
+
+
+# 싱글톤 인스턴스
+_cache_backend_instance: Optional[CacheBackend] = None
+_cache_backend_lock = threading.Lock()
+
+
+def create_cache_backend(backend_type: Optional[str] = None) -> CacheBackend:
+    """
+    설정에 따라 캐시 백엔드 생성
+
+    Args:
+        backend_type: "memory" 또는 "redis" (기본값: settings.cache_backend)
+
+    Returns:
+        CacheBackend: 캐시 백엔드
+    """
+    settings = get_settings()
+    backend_type = (backend_type or settings.cache_backend).lower()
+
+    if backend_type == "redis":
+        return RedisCacheBackend(
+            url=settings.redis_url,
+            namespace=settings.cache_key_prefix
+        )
+    if backend_type != "memory":
+        logger.warning(
+            "Unknown cache backend, falling back to memory",
+            extra={"cache_backend": backend_type}
+        )
+    return InMemoryCacheBackend()
+
+
+def get_cache_backend() -> CacheBackend:
+    """
+    CacheBackend 싱글톤 인스턴스 반환
+
+    Returns:
+        CacheBackend: 캐시 백엔드
+    """
+    global _cache_backend_instance
+
+    if _cache_backend_instance is None:
+        with _cache_backend_lock:
+            if _cache_backend_instance is None:
+                _cache_backend_instance = create_cache_backend()
+
+    return _cache_backend_instance
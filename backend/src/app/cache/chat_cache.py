@@ -1,29 +1,54 @@
 """
 Chat History Cache
-대화 이력 캐시 관리 (메모리 기반)
+대화 이력 캐시 관리 (CacheBackend 기반: 메모리 / Redis)
 """
 
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+from datetime import datetime
 import threading
 
+from .backends import CacheBackend, get_cache_backend
+from ..config import get_settings
+from ..config.logger import get_logger
+from ..observability import record_cache_lookup
+
+logger = get_logger()
+
 
 class ChatCache:
     """
-    대화 이력 캐시 (메모리)
+    대화 이력 캐시
     
     무제한 대화 이력 유지 (브라우저 탭 닫을 때까지)
+    저장소는 CacheBackend에 위임 (멀티 워커 시 Redis 공유)
+    
+    persist 활성 시:
+    - add_message: write-behind 큐로 DB(ChatHistory) 저장 예약 (요청 경로 DB 대기 없음)
+    - get_chat_history: 캐시 미스 시 세션당 한 번 DB에서 최근 이력 복원 (워커 재시작 대비)
     """
     
     MAX_HISTORY_TURNS = None  # 무제한 (None = 제한 없음)
     TTL_SECONDS = 86400       # 24시간 (백업용)
+    KEY_PREFIX = "chat:"
+    WARMED_PREFIX = "chat_warmed:"
     
-    def __init__(self):
-        self._cache: Dict[str, List[Dict]] = {}
-        self._timestamps: Dict[str, datetime] = {}
-        self._lock = threading.Lock()
+    def __init__(self, backend: Optional[CacheBackend] = None, persist: Optional[bool] = None):
+        """
+        Initialize chat cache
+        
+        Args:
+            backend: 캐시 백엔드 (기본값: get_cache_backend())
+            persist: DB 저장/복원 여부 (기본값: settings.chat_persist_enabled)
+        """
+        settings = get_settings()
+        self.backend = backend or get_cache_backend()
+        self.persist = settings.chat_persist_enabled if persist is None else persist
+        self.warm_limit = settings.chat_history_warm_limit
     
-    def get_chat_history(self, session_id: str) -> List[Dict]:
+    def _key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}{session_id}"
+    
+    def get_chat_history(self, session_id: str) -> Sequence[Dict]:
         """
         세션의 대화 이력 조회
         
@@ -31,18 +56,61 @@ class ChatCache:
             session_id: 세션 ID
         
         Returns:
-            List[Dict]: 대화 이력 (role, content 포함)
-        """
-        with self._lock:
-            # TTL 체크
-            if session_id in self._timestamps:
-                if datetime.now() - self._timestamps[session_id] > timedelta(seconds=self.TTL_SECONDS):
-                    # TTL 초과 시 삭제
-                    self._cache.pop(session_id, None)
-                    self._timestamps.pop(session_id, None)
-                    return []
+            Sequence[Dict]: 대화 이력 불변 스냅샷 (role, content 포함)
+        """
+        # 락/복사 없이 copy-on-write 튜플 스냅샷 반환 (TTL 만료는 백엔드에서 처리)
+        history = self.backend.get_list(self._key(session_id))
+        record_cache_lookup("chat_history", hit=bool(history))
+        if history or not self.persist:
+            return history
+        
+        return self._warm_from_db(session_id)
+    
+    def _warm_from_db(self, session_id: str) -> Sequence[Dict]:
+        """
+        캐시 미스 시 DB에서 최근 대화 이력 복원 (세션당 한 번)
+        
+        Args:
+            session_id: 세션 ID
+        
+        Returns:
+            Sequence[Dict]: 복원된 대화 이력
+        """
+        warmed_key = f"{self.WARMED_PREFIX}{session_id}"
+        if self.backend.get(warmed_key):
+            return ()
+        self.backend.set(warmed_key, True, ttl=self.TTL_SECONDS)
+        
+        try:
+            from ..db.engine import get_db
+            from ..db.repositories.session_repo import SessionRepository
             
-            return self._cache.get(session_id, []).copy()
+            with get_db() as db:
+                rows = SessionRepository(db).get_recent_chat_history(session_id, limit=self.warm_limit)
+                messages = [
+                    {
+                        "role": row.role.value.lower() if hasattr(row.role, "value") else str(row.role).lower(),
+                        "content": row.content,
+                        "timestamp": row.created_at.isoformat() if row.created_at else None
+                    }
+                    for row in rows
+                ]
+        except Exception as e:
+            logger.warning(
+                "Failed to warm chat history from DB",
+                extra={"session_id": session_id, "error": str(e)}
+            )
+            return ()
+        
+        if not messages:
+            return ()
+        
+        self.backend.extend(self._key(session_id), messages, ttl=self.TTL_SECONDS)
+        logger.info(
+            "Chat history warmed from DB",
+            extra={"session_id": session_id, "messages": len(messages)}
+        )
+        return self.backend.get_list(self._key(session_id))
     
     def add_message(self, session_id: str, role: str, content: str):
         """
@@ -55,22 +123,23 @@ class ChatCache:
             role: 메시지 역할 (user/assistant)
             content: 메시지 내용
         """
-        with self._lock:
-            if session_id not in self._cache:
-                self._cache[session_id] = []
-            
-            # 메시지 추가
-            self._cache[session_id].append({
+        # 턴 제한 없음 (무제한 저장)
+        # 브라우저 탭 닫을 때 cleanup API가 호출되어 자동 삭제
+        # 추가 시마다 TTL 갱신
+        self.backend.append(
+            self._key(session_id),
+            {
                 "role": role,
                 "content": content,
                 "timestamp": datetime.now().isoformat()
-            })
-            
-            # 턴 제한 없음 (무제한 저장)
-            # 브라우저 탭 닫을 때 cleanup API가 호출되어 자동 삭제
-            
-            # 타임스탬프 업데이트
-            self._timestamps[session_id] = datetime.now()
+            },
+            ttl=self.TTL_SECONDS
+        )
+        
+        if self.persist:
+            # DB 저장은 write-behind 큐로 위임 (논블로킹)
+            from ..db.write_behind import get_write_behind_writer
+            get_write_behind_writer().enqueue_chat_message(session_id, role, content)
     
     def clear_session(self, session_id: str):
         """
@@ -79,23 +148,19 @@ class ChatCache:
         Args:
             session_id: 세션 ID
         """
-        with self._lock:
-            self._cache.pop(session_id, None)
-            self._timestamps.pop(session_id, None)
+        self.backend.delete(self._key(session_id))
+        # 초기화한 세션을 DB에서 다시 복원하지 않도록 표시
+        self.backend.set(f"{self.WARMED_PREFIX}{session_id}", True, ttl=self.TTL_SECONDS)
     
     def set_ttl(self, session_id: str, seconds: int):
         """
-        TTL 설정 (백업용)
+        세션별 TTL 설정
         
         Args:
             session_id: 세션 ID
             seconds: TTL (초)
         """
-        with self._lock:
-            if session_id in self._timestamps:
-                # TTL 커스텀 설정은 현재 구현에서는 사용하지 않음
-                # 필요 시 세션별 TTL을 저장하는 dict 추가 가능
-                pass
+        self.backend.expire(self._key(session_id), seconds)
     
     def get_all_sessions(self) -> List[str]:
         """
@@ -104,16 +169,15 @@ class ChatCache:
         Returns:
             List[str]: 세션 ID 목록
         """
-        with self._lock:
-            return list(self._cache.keys())
+        prefix_len = len(self.KEY_PREFIX)
+        return [key[prefix_len:] for key in self.backend.scan_keys(self.KEY_PREFIX)]
     
     def clear_all(self):
         """
         모든 캐시 삭제 (테스트용)
         """
-        with self._lock:
-            self._cache.clear()
-            self._timestamps.clear()
+        self.backend.delete_prefix(self.KEY_PREFIX)
+        self.backend.delete_prefix(self.WARMED_PREFIX)
 
 
 # 싱글톤 인스턴스
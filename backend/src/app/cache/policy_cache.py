@@ -1,31 +1,42 @@
 """
 Policy Document Cache
-정책 문서 캐시 관리 (메모리 기반)
+정책 문서 캐시 관리 (CacheBackend 기반: 메모리 / Redis)
 """
 
 from typing import Dict, Optional, Any, List
-from datetime import datetime, timedelta
+from datetime import datetime
 import threading
 
+from .backends import CacheBackend, get_cache_backend
 from ..config.logger import get_logger
+from ..observability import record_cache_lookup
 
 logger = get_logger()
 
 
 class PolicyCache:
     """
-    정책 문서 캐시 (메모리)
+    정책 문서 캐시
     
     공고 선택 시 전체 문서를 캐시에 저장하여
     매번 Qdrant 벡터 검색을 하지 않고 재사용
+    저장소는 CacheBackend에 위임 (멀티 워커 시 Redis 공유)
     """
     
     TTL_SECONDS = 86400  # 24시간 (백업용)
+    KEY_PREFIX = "policy:"
     
-    def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._timestamps: Dict[str, datetime] = {}
-        self._lock = threading.Lock()
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        """
+        Initialize policy cache
+        
+        Args:
+            backend: 캐시 백엔드 (기본값: get_cache_backend())
+        """
+        self.backend = backend or get_cache_backend()
+    
+    def _key(self, session_id: str) -> str:
+        return f"{self.KEY_PREFIX}{session_id}"
     
     def set_policy_context(
         self,
@@ -43,24 +54,26 @@ class PolicyCache:
             policy_info: 정책 기본 정보
             documents: 전체 문서 청크 리스트
         """
-        with self._lock:
-            self._cache[session_id] = {
+        self.backend.set(
+            self._key(session_id),
+            {
                 "type": "policy",
                 "policy_id": policy_id,
                 "policy_info": policy_info,
                 "documents": documents,
                 "cached_at": datetime.now().isoformat()
+            },
+            ttl=self.TTL_SECONDS
+        )
+        
+        logger.info(
+            "Policy context cached",
+            extra={
+                "session_id": session_id,
+                "policy_id": policy_id,
+                "documents_count": len(documents)
             }
-            self._timestamps[session_id] = datetime.now()
-            
-            logger.info(
-                "Policy context cached",
-                extra={
-                    "session_id": session_id,
-                    "policy_id": policy_id,
-                    "documents_count": len(documents)
-                }
-            )
+        )
     
     def set_web_context(
         self,
@@ -78,47 +91,49 @@ class PolicyCache:
             web_info: 웹 공고 정보 (title, url, source 등)
             content: 웹 공고 본문 내용
         """
-        with self._lock:
-            # 웹 공고 내용을 문서 형식으로 변환
-            url = web_info.get("url", "")
-            documents = [
-                {
-                    "content": content,
-                    "doc_type": "web_content",
-                    "score": 1.0,
-                    "source": url,  # 출처 URL
-                    "url": url       # 명시적 URL 필드 추가
-                }
-            ]
-            
-            logger.info(
-                "Web context being cached",
-                extra={
-                    "session_id": session_id,
-                    "web_id": web_id,
-                    "content_length": len(content),
-                    "content_preview": content[:200] if content else "[EMPTY]"
-                }
-            )
-            
-            self._cache[session_id] = {
+        # 웹 공고 내용을 문서 형식으로 변환
+        url = web_info.get("url", "")
+        documents = [
+            {
+                "content": content,
+                "doc_type": "web_content",
+                "score": 1.0,
+                "source": url,  # 출처 URL
+                "url": url       # 명시적 URL 필드 추가
+            }
+        ]
+        
+        logger.info(
+            "Web context being cached",
+            extra={
+                "session_id": session_id,
+                "web_id": web_id,
+                "content_length": len(content),
+                "content_preview": content[:200] if content else "[EMPTY]"
+            }
+        )
+        
+        self.backend.set(
+            self._key(session_id),
+            {
                 "type": "web",
                 "web_id": web_id,
                 "web_info": web_info,
                 "documents": documents,
                 "cached_at": datetime.now().isoformat()
+            },
+            ttl=self.TTL_SECONDS
+        )
+        
+        logger.info(
+            "Web context cached",
+            extra={
+                "session_id": session_id,
+                "web_id": web_id,
+                "title": web_info.get("title", ""),
+                "url": web_info.get("url", "")
             }
-            self._timestamps[session_id] = datetime.now()
-            
-            logger.info(
-                "Web context cached",
-                extra={
-                    "session_id": session_id,
-                    "web_id": web_id,
-                    "title": web_info.get("title", ""),
-                    "url": web_info.get("url", "")
-                }
-            )
+        )
     
     def get_policy_context(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -129,38 +144,40 @@ class PolicyCache:
         
         Returns:
             Optional[Dict]: 정책 컨텍스트 (policy_id, policy_info, documents 포함)
-                          캐시 미스 시 None
+                          캐시 미스 시 None (TTL 만료 포함)
+        """
+        context = self.backend.get(self._key(session_id))
+        record_cache_lookup("policy_context", hit=bool(context))
+        
+        if context:
+            logger.debug(
+                "Policy context cache hit",
+                extra={
+                    "session_id": session_id,
+                    "policy_id": context.get("policy_id")
+                }
+            )
+        else:
+            logger.debug(
+                "Policy context cache miss",
+                extra={"session_id": session_id}
+            )
+        
+        return context.copy() if context else None
+    
+    def get_policy_contexts(self, session_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 세션의 정책 컨텍스트 일괄 조회 (백엔드 MGET 사용)
+        
+        Args:
+            session_ids: 세션 ID 목록
+        
+        Returns:
+            Dict[str, Dict]: 세션 ID → 정책 컨텍스트 (캐시 미스 세션 제외)
         """
-        with self._lock:
-            # TTL 체크
-            if session_id in self._timestamps:
-                if datetime.now() - self._timestamps[session_id] > timedelta(seconds=self.TTL_SECONDS):
-                    # TTL 초과 시 삭제
-                    logger.info(
-                        "Policy context expired",
-                        extra={"session_id": session_id}
-                    )
-                    self._cache.pop(session_id, None)
-                    self._timestamps.pop(session_id, None)
-                    return None
-            
-            context = self._cache.get(session_id)
-            
-            if context:
-                logger.debug(
-                    "Policy context cache hit",
-                    extra={
-                        "session_id": session_id,
-                        "policy_id": context.get("policy_id")
-                    }
-                )
-            else:
-                logger.debug(
-                    "Policy context cache miss",
-                    extra={"session_id": session_id}
-                )
-            
-            return context.copy() if context else None
+        found = self.backend.get_many(self._key(sid) for sid in session_ids)
+        prefix_len = len(self.KEY_PREFIX)
+        return {key[prefix_len:]: ctx for key, ctx in found.items() if ctx}
     
     def clear_policy_context(self, session_id: str):
         """
@@ -169,33 +186,21 @@ class PolicyCache:
         Args:
             session_id: 세션 ID
         """
-        with self._lock:
-            if session_id in self._cache:
-                policy_id = self._cache[session_id].get("policy_id")
-                self._cache.pop(session_id, None)
-                self._timestamps.pop(session_id, None)
-                
-                logger.info(
-                    "Policy context cleared",
-                    extra={
-                        "session_id": session_id,
-                        "policy_id": policy_id
-                    }
-                )
+        if self.backend.delete(self._key(session_id)):
+            logger.info(
+                "Policy context cleared",
+                extra={"session_id": session_id}
+            )
     
     def set_ttl(self, session_id: str, seconds: int):
         """
-        TTL 설정 (백업용)
+        세션별 TTL 설정
         
         Args:
             session_id: 세션 ID
             seconds: TTL (초)
         """
-        with self._lock:
-            if session_id in self._timestamps:
-                # TTL 커스텀 설정은 현재 구현에서는 사용하지 않음
-                # 필요 시 세션별 TTL을 저장하는 dict 추가 가능
-                pass
+        self.backend.expire(self._key(session_id), seconds)
     
     def get_all_sessions(self) -> List[str]:
         """
@@ -204,8 +209,8 @@ class PolicyCache:
         Returns:
             List[str]: 세션 ID 목록
         """
-        with self._lock:
-            return list(self._cache.keys())
+        prefix_len = len(self.KEY_PREFIX)
+        return [key[prefix_len:] for key in self.backend.scan_keys(self.KEY_PREFIX)]
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """
@@ -214,29 +219,27 @@ class PolicyCache:
         Returns:
             Dict: 캐시 통계
         """
-        with self._lock:
-            total_sessions = len(self._cache)
-            total_documents = sum(
-                len(ctx.get("documents", []))
-                for ctx in self._cache.values()
+        contexts = self.backend.get_many(self.backend.scan_keys(self.KEY_PREFIX))
+        total_sessions = len(contexts)
+        total_documents = sum(
+            len(ctx.get("documents", []))
+            for ctx in contexts.values()
+        )
+        
+        return {
+            "total_sessions": total_sessions,
+            "total_documents": total_documents,
+            "avg_documents_per_session": (
+                total_documents / total_sessions if total_sessions > 0 else 0
             )
-            
-            return {
-                "total_sessions": total_sessions,
-                "total_documents": total_documents,
-                "avg_documents_per_session": (
-                    total_documents / total_sessions if total_sessions > 0 else 0
-                )
-            }
+        }
     
     def clear_all(self):
         """
         모든 캐시 삭제 (테스트용)
         """
-        with self._lock:
-            self._cache.clear()
-            self._timestamps.clear()
-            logger.info("All policy contexts cleared")
+        self.backend.delete_prefix(self.KEY_PREFIX)
+        logger.info("All policy contexts cleared")
 
 
 # 싱글톤 인스턴스
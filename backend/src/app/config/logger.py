@@ -1,84 +1,273 @@
 """
 Structured logging configuration
 JSON 형식의 구조화된 로그를 제공합니다.
+
+요청 스레드는 로그 레코드를 큐에 넣기만 하고, JSON 포맷팅과 stdout 쓰기는
+QueueListener 스레드가 담당합니다.
+- 큐가 가득 차면 요청을 막지 않고 버린 뒤 개수를 기록 (레벨별)
+- 비활성 레벨은 logger.isEnabledFor 단계에서 걸러져 레코드도 만들지 않음
+- 메시지별 속도 제한(선택): 같은 로거/메시지가 초당 한도를 넘으면 버리고, 다음 통과 레코드에 suppressed 개수 표시
 """
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Any, Dict
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Tuple
 from pythonjsonlogger import jsonlogger
 
 from .settings import get_settings
 
+LOGGER_NAME = "policy_qa_agent"
+_MAX_RATE_LIMIT_KEYS = 10000
+
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Custom JSON formatter with additional fields"""
-    
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # 레코드마다 설정을 조회하지 않도록 고정 필드는 한 번만 읽음
+        settings = get_settings()
+        self._environment = settings.environment
+        self._service = settings.app_name
+
     def add_fields(
-        self, 
-        log_record: Dict[str, Any], 
-        record: logging.LogRecord, 
+        self,
+        log_record: Dict[str, Any],
+        record: logging.LogRecord,
         message_dict: Dict[str, Any]
     ) -> None:
         """Add custom fields to log record"""
         super().add_fields(log_record, record, message_dict)
-        
+
         # Add environment
-        settings = get_settings()
-        log_record["environment"] = settings.environment
-        log_record["service"] = settings.app_name
-        
+        log_record["environment"] = self._environment
+        log_record["service"] = self._service
+
         # Add log level name
         if not log_record.get("level"):
             log_record["level"] = record.levelname
 
 
+class RateLimitFilter(logging.Filter):
+    """
+    로거/메시지별 토큰 버킷 속도 제한 (ERROR 이상은 제한하지 않음)
+
+    키는 포맷 전 메시지 템플릿(record.msg)이므로 extra 값이 달라도 같은 메시지로 취급합니다.
+
+    Attributes:
+        rates: 로거 이름 → 메시지당 초당 허용 수 (하위 로거에도 적용)
+        burst: 순간 허용 수
+    """
+
+    def __init__(self, rates: Dict[str, float], burst: int = 20):
+        super().__init__()
+        self.rates = {name: rate for name, rate in rates.items() if rate > 0}
+        self.burst = max(1, burst)
+        self.suppressed_total = 0
+        self._buckets: Dict[Tuple[str, str], list] = {}  # key → [tokens, last, suppressed]
+        self._lock = threading.Lock()
+
+    def _rate_for(self, name: str) -> Optional[float]:
+        while True:
+            rate = self.rates.get(name)
+            if rate is not None or "." not in name:
+                return rate
+            name = name.rsplit(".", 1)[0]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR:
+            return True
+        rate = self._rate_for(record.name)
+        if rate is None:
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= _MAX_RATE_LIMIT_KEYS:
+                    self._buckets.clear()
+                bucket = self._buckets[key] = [float(self.burst), now, 0]
+            tokens = min(float(self.burst), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if tokens < 1.0:
+                bucket[0] = tokens
+                bucket[2] += 1
+                self.suppressed_total += 1
+                return False
+            bucket[0] = tokens - 1.0
+            suppressed, bucket[2] = bucket[2], 0
+
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    요청 스레드를 막지 않는 QueueHandler
+
+    - 큐가 가득 차면 레코드를 버리고 레벨별로 집계
+    - 포맷팅은 리스너 스레드로 미룸 (기본 QueueHandler.prepare는 여기서 메시지를 포맷함)
+    - 버린 레코드가 있으면 다음 성공 시 경고 레코드 1건으로 알림
+    """
+
+    def __init__(self, log_queue: "queue.Queue"):
+        super().__init__(log_queue)
+        self.dropped: Dict[str, int] = {}
+        self._unreported = 0
+        self._lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 같은 프로세스의 스레드로만 전달하므로 복사/피클링 준비 불필요
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+                self._unreported += 1
+            return
+
+        if self._unreported:
+            with self._lock:
+                dropped, self._unreported = self._unreported, 0
+            if dropped:
+                self._report_dropped(record.name, dropped)
+
+    def _report_dropped(self, name: str, dropped: int) -> None:
+        notice = logging.LogRecord(
+            name, logging.WARNING, __file__, 0, "Log records dropped (queue full)", None, None
+        )
+        notice.dropped = dropped
+        try:
+            self.queue.put_nowait(notice)
+        except queue.Full:
+            with self._lock:
+                self._unreported += dropped
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            dropped = dict(self.dropped)
+        return {
+            "queued": self.queue.qsize(),
+            "capacity": self.queue.maxsize,
+            "dropped": dropped,
+            "dropped_total": sum(dropped.values()),
+        }
+
+
+class LogQueueListener(QueueListener):
+    """종료 시 큐가 가득 차 있어도 실패하지 않는 QueueListener (기본 구현은 put_nowait로 종료 신호를 넣음)"""
+
+    def enqueue_sentinel(self) -> None:
+        # 리스너가 계속 비우고 있으므로 잠시 기다리면 자리가 남
+        self.queue.put(self._sentinel, timeout=5)
+
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[BoundedQueueHandler] = None
+_rate_limit_filter: Optional[RateLimitFilter] = None
+
+
 def setup_logging() -> logging.Logger:
     """
     Setup application logging
-    
+
     Returns:
         logging.Logger: Configured logger
     """
+    global _listener, _queue_handler, _rate_limit_filter
     settings = get_settings()
-    
+    level = logging.DEBUG if settings.debug else logging.INFO
+
     # Create logger
-    logger = logging.getLogger("policy_qa_agent")
-    logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
-    
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level)
+
     # Remove existing handlers
+    shutdown_logging()
     logger.handlers.clear()
-    
+
     # Create console handler
     handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(logging.DEBUG if settings.debug else logging.INFO)
-    
+    handler.setLevel(level)
+
     # Set JSON formatter
     formatter = CustomJsonFormatter(
         "%(timestamp)s %(level)s %(name)s %(message)s",
         rename_fields={"timestamp": "@timestamp"}
     )
     handler.setFormatter(formatter)
-    
-    # Add handler to logger
-    logger.addHandler(handler)
-    
+
+    if settings.log_async:
+        # 요청 스레드 → 큐 → 리스너 스레드(포맷 + 출력)
+        _queue_handler = BoundedQueueHandler(queue.Queue(maxsize=max(1, settings.log_queue_size)))
+        _listener = LogQueueListener(_queue_handler.queue, handler, respect_handler_level=True)
+        _listener.start()
+        logger.addHandler(_queue_handler)
+    else:
+        _queue_handler = None
+        logger.addHandler(handler)
+
+    # 속도 제한은 큐에 넣기 전에 적용 (버릴 레코드는 큐/포맷 비용 없음)
+    _rate_limit_filter = None
+    if settings.log_rate_limits:
+        _rate_limit_filter = RateLimitFilter(settings.log_rate_limits, settings.log_rate_limit_burst)
+        for attached in logger.handlers:
+            attached.addFilter(_rate_limit_filter)
+
     # Prevent propagation to root logger
     logger.propagate = False
-    
+
     return logger
 
 
+def shutdown_logging() -> None:
+    """큐에 남은 로그를 모두 출력하고 리스너 스레드 종료 (애플리케이션 종료 시)"""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    """
+    로깅 파이프라인 통계 (모니터링용)
+
+    Returns:
+        Dict: async 여부, 큐 사용량, 레벨별 버린 수, 속도 제한으로 버린 수
+    """
+    stats: Dict[str, Any] = {"async": _queue_handler is not None and _listener is not None}
+    if _queue_handler is not None:
+        stats.update(_queue_handler.get_stats())
+    stats["rate_limited_total"] = _rate_limit_filter.suppressed_total if _rate_limit_filter else 0
+    return stats
+
+
 # Create global logger instance
 logger = setup_logging()
+atexit.register(shutdown_logging)
 
 
-def get_logger() -> logging.Logger:
+def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     Get logger instance
-    
+
+    Args:
+        name: 하위 로거 이름 (예: "ingest" → policy_qa_agent.ingest, 속도 제한을 따로 걸 때 사용)
+
     Returns:
         logging.Logger: Logger instance
     """
+    if name:
+        return logger.getChild(name)
     return logger
-
@@ -4,7 +4,7 @@ Application settings using Pydantic Settings
 """
 
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -32,6 +32,21 @@ class Settings(BaseSettings):
     openai_api_key: str
     openai_model: str = "gpt-4o-mini"  # 128K context, 저렴한 비용
     openai_temperature: float = 0.0
+    openai_base_url: str = "https://api.openai.com/v1"  # OpenAI 호환 서버 (로컬 가짜 서버 테스트 시 변경)
+    openai_timeout: float = 60.0  # 요청 타임아웃 (초)
+    openai_max_connections: int = 64  # 연결 풀 최대 연결 수
+    openai_max_keepalive_connections: int = 16
+    openai_max_retries: int = 3  # 429/5xx/네트워크 오류 재시도 횟수
+    openai_rpm_limit: int = 0  # 분당 요청 수 한도 (0 = 제한 없음)
+    openai_tpm_limit: int = 0  # 분당 토큰 수 한도 (0 = 제한 없음)
+    openai_hedge_delay_ms: int = 0  # 이 시간 내 응답이 없으면 헤징 요청 (0 = 사용 안 함)
+    
+    # LLM Response Cache (temperature=0 호출만)
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = 2048  # 메모리 LRU 크기
+    llm_cache_sqlite_path: Optional[str] = None  # 예: "data/llm_cache.sqlite3" (설정 시 재시작 후에도 유지)
+    llm_cache_ttl_seconds: int = 0  # 디스크 항목 유효 기간 (0 = 무기한)
+    llm_cache_version: str = "1"  # 올리면 기존 캐시 전체 무효화
     
     # Embedding Model
     embedding_model: str = "BAAI/bge-m3"
@@ -39,6 +54,14 @@ class Settings(BaseSettings):
     
     # Web Search
     tavily_api_key: Optional[str] = None
+    tavily_base_url: str = "https://api.tavily.com"  # 로컬 스텁 서버로 교체 가능
+    tavily_search_depth: str = "basic"  # basic | advanced (advanced는 크레딧 2배, 지연 증가)
+    tavily_timeout: float = 10.0  # 호출당 타임아웃 (초)
+    tavily_max_connections: int = 20
+    tavily_cache_ttl_seconds: int = 600  # 동일 검색 결과 재사용 기간 (0 = 캐시 사용 안 함)
+    tavily_cache_max_entries: int = 512
+    tavily_breaker_failures: int = 5  # 연속 실패 시 호출 차단 (0 = 사용 안 함)
+    tavily_breaker_reset_seconds: float = 30.0  # 차단 유지 시간
     
     # LangSmith (Observability)
     langsmith_api_key: Optional[str] = None
@@ -46,12 +69,68 @@ class Settings(BaseSettings):
     langsmith_tracing: bool = False
     langsmith_endpoint: str = "https://api.smith.langchain.com"
     
+    # Tracing (샘플링 + 백그라운드 내보내기, app.observability.tracer)
+    tracing_enabled: bool = True
+    tracing_exporter: str = "auto"  # auto | langsmith | file | none (auto: LangSmith 활성 시 langsmith, 아니면 none)
+    tracing_file_path: str = "logs/traces.jsonl"  # file exporter 출력 (OTLP JSON, 한 줄에 트레이스 1개)
+    tracing_sample_rate: float = 0.1  # head 샘플링 기본 비율 (루트 span 시작 시 결정)
+    tracing_sample_rates: Dict[str, float] = {}  # 루트 워크플로우별 비율 (예: {"chat_stream": 0.05, "run_eligibility_workflow": 1.0})
+    tracing_tail_latency_ms: float = 5000.0  # head에서 빠진 트레이스도 이보다 느리면 보관 (0 = 사용 안 함)
+    tracing_keep_errors: bool = True  # head에서 빠진 트레이스도 예외가 있으면 보관
+    tracing_capture_io: bool = True  # span 입력/출력 기록 (내보낼 때 직렬화 + PII 마스킹)
+    tracing_max_spans: int = 256  # 트레이스당 최대 span 수
+    tracing_queue_size: int = 1000  # 내보내기 대기 트레이스 수 (가득 차면 버림)
+    tracing_batch_size: int = 50
+    
+    # Logging (app.config.logger)
+    log_async: bool = True  # 큐 + 리스너 스레드로 포맷/출력 (요청 스레드는 큐에 넣기만)
+    log_queue_size: int = 10000  # 가득 차면 버리고 레벨별로 집계 (/api/v1/stats의 logging)
+    log_rate_limits: Dict[str, float] = {}  # 로거 이름 → 메시지별 초당 허용 수 (예: {"policy_qa_agent": 50}, ERROR 이상 제외)
+    log_rate_limit_burst: int = 20
+    
+    # Metrics (app.observability.metrics)
+    metrics_enabled: bool = True  # GET /metrics 노출 (Prometheus 텍스트 형식, 워커 프로세스별 집계)
+    
+    # Session Cache
+    cache_backend: str = "memory"  # memory | redis (멀티 워커 시 redis)
+    redis_url: Optional[str] = None
+    cache_key_prefix: str = "policy_qa:"
+    
+    # Chat History Persistence (write-behind)
+    chat_persist_enabled: bool = True
+    chat_history_warm_limit: int = 50  # 캐시 미스 시 DB에서 복원할 최근 메시지 수
+    write_behind_batch_size: int = 100
+    write_behind_flush_interval: float = 1.0  # 초
+    write_behind_queue_size: int = 10000
+    
+    # Startup
+    warmup_enabled: bool = True  # 시작 시 임베딩 모델/BM25 인덱스/그래프 미리 로드
+    
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:3001"]
     
     # Chunking
-    chunk_size: int = 500
-    chunk_overlap: int = 50
+    chunk_size: int = 500  # 청크 최대 토큰 수 (임베딩 모델 토크나이저 기준)
+    chunk_overlap: int = 50  # 청크 간 겹침 토큰 수 (문장 단위)
+    
+    # BM25 Tokenizer
+    bm25_tokenizer: str = "morpheme"  # whitespace | morpheme | ngram (scripts/compare_tokenizers.py로 비교)
+    bm25_query_cache_size: int = 4096  # 질의 토큰화 LRU 캐시 크기
+    
+    # Prompt Context Packing
+    prompt_token_budget: int = 6000  # 프롬프트 전체 토큰 예산 (템플릿 + 문서 + 대화 이력)
+    prompt_history_token_ratio: float = 0.25  # 예산 중 대화 이력 최대 비율
+    prompt_recent_messages: int = 4  # 원문 유지할 최근 메시지 수
+    prompt_old_turn_max_tokens: int = 120  # 오래된 메시지당 최대 토큰 수
+    
+    # Sufficiency / Speculative Web Search
+    speculative_web_search: bool = True  # 경계 구간이면 첫 답변 생성과 동시에 웹 검색 시작
+    sufficiency_borderline_score: float = 0.85
+    sufficiency_min_query_coverage: float = 0.6
+    
+    # Query Classification
+    query_classifier_enabled: bool = True  # 키워드 미매칭 시 BGE-M3 최근접 중심 분류 (LLM 전 단계)
+    query_classifier_min_margin: float = 0.04  # 두 클래스 유사도 차이가 이보다 작으면 LLM으로 위임
     
     # Retrieval
     retrieval_top_k: int = 5
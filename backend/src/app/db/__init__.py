@@ -9,6 +9,7 @@ from .models import (
     ChecklistResult,
     WebSource,
     ChatHistory,
+    PolicyCondition,
     Base
 )
 
@@ -23,6 +24,7 @@ __all__ = [
     "ChecklistResult",
     "WebSource",
     "ChatHistory",
+    "PolicyCondition",
     "Base",
 ]
 
@@ -3,6 +3,7 @@ Database engine and session management
 SQLAlchemy 엔진 및 세션 관리
 """
 
+import time
 from typing import AsyncGenerator, Generator
 from contextlib import asynccontextmanager, contextmanager
 
@@ -12,21 +13,42 @@ from sqlalchemy.pool import QueuePool
 
 from ..config import get_settings
 from ..config.logger import get_logger
+from ..observability.metrics import DB_POOL_CHECKED_OUT, DB_POOL_WAIT_SECONDS
 
 logger = get_logger()
 settings = get_settings()
 
+
+class TimedQueuePool(QueuePool):
+    """
+    연결 획득 대기 시간을 기록하는 QueuePool
+
+    SQLAlchemy 풀 이벤트(checkout)는 연결을 얻은 뒤에만 호출되므로
+    대기 시간(풀 고갈 시 반납 대기 + 새 연결 생성 포함)은 _do_get을 감싸 측정합니다.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT_SECONDS.observe(time.perf_counter() - started)
+
+
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.database_url,
     echo=settings.db_echo,
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
-    poolclass=QueuePool,
+    poolclass=TimedQueuePool,
     pool_pre_ping=True,  # Enable connection health checks
     pool_recycle=3600,  # Recycle connections after 1 hour
 )
 
+# dispose() 시 풀이 새로 만들어지므로 수집 시점의 engine.pool을 조회
+DB_POOL_CHECKED_OUT.set_function(lambda: engine.pool.checkedout())
+
 # Create session factory
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -301,3 +301,36 @@ class ChatHistory(Base):
     def __repr__(self) -> str:
         return f"<ChatHistory(id={self.id}, role={self.role})>"
 
+
+
+# ============================================================
+# Model 8: PolicyCondition (사전 파싱된 자격 조건)
+# ============================================================
+
+class PolicyCondition(Base):
+    """
+    사전 파싱된 자격 조건 모델
+    
+    apply_target 텍스트를 14대 표준 스키마로 파싱한 결과를
+    (정책 ID, 원문 해시, 프롬프트 버전) 단위로 저장합니다.
+    """
+    
+    __tablename__ = "policy_conditions"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True, comment="조건 세트 고유 ID")
+    policy_id = Column(Integer, ForeignKey("policies.id", ondelete="CASCADE"), nullable=False, comment="정책 ID")
+    content_hash = Column(String(64), nullable=False, comment="apply_target 원문 해시 (SHA-256)")
+    prompt_version = Column(String(32), nullable=False, comment="파싱 프롬프트 버전")
+    conditions = Column(JSON, nullable=False, comment="조건 리스트 (14대 표준 스키마)")
+    extra_requirements = Column(Text, comment="정량화되지 않은 추가 요구사항")
+    model = Column(String(100), comment="파싱에 사용한 LLM 모델")
+    created_at = Column(DateTime, default=datetime.utcnow, comment="생성일")
+    
+    # Indexes
+    __table_args__ = (
+        Index("idx_policy_id", "policy_id"),
+        UniqueConstraint("policy_id", "content_hash", "prompt_version", name="unique_policy_condition_version"),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<PolicyCondition(policy_id={self.policy_id}, version={self.prompt_version})>"
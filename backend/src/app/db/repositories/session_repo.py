@@ -3,8 +3,9 @@ Session Repository
 세션 데이터 접근 계층
 """
 
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime
+from sqlalchemy import insert
 from sqlalchemy.orm import Session as SASession
 
 from ..models import Session, Slot, ChatHistory, ChecklistResult, WorkflowTypeEnum, RoleEnum
@@ -168,6 +169,39 @@ class SessionRepository:
             )
             raise
     
+    def ensure_sessions(
+        self,
+        session_ids: Iterable[str],
+        workflow_type: WorkflowTypeEnum = WorkflowTypeEnum.QA
+    ) -> int:
+        """
+        세션 행이 없으면 일괄 생성 (FK 보장용, commit 하지 않음)
+        
+        Args:
+            session_ids: 세션 ID 목록
+            workflow_type: 새로 만들 세션의 워크플로우 타입
+        
+        Returns:
+            int: 새로 생성된 세션 수
+        """
+        session_ids = set(session_ids)
+        if not session_ids:
+            return 0
+        
+        existing = {
+            row[0] for row in self.db.query(Session.id).filter(Session.id.in_(session_ids)).all()
+        }
+        missing = [sid for sid in session_ids if sid not in existing]
+        if missing:
+            self.db.execute(
+                insert(Session),
+                [
+                    {"id": sid, "workflow_type": workflow_type, "state": {}}
+                    for sid in missing
+                ]
+            )
+        return len(missing)
+    
     # ============================================================
     # Slot Operations
     # ============================================================
@@ -257,6 +291,54 @@ class SessionRepository:
             )
             raise
     
+    def bulk_upsert_slots(self, slots: List[Dict[str, Any]]) -> int:
+        """
+        슬롯 일괄 upsert (단일 커밋)
+        
+        세션 행이 없으면 먼저 생성합니다 (FK 보장).
+        MySQL은 INSERT ... ON DUPLICATE KEY UPDATE 한 번으로 처리합니다.
+        
+        Args:
+            slots: [{"session_id", "slot_name", "slot_value"}, ...]
+        
+        Returns:
+            int: 처리한 슬롯 수
+        """
+        if not slots:
+            return 0
+        
+        try:
+            self.ensure_sessions(
+                (slot["session_id"] for slot in slots),
+                workflow_type=WorkflowTypeEnum.ELIGIBILITY
+            )
+            
+            if self.db.get_bind().dialect.name == "mysql":
+                from sqlalchemy.dialects.mysql import insert as mysql_insert
+                
+                stmt = mysql_insert(Slot).values(slots)
+                stmt = stmt.on_duplicate_key_update(slot_value=stmt.inserted.slot_value)
+                self.db.execute(stmt)
+            else:
+                for slot in slots:
+                    existing = self.get_slot(slot["session_id"], slot["slot_name"])
+                    if existing:
+                        existing.slot_value = slot["slot_value"]
+                    else:
+                        self.db.add(Slot(**slot))
+            
+            self.db.commit()
+            return len(slots)
+            
+        except Exception as e:
+            self.db.rollback()
+            logger.error(
+                "Error bulk upserting slots",
+                extra={"count": len(slots), "error": str(e)},
+                exc_info=True
+            )
+            raise
+    
     # ============================================================
     # Chat History Operations
     # ============================================================
@@ -284,6 +366,60 @@ class SessionRepository:
             )
             raise
     
+    def get_recent_chat_history(self, session_id: str, limit: int = 50) -> List[ChatHistory]:
+        """
+        최근 채팅 이력 조회 (오래된 순으로 정렬하여 반환)
+        
+        Args:
+            session_id: 세션 ID
+            limit: 반환 개수
+        
+        Returns:
+            List[ChatHistory]: 최근 채팅 이력 리스트
+        """
+        try:
+            rows = self.db.query(ChatHistory).filter(
+                ChatHistory.session_id == session_id
+            ).order_by(ChatHistory.created_at.desc(), ChatHistory.id.desc()).limit(limit).all()
+            return list(reversed(rows))
+        except Exception as e:
+            logger.error(
+                "Error getting recent chat history",
+                extra={"session_id": session_id, "error": str(e)},
+                exc_info=True
+            )
+            raise
+    
+    def bulk_add_chat_messages(self, messages: List[Dict[str, Any]]) -> int:
+        """
+        채팅 메시지 일괄 추가 (multi-row INSERT, 단일 커밋)
+        
+        세션 행이 없으면 먼저 생성합니다 (FK 보장).
+        
+        Args:
+            messages: [{"session_id", "role", "content", "chat_metadata", "created_at"}, ...]
+        
+        Returns:
+            int: 추가된 메시지 수
+        """
+        if not messages:
+            return 0
+        
+        try:
+            self.ensure_sessions(m["session_id"] for m in messages)
+            self.db.execute(insert(ChatHistory), messages)
+            self.db.commit()
+            return len(messages)
+            
+        except Exception as e:
+            self.db.rollback()
+            logger.error(
+                "Error bulk adding chat messages",
+                extra={"count": len(messages), "error": str(e)},
+                exc_info=True
+            )
+            raise
+    
     def add_chat_message(
         self,
         session_id: str,
@@ -308,7 +444,7 @@ class SessionRepository:
                 session_id=session_id,
                 role=role,
                 content=content,
-                metadata=metadata or {}
+                chat_metadata=metadata or {}
             )
             
             self.db.add(chat)
@@ -0,0 +1,288 @@
+"""
+Write-Behind Writer
+대화 이력 / 슬롯 비동기 일괄 저장 (요청 경로에서 DB 대기 없음)
+
+요청 경로는 큐에 넣기만 하고, 백그라운드 스레드가
+크기/시간 임계치마다 multi-row INSERT로 한 번에 커밋합니다.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime
+import json
+import queue
+import threading
+import time
+
+from ..config import get_settings
+from ..config.logger import get_logger
+
+logger = get_logger()
+
+# 큐 항목 종류
+_KIND_CHAT = "chat"
+_KIND_SLOT = "slot"
+
+
+class WriteBehindWriter:
+    """
+    배치 write-behind 저장기
+
+    - enqueue_*: 논블로킹 (큐가 가득 차면 버리고 dropped 카운트 증가)
+    - 백그라운드 스레드: batch_size 또는 flush_interval 도달 시 flush
+    - stop(): 남은 항목 모두 flush 후 종료 (이후 enqueue는 버리고 dropped 카운트 증가)
+
+    Attributes:
+        batch_size: 한 번에 저장할 최대 항목 수
+        flush_interval: 최대 대기 시간 (초)
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000
+    ):
+        """
+        Initialize writer
+
+        Args:
+            batch_size: 한 번에 저장할 최대 항목 수
+            flush_interval: 최대 대기 시간 (초)
+            max_queue_size: 큐 최대 크기
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Tuple[str, Dict[str, Any]]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._start_lock = threading.Lock()
+        self._closed = False
+        self._stats = {"enqueued": 0, "written": 0, "dropped": 0, "failed": 0, "flushes": 0}
+
+    # ============================================================
+    # Request path (non-blocking)
+    # ============================================================
+
+    def enqueue_chat_message(
+        self,
+        session_id: str,
+        role: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        created_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        채팅 메시지 저장 예약
+
+        Args:
+            session_id: 세션 ID
+            role: 역할 (user/assistant/system, 대소문자 무관)
+            content: 메시지 내용
+            metadata: 메타데이터 (선택)
+            created_at: 생성 시각 (기본값: 현재 UTC)
+
+        Returns:
+            bool: 큐 적재 성공 여부
+        """
+        return self._put(_KIND_CHAT, {
+            "session_id": session_id,
+            "role": role.upper(),
+            "content": content,
+            "chat_metadata": metadata or {},
+            "created_at": created_at or datetime.utcnow()
+        })
+
+    def enqueue_slot(self, session_id: str, slot_name: str, slot_value: Any) -> bool:
+        """
+        슬롯 저장 예약 (같은 배치 내 동일 슬롯은 마지막 값만 저장)
+
+        Args:
+            session_id: 세션 ID
+            slot_name: 슬롯 이름
+            slot_value: 슬롯 값 (문자열이 아니면 JSON 직렬화)
+
+        Returns:
+            bool: 큐 적재 성공 여부
+        """
+        if slot_value is not None and not isinstance(slot_value, str):
+            slot_value = json.dumps(slot_value, ensure_ascii=False)
+        return self._put(_KIND_SLOT, {
+            "session_id": session_id,
+            "slot_name": slot_name,
+            "slot_value": slot_value
+        })
+
+    def _put(self, kind: str, item: Dict[str, Any]) -> bool:
+        if self._closed:
+            # stop() 이후 적재하면 새 데몬 스레드가 뜨고 종료 시 유실되므로 받지 않음
+            self._stats["dropped"] += 1
+            logger.warning(
+                "Write-behind writer stopped, dropping item",
+                extra={"kind": kind, "session_id": item.get("session_id")}
+            )
+            return False
+        if self._thread is None or not self._thread.is_alive():
+            with self._start_lock:
+                if not self._closed:
+                    self._start_thread()
+        try:
+            self._queue.put_nowait((kind, item))
+            self._stats["enqueued"] += 1
+            return True
+        except queue.Full:
+            self._stats["dropped"] += 1
+            logger.warning(
+                "Write-behind queue full, dropping item",
+                extra={"kind": kind, "session_id": item.get("session_id")}
+            )
+            return False
+
+    # ============================================================
+    # Lifecycle
+    # ============================================================
+
+    def start(self):
+        """백그라운드 스레드 시작 (이미 실행 중이면 무시, stop() 이후 호출하면 다시 적재 허용)"""
+        with self._start_lock:
+            self._closed = False
+            self._start_thread()
+
+    def _start_thread(self):
+        """_start_lock을 잡은 상태에서 호출 (이전 스레드가 아직 flush 중이면 새로 띄우지 않음)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="write-behind-writer",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Write-behind writer started",
+            extra={"batch_size": self.batch_size, "flush_interval": self.flush_interval}
+        )
+
+    def stop(self, timeout: float = 10.0):
+        """
+        남은 항목을 모두 flush하고 종료 (shutdown 시 호출)
+
+        Args:
+            timeout: 최대 대기 시간 (초)
+        """
+        with self._start_lock:
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        self._stop_event.set()
+        thread.join(timeout=timeout)
+        if thread.is_alive():
+            # 아직 flush 중인 스레드를 잊으면 다음 start()가 두 번째 writer를 띄움
+            logger.warning("Write-behind writer still flushing after stop timeout", extra=self.get_stats())
+            return
+        self._thread = None
+        logger.info("Write-behind writer stopped", extra=self.get_stats())
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        저장 통계 조회 (모니터링용)
+
+        Returns:
+            Dict: enqueued/written/dropped/failed/flushes/pending
+        """
+        return {**self._stats, "pending": self._queue.qsize()}
+
+    # ============================================================
+    # Background loop
+    # ============================================================
+
+    def _run(self):
+        batch: List[Tuple[str, Dict[str, Any]]] = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while True:
+            stopping = self._stop_event.is_set()
+            timeout = 0 if stopping else max(0.0, deadline - time.monotonic())
+            try:
+                batch.append(self._queue.get(timeout=timeout) if timeout else self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            if batch and (
+                len(batch) >= self.batch_size
+                or time.monotonic() >= deadline
+                or (stopping and self._queue.empty())
+            ):
+                self._flush(batch)
+                batch = []
+
+            if time.monotonic() >= deadline:
+                deadline = time.monotonic() + self.flush_interval
+
+            if stopping and not batch and self._queue.empty():
+                return
+
+    def _flush(self, batch: List[Tuple[str, Dict[str, Any]]]):
+        """배치를 multi-row INSERT / upsert로 저장 (실패 시 로그 후 폐기)"""
+        from .engine import get_db
+        from .repositories.session_repo import SessionRepository
+
+        messages = [item for kind, item in batch if kind == _KIND_CHAT]
+        # 동일 (session_id, slot_name)은 마지막 값만 유지
+        slots: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for kind, item in batch:
+            if kind == _KIND_SLOT:
+                slots[(item["session_id"], item["slot_name"])] = item
+
+        started = time.perf_counter()
+        try:
+            with get_db() as db:
+                repo = SessionRepository(db)
+                repo.bulk_add_chat_messages(messages)
+                repo.bulk_upsert_slots(list(slots.values()))
+
+            self._stats["written"] += len(batch)
+            self._stats["flushes"] += 1
+            logger.debug(
+                "Write-behind batch flushed",
+                extra={
+                    "chat_messages": len(messages),
+                    "slots": len(slots),
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 2)
+                }
+            )
+        except Exception as e:
+            self._stats["failed"] += len(batch)
+            logger.error(
+                "Write-behind batch flush failed",
+                extra={"chat_messages": len(messages), "slots": len(slots), "error": str(e)},
+                exc_info=True
+            )
+
+
+# 싱글톤 인스턴스
+_writer_instance: Optional[WriteBehindWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_write_behind_writer() -> WriteBehindWriter:
+    """
+    WriteBehindWriter 싱글톤 인스턴스 반환
+
+    Returns:
+        WriteBehindWriter: 저장기 인스턴스
+    """
+    global _writer_instance
+
+    if _writer_instance is None:
+        with _writer_lock:
+            if _writer_instance is None:
+                settings = get_settings()
+                _writer_instance = WriteBehindWriter(
+                    batch_size=settings.write_behind_batch_size,
+                    flush_interval=settings.write_behind_flush_interval,
+                    max_queue_size=settings.write_behind_queue_size
+                )
+
+    return _writer_instance
@@ -3,7 +3,7 @@ Eligibility Domain Models
 자격 확인 관련 Pydantic 스키마
 """
 
-from typing import List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
 from pydantic import BaseModel, Field
 
 
@@ -124,3 +124,56 @@ class EligibilityResult(BaseModel):
                 ]
             }
         }
+
+
+class EligibilityBatchRequest(BaseModel):
+    """여러 정책 일괄 자격 확인 요청"""
+    
+    profile: Dict[str, Any] = Field(..., description="사용자 정보 (슬롯 키 또는 조건 타입 → 답변)")
+    policy_ids: Optional[List[int]] = Field(None, max_length=5000, description="대상 정책 ID 목록")
+    query: Optional[str] = Field(None, description="대상 정책 검색어 (policy_ids 대신 사용)")
+    region: Optional[str] = Field(None, description="검색 시 지역 필터")
+    category: Optional[str] = Field(None, description="검색 시 카테고리 필터")
+    limit: int = Field(200, ge=1, le=5000, description="검색 시 최대 정책 수")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "profile": {
+                    "age": "만 29세",
+                    "location": "서울 강남구",
+                    "business_age": "예비창업자"
+                },
+                "query": "창업",
+                "limit": 200
+            }
+        }
+
+
+class PolicyScreeningResult(BaseModel):
+    """정책별 일괄 판정 결과"""
+    
+    policy_id: int = Field(..., description="정책 ID")
+    policy_name: Optional[str] = Field(None, description="정책명")
+    status: Literal["PASS", "FAIL", "UNKNOWN"] = Field(..., description="판정 결과")
+    reason: str = Field(..., description="판정 사유")
+    missing_slots: List[str] = Field(default_factory=list, description="판정에 필요한 미입력 정보")
+    failed_conditions: List[str] = Field(default_factory=list, description="충족하지 못한 조건명")
+    needs_review: bool = Field(False, description="대화형 자격 확인이 필요한 조건 포함 여부")
+
+
+class MissingSlot(BaseModel):
+    """추가로 입력하면 판정 가능한 정보"""
+    
+    slot: str = Field(..., description="슬롯 키")
+    question: Optional[str] = Field(None, description="해당 정보를 묻는 질문")
+    policy_count: int = Field(..., description="이 정보가 필요한 정책 수")
+
+
+class EligibilityBatchResponse(BaseModel):
+    """여러 정책 일괄 자격 확인 응답"""
+    
+    results: List[PolicyScreeningResult] = Field(..., description="정책별 결과")
+    summary: Dict[str, int] = Field(..., description="결과별 정책 수")
+    missing_slots: List[MissingSlot] = Field(default_factory=list, description="미입력 정보 (필요 정책 수 내림차순)")
+    elapsed_ms: float = Field(..., description="판정 소요 시간 (ms)")
@@ -1,6 +1,8 @@
 """
 QA Agent 평가 모듈
 LangSmith를 사용한 자동화된 평가
+
+오프라인 검색 벤치마크는 retrieval_bench 모듈 참고 (scripts/bench_retrieval.py)
 """
 
 from .datasets import QA_EVALUATION_DATASET
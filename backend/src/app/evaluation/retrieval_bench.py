@@ -0,0 +1,701 @@
+"""
+오프라인 검색 벤치마크
+고정 코퍼스 스냅샷 + 라벨 질의 세트로 검색 모드별 품질과 지연 시간을 측정합니다.
+
+LangSmith / Qdrant / BGE-M3 / MySQL 없이 노트북에서 실행할 수 있도록
+- Qdrant → InMemoryVectorIndex (스냅샷의 청크 벡터, 코사인 유사도)
+- 임베더 → SnapshotEmbedder (스냅샷 생성 시 미리 계산한 질의 벡터)
+- MySQL 상세 조회 단계는 제외 (SimpleSearchService.rank_candidates까지 측정)
+
+측정 항목 (모드별: dense / sparse / hybrid_rrf / hybrid_weighted):
+- 품질: recall@k, MRR, nDCG@k (질의 태그별 포함)
+- 지연: p50/p95/p99, 단계별 평균 (embed / qdrant / bm25 / fuse), 처리량(QPS)
+
+스냅샷 디렉터리 구성:
+- snapshot.json: 메타 정보, 청크 payload 목록, 질의 목록
+  질의 형식: {"id", "query", "relevant": {policy_id: 등급}, "tags": [...], "region"?, "category"?}
+- vectors.npy: 청크 임베딩 (float32, 청크 순서)
+- query_vectors.npy: 질의 임베딩 (float32, 질의 순서)
+"""
+
+import hashlib
+import json
+import math
+import platform
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config.logger import get_logger
+
+logger = get_logger()
+
+SNAPSHOT_FORMAT_VERSION = 1
+REPORT_FORMAT_VERSION = 1
+
+SNAPSHOT_FILE = "snapshot.json"
+VECTORS_FILE = "vectors.npy"
+QUERY_VECTORS_FILE = "query_vectors.npy"
+
+# 벤치마크 모드 → (rank_candidates mode, RRF 사용 여부)
+MODES: Dict[str, Tuple[str, bool]] = {
+    "dense": ("dense", True),
+    "sparse": ("sparse", True),
+    "hybrid_rrf": ("hybrid", True),
+    "hybrid_weighted": ("hybrid", False),
+}
+
+DEFAULT_KS = (1, 5, 10)
+STAGES = ("embed", "qdrant", "bm25", "fuse")
+
+
+@dataclass
+class LabeledQuery:
+    """라벨 질의 (relevant: policy_id → 관련도 등급, 1 이상이면 정답)"""
+    id: str
+    query: str
+    relevant: Dict[int, int]
+    tags: List[str] = field(default_factory=list)
+    region: Optional[str] = None
+    category: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], default_id: str = "") -> "LabeledQuery":
+        """
+        JSON 질의 → LabeledQuery
+
+        relevant는 id 목록([3, 7]) 또는 {id: 등급} 모두 허용합니다.
+        """
+        relevant = data.get("relevant") or {}
+        if isinstance(relevant, dict):
+            grades = {int(pid): int(grade) for pid, grade in relevant.items()}
+        else:
+            grades = {int(pid): 1 for pid in relevant}
+        return cls(
+            id=str(data.get("id") or default_id),
+            query=data["query"],
+            relevant=grades,
+            tags=list(data.get("tags") or []),
+            region=data.get("region"),
+            category=data.get("category"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "id": self.id,
+            "query": self.query,
+            "relevant": {str(pid): grade for pid, grade in self.relevant.items()},
+            "tags": self.tags,
+        }
+        if self.region:
+            data["region"] = self.region
+        if self.category:
+            data["category"] = self.category
+        return data
+
+
+@dataclass
+class CorpusSnapshot:
+    """
+    고정 코퍼스 스냅샷
+
+    Attributes:
+        chunks: 청크 payload 목록 (Qdrant payload와 같은 형식: content, policy_id, doc_type, ...)
+        vectors: 청크 임베딩 (len(chunks) x dim)
+        queries: 라벨 질의 목록
+        query_vectors: 질의 임베딩 (len(queries) x dim)
+        meta: 생성 정보 (임베딩 모델, 원본 데이터, 생성 시각 등)
+    """
+    chunks: List[Dict[str, Any]]
+    vectors: np.ndarray
+    queries: List[LabeledQuery]
+    query_vectors: np.ndarray
+    meta: Dict[str, Any] = field(default_factory=dict)
+    fingerprint: str = ""
+
+    def save(self, path: Path) -> str:
+        """
+        스냅샷 디렉터리 저장
+
+        Args:
+            path: 저장할 디렉터리 (없으면 생성)
+
+        Returns:
+            str: 스냅샷 지문 (sha256 앞 16자리)
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        document = {
+            "format": SNAPSHOT_FORMAT_VERSION,
+            "meta": self.meta,
+            "chunks": self.chunks,
+            "queries": [query.to_dict() for query in self.queries],
+        }
+        with open(path / SNAPSHOT_FILE, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False)
+        np.save(path / VECTORS_FILE, np.asarray(self.vectors, dtype=np.float32))
+        np.save(path / QUERY_VECTORS_FILE, np.asarray(self.query_vectors, dtype=np.float32))
+        self.fingerprint = _fingerprint(path)
+        return self.fingerprint
+
+    @classmethod
+    def load(cls, path: Path) -> "CorpusSnapshot":
+        """
+        스냅샷 디렉터리 로드
+
+        Raises:
+            ValueError: 형식 버전 불일치 또는 벡터/목록 개수 불일치
+        """
+        path = Path(path)
+        with open(path / SNAPSHOT_FILE, "r", encoding="utf-8") as f:
+            document = json.load(f)
+        if document.get("format") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format: {document.get('format')}")
+
+        chunks = document["chunks"]
+        queries = [LabeledQuery.from_dict(q, default_id=f"q{i}") for i, q in enumerate(document["queries"])]
+        vectors = np.load(path / VECTORS_FILE)
+        query_vectors = np.load(path / QUERY_VECTORS_FILE)
+        if len(vectors) != len(chunks) or len(query_vectors) != len(queries):
+            raise ValueError(
+                f"Snapshot size mismatch: chunks={len(chunks)} vectors={len(vectors)} "
+                f"queries={len(queries)} query_vectors={len(query_vectors)}"
+            )
+        return cls(
+            chunks=chunks,
+            vectors=vectors,
+            queries=queries,
+            query_vectors=query_vectors,
+            meta=document.get("meta", {}),
+            fingerprint=_fingerprint(path),
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "chunks": len(self.chunks),
+            "policies": len({chunk.get("policy_id") for chunk in self.chunks}),
+            "queries": len(self.queries),
+            "dimension": int(self.vectors.shape[1]) if self.vectors.ndim == 2 else 0,
+            "embedding_model": self.meta.get("embedding_model"),
+        }
+
+
+def _fingerprint(path: Path) -> str:
+    digest = hashlib.sha256()
+    for name in (SNAPSHOT_FILE, VECTORS_FILE, QUERY_VECTORS_FILE):
+        with open(path / name, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class InMemoryVectorIndex:
+    """
+    QdrantManager 대체용 메모리 벡터 인덱스 (코사인 유사도, 전수 비교)
+
+    search / get_all_documents의 입출력 형식은 QdrantManager와 같습니다.
+    """
+
+    def __init__(self, vectors: np.ndarray, payloads: List[Dict[str, Any]]):
+        self.vectors = _normalize(vectors)
+        self.payloads = payloads
+        self._filter_masks: Dict[Tuple[Tuple[str, Any], ...], np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    def _mask(self, filter_dict: Dict[str, Any]) -> np.ndarray:
+        key = tuple(sorted(filter_dict.items()))
+        mask = self._filter_masks.get(key)
+        if mask is None:
+            mask = np.array(
+                [all(payload.get(k) == v for k, v in key) for payload in self.payloads],
+                dtype=bool
+            )
+            self._filter_masks[key] = mask
+        return mask
+
+    def search(
+        self,
+        query_vector: Sequence[float],
+        limit: int = 10,
+        score_threshold: Optional[float] = None,
+        filter_dict: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        벡터 검색
+
+        Args:
+            query_vector: 질의 벡터
+            limit: 최대 결과 수
+            score_threshold: 최소 유사도
+            filter_dict: payload 일치 필터 (예: {"region": "서울"})
+
+        Returns:
+            List[Dict]: [{"id", "score", "payload"}] 점수 내림차순
+        """
+        scores = self.vectors @ _normalize(query_vector)
+        if filter_dict:
+            scores = np.where(self._mask(filter_dict), scores, -np.inf)
+
+        limit = min(limit, len(scores))
+        if limit <= 0:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        results = []
+        for index in top:
+            score = float(scores[index])
+            if score == -np.inf or (score_threshold is not None and score < score_threshold):
+                break
+            results.append({"id": int(index), "score": score, "payload": self.payloads[index]})
+        return results
+
+    def get_all_documents(
+        self,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        limit: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """필터링된 문서 목록 (벡터 없이 payload만)"""
+        indices = range(len(self.payloads))
+        if filter_dict:
+            indices = np.flatnonzero(self._mask(filter_dict))
+        return [{"id": int(i), "payload": self.payloads[i]} for i in list(indices)[:limit]]
+
+
+class SnapshotEmbedder:
+    """
+    스냅샷의 질의 벡터를 돌려주는 임베더
+
+    스냅샷에 없는 질의는 fallback 임베더(실제 모델)가 있으면 위임하고, 없으면 KeyError.
+    """
+
+    def __init__(self, query_vectors: Dict[str, np.ndarray], fallback: Optional[Any] = None):
+        self._vectors = query_vectors
+        self.fallback = fallback
+        first = next(iter(query_vectors.values()), None)
+        self.dimension = int(first.shape[-1]) if first is not None else getattr(fallback, "dimension", 0)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: CorpusSnapshot, fallback: Optional[Any] = None) -> "SnapshotEmbedder":
+        return cls(
+            {query.query: snapshot.query_vectors[i] for i, query in enumerate(snapshot.queries)},
+            fallback=fallback
+        )
+
+    def embed_text(self, text: str) -> np.ndarray:
+        vector = self._vectors.get(text)
+        if vector is not None:
+            return vector
+        if self.fallback is None:
+            raise KeyError(f"Query not in snapshot: {text[:50]}")
+        return np.asarray(self.fallback.embed_text(text), dtype=np.float32)
+
+
+# ============================================================================
+# 품질 지표
+# ============================================================================
+
+def recall_at_k(ranked: Sequence[int], relevant: Dict[int, int], k: int) -> float:
+    """상위 k개 안에 들어온 정답 비율"""
+    positives = {pid for pid, grade in relevant.items() if grade > 0}
+    if not positives:
+        return 0.0
+    return len(positives.intersection(ranked[:k])) / len(positives)
+
+
+def reciprocal_rank(ranked: Sequence[int], relevant: Dict[int, int]) -> float:
+    """첫 정답 순위의 역수 (없으면 0)"""
+    for rank, pid in enumerate(ranked, 1):
+        if relevant.get(pid, 0) > 0:
+            return 1.0 / rank
+    return 0.0
+
+
+def ndcg_at_k(ranked: Sequence[int], relevant: Dict[int, int], k: int) -> float:
+    """등급 관련도 기반 nDCG@k (gain = 2^등급 - 1)"""
+    dcg = sum(
+        (2 ** relevant.get(pid, 0) - 1) / math.log2(rank + 1)
+        for rank, pid in enumerate(ranked[:k], 1)
+    )
+    ideal = sorted((grade for grade in relevant.values() if grade > 0), reverse=True)[:k]
+    idcg = sum((2 ** grade - 1) / math.log2(rank + 1) for rank, grade in enumerate(ideal, 1))
+    return dcg / idcg if idcg else 0.0
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _quality(rankings: List[List[int]], queries: List[LabeledQuery], ks: Sequence[int]) -> Dict[str, float]:
+    n = len(queries) or 1
+    quality = {"mrr": sum(reciprocal_rank(r, q.relevant) for r, q in zip(rankings, queries)) / n}
+    for k in ks:
+        quality[f"recall@{k}"] = sum(recall_at_k(r, q.relevant, k) for r, q in zip(rankings, queries)) / n
+        quality[f"ndcg@{k}"] = sum(ndcg_at_k(r, q.relevant, k) for r, q in zip(rankings, queries)) / n
+    return {name: round(value, 4) for name, value in quality.items()}
+
+
+def _stage_totals() -> Dict[str, Tuple[float, int]]:
+    from ..observability.metrics import SEARCH_STAGE_SECONDS
+
+    totals = {}
+    for stage in STAGES:
+        _, total, count = SEARCH_STAGE_SECONDS.labels(stage=stage).snapshot()
+        totals[stage] = (total, count)
+    return totals
+
+
+# ============================================================================
+# 벤치마크 실행
+# ============================================================================
+
+def run_mode(
+    mode: str,
+    snapshot: CorpusSnapshot,
+    index: InMemoryVectorIndex,
+    embedder: SnapshotEmbedder,
+    ks: Sequence[int] = DEFAULT_KS,
+    repeat: int = 3,
+    score_threshold: Optional[float] = None,
+    config: Optional[Any] = None
+) -> Dict[str, Any]:
+    """
+    검색 모드 1개 벤치마크
+
+    품질은 첫 회차 순위로 계산하고, 지연 시간은 모든 회차(워밍업 1회 제외)를 모읍니다.
+
+    Args:
+        mode: MODES의 키
+        snapshot: 코퍼스 스냅샷
+        index: 벡터 인덱스
+        embedder: 스냅샷 임베더
+        ks: recall/nDCG 컷오프
+        repeat: 질의 세트 반복 횟수 (지연 시간 표본 수)
+        score_threshold: Dense 유사도 임계값 (None이면 설정 기본값)
+        config: SearchConfig (None이면 기본 설정)
+
+    Returns:
+        Dict: 모드별 결과 (quality, by_tag, latency_ms, stages_ms, throughput_qps, ...)
+
+    Raises:
+        RuntimeError: BM25 인덱스 구축 실패 (sparse/hybrid 모드)
+    """
+    from ..services.search_config import get_search_config
+    from ..services.simple_search_service import SimpleSearchService
+    from ..vector_store.sparse_search import HybridSearcher
+
+    search_mode, use_rrf = MODES[mode]
+    config = config or get_search_config()
+    if score_threshold is None:
+        score_threshold = config.default_score_threshold
+
+    service = SimpleSearchService(
+        config=config,
+        qdrant_manager=index,
+        embedder=embedder,
+        hybrid_searcher=HybridSearcher(
+            dense_weight=config.dense_weight,
+            sparse_weight=config.sparse_weight,
+            use_rrf=use_rrf,
+            rrf_k=config.rrf_k
+        )
+    )
+
+    started = time.perf_counter()
+    if search_mode != "dense" and not service.warmup():
+        raise RuntimeError(f"{mode}: BM25 index build failed (see error log)")
+    index_build_ms = (time.perf_counter() - started) * 1000
+
+    def rank(query: LabeledQuery) -> List[int]:
+        ranked, _ = service.rank_candidates(
+            query=query.query,
+            region=query.region,
+            category=query.category,
+            score_threshold=score_threshold,
+            mode=search_mode
+        )
+        return [pid for pid, _, _ in ranked]
+
+    queries = snapshot.queries
+    rankings = [rank(query) for query in queries]  # 워밍업 겸 품질 측정
+
+    stages_before = _stage_totals()
+    latencies: List[float] = []
+    wall_started = time.perf_counter()
+    for _ in range(max(1, repeat)):
+        for query in queries:
+            query_started = time.perf_counter()
+            rank(query)
+            latencies.append((time.perf_counter() - query_started) * 1000)
+    wall_seconds = time.perf_counter() - wall_started
+    stages_after = _stage_totals()
+
+    stages_ms = {}
+    for stage in STAGES:
+        total = stages_after[stage][0] - stages_before[stage][0]
+        count = stages_after[stage][1] - stages_before[stage][1]
+        if count:
+            stages_ms[stage] = round(total / count * 1000, 3)
+
+    by_tag: Dict[str, Dict[str, float]] = {}
+    for tag in sorted({tag for query in queries for tag in query.tags}):
+        selected = [(r, q) for r, q in zip(rankings, queries) if tag in q.tags]
+        by_tag[tag] = {
+            "queries": len(selected),
+            **_quality([r for r, _ in selected], [q for _, q in selected], ks),
+        }
+
+    return {
+        "mode": mode,
+        "queries": len(queries),
+        "samples": len(latencies),
+        "quality": _quality(rankings, queries, ks),
+        "by_tag": by_tag,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50), 3),
+            "p95": round(percentile(latencies, 0.95), 3),
+            "p99": round(percentile(latencies, 0.99), 3),
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        },
+        "stages_ms": stages_ms,
+        "throughput_qps": round(len(latencies) / wall_seconds, 1) if wall_seconds else 0.0,
+        "index_build_ms": round(index_build_ms, 1),
+        "misses": [q.id for r, q in zip(rankings, queries) if reciprocal_rank(r[:max(ks)], q.relevant) == 0.0],
+    }
+
+
+def run_benchmark(
+    snapshot: CorpusSnapshot,
+    modes: Optional[Iterable[str]] = None,
+    ks: Sequence[int] = DEFAULT_KS,
+    repeat: int = 3,
+    score_threshold: Optional[float] = None,
+    fallback_embedder: Optional[Any] = None,
+    label: str = ""
+) -> Dict[str, Any]:
+    """
+    스냅샷에 대해 여러 검색 모드 벤치마크 실행
+
+    Args:
+        snapshot: 코퍼스 스냅샷
+        modes: 실행할 모드 (기본값: 전체)
+        ks: recall/nDCG 컷오프
+        repeat: 지연 시간 측정 반복 횟수
+        score_threshold: Dense 유사도 임계값
+        fallback_embedder: 스냅샷에 없는 질의용 임베더 (선택)
+        label: 보고서 라벨 (예: git 커밋)
+
+    Returns:
+        Dict: JSON 직렬화 가능한 보고서
+
+    Raises:
+        ValueError: 알 수 없는 모드
+    """
+    from ..services.search_config import get_search_config
+
+    modes = list(modes or MODES)
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark modes: {unknown} (available: {list(MODES)})")
+
+    config = get_search_config()
+    index = InMemoryVectorIndex(snapshot.vectors, snapshot.chunks)
+    embedder = SnapshotEmbedder.from_snapshot(snapshot, fallback=fallback_embedder)
+
+    results = {}
+    for mode in modes:
+        logger.info("Running retrieval benchmark", extra={"mode": mode, "queries": len(snapshot.queries)})
+        results[mode] = run_mode(
+            mode, snapshot, index, embedder,
+            ks=ks, repeat=repeat, score_threshold=score_threshold, config=config
+        )
+
+    return {
+        "format": REPORT_FORMAT_VERSION,
+        "label": label,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "snapshot": snapshot.summary(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "numpy": np.__version__,
+        },
+        "config": {
+            "ks": list(ks),
+            "repeat": repeat,
+            "score_threshold": score_threshold if score_threshold is not None else config.default_score_threshold,
+            "qdrant_limit": config.qdrant_limit,
+            "dense_weight": config.dense_weight,
+            "sparse_weight": config.sparse_weight,
+            "rrf_k": config.rrf_k,
+            "sparse_min_score": config.sparse_min_score,
+        },
+        "modes": results,
+    }
+
+
+def compare_reports(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    max_quality_drop: float = 0.01,
+    max_latency_increase: float = 0.25,
+    latency_metric: str = "p95"
+) -> List[str]:
+    """
+    기준 보고서 대비 회귀 목록
+
+    - 품질: 지표가 max_quality_drop(절대값)보다 많이 떨어지면 회귀
+    - 지연: latency_metric이 max_latency_increase(비율)보다 많이 늘면 회귀
+    스냅샷 지문이 다르면 품질 비교는 의미가 없으므로 지연 시간만 비교합니다.
+
+    Args:
+        current: 이번 보고서
+        baseline: 기준 보고서
+        max_quality_drop: 허용 품질 하락 (예: 0.01 = 1%p)
+        max_latency_increase: 허용 지연 증가 비율 (예: 0.25 = 25%)
+        latency_metric: 비교할 지연 지표 (p50 | p95 | p99 | mean)
+
+    Returns:
+        List[str]: 회귀 설명 (없으면 빈 리스트)
+    """
+    regressions: List[str] = []
+    same_corpus = current["snapshot"].get("fingerprint") == baseline["snapshot"].get("fingerprint")
+
+    for mode, result in current["modes"].items():
+        base = baseline.get("modes", {}).get(mode)
+        if base is None:
+            continue
+
+        if same_corpus:
+            for metric, value in result["quality"].items():
+                base_value = base["quality"].get(metric)
+                if base_value is not None and base_value - value > max_quality_drop:
+                    regressions.append(f"{mode} {metric}: {base_value:.4f} -> {value:.4f}")
+
+        base_latency = base["latency_ms"].get(latency_metric, 0.0)
+        latency = result["latency_ms"].get(latency_metric, 0.0)
+        if base_latency > 0 and latency > base_latency * (1 + max_latency_increase):
+            regressions.append(
+                f"{mode} latency {latency_metric}: {base_latency:.3f}ms -> {latency:.3f}ms "
+                f"(+{(latency / base_latency - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+# ============================================================================
+# 스냅샷 생성
+# ============================================================================
+
+def policy_documents(policy: Dict[str, Any]) -> Dict[str, str]:
+    """정책 1건 → 문서 유형별 본문 (scripts/ingest_data.py와 같은 필드 구성)"""
+    return {
+        "OVERVIEW": policy.get("program_overview") or "",
+        "TARGET": policy.get("apply_target") or "",
+        "SUPPORT": policy.get("support_description") or "",
+        "PROCESS": policy.get("biz_process") or "",
+        "CONTACT": f"{policy.get('contact_agency') or ''} {policy.get('application_method') or ''}",
+    }
+
+
+def known_item_queries(policies: List[Dict[str, Any]], id_of: Callable[[int, Dict[str, Any]], int]) -> List[LabeledQuery]:
+    """
+    사업명 → 해당 정책 known-item 질의 (띄어쓰기 유지/제거 두 가지)
+
+    사업명은 색인 본문에 들어가지 않으므로 본문 표현과의 의미/어휘 일치로 찾아야 합니다.
+    """
+    queries: List[LabeledQuery] = []
+    seen = set()
+    for i, policy in enumerate(policies, 1):
+        name = (policy.get("program_name") or "").strip()
+        if not name or name in seen:
+            continue
+        seen.add(name)
+        pid = id_of(i, policy)
+        queries.append(LabeledQuery(id=f"name-{pid}", query=name, relevant={pid: 1}, tags=["known_item", "spaced"]))
+        if " " in name:
+            queries.append(LabeledQuery(
+                id=f"name-{pid}-unspaced", query=name.replace(" ", ""), relevant={pid: 1},
+                tags=["known_item", "unspaced"]
+            ))
+    return queries
+
+
+def build_snapshot(
+    policies: List[Dict[str, Any]],
+    embedder: Any,
+    queries: List[LabeledQuery],
+    id_of: Callable[[int, Dict[str, Any]], int],
+    chunk_workers: Optional[int] = None,
+    batch_size: int = 32,
+    meta: Optional[Dict[str, Any]] = None
+) -> CorpusSnapshot:
+    """
+    정책 데이터 → 스냅샷 (적재 파이프라인과 같은 청킹 + 임베딩)
+
+    Args:
+        policies: data.json 정책 목록
+        embedder: embed_batch를 제공하는 임베더 (BGE-M3)
+        queries: 라벨 질의 목록
+        id_of: (1부터 시작하는 순번, 정책) → policy_id
+        chunk_workers: 청킹 프로세스 수
+        batch_size: 임베딩 배치 크기
+        meta: 추가 메타 정보
+
+    Returns:
+        CorpusSnapshot: 저장 전 스냅샷
+    """
+    from ..vector_store.chunker import chunk_documents
+
+    sources: List[Tuple[str, Dict[str, Any]]] = []
+    for i, policy in enumerate(policies, 1):
+        for doc_type, content in policy_documents(policy).items():
+            if content.strip():
+                sources.append((content, {
+                    "policy_id": id_of(i, policy),
+                    "doc_type": doc_type,
+                    "region": policy.get("region"),
+                    "category": policy.get("category"),
+                    "program_id": policy.get("program_id"),
+                }))
+
+    chunks: List[Dict[str, Any]] = []
+    for chunked in chunk_documents(sources, workers=chunk_workers):
+        chunks.extend(
+            {"content": chunk["content"], **chunk["metadata"], "chunk_index": chunk["chunk_index"]}
+            for chunk in chunked
+            if chunk["content"].strip()
+        )
+
+    logger.info("Embedding snapshot corpus", extra={"chunks": len(chunks), "queries": len(queries)})
+    vectors = embedder.embed_batch(texts=[chunk["content"] for chunk in chunks], batch_size=batch_size, show_progress=True)
+    query_vectors = embedder.embed_batch(texts=[query.query for query in queries], batch_size=batch_size)
+
+    return CorpusSnapshot(
+        chunks=chunks,
+        vectors=np.asarray(vectors, dtype=np.float32),
+        queries=queries,
+        query_vectors=np.asarray(query_vectors, dtype=np.float32),
+        meta={
+            "embedding_model": getattr(embedder, "model_name", None),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            **(meta or {}),
+        },
+    )
@@ -1,9 +1,15 @@
 """LLM module"""
 
-from .openai_client import OpenAIClient, get_openai_client
+from .openai_client import OpenAIClient, LLMMetrics, get_openai_client, close_openai_client
+from .rate_limiter import TokenBucketRateLimiter
+from .response_cache import LLMResponseCache
 
 __all__ = [
     "OpenAIClient",
+    "LLMMetrics",
     "get_openai_client",
+    "close_openai_client",
+    "TokenBucketRateLimiter",
+    "LLMResponseCache",
 ]
 
@@ -1,60 +1,223 @@
 """
 OpenAI Client
-LLM 호출 래퍼 (스트리밍 지원)
+LLM 호출 게이트웨이 (스트리밍 지원)
+
+OpenAI 호환 Chat Completions API를 httpx로 직접 호출합니다.
+- 연결 풀: 동기/비동기 클라이언트 공용 설정 (keep-alive 재사용)
+- 속도 제한: RPM/TPM 토큰 버킷
+- 재시도: 429/5xx/네트워크 오류에 지수 백오프 + full jitter (Retry-After 우선)
+- 헤징: 일정 시간 응답이 없으면 같은 요청을 한 번 더 보내 먼저 온 응답 사용 (선택)
+- 메트릭: 호출별 지연시간/토큰 수 집계 (/metrics 히스토그램: 첫 토큰 시간, tokens/sec)
+- 응답 캐시: temperature=0 비스트리밍 호출은 동일 입력이면 네트워크 없이 응답
+
+openai_base_url만 바꾸면 로컬 가짜 서버로 테스트할 수 있습니다.
 """
 
-from typing import List, Dict, Any, Optional, AsyncGenerator
+import asyncio
+import json
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from functools import lru_cache
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+import httpx
 
 from ..config import get_settings
 from ..config.logger import get_logger
 from ..observability import trace_llm_call
+from ..observability.metrics import (
+    LLM_REQUEST_SECONDS,
+    LLM_REQUESTS_TOTAL,
+    LLM_TIME_TO_FIRST_TOKEN_SECONDS,
+    LLM_TOKENS_PER_SECOND,
+    LLM_TOKENS_TOTAL,
+)
+from .rate_limiter import TokenBucketRateLimiter
+from .response_cache import create_response_cache, make_cache_key
 
 logger = get_logger()
 settings = get_settings()
 
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 20.0
+DEFAULT_COMPLETION_TOKENS = 512
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    """닫힌 이벤트 루프에 묶였던 AsyncClient 정리 (소켓 해제, 오류는 무시)"""
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.debug("Failed to close stale async client", extra={"error": str(e)})
+
+
+class LLMMetrics:
+    """
+    LLM 호출 메트릭 (프로세스 내 집계)
+
+    Attributes:
+        window: 지연시간 백분위 계산에 쓰는 최근 호출 수
+    """
+
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._latencies: deque = deque(maxlen=window)
+        self._first_token: deque = deque(maxlen=window)
+        self._counters = {
+            "calls": 0,
+            "errors": 0,
+            "retries": 0,
+            "hedged": 0,
+            "streamed": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "rate_limited_seconds": 0.0,
+        }
+
+    def record(
+        self,
+        latency_ms: float,
+        ok: bool,
+        retries: int = 0,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        hedged: bool = False,
+        streamed: bool = False,
+        first_token_ms: Optional[float] = None,
+        rate_limited_seconds: float = 0.0,
+        output_chunks: int = 0
+    ) -> None:
+        """
+        호출 1건 기록 (내부 집계 + /metrics 히스토그램)
+
+        Args:
+            output_chunks: 스트리밍 청크 수 (usage가 없을 때 completion 토큰 수 대용)
+        """
+        mode = "stream" if streamed else "complete"
+        LLM_REQUESTS_TOTAL.labels(mode, "ok" if ok else "error").inc()
+        if ok:
+            LLM_REQUEST_SECONDS.labels(mode).observe(latency_ms / 1000)
+            LLM_TOKENS_TOTAL.labels("prompt").inc(prompt_tokens or 0)
+            LLM_TOKENS_TOTAL.labels("completion").inc(completion_tokens or 0)
+            # 스트리밍은 첫 토큰 이후 구간만 생성 속도로 계산 (대기/프롬프트 처리 시간 제외)
+            generated = completion_tokens or output_chunks
+            generation_ms = latency_ms - (first_token_ms or 0.0)
+            if generated and generation_ms > 0:
+                LLM_TOKENS_PER_SECOND.labels(mode).observe(generated / (generation_ms / 1000))
+        if first_token_ms is not None:
+            LLM_TIME_TO_FIRST_TOKEN_SECONDS.observe(first_token_ms / 1000)
+
+        with self._lock:
+            c = self._counters
+            c["calls"] += 1
+            c["errors"] += int(not ok)
+            c["retries"] += retries
+            c["hedged"] += int(hedged)
+            c["streamed"] += int(streamed)
+            c["prompt_tokens"] += prompt_tokens or 0
+            c["completion_tokens"] += completion_tokens or 0
+            c["rate_limited_seconds"] += rate_limited_seconds
+            if ok:
+                self._latencies.append(latency_ms)
+            if first_token_ms is not None:
+                self._first_token.append(first_token_ms)
+
+    @staticmethod
+    def _percentile(values: List[float], pct: float) -> Optional[float]:
+        if not values:
+            return None
+        ordered = sorted(values)
+        return round(ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))], 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        집계 통계
+
+        Returns:
+            Dict: 카운터 + 지연시간 p50/p95/p99 (ms)
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            latencies = list(self._latencies)
+            first_token = list(self._first_token)
+
+        stats["rate_limited_seconds"] = round(stats["rate_limited_seconds"], 3)
+        stats["latency_ms"] = {p: self._percentile(latencies, n) for p, n in (("p50", 50), ("p95", 95), ("p99", 99))}
+        stats["first_token_ms"] = {p: self._percentile(first_token, n) for p, n in (("p50", 50), ("p95", 95))}
+        return stats
+
 
 class OpenAIClient:
     """
-    OpenAI LLM 클라이언트
-    
+    OpenAI LLM 게이트웨이 (프로세스당 1개 공유, get_openai_client 사용)
+
     Attributes:
-        model: ChatOpenAI 인스턴스
         model_name: 모델 이름
-        temperature: 온도 설정
+        temperature: 기본 온도
+        base_url: OpenAI 호환 API base URL
+        rate_limiter: RPM/TPM 토큰 버킷
+        metrics: 호출 메트릭
     """
-    
-    def __init__(self):
-        """Initialize OpenAI client"""
-        self.model_name = settings.openai_model
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None
+    ):
+        """
+        Initialize OpenAI client
+
+        Args:
+            base_url: API base URL (기본값: settings.openai_base_url)
+            api_key: API 키 (기본값: settings.openai_api_key)
+            model: 모델명 (기본값: settings.openai_model)
+        """
+        self.model_name = model or settings.openai_model
         self.temperature = settings.openai_temperature
-        
-        try:
-            self.model = ChatOpenAI(
-                model=self.model_name,
-                temperature=self.temperature,
-                openai_api_key=settings.openai_api_key
-            )
-            
-            logger.info(
-                "OpenAI client initialized",
-                extra={
-                    "model": self.model_name,
-                    "temperature": self.temperature
-                }
-            )
-            
-        except Exception as e:
-            logger.error(
-                "Failed to initialize OpenAI client",
-                extra={"error": str(e)},
-                exc_info=True
-            )
-            raise
-    
+        self.base_url = (base_url or settings.openai_base_url).rstrip("/")
+        self.max_retries = settings.openai_max_retries
+        self.hedge_delay = settings.openai_hedge_delay_ms / 1000
+
+        self._headers = {"Authorization": f"Bearer {api_key or settings.openai_api_key}"}
+        self._timeout = httpx.Timeout(settings.openai_timeout, connect=10.0)
+        self._limits = httpx.Limits(
+            max_connections=settings.openai_max_connections,
+            max_keepalive_connections=settings.openai_max_keepalive_connections
+        )
+        self._client = httpx.Client(
+            base_url=self.base_url, headers=self._headers, timeout=self._timeout, limits=self._limits
+        )
+        # httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로 루프별로 생성 (닫힌 루프의 클라이언트는 정리)
+        self._async_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._closing_tasks: Set[asyncio.Task] = set()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+
+        self.rate_limiter = TokenBucketRateLimiter(settings.openai_rpm_limit, settings.openai_tpm_limit)
+        self.metrics = LLMMetrics()
+        self.response_cache = create_response_cache()
+
+        logger.info(
+            "OpenAI client initialized",
+            extra={
+                "model": self.model_name,
+                "temperature": self.temperature,
+                "base_url": self.base_url,
+                "max_connections": settings.openai_max_connections,
+                "rpm_limit": settings.openai_rpm_limit,
+                "tpm_limit": settings.openai_tpm_limit,
+                "hedge_delay_ms": settings.openai_hedge_delay_ms
+            }
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
     @trace_llm_call(
         name="generate_response",
         tags=["llm", "openai"],
@@ -64,54 +227,98 @@ class OpenAIClient:
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        cache_version: Optional[str] = None
     ) -> str:
         """
         메시지 기반 응답 생성 (Non-streaming)
-        
+
         Args:
             messages: 메시지 리스트 [{"role": "user/assistant/system", "content": str}]
             temperature: 온도 (선택)
             max_tokens: 최대 토큰 (선택)
-        
+            cache_version: 응답 캐시 버전 (프롬프트/파싱 로직 버전, temperature=0일 때만 사용)
+
         Returns:
             str: 생성된 응답
         """
+        payload = self._payload(messages, temperature, max_tokens, stream=False)
+        cache_key, cached = self._cache_lookup(payload, cache_version)
+        if cached is not None:
+            return cached
+
+        started = time.perf_counter()
+        state = {"retries": 0, "waited": 0.0}
+
         try:
-            # Convert to LangChain messages
-            lc_messages = self._convert_to_langchain_messages(messages)
-            
-            # Generate response
-            response = self.model.invoke(
-                lc_messages,
-                temperature=temperature or self.temperature,
-                max_tokens=max_tokens
-            )
-            
-            return response.content
-            
+            if self.hedge_delay > 0:
+                data, hedged = self._hedged_sync(lambda: self._request_sync(payload, state))
+            else:
+                data, hedged = self._request_sync(payload, state), False
         except Exception as e:
-            logger.error(
-                "Error generating response",
-                extra={"error": str(e)},
-                exc_info=True
-            )
+            self._record_failure(started, state, e)
+            raise
+
+        content = self._finish(data, payload, started, state, hedged)
+        self._cache_store(cache_key, payload, content, cache_version)
+        return content
+
+    async def agenerate(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        cache_version: Optional[str] = None
+    ) -> str:
+        """
+        메시지 기반 응답 생성 (비동기, Non-streaming)
+
+        Args:
+            messages: 메시지 리스트
+            temperature: 온도 (선택)
+            max_tokens: 최대 토큰 (선택)
+            cache_version: 응답 캐시 버전 (temperature=0일 때만 사용)
+
+        Returns:
+            str: 생성된 응답
+        """
+        payload = self._payload(messages, temperature, max_tokens, stream=False)
+        cache_key, cached = self._cache_lookup(payload, cache_version)
+        if cached is not None:
+            return cached
+
+        started = time.perf_counter()
+        state = {"retries": 0, "waited": 0.0}
+
+        try:
+            if self.hedge_delay > 0:
+                data, hedged = await self._hedged_async(lambda: self._request_async(payload, state))
+            else:
+                data, hedged = await self._request_async(payload, state), False
+        except Exception as e:
+            self._record_failure(started, state, e)
             raise
-    
+
+        content = self._finish(data, payload, started, state, hedged)
+        self._cache_store(cache_key, payload, content, cache_version)
+        return content
+
     def generate_with_system(
         self,
         system_prompt: str,
         user_message: str,
-        temperature: Optional[float] = None
+        temperature: Optional[float] = None,
+        cache_version: Optional[str] = None
     ) -> str:
         """
         시스템 프롬프트와 사용자 메시지로 응답 생성
-        
+
         Args:
             system_prompt: 시스템 프롬프트
             user_message: 사용자 메시지
             temperature: 온도 (선택)
-        
+            cache_version: 응답 캐시 버전 (선택)
+
         Returns:
             str: 생성된 응답
         """
@@ -119,9 +326,9 @@ class OpenAIClient:
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_message}
         ]
-        
-        return self.generate(messages, temperature=temperature)
-    
+
+        return self.generate(messages, temperature=temperature, cache_version=cache_version)
+
     async def generate_stream(
         self,
         messages: List[Dict[str, str]],
@@ -130,36 +337,86 @@ class OpenAIClient:
     ) -> AsyncGenerator[str, None]:
         """
         메시지 기반 스트리밍 응답 생성
-        
+
+        재시도는 첫 청크를 받기 전(연결/상태 코드 오류)까지만 수행합니다.
+
         Args:
             messages: 메시지 리스트 [{"role": "user/assistant/system", "content": str}]
             temperature: 온도 (선택)
             max_tokens: 최대 토큰 (선택)
-        
+
         Yields:
-            str: 생성된 응답 청크 (한 글자씩 또는 단어씩)
+            str: 생성된 응답 청크
         """
+        payload = self._payload(messages, temperature, max_tokens, stream=True)
+        estimated = self._estimate_tokens(payload)
+        started = time.perf_counter()
+        first_token_ms: Optional[float] = None
+        usage: Dict[str, Any] = {}
+        completion_chars = 0
+        chunks = 0
+        attempt = 0
+        waited = 0.0
+
         try:
-            # Convert to LangChain messages
-            lc_messages = self._convert_to_langchain_messages(messages)
-            
-            # Generate streaming response
-            async for chunk in self.model.astream(
-                lc_messages,
-                temperature=temperature or self.temperature,
-                max_tokens=max_tokens
-            ):
-                if chunk.content:
-                    yield chunk.content
-                    
+            while True:
+                waited += await self.rate_limiter.aacquire(estimated)
+                client = self._get_async_client()
+                try:
+                    async with client.stream("POST", "/chat/completions", json=payload) as response:
+                        if response.status_code in RETRYABLE_STATUS and attempt < self.max_retries:
+                            await response.aread()
+                            delay = self._backoff(attempt, response)
+                            attempt += 1
+                            await asyncio.sleep(delay)
+                            continue
+                        if response.status_code >= 400:
+                            await response.aread()
+                        response.raise_for_status()
+
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            data = line[5:].strip()
+                            if data == "[DONE]":
+                                break
+                            event = json.loads(data)
+                            if event.get("usage"):
+                                usage = event["usage"]
+                            for choice in event.get("choices") or []:
+                                content = (choice.get("delta") or {}).get("content")
+                                if content:
+                                    if first_token_ms is None:
+                                        first_token_ms = (time.perf_counter() - started) * 1000
+                                    completion_chars += len(content)
+                                    chunks += 1
+                                    yield content
+                    break
+                except httpx.TransportError:
+                    # 이미 일부를 전송했으면 재시도하면 답변이 중복되므로 그대로 실패
+                    if first_token_ms is not None or attempt >= self.max_retries:
+                        raise
+                    delay = self._backoff(attempt)
+                    attempt += 1
+                    await asyncio.sleep(delay)
+
         except Exception as e:
-            logger.error(
-                "Error generating streaming response",
-                extra={"error": str(e)},
-                exc_info=True
-            )
+            self._record_failure(started, {"retries": attempt, "waited": waited}, e)
             raise
-    
+
+        self.rate_limiter.settle(estimated, usage.get("total_tokens"))
+        self.metrics.record(
+            latency_ms=(time.perf_counter() - started) * 1000,
+            ok=True,
+            retries=attempt,
+            prompt_tokens=usage.get("prompt_tokens"),
+            completion_tokens=usage.get("completion_tokens"),
+            streamed=True,
+            first_token_ms=first_token_ms,
+            rate_limited_seconds=waited,
+            output_chunks=chunks
+        )
+
     async def generate_with_system_stream(
         self,
         system_prompt: str,
@@ -168,12 +425,12 @@ class OpenAIClient:
     ) -> AsyncGenerator[str, None]:
         """
         시스템 프롬프트와 사용자 메시지로 스트리밍 응답 생성
-        
+
         Args:
             system_prompt: 시스템 프롬프트
             user_message: 사용자 메시지
             temperature: 온도 (선택)
-        
+
         Yields:
             str: 생성된 응답 청크
         """
@@ -181,42 +438,318 @@ class OpenAIClient:
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_message}
         ]
-        
+
         async for chunk in self.generate_stream(messages, temperature=temperature):
             yield chunk
-    
-    def _convert_to_langchain_messages(self, messages: List[Dict[str, str]]) -> List:
+
+    def get_stats(self) -> Dict[str, Any]:
         """
-        딕셔너리 메시지를 LangChain 메시지로 변환
-        
-        Args:
-            messages: 메시지 리스트
-        
+        게이트웨이 메트릭 (모니터링용)
+
+        Returns:
+            Dict: 호출 수/오류/재시도/헤징/토큰/지연시간
+        """
+        stats = {"model": self.model_name, **self.metrics.get_stats()}
+        stats["cache"] = self.response_cache.get_stats() if self.response_cache else None
+        return stats
+
+    def close(self) -> None:
+        """동기 연결 풀 종료"""
+        self._client.close()
+        if self.response_cache is not None:
+            self.response_cache.close()
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+
+    async def aclose(self) -> None:
+        """비동기/동기 연결 풀 종료 (현재 루프 + 닫힌 루프의 클라이언트)"""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+        for stale in self._pop_stale_async_clients():
+            await _aclose_quietly(stale)
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Response cache
+    # ------------------------------------------------------------------
+
+    def _cache_version(self, cache_version: Optional[str]) -> str:
+        return f"{settings.llm_cache_version}:{cache_version}" if cache_version else settings.llm_cache_version
+
+    def _cache_lookup(
+        self,
+        payload: Dict[str, Any],
+        cache_version: Optional[str]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        temperature=0 호출이면 캐시 조회
+
         Returns:
-            List: LangChain 메시지 리스트
-        """
-        lc_messages = []
-        for msg in messages:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            
-            if role == "system":
-                lc_messages.append(SystemMessage(content=content))
-            elif role == "assistant":
-                lc_messages.append(AIMessage(content=content))
-            else:  # user
-                lc_messages.append(HumanMessage(content=content))
-        
-        return lc_messages
+            Tuple[Optional[str], Optional[str]]: (캐시 키, 캐시된 응답)
+        """
+        if self.response_cache is None or payload["temperature"] != 0:
+            return None, None
+
+        key = make_cache_key(
+            payload["model"],
+            payload["messages"],
+            0.0,
+            payload.get("max_tokens"),
+            self._cache_version(cache_version)
+        )
+        return key, self.response_cache.get(key)
+
+    def _cache_store(
+        self,
+        key: Optional[str],
+        payload: Dict[str, Any],
+        content: str,
+        cache_version: Optional[str]
+    ) -> None:
+        if key is None or not content:
+            return
+        self.response_cache.set(key, content, model=payload["model"], version=self._cache_version(cache_version))
+
+    # ------------------------------------------------------------------
+    # Request helpers
+    # ------------------------------------------------------------------
+
+    def _payload(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        stream: bool
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "model": self.model_name,
+            "messages": [
+                {"role": msg.get("role", "user"), "content": msg.get("content", "")}
+                for msg in messages
+            ],
+            "temperature": self.temperature if temperature is None else temperature,
+        }
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+        if stream:
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
+        return payload
+
+    @staticmethod
+    def _estimate_tokens(payload: Dict[str, Any]) -> int:
+        """TPM 예약용 토큰 추정 (비ASCII 1자 ≈ 1토큰, ASCII 4자 ≈ 1토큰)"""
+        text = "".join(msg["content"] for msg in payload["messages"])
+        non_ascii = sum(1 for ch in text if ord(ch) > 127)
+        prompt = non_ascii + (len(text) - non_ascii) // 4 + 4 * len(payload["messages"])
+        return prompt + (payload.get("max_tokens") or DEFAULT_COMPLETION_TOKENS)
+
+    @staticmethod
+    def _backoff(attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """지수 백오프 + full jitter (Retry-After 헤더가 있으면 우선)"""
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after:
+                try:
+                    return min(BACKOFF_MAX_SECONDS, float(retry_after))
+                except ValueError:
+                    pass
+        return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt)))
+
+    def _request_sync(self, payload: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+        """동기 요청 (재시도 포함)"""
+        estimated = self._estimate_tokens(payload)
+        attempt = 0
+        while True:
+            state["waited"] += self.rate_limiter.acquire(estimated)
+            try:
+                response = self._client.post("/chat/completions", json=payload)
+                if response.status_code in RETRYABLE_STATUS and attempt < self.max_retries:
+                    delay = self._backoff(attempt, response)
+                else:
+                    response.raise_for_status()
+                    data = response.json()
+                    self.rate_limiter.settle(estimated, (data.get("usage") or {}).get("total_tokens"))
+                    return data
+            except httpx.TransportError:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+
+            attempt += 1
+            state["retries"] += 1
+            logger.warning(
+                "Retrying LLM request",
+                extra={"attempt": attempt, "delay_seconds": round(delay, 2)}
+            )
+            time.sleep(delay)
+
+    async def _request_async(self, payload: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+        """비동기 요청 (재시도 포함)"""
+        estimated = self._estimate_tokens(payload)
+        attempt = 0
+        while True:
+            state["waited"] += await self.rate_limiter.aacquire(estimated)
+            try:
+                response = await self._get_async_client().post("/chat/completions", json=payload)
+                if response.status_code in RETRYABLE_STATUS and attempt < self.max_retries:
+                    delay = self._backoff(attempt, response)
+                else:
+                    response.raise_for_status()
+                    data = response.json()
+                    self.rate_limiter.settle(estimated, (data.get("usage") or {}).get("total_tokens"))
+                    return data
+            except httpx.TransportError:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+
+            attempt += 1
+            state["retries"] += 1
+            logger.warning(
+                "Retrying LLM request",
+                extra={"attempt": attempt, "delay_seconds": round(delay, 2)}
+            )
+            await asyncio.sleep(delay)
+
+    def _hedged_sync(self, call: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], bool]:
+        """
+        헤징 요청 (동기): hedge_delay 안에 응답이 없으면 같은 요청을 하나 더 보냄
+
+        동기 요청은 취소할 수 없으므로 늦은 쪽 응답은 버려집니다.
+        """
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=max(2, settings.openai_max_connections // 4),
+                thread_name_prefix="llm-hedge"
+            )
+
+        primary = self._hedge_executor.submit(call)
+        done, _ = wait([primary], timeout=self.hedge_delay)
+        if done:
+            return primary.result(), False
+
+        futures = [primary, self._hedge_executor.submit(call)]
+        last_error: Optional[BaseException] = None
+        while futures:
+            done, pending = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result(), True
+                last_error = future.exception()
+            futures = list(pending)
+        raise last_error
+
+    async def _hedged_async(self, call: Callable[[], Awaitable[Dict[str, Any]]]) -> Tuple[Dict[str, Any], bool]:
+        """헤징 요청 (비동기): 먼저 성공한 응답을 사용하고 나머지는 취소"""
+        primary = asyncio.ensure_future(call())
+        done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay)
+        if done:
+            return primary.result(), False
+
+        tasks = {primary, asyncio.ensure_future(call())}
+        last_error: Optional[BaseException] = None
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result(), True
+                    last_error = task.exception()
+            raise last_error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            # 루프가 바뀌었으면 이전(닫힌) 루프의 클라이언트를 현재 루프에서 닫도록 예약
+            for stale in self._pop_stale_async_clients():
+                task = loop.create_task(_aclose_quietly(stale))
+                self._closing_tasks.add(task)
+                task.add_done_callback(self._closing_tasks.discard)
+            client = httpx.AsyncClient(
+                base_url=self.base_url, headers=self._headers, timeout=self._timeout, limits=self._limits
+            )
+            self._async_clients[loop] = client
+        return client
+
+    def _pop_stale_async_clients(self) -> List[httpx.AsyncClient]:
+        """닫힌 이벤트 루프에 묶인 AsyncClient 분리"""
+        stale = []
+        for loop in list(self._async_clients):
+            if loop.is_closed():
+                client = self._async_clients.pop(loop, None)
+                if client is not None:
+                    stale.append(client)
+        return stale
+
+    def _finish(
+        self,
+        data: Dict[str, Any],
+        payload: Dict[str, Any],
+        started: float,
+        state: Dict[str, Any],
+        hedged: bool
+    ) -> str:
+        """응답 파싱 + 메트릭 기록"""
+        latency_ms = (time.perf_counter() - started) * 1000
+        usage = data.get("usage") or {}
+        self.metrics.record(
+            latency_ms=latency_ms,
+            ok=True,
+            retries=state["retries"],
+            prompt_tokens=usage.get("prompt_tokens"),
+            completion_tokens=usage.get("completion_tokens"),
+            hedged=hedged,
+            rate_limited_seconds=state["waited"]
+        )
+        logger.debug(
+            "LLM call completed",
+            extra={
+                "model": payload["model"],
+                "latency_ms": round(latency_ms, 1),
+                "prompt_tokens": usage.get("prompt_tokens"),
+                "completion_tokens": usage.get("completion_tokens"),
+                "retries": state["retries"],
+                "hedged": hedged
+            }
+        )
+
+        choices = data.get("choices") or []
+        if not choices:
+            return ""
+        return (choices[0].get("message") or {}).get("content") or ""
+
+    def _record_failure(self, started: float, state: Dict[str, Any], error: Exception) -> None:
+        self.metrics.record(
+            latency_ms=(time.perf_counter() - started) * 1000,
+            ok=False,
+            retries=state["retries"],
+            rate_limited_seconds=state["waited"]
+        )
+        logger.error(
+            "Error generating response",
+            extra={"error": str(error), "retries": state["retries"]},
+            exc_info=True
+        )
 
 
 @lru_cache()
 def get_openai_client() -> OpenAIClient:
     """
     Get cached OpenAI client instance
-    
+
     Returns:
         OpenAIClient: Cached client instance
     """
     return OpenAIClient()
 
+
+async def close_openai_client() -> None:
+    """생성된 게이트웨이가 있으면 연결 풀 종료 (애플리케이션 종료 시)"""
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().aclose()
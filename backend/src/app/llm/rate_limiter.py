@@ -0,0 +1,118 @@
+"""
+Rate Limiter
+토큰 버킷 기반 LLM 호출 속도 제한 (RPM / TPM)
+
+호출 시점에 요청 1건 + 예상 토큰 수를 미리 차감(예약)하고,
+버킷이 음수가 되면 부족분이 채워질 때까지 대기합니다.
+응답 후 실제 사용 토큰으로 차이를 정산합니다.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucketRateLimiter:
+    """
+    RPM/TPM 토큰 버킷 (스레드/코루틴 공용)
+
+    Attributes:
+        rpm: 분당 요청 수 한도 (0 이하면 무제한)
+        tpm: 분당 토큰 수 한도 (0 이하면 무제한)
+    """
+
+    def __init__(self, rpm: int = 0, tpm: int = 0):
+        """
+        Initialize limiter
+
+        Args:
+            rpm: 분당 요청 수 한도
+            tpm: 분당 토큰 수 한도
+        """
+        self.rpm = max(0, rpm)
+        self.tpm = max(0, tpm)
+        self._requests = float(self.rpm)
+        self._tokens = float(self.tpm)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.rpm or self.tpm)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def _reserve(self, tokens: int) -> float:
+        """
+        요청 1건 + tokens 예약 후 대기 시간 반환
+
+        Returns:
+            float: 대기해야 할 초
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            wait = 0.0
+            if self.rpm:
+                self._requests -= 1
+                if self._requests < 0:
+                    wait = max(wait, -self._requests * 60 / self.rpm)
+            if self.tpm:
+                # 한 요청이 TPM 전체보다 크면 버킷 크기만큼만 요구 (영원히 대기하지 않도록)
+                self._tokens -= min(tokens, self.tpm)
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens * 60 / self.tpm)
+            return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        동기 대기 (스레드)
+
+        Args:
+            tokens: 예상 토큰 수
+
+        Returns:
+            float: 실제 대기한 초
+        """
+        if not self.enabled:
+            return 0.0
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """
+        비동기 대기 (이벤트 루프를 막지 않음)
+
+        Args:
+            tokens: 예상 토큰 수
+
+        Returns:
+            float: 실제 대기한 초
+        """
+        if not self.enabled:
+            return 0.0
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def settle(self, estimated: int, actual: Optional[int]) -> None:
+        """
+        예상 토큰과 실제 사용 토큰 차이 정산
+
+        Args:
+            estimated: 예약한 토큰 수
+            actual: 실제 사용 토큰 수 (모르면 None → 정산 안 함)
+        """
+        if not self.tpm or actual is None:
+            return
+        with self._lock:
+            self._tokens = min(self.tpm, self._tokens + min(estimated, self.tpm) - actual)
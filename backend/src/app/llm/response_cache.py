@@ -0,0 +1,232 @@
+"""
+LLM Response Cache
+temperature=0 LLM 응답 캐시 (content-addressed)
+
+(model, messages, temperature, max_tokens, 버전) 해시를 키로
+프로세스 내 LRU → (선택) SQLite 디스크 순으로 조회합니다.
+버전(LLM_CACHE_VERSION + 호출자가 넘기는 프롬프트 버전)이 바뀌면 기존 항목은 자동으로 무시됩니다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..config import get_settings
+from ..config.logger import get_logger
+from ..observability import record_cache_lookup
+
+logger = get_logger()
+
+
+def make_cache_key(
+    model: str,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_tokens: Optional[int],
+    version: str
+) -> str:
+    """
+    캐시 키 생성
+
+    Args:
+        model: 모델명
+        messages: 메시지 리스트
+        temperature: 온도
+        max_tokens: 최대 토큰
+        version: 캐시 버전 (전역 + 프롬프트 버전)
+
+    Returns:
+        str: SHA-256 hex
+    """
+    raw = json.dumps(
+        {
+            "model": model,
+            "messages": [[m.get("role", "user"), m.get("content", "")] for m in messages],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "version": version,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    LRU + SQLite 2단 응답 캐시
+
+    Attributes:
+        max_entries: 메모리 LRU 최대 항목 수
+        sqlite_path: SQLite 파일 경로 (None이면 메모리만 사용)
+        ttl_seconds: 디스크 항목 유효 기간 (0이면 무기한)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        sqlite_path: Optional[str] = None,
+        ttl_seconds: int = 0
+    ):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: 메모리 LRU 최대 항목 수
+            sqlite_path: SQLite 파일 경로 (선택)
+            ttl_seconds: 디스크 항목 유효 기간 (초)
+        """
+        self.max_entries = max(1, max_entries)
+        self.sqlite_path = sqlite_path
+        self.ttl_seconds = ttl_seconds
+
+        self._lru: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0}
+        self._db: Optional[sqlite3.Connection] = None
+
+        if sqlite_path:
+            try:
+                Path(sqlite_path).parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(sqlite_path, check_same_thread=False, isolation_level=None)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_response_cache ("
+                    "key TEXT PRIMARY KEY, model TEXT, version TEXT, response TEXT, created_at REAL)"
+                )
+                self._db.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_llm_response_cache_version ON llm_response_cache(version)"
+                )
+            except sqlite3.Error as e:
+                logger.warning(
+                    "LLM response cache disk tier unavailable, using memory only",
+                    extra={"path": sqlite_path, "error": str(e)}
+                )
+                self._db = None
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회 (메모리 → 디스크, 디스크 적중 시 메모리로 승격)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[str]: 응답 (없으면 None)
+        """
+        with self._lock:
+            response = self._lru.get(key)
+            if response is not None:
+                self._lru.move_to_end(key)
+                self._stats["memory_hits"] += 1
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT response, created_at FROM llm_response_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and (not self.ttl_seconds or time.time() - row[1] < self.ttl_seconds):
+                    self._remember(key, row[0])
+                    self._stats["disk_hits"] += 1
+                    response = row[0]
+
+            if response is None:
+                self._stats["misses"] += 1
+
+        record_cache_lookup("llm_response", hit=response is not None)
+        return response
+
+    def set(self, key: str, response: str, model: str = "", version: str = "") -> None:
+        """
+        응답 저장
+
+        Args:
+            key: 캐시 키
+            response: 응답 텍스트
+            model: 모델명 (디스크 메타데이터)
+            version: 캐시 버전 (디스크 무효화용)
+        """
+        with self._lock:
+            self._remember(key, response)
+            self._stats["stores"] += 1
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO llm_response_cache (key, model, version, response, created_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (key, model, version, response, time.time())
+                    )
+                except sqlite3.Error as e:
+                    logger.warning("Failed to write LLM response cache", extra={"error": str(e)})
+
+    def _remember(self, key: str, response: str) -> None:
+        self._lru[key] = response
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def invalidate(self, version: Optional[str] = None) -> int:
+        """
+        캐시 무효화
+
+        메모리 LRU는 버전 정보를 들고 있지 않으므로 항상 전체 비웁니다.
+
+        Args:
+            version: 이 버전의 디스크 항목만 삭제 (None이면 전체)
+
+        Returns:
+            int: 삭제된 디스크 항목 수
+        """
+        with self._lock:
+            self._lru.clear()
+            if self._db is None:
+                return 0
+            if version is None:
+                cursor = self._db.execute("DELETE FROM llm_response_cache")
+            else:
+                cursor = self._db.execute("DELETE FROM llm_response_cache WHERE version = ?", (version,))
+            return cursor.rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        적중률 통계 (모니터링용)
+
+        Returns:
+            Dict: memory_hits/disk_hits/misses/stores/entries/hit_rate
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._lru)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        stats["disk_enabled"] = self._db is not None
+        return stats
+
+    def close(self) -> None:
+        """디스크 연결 종료"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def create_response_cache() -> Optional[LLMResponseCache]:
+    """
+    설정에 따라 응답 캐시 생성
+
+    Returns:
+        Optional[LLMResponseCache]: 캐시 (비활성화 시 None)
+    """
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return None
+    return LLMResponseCache(
+        max_entries=settings.llm_cache_max_entries,
+        sqlite_path=settings.llm_cache_sqlite_path,
+        ttl_seconds=settings.llm_cache_ttl_seconds
+    )
@@ -3,16 +3,24 @@ FastAPI Application Entrypoint
 정책·지원금 AI Agent의 메인 애플리케이션
 """
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from .config import get_settings
 from .config.logger import get_logger
 from .db.engine import init_db, close_db
+from .db.write_behind import get_write_behind_writer
+from .llm import close_openai_client
+from .web_search.clients import close_tavily_client
+from .observability import get_registry, shutdown_tracer
+from .observability.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from .startup import run_warmup, mark_started, mark_stopping, get_startup_status
 from .api import routes_policy, routes_admin, routes_chat, routes_eligibility, routes_web_source
 
 # Initialize
@@ -32,6 +40,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     init_db()
     logger.info("Database initialized")
     
+    # Start chat history / slot write-behind writer
+    if settings.chat_persist_enabled:
+        get_write_behind_writer().start()
+    
     # Initialize LangSmith (if enabled)
     if settings.langsmith_tracing:
         import os
@@ -40,10 +52,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
         os.environ["LANGCHAIN_PROJECT"] = settings.langsmith_project
         logger.info("LangSmith tracing enabled", extra={"project": settings.langsmith_project})
     
+    # Warm up heavy dependencies in a worker thread
+    # (liveness는 바로 응답, readiness는 웜업 완료 후 통과: /api/v1/health/ready)
+    mark_started(warmup=settings.warmup_enabled)
+    if settings.warmup_enabled:
+        app.state.warmup_task = asyncio.create_task(run_in_threadpool(run_warmup))
+    
     yield
     
     # Cleanup
     logger.info("Shutting down application")
+    mark_stopping()  # readiness 실패로 전환 (새 트래픽 차단)
+    get_write_behind_writer().stop()  # 남은 대화 이력/슬롯 flush
+    await close_openai_client()  # LLM 연결 풀 종료
+    await close_tavily_client()  # 웹 검색 연결 풀 종료
+    await run_in_threadpool(shutdown_tracer)  # 대기 중인 트레이스 내보내기
     close_db()
 
 
@@ -64,6 +87,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Trace-Id"],  # 프론트엔드에서 트레이스 ID 확인용
 )
 
 
@@ -83,6 +107,7 @@ async def health_check():
             "status": "healthy",
             "service": settings.app_name,
             "environment": settings.environment,
+            "phase": get_startup_status()["phase"],
         }
     )
 
@@ -101,6 +126,16 @@ async def root():
     }
 
 
+if settings.metrics_enabled:
+    @app.get("/metrics", tags=["Health"], include_in_schema=False)
+    async def metrics():
+        """
+        Prometheus metrics endpoint
+        검색 단계/그래프 노드/LLM/캐시/DB 풀 지표 (텍스트 형식, 워커 프로세스별)
+        """
+        return PlainTextResponse(get_registry().render(), media_type=METRICS_CONTENT_TYPE)
+
+
 # ============================================================
 # Include Routers
 # ============================================================
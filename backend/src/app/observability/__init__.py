@@ -1,11 +1,13 @@
 """
 LangSmith Observability Module
-실시간 트레이싱 및 평가를 위한 모듈
+실시간 트레이싱, 메트릭 및 평가를 위한 모듈
 """
 
 from .langsmith_client import LangSmithClient, get_langsmith_client
 from .tracing import trace_workflow, trace_llm_call, trace_retrieval, trace_tool
+from .tracer import Tracer, get_tracer, shutdown_tracer, current_trace_id, new_trace_id
 from .tags import get_base_tags, get_feature_tags
+from .metrics import get_registry, record_cache_lookup, timed
 
 __all__ = [
     "LangSmithClient",
@@ -14,7 +16,15 @@ __all__ = [
     "trace_llm_call",
     "trace_retrieval",
     "trace_tool",
+    "Tracer",
+    "get_tracer",
+    "shutdown_tracer",
+    "current_trace_id",
+    "new_trace_id",
     "get_base_tags",
     "get_feature_tags",
+    "get_registry",
+    "record_cache_lookup",
+    "timed",
 ]
 
@@ -0,0 +1,259 @@
+"""
+Trace Exporters
+완료된 트레이스를 외부로 내보내는 exporter (백그라운드 스레드에서만 호출)
+
+- FileTraceExporter: OTLP JSON 형식(resourceSpans) JSON Lines 파일, 오프라인 사용 가능
+  (OTLP/HTTP JSON 수집기에 그대로 POST 가능)
+- LangSmithTraceExporter: span마다 LangSmith run 생성
+- NullTraceExporter: 버림 (벤치마크/비활성화용)
+
+입력/출력은 내보낼 때 직렬화(깊이/길이 제한) 후 PII 마스킹합니다.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .redact import redact_pii
+
+if TYPE_CHECKING:
+    from .tracer import Span, Trace
+
+_MAX_DEPTH = 4
+_MAX_ITEMS = 50
+_MAX_CHARS = 2000
+_SERVICE_NAME = "policy-qa-agent"
+
+
+def to_jsonable(value: Any, depth: int = 0) -> Any:
+    """
+    span 입력/출력을 JSON 직렬화 가능한 값으로 변환 (깊이/항목 수/문자열 길이 제한)
+
+    원시 타입이 아닌 객체는 repr 대신 타입 이름만 남깁니다 (비용/민감정보 노출 방지).
+
+    Args:
+        value: 원본 값
+        depth: 현재 깊이
+
+    Returns:
+        Any: 변환된 값
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return value if len(value) <= _MAX_CHARS else value[:_MAX_CHARS] + "...(truncated)"
+    if depth >= _MAX_DEPTH:
+        return f"<{type(value).__name__}>"
+    if isinstance(value, dict):
+        items = list(value.items())
+        converted = {str(k): to_jsonable(v, depth + 1) for k, v in items[:_MAX_ITEMS]}
+        if len(items) > _MAX_ITEMS:
+            converted["..."] = f"{len(items) - _MAX_ITEMS} more"
+        return converted
+    if isinstance(value, (list, tuple)):
+        converted_list = [to_jsonable(v, depth + 1) for v in value[:_MAX_ITEMS]]
+        if len(value) > _MAX_ITEMS:
+            converted_list.append(f"... {len(value) - _MAX_ITEMS} more")
+        return converted_list
+    return f"<{type(value).__name__}>"
+
+
+def span_io(span: "Span") -> Dict[str, Any]:
+    """span 입력/출력 (직렬화 + PII 마스킹)"""
+    # span마다 GIL 양보: 직렬화가 요청 스레드를 switch interval(5ms) 동안 막지 않도록
+    time.sleep(0)
+    io: Dict[str, Any] = {}
+    if span.inputs is not None:
+        args, kwargs = span.inputs
+        io["inputs"] = redact_pii({"args": to_jsonable(args), "kwargs": to_jsonable(kwargs)})
+    if span.outputs is not None:
+        io["outputs"] = redact_pii({"output": to_jsonable(span.outputs)})
+    return io
+
+
+class TraceExporter:
+    """Exporter 기본 클래스"""
+
+    name = "base"
+
+    def export(self, traces: List["Trace"]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class NullTraceExporter(TraceExporter):
+    """아무것도 내보내지 않음"""
+
+    name = "none"
+
+    def export(self, traces: List["Trace"]) -> None:
+        pass
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, str):
+        return {"stringValue": value}
+    return {"stringValue": json.dumps(value, ensure_ascii=False, default=str)}
+
+
+class FileTraceExporter(TraceExporter):
+    """
+    OTLP JSON Lines 파일 exporter
+
+    Attributes:
+        path: 출력 파일 경로 (한 줄에 트레이스 1개의 ExportTraceServiceRequest)
+    """
+
+    name = "file"
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _status(span: "Span") -> Dict[str, Any]:
+        if span.error:
+            return {"code": 2, "message": span.error}  # STATUS_CODE_ERROR
+        if span.cancelled:
+            return {"code": 0, "message": "cancelled"}  # STATUS_CODE_UNSET
+        return {"code": 1}  # STATUS_CODE_OK
+
+    def _span_to_otlp(self, trace: "Trace", span: "Span") -> Dict[str, Any]:
+        attributes: Dict[str, Any] = {
+            "run_type": span.run_type,
+            "sampling.decision": trace.sampling,
+        }
+        if span.tags:
+            attributes["tags"] = list(span.tags)
+        for key, value in (span.metadata or {}).items():
+            attributes[f"metadata.{key}"] = value
+        for key, value in span_io(span).items():
+            attributes[key] = value
+
+        otlp_span = {
+            "traceId": trace.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns or span.start_ns),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()],
+            "status": self._status(span),
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        return otlp_span
+
+    def export(self, traces: List["Trace"]) -> None:
+        lines = []
+        for trace in traces:
+            lines.append(json.dumps({
+                "resourceSpans": [{
+                    "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": _SERVICE_NAME}}]},
+                    "scopeSpans": [{
+                        "scope": {"name": "app.observability"},
+                        "spans": [self._span_to_otlp(trace, span) for span in trace.spans],
+                    }],
+                }]
+            }, ensure_ascii=False, default=str))
+        with self._lock:
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class LangSmithTraceExporter(TraceExporter):
+    """
+    LangSmith exporter (span → run)
+
+    Attributes:
+        client: langsmith.Client
+        project_name: 프로젝트 이름
+    """
+
+    name = "langsmith"
+
+    def __init__(self, client: Any, project_name: str):
+        self.client = client
+        self.project_name = project_name
+
+    @staticmethod
+    def _run_id(trace_id: str, span_id: str) -> str:
+        # trace_id(32 hex) 앞 16자리 + span_id(16 hex) → UUID
+        return str(uuid.UUID(hex=trace_id[:16] + span_id))
+
+    @staticmethod
+    def _time(ns: int) -> datetime:
+        return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc)
+
+    def export(self, traces: List["Trace"]) -> None:
+        for trace in traces:
+            # 부모 run이 먼저 만들어지도록 시작 시각 순으로 생성
+            for span in sorted(trace.spans, key=lambda s: s.start_ns):
+                io = span_io(span)
+                parent_run_id: Optional[str] = self._run_id(trace.trace_id, span.parent_id) if span.parent_id else None
+                self.client.create_run(
+                    name=span.name,
+                    inputs=io.get("inputs", {}),
+                    run_type=span.run_type,
+                    id=self._run_id(trace.trace_id, span.span_id),
+                    parent_run_id=parent_run_id,
+                    start_time=self._time(span.start_ns),
+                    end_time=self._time(span.end_ns or span.start_ns),
+                    outputs=io.get("outputs"),
+                    error=span.error,
+                    tags=list(span.tags or []),
+                    extra={"metadata": {
+                        **(span.metadata or {}),
+                        "trace_id": trace.trace_id,
+                        "sampling": trace.sampling,
+                        "cancelled": span.cancelled
+                    }},
+                    project_name=self.project_name,
+                )
+
+
+def create_exporter(name: str, file_path: Optional[str] = None) -> TraceExporter:
+    """
+    exporter 생성
+
+    Args:
+        name: auto | langsmith | file | none
+        file_path: file exporter 출력 경로
+
+    Returns:
+        TraceExporter: exporter (auto에서 LangSmith 비활성 시 NullTraceExporter)
+
+    Raises:
+        ValueError: 알 수 없는 이름
+    """
+    if name in ("auto", "langsmith"):
+        from .langsmith_client import get_langsmith_client
+        langsmith = get_langsmith_client()
+        if langsmith.is_enabled():
+            return LangSmithTraceExporter(langsmith.get_client(), langsmith.project_name)
+        return NullTraceExporter()
+    if name == "file":
+        return FileTraceExporter(file_path or "logs/traces.jsonl")
+    if name == "none":
+        return NullTraceExporter()
+    raise ValueError(f"Unknown trace exporter: {name}")
@@ -0,0 +1,437 @@
+"""
+Metrics
+프로세스 내 카운터/게이지/고정 버킷 히스토그램 + Prometheus 텍스트 형식 출력
+
+외부 의존성 없이 요청 경로에서 가볍게 기록합니다.
+- 관측 1건 = bisect 1회 + 락 1회 (라벨 조합별 자식 객체는 처음 한 번만 생성)
+- 백분위는 서버에서 계산하지 않고 버킷 카운트만 노출 (Prometheus histogram_quantile 사용)
+- 워커 프로세스마다 별도 집계 (멀티 워커는 수집기에서 합산)
+
+GET /metrics 가 get_registry().render() 결과를 반환합니다.
+"""
+
+import inspect
+import math
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 초 단위 지연시간 버킷 (1ms ~ 30s)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# 연결 풀 대기용 버킷 (대부분 0에 가까우므로 더 촘촘하게)
+WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+# LLM 토큰 생성 속도 버킷 (tokens/sec)
+THROUGHPUT_BUCKETS = (5.0, 10.0, 20.0, 30.0, 50.0, 75.0, 100.0, 150.0, 200.0, 400.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{n}="{_escape_label(v)}"' for n, v in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _CounterValue:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeValue:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """수집 시점에 값을 읽어올 함수 지정 (예: 연결 풀 사용 중 연결 수)"""
+        self._function = function
+
+    def get(self) -> float:
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except Exception:
+                return math.nan
+        return self.value
+
+
+class _HistogramValue:
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._lock = threading.Lock()
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 마지막 칸 = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def time(self) -> "Timer":
+        return Timer(self)
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        with self._lock:
+            return list(self.counts), self.sum, self.count
+
+
+class _Metric:
+    """라벨 조합별 값을 가지는 메트릭 기본 클래스"""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _new_value(self) -> Any:
+        raise NotImplementedError
+
+    def labels(self, *values: Any, **kwargs: Any) -> Any:
+        """
+        라벨 값에 해당하는 자식 값 반환 (없으면 생성)
+
+        Args:
+            *values: 라벨 값 (labelnames 순서)
+            **kwargs: 라벨 이름=값
+
+        Returns:
+            라벨 조합의 값 객체 (inc/set/observe)
+
+        Raises:
+            ValueError: 라벨 개수/이름 불일치
+        """
+        if kwargs:
+            try:
+                values = tuple(kwargs[name] for name in self.labelnames)
+            except KeyError as e:
+                raise ValueError(f"{self.name}: missing label {e}") from None
+        if len(values) != len(self.labelnames) or (kwargs and len(kwargs) != len(self.labelnames)):
+            raise ValueError(f"{self.name}: expected labels {self.labelnames}")
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = self._new_value()
+        return child
+
+    def _items(self) -> List[Tuple[Tuple[str, ...], Any]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+    def _header(self) -> List[str]:
+        doc = self.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+        return [f"# HELP {self.name} {doc}", f"# TYPE {self.name} {self.type}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터 (이름은 _total로 끝나도록)"""
+
+    type = "counter"
+
+    def _new_value(self) -> _CounterValue:
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """라벨 없는 카운터 증가"""
+        self.labels().inc(amount)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, child in self._items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """현재 값 게이지"""
+
+    type = "gauge"
+
+    def _new_value(self) -> _GaugeValue:
+        return _GaugeValue()
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self.labels().set_function(function)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, child in self._items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.get())}")
+        return lines
+
+
+class Histogram(_Metric):
+    """
+    고정 버킷 히스토그램
+
+    Attributes:
+        buckets: 버킷 상한 (오름차순, +Inf는 자동 추가)
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets if b != math.inf))
+
+    def _new_value(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """라벨 없는 히스토그램에 관측값 기록"""
+        self.labels().observe(value)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, child in self._items():
+            counts, total, count = child.snapshot()
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Timer:
+    """
+    경과 시간(초)을 히스토그램에 기록하는 컨텍스트 매니저/데코레이터
+
+    예외가 나도 기록합니다 (느린 실패도 지연시간 분포에 포함).
+    """
+
+    __slots__ = ("_value", "_started")
+
+    def __init__(self, value: _HistogramValue):
+        self._value = value
+        self._started = 0.0
+
+    def __enter__(self) -> "Timer":
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._value.observe(time.perf_counter() - self._started)
+
+    def __call__(self, func: Callable) -> Callable:
+        value = self._value
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                started = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    value.observe(time.perf_counter() - started)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                value.observe(time.perf_counter() - started)
+
+        return wrapper
+
+
+def timed(histogram: Histogram, **labels: Any) -> Timer:
+    """
+    히스토그램 타이머 생성
+
+    Args:
+        histogram: 기록할 히스토그램
+        **labels: 라벨 값
+
+    Returns:
+        Timer: with 블록 또는 데코레이터(sync/async)로 사용
+
+    Example:
+        ```python
+        with timed(SEARCH_STAGE_SECONDS, stage="embed"):
+            vector = embedder.embed_text(query)
+
+        @timed(GRAPH_NODE_SECONDS, node="check_sufficiency")
+        def check_sufficiency_node(state): ...
+        ```
+    """
+    return Timer(histogram.labels(**labels))
+
+
+class MetricsRegistry:
+    """메트릭 등록/출력 (이름 중복 시 기존 메트릭 반환)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.type}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def render(self) -> str:
+        """
+        Prometheus 텍스트 형식 (version 0.0.4)
+
+        Returns:
+            str: 전체 메트릭 텍스트
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """프로세스 공용 레지스트리"""
+    return _registry
+
+
+# ----------------------------------------------------------------------
+# Application metrics
+# ----------------------------------------------------------------------
+
+SEARCH_STAGE_SECONDS = _registry.histogram(
+    "policy_qa_search_stage_seconds",
+    "Search pipeline stage latency (embed, qdrant, bm25, fuse, hydrate, web)",
+    ["stage"]
+)
+GRAPH_NODE_SECONDS = _registry.histogram(
+    "policy_qa_graph_node_seconds",
+    "Graph node execution latency",
+    ["node"]
+)
+LLM_REQUEST_SECONDS = _registry.histogram(
+    "policy_qa_llm_request_seconds",
+    "LLM request latency including retries (successful calls)",
+    ["mode"]
+)
+LLM_TIME_TO_FIRST_TOKEN_SECONDS = _registry.histogram(
+    "policy_qa_llm_time_to_first_token_seconds",
+    "Streaming LLM time to first content token"
+)
+LLM_TOKENS_PER_SECOND = _registry.histogram(
+    "policy_qa_llm_tokens_per_second",
+    "LLM completion throughput (streaming: after first token)",
+    ["mode"],
+    buckets=THROUGHPUT_BUCKETS
+)
+LLM_REQUESTS_TOTAL = _registry.counter(
+    "policy_qa_llm_requests_total",
+    "LLM requests by mode and outcome",
+    ["mode", "status"]
+)
+LLM_TOKENS_TOTAL = _registry.counter(
+    "policy_qa_llm_tokens_total",
+    "LLM tokens reported by the API",
+    ["kind"]
+)
+CACHE_LOOKUPS_TOTAL = _registry.counter(
+    "policy_qa_cache_lookups_total",
+    "Cache lookups by cache and result (hit/miss)",
+    ["cache", "result"]
+)
+DB_POOL_WAIT_SECONDS = _registry.histogram(
+    "policy_qa_db_pool_wait_seconds",
+    "Time spent acquiring a connection from the DB pool",
+    buckets=WAIT_BUCKETS
+)
+DB_POOL_CHECKED_OUT = _registry.gauge(
+    "policy_qa_db_pool_checked_out",
+    "DB connections currently checked out"
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """
+    캐시 조회 결과 기록
+
+    Args:
+        cache: 캐시 이름 (llm_response, tavily, policy_context, chat_history)
+        hit: 적중 여부
+    """
+    CACHE_LOOKUPS_TOTAL.labels(cache, "hit" if hit else "miss").inc()
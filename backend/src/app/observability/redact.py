@@ -1,115 +1,184 @@
 """
 PII/민감정보 마스킹 규칙 (선택)
 개인정보 보호를 위한 데이터 마스킹 유틸리티
+
+- 이메일/주민등록번호/전화번호를 사전 컴파일 패턴 하나로 문자열당 1회 치환
+- '@'도 숫자도 없는 문자열은 정규식 없이 그대로 반환
+- dict/list/tuple 중첩 구조를 재귀 없이 순회 (리스트 안의 문자열 포함)
 """
 
 import re
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
+
+_EMAIL = r"(?P<email_user>[a-zA-Z0-9._%+-]+)@(?P<email_domain>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
+# 숫자 경계: 금액/ID 같은 긴 숫자열 일부를 번호로 오인하지 않도록 앞뒤가 숫자가 아닐 때만 매칭
+_RESIDENT = r"(?<!\d)(?P<rrn_first>\d{6})-?\d{7}(?!\d)"
+_PHONE = r"(?<!\d)(?P<phone_first>\d{2,3})-?\d{3,4}-?(?P<phone_last>\d{4})(?!\d)"
+# 번호 후보: 9자 이상의 숫자/하이픈 덩어리 (전화번호 최소 9자리)
+_NUMBER_RUN = r"(?<![\d-])\d[\d-]{7,}\d"
+
+_EMAIL_PATTERN = re.compile(_EMAIL)
+_RESIDENT_PATTERN = re.compile(_RESIDENT)
+_PHONE_PATTERN = re.compile(_PHONE)
+
+# 단일 패스 패턴: 세 패턴의 단순 alternation은 매 위치마다 모든 분기를 시도해 3패스보다 느리므로,
+# 첫 글자로 빠르게 걸러지는 후보(숫자 덩어리/이메일)만 찾고 번호 종류는 후보 안에서 판정
+_NUMBER_PATTERN = re.compile(f"(?P<number>{_NUMBER_RUN})")
+_PII_PATTERN = re.compile(f"(?P<number>{_NUMBER_RUN})|(?P<email>{_EMAIL})")
+_HAS_DIGIT = re.compile(r"\d").search
+
+
+def _mask_email(match: "re.Match") -> str:
+    return f"{match.group('email_user')[0]}***@{match.group('email_domain')}"
+
+
+def _mask_resident(match: "re.Match") -> str:
+    return f"{match.group('rrn_first')}-*******"
+
+
+def _mask_phone(match: "re.Match") -> str:
+    return f"{match.group('phone_first')}-****-{match.group('phone_last')}"
+
+
+def _mask_number(run: str) -> str:
+    # 대부분 덩어리 전체가 번호 1개 (주민등록번호 13자리를 전화번호보다 먼저 판정)
+    match = _RESIDENT_PATTERN.fullmatch(run)
+    if match:
+        return _mask_resident(match)
+    match = _PHONE_PATTERN.fullmatch(run)
+    if match:
+        return _mask_phone(match)
+    return _PHONE_PATTERN.sub(_mask_phone, _RESIDENT_PATTERN.sub(_mask_resident, run))
+
+
+def _mask(match: "re.Match") -> str:
+    if match.lastgroup == "email":
+        return _mask_email(match)
+    return _mask_number(match.group("number"))
 
 
 def redact_email(text: str) -> str:
     """
     이메일 주소 마스킹
-    
+
     Args:
         text: 원본 텍스트
-    
+
     Returns:
         str: 마스킹된 텍스트
-    
+
     Example:
         >>> redact_email("user@example.com")
         "u***@example.com"
     """
-    pattern = r'([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-    
-    def mask(match):
-        username = match.group(1)
-        domain = match.group(2)
-        masked_username = username[0] + "***" if len(username) > 0 else "***"
-        return f"{masked_username}@{domain}"
-    
-    return re.sub(pattern, mask, text)
+    return _EMAIL_PATTERN.sub(_mask_email, text) if "@" in text else text
 
 
 def redact_phone(text: str) -> str:
     """
     전화번호 마스킹
-    
+
     Args:
         text: 원본 텍스트
-    
+
     Returns:
         str: 마스킹된 텍스트
-    
+
     Example:
         >>> redact_phone("010-1234-5678")
         "010-****-5678"
     """
-    pattern = r'(\d{2,3})-?(\d{3,4})-?(\d{4})'
-    
-    def mask(match):
-        first = match.group(1)
-        last = match.group(3)
-        return f"{first}-****-{last}"
-    
-    return re.sub(pattern, mask, text)
+    return _PHONE_PATTERN.sub(_mask_phone, text)
 
 
 def redact_resident_number(text: str) -> str:
     """
     주민등록번호 마스킹
-    
+
     Args:
         text: 원본 텍스트
-    
+
     Returns:
         str: 마스킹된 텍스트
-    
+
     Example:
         >>> redact_resident_number("123456-1234567")
         "123456-*******"
     """
-    pattern = r'(\d{6})-?(\d{7})'
-    
-    def mask(match):
-        first = match.group(1)
-        return f"{first}-*******"
-    
-    return re.sub(pattern, mask, text)
+    return _RESIDENT_PATTERN.sub(_mask_resident, text)
+
+
+def redact_text(text: str) -> str:
+    """
+    문자열 1개의 PII 마스킹 (이메일/주민등록번호/전화번호, 단일 패스)
+
+    Args:
+        text: 원본 텍스트
+
+    Returns:
+        str: 마스킹된 텍스트
+    """
+    if "@" in text:
+        return _PII_PATTERN.sub(_mask, text)
+    if not _HAS_DIGIT(text):
+        return text
+    return _NUMBER_PATTERN.sub(_mask, text)
 
 
-def redact_pii(data: Dict[str, Any]) -> Dict[str, Any]:
+def redact_pii(data: Any) -> Any:
     """
-    딕셔너리 내의 PII 정보 마스킹
-    
+    중첩 데이터(dict/list/tuple/str) 내의 PII 정보 마스킹
+
+    원본은 변경하지 않고 새 컨테이너를 반환합니다. 같은 객체가 여러 번
+    참조되면(순환 참조 포함) 마스킹 결과도 같은 객체를 공유합니다.
+
     Args:
         data: 원본 데이터
-    
+
     Returns:
-        Dict[str, Any]: 마스킹된 데이터
+        Any: 마스킹된 데이터 (문자열 외 값은 그대로)
     """
-    if not isinstance(data, dict):
+    if isinstance(data, str):
+        return redact_text(data)
+    if not isinstance(data, (dict, list, tuple)):
         return data
-    
-    redacted = {}
-    
-    for key, value in data.items():
-        if isinstance(value, str):
-            # 이메일 마스킹
-            value = redact_email(value)
-            # 전화번호 마스킹
-            value = redact_phone(value)
-            # 주민등록번호 마스킹
-            value = redact_resident_number(value)
-        elif isinstance(value, dict):
-            # 재귀적으로 처리
-            value = redact_pii(value)
-        elif isinstance(value, list):
-            # 리스트 내의 각 항목 처리
-            value = [redact_pii(item) if isinstance(item, dict) else item for item in value]
-        
-        redacted[key] = value
-    
-    return redacted
 
+    root: Any = {} if isinstance(data, dict) else []
+    copies: Dict[int, Any] = {id(data): root}
+    stack: List[Tuple[Any, Any]] = [(data, root)]
+    # tuple은 list로 채운 뒤 마지막에 변환: (부모 사본, 키, list 사본)
+    tuple_fixups: List[Tuple[Any, Any, List[Any]]] = [(None, None, root)] if isinstance(data, tuple) else []
+
+    while stack:
+        source, target = stack.pop()
+        items = source.items() if isinstance(source, dict) else enumerate(source)
+        for key, value in items:
+            if isinstance(value, str):
+                value = redact_text(value)
+            elif isinstance(value, (dict, list, tuple)):
+                copy = copies.get(id(value))
+                if copy is None:
+                    copy = {} if isinstance(value, dict) else []
+                    copies[id(value)] = copy
+                    stack.append((value, copy))
+                if isinstance(value, tuple):
+                    tuple_fixups.append((target, key, copy))
+                value = copy
+
+            if isinstance(target, dict):
+                target[key] = value
+            else:
+                target.append(value)
+
+    # 나중에 만든(더 깊은) tuple부터 변환해야 부모 tuple에 변환 결과가 들어감
+    converted_tuples: Dict[int, tuple] = {}
+    for parent, key, items_copy in reversed(tuple_fixups):
+        converted = converted_tuples.get(id(items_copy))
+        if converted is None:
+            converted = converted_tuples[id(items_copy)] = tuple(items_copy)
+        if parent is None:
+            root = converted
+        else:
+            parent[key] = converted
+
+    return root
@@ -0,0 +1,430 @@
+"""
+Sampling Tracer
+샘플링 + 백그라운드 내보내기 트레이서 (trace_workflow 등 데코레이터의 기반)
+
+- 트레이스 ID/현재 span은 contextvar로 전파 (asyncio 태스크, run_in_threadpool, SSE 제너레이터)
+- head 샘플링: 루트 span 시작 시 워크플로우별 비율로 결정
+- tail 샘플링: head에서 빠진 트레이스도 예외가 있거나 느리면(tracing_tail_latency_ms) 보관
+- 요청 경로에서는 span 기록(시각/부모/입력 참조)만 하고, 직렬화·PII 마스킹·전송은
+  백그라운드 스레드가 처리. 내보내기 큐가 가득 차면 트레이스를 버리고 개수만 셉니다.
+"""
+
+import asyncio
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..config import get_settings
+from ..config.logger import get_logger
+from .exporters import TraceExporter, create_exporter
+
+logger = get_logger()
+
+# Sampling decisions
+HEAD = "head"
+TAIL_ERROR = "tail_error"
+TAIL_LATENCY = "tail_latency"
+DISCARDED = "discarded"
+
+
+@dataclass
+class Span:
+    """
+    span 1개 (입력/출력은 참조만 보관, 내보낼 때 직렬화)
+
+    Attributes:
+        name: 이름
+        span_id: 16 hex
+        parent_id: 부모 span_id (루트는 None)
+        run_type: chain/llm/tool/retriever
+        start_ns / end_ns: Unix epoch 나노초
+    """
+    name: str
+    span_id: str
+    parent_id: Optional[str]
+    run_type: str
+    start_ns: int
+    end_ns: Optional[int] = None
+    tags: Optional[List[str]] = None
+    metadata: Optional[Dict[str, Any]] = None
+    inputs: Optional[Tuple[tuple, dict]] = None
+    outputs: Any = None
+    error: Optional[str] = None
+    cancelled: bool = False
+
+
+@dataclass
+class Trace:
+    """
+    트레이스 1개 (루트 span 종료 시 내보내기 여부 결정)
+
+    Attributes:
+        trace_id: 32 hex
+        name: 루트 span 이름 (샘플링 비율 기준)
+        head_sampled: head 샘플링 결과
+        sampling: 최종 결정 (head/tail_error/tail_latency/discarded)
+    """
+    trace_id: str
+    name: str
+    head_sampled: bool
+    spans: List[Span] = field(default_factory=list)
+    dropped_spans: int = 0
+    has_error: bool = False
+    finished: bool = False
+    sampling: str = DISCARDED
+
+
+@dataclass
+class SpanHandle:
+    """start_span 반환값 (end_span에 전달)"""
+    trace: Trace
+    span: Span
+    token: Optional[Token]
+    perf_start: float
+
+
+# (트레이스, 현재 span) — 비활성화 상태의 span()은 span 없이 트레이스 ID만 설정
+_current: ContextVar[Optional[Tuple[Trace, Optional[Span]]]] = ContextVar("trace_current_span", default=None)
+
+
+def current_trace_id() -> Optional[str]:
+    """현재 컨텍스트의 트레이스 ID (트레이스 밖이면 None)"""
+    current = _current.get()
+    return current[0].trace_id if current else None
+
+
+def new_trace_id() -> str:
+    """32자리 hex 트레이스 ID (uuid4보다 빠른 random 기반, OTLP trace id 형식)"""
+    return "%032x" % random.getrandbits(128)
+
+
+class Tracer:
+    """
+    샘플링 트레이서
+
+    Attributes:
+        exporter: 트레이스 exporter
+        enabled: span 기록 여부 (False면 데코레이터가 원본 함수를 그대로 사용)
+    """
+
+    def __init__(
+        self,
+        exporter: TraceExporter,
+        enabled: bool = True,
+        sample_rate: float = 0.1,
+        sample_rates: Optional[Dict[str, float]] = None,
+        tail_latency_ms: float = 0.0,
+        keep_errors: bool = True,
+        capture_io: bool = True,
+        max_spans: int = 256,
+        queue_size: int = 1000,
+        batch_size: int = 50
+    ):
+        self.exporter = exporter
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.sample_rates = dict(sample_rates or {})
+        self.tail_latency_ms = tail_latency_ms
+        self.keep_errors = keep_errors
+        self.capture_io = capture_io
+        self.max_spans = max_spans
+        self.batch_size = batch_size
+
+        self._queue: "queue.Queue[Optional[Trace]]" = queue.Queue(maxsize=queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "traces": 0,
+            HEAD: 0,
+            TAIL_ERROR: 0,
+            TAIL_LATENCY: 0,
+            DISCARDED: 0,
+            "queue_dropped": 0,
+            "exported": 0,
+            "export_errors": 0,
+            "spans_dropped": 0,
+        }
+
+    # ------------------------------------------------------------
+    # Span lifecycle (요청 경로)
+    # ------------------------------------------------------------
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def start_span(
+        self,
+        name: str,
+        run_type: str = "chain",
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        inputs: Optional[Tuple[tuple, dict]] = None,
+        trace_id: Optional[str] = None
+    ) -> SpanHandle:
+        """
+        span 시작 (현재 트레이스가 없으면 새 루트 트레이스)
+
+        Args:
+            name: span 이름
+            run_type: chain/llm/tool/retriever
+            tags: 태그
+            metadata: 메타데이터
+            inputs: (args, kwargs) 참조
+            trace_id: 루트일 때 사용할 트레이스 ID (SSE 응답 헤더와 맞출 때)
+
+        Returns:
+            SpanHandle: end_span에 전달
+        """
+        current = _current.get()
+        if current is None or current[0].finished:
+            rate = self.sample_rates.get(name, self.sample_rate)
+            trace = Trace(
+                trace_id=trace_id or new_trace_id(),
+                name=name,
+                head_sampled=rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+            )
+            parent_id = None
+        else:
+            trace, parent = current
+            parent_id = parent.span_id if parent is not None else None
+
+        span = Span(
+            name=name,
+            span_id="%016x" % random.getrandbits(64),
+            parent_id=parent_id,
+            run_type=run_type,
+            start_ns=time.time_ns(),
+            tags=tags,
+            metadata=metadata,
+            inputs=inputs if self.capture_io else None,
+        )
+        if len(trace.spans) < self.max_spans:
+            trace.spans.append(span)
+        else:
+            trace.dropped_spans += 1
+
+        return SpanHandle(trace, span, _current.set((trace, span)), time.perf_counter())
+
+    def end_span(self, handle: SpanHandle, outputs: Any = None, error: Optional[BaseException] = None) -> None:
+        """
+        span 종료 (루트면 샘플링 결정 후 내보내기 큐에 추가)
+
+        Args:
+            handle: start_span 반환값
+            outputs: 반환값 참조
+            error: 예외
+        """
+        span, trace = handle.span, handle.trace
+        span.end_ns = time.time_ns()
+        if self.capture_io:
+            span.outputs = outputs
+        if isinstance(error, (asyncio.CancelledError, GeneratorExit)):
+            # 취소(예측 웹 검색 취소, 클라이언트 연결 끊김)는 오류가 아님 → tail 샘플링 대상 아님
+            span.cancelled = True
+        elif error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+            trace.has_error = True
+
+        if handle.token is not None:
+            try:
+                _current.reset(handle.token)
+            except ValueError:
+                # 다른 컨텍스트에서 종료 (예: 연결 끊긴 SSE 제너레이터 정리)
+                _current.set(None)
+
+        if span.parent_id is None:
+            self._finish_trace(trace, (time.perf_counter() - handle.perf_start) * 1000)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        run_type: str = "chain",
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        trace_id: Optional[str] = None
+    ) -> Iterator[Optional[SpanHandle]]:
+        """
+        span 컨텍스트 매니저
+
+        비활성화 시에도 트레이스 ID는 컨텍스트에 설정하여(기록/내보내기 없음)
+        current_trace_id()로 응답 헤더/SSE 이벤트에 실을 수 있습니다.
+
+        Example:
+            with get_tracer().span("chat_stream", trace_id=trace_id):
+                ...
+        """
+        if not self.enabled:
+            token = _current.set((Trace(trace_id or new_trace_id(), name, False), None))
+            try:
+                yield None
+            finally:
+                try:
+                    _current.reset(token)
+                except ValueError:
+                    _current.set(None)
+            return
+        handle = self.start_span(name, run_type, tags, metadata, trace_id=trace_id)
+        try:
+            yield handle
+        except BaseException as e:
+            self.end_span(handle, error=e)
+            raise
+        self.end_span(handle)
+
+    def _finish_trace(self, trace: Trace, duration_ms: float) -> None:
+        trace.finished = True
+        if trace.head_sampled:
+            trace.sampling = HEAD
+        elif self.keep_errors and trace.has_error:
+            trace.sampling = TAIL_ERROR
+        elif self.tail_latency_ms > 0 and duration_ms >= self.tail_latency_ms:
+            trace.sampling = TAIL_LATENCY
+        else:
+            trace.sampling = DISCARDED
+
+        with self._stats_lock:
+            self._stats["traces"] += 1
+            self._stats[trace.sampling] += 1
+            self._stats["spans_dropped"] += trace.dropped_spans
+        if trace.sampling == DISCARDED:
+            return
+
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self._count("queue_dropped")
+
+    # ------------------------------------------------------------
+    # Export (백그라운드 스레드)
+    # ------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run_worker, name="trace-exporter", daemon=True)
+                self._worker.start()
+
+    def _run_worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch: List[Trace] = []
+            stop = item is None
+            if item is not None:
+                batch.append(item)
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            if batch:
+                try:
+                    self.exporter.export(batch)
+                    self._count("exported", len(batch))
+                except Exception as e:
+                    self._count("export_errors", len(batch))
+                    logger.warning(
+                        "Trace export failed",
+                        extra={"exporter": self.exporter.name, "traces": len(batch), "error": str(e)}
+                    )
+            if stop:
+                return
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        남은 트레이스 내보내기 후 종료
+
+        Args:
+            timeout: 대기 시간 (초)
+        """
+        worker = self._worker
+        if worker is not None:
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+            worker.join(timeout)
+            self._worker = None
+        self.exporter.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        트레이서 통계
+
+        Returns:
+            Dict: enabled/exporter/샘플링 결정별 수/큐 길이 및 버림 수/내보내기 성공·실패 수
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        return {
+            "enabled": self.enabled,
+            "exporter": self.exporter.name,
+            "sample_rate": self.sample_rate,
+            "queue_depth": self._queue.qsize(),
+            **stats,
+        }
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """
+    Tracer 싱글톤 반환 (설정 기반)
+
+    exporter가 none이면(auto에서 LangSmith 비활성 포함) 비활성화되어
+    데코레이터가 원본 함수를 그대로 반환합니다.
+
+    Returns:
+        Tracer: 트레이서
+    """
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                settings = get_settings()
+                exporter = create_exporter(settings.tracing_exporter, settings.tracing_file_path)
+                _tracer = Tracer(
+                    exporter=exporter,
+                    enabled=settings.tracing_enabled and exporter.name != "none",
+                    sample_rate=settings.tracing_sample_rate,
+                    sample_rates=settings.tracing_sample_rates,
+                    tail_latency_ms=settings.tracing_tail_latency_ms,
+                    keep_errors=settings.tracing_keep_errors,
+                    capture_io=settings.tracing_capture_io,
+                    max_spans=settings.tracing_max_spans,
+                    queue_size=settings.tracing_queue_size,
+                    batch_size=settings.tracing_batch_size,
+                )
+                logger.info(
+                    "Tracer initialized",
+                    extra={
+                        "enabled": _tracer.enabled,
+                        "exporter": exporter.name,
+                        "sample_rate": settings.tracing_sample_rate,
+                        "tail_latency_ms": settings.tracing_tail_latency_ms
+                    }
+                )
+    return _tracer
+
+
+def shutdown_tracer(timeout: float = 5.0) -> None:
+    """트레이서 종료 (앱 종료 시 남은 트레이스 flush)"""
+    if _tracer is not None:
+        _tracer.shutdown(timeout)
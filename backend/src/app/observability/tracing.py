@@ -1,14 +1,17 @@
 """
-LangSmith 트레이싱 데코레이터 및 유틸리티
+트레이싱 데코레이터 및 유틸리티
 워크플로우 및 LLM 호출을 트레이싱합니다.
+
+span 기록은 app.observability.tracer(샘플링 + 백그라운드 내보내기)가 담당하므로
+요청 경로에서는 LangSmith 호출이나 직렬화가 일어나지 않습니다.
+트레이서가 비활성화되면(exporter 없음) 원본 함수를 그대로 반환합니다.
 """
 
+import inspect
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, TypeVar, cast
 
-from langsmith import traceable
-
-from .langsmith_client import get_langsmith_client
+from .tracer import get_tracer
 from ..config.logger import get_logger
 
 logger = get_logger()
@@ -26,7 +29,7 @@ def trace_workflow(
     워크플로우 실행을 트레이싱하는 데코레이터
     
     Args:
-        name: 트레이스 이름
+        name: 트레이스 이름 (루트 span이면 샘플링 비율 기준: settings.tracing_sample_rates)
         tags: 태그 리스트
         metadata: 메타데이터
         run_type: 실행 타입 (chain, tool, llm, etc.)
@@ -47,45 +50,58 @@ def trace_workflow(
         ```
     """
     def decorator(func: F) -> F:
-        client = get_langsmith_client()
+        tracer = get_tracer()
         
-        if not client.is_enabled():
-            # LangSmith가 비활성화된 경우 원본 함수 반환
+        if not tracer.enabled:
+            # 트레이싱이 비활성화된 경우 원본 함수 반환
             return func
         
+        span_tags = list(tags or [])
+        span_metadata = dict(metadata or {})
+        
+        if inspect.iscoroutinefunction(func):
+            # async 함수는 await 완료 시점까지 트레이싱
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                handle = tracer.start_span(name, run_type, span_tags, span_metadata, (args, kwargs))
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException as e:
+                    tracer.end_span(handle, error=e)
+                    if isinstance(e, Exception):
+                        logger.error(
+                            f"Error in traced workflow: {name}",
+                            extra={
+                                "workflow": name,
+                                "error": str(e)
+                            },
+                            exc_info=True
+                        )
+                    raise
+                tracer.end_span(handle, outputs=result)
+                return result
+            
+            return cast(F, async_wrapper)
+        
         @wraps(func)
-        @traceable(
-            name=name,
-            tags=tags or [],
-            metadata=metadata or {},
-            run_type=run_type
-        )
         def wrapper(*args: Any, **kwargs: Any) -> Any:
+            handle = tracer.start_span(name, run_type, span_tags, span_metadata, (args, kwargs))
             try:
-                logger.debug(
-                    f"Starting traced workflow: {name}",
-                    extra={
-                        "workflow": name,
-                        "tags": tags,
-                        "run_type": run_type
-                    }
-                )
                 result = func(*args, **kwargs)
-                logger.debug(
-                    f"Completed traced workflow: {name}",
-                    extra={"workflow": name}
-                )
-                return result
-            except Exception as e:
-                logger.error(
-                    f"Error in traced workflow: {name}",
-                    extra={
-                        "workflow": name,
-                        "error": str(e)
-                    },
-                    exc_info=True
-                )
+            except BaseException as e:
+                tracer.end_span(handle, error=e)
+                if isinstance(e, Exception):
+                    logger.error(
+                        f"Error in traced workflow: {name}",
+                        extra={
+                            "workflow": name,
+                            "error": str(e)
+                        },
+                        exc_info=True
+                    )
                 raise
+            tracer.end_span(handle, outputs=result)
+            return result
         
         return cast(F, wrapper)
     return decorator
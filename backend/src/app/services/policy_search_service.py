@@ -13,7 +13,7 @@ from ..vector_store import get_qdrant_manager, get_embedder
 from ..domain.policy import PolicyResponse
 from ..config.logger import get_logger
 from ..observability import trace_workflow, get_feature_tags
-from ..web_search.clients import TavilySearchClient
+from ..web_search.clients import get_tavily_client
 # NOTE: create_search_workflow는 더 이상 사용하지 않음 (SimpleSearchService로 대체)
 
 logger = get_logger()
@@ -48,7 +48,7 @@ class PolicySearchService:
         #   Qdrant/임베딩은 다른 기능(예: QA)에서 재사용할 수 있도록 초기화는 유지합니다.
         self.qdrant_manager = get_qdrant_manager()
         self.embedder = get_embedder()
-        self.tavily_client = TavilySearchClient()
+        self.tavily_client = get_tavily_client()
     
     @trace_workflow(
         name="hybrid_search",
@@ -188,8 +188,7 @@ class PolicySearchService:
             # Tavily 웹 검색 실행
             web_results = self.tavily_client.search(
                 query=f"{query} 정부 지원 사업 공고",
-                max_results=max_results,
-                search_depth="advanced"
+                max_results=max_results
             )
             
             if not web_results:
@@ -6,9 +6,12 @@ Search Configuration
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 
+from ..text.keyword_matcher import KeywordMatcher
+
 
 class SimilarityStrategy(Enum):
     """유사도 조정 전략"""
@@ -24,6 +27,12 @@ class SearchMode(Enum):
     HYBRID = "hybrid"         # Dense + Sparse 하이브리드
 
 
+@lru_cache(maxsize=8)
+def _adjustment_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """조정 키워드 매처 (키워드 자체를 카테고리로 사용, 설정이 바뀌면 새로 빌드)"""
+    return KeywordMatcher({kw: [kw] for kw in keywords})
+
+
 @dataclass
 class SearchConfig:
     """
@@ -162,13 +171,16 @@ class SearchConfig:
         """
         threshold = self.default_score_threshold
 
-        # 키워드별 조정
-        if keywords:
+        # 키워드별 조정 (검색어 단어마다 설정 순서상 가장 앞선 매칭 1개만 반영)
+        if keywords and self.keyword_threshold_adjustments:
+            adjustments = self.keyword_threshold_adjustments
+            priority = {kw: i for i, kw in enumerate(adjustments)}
+            matcher = _adjustment_matcher(tuple(adjustments))
             for keyword in keywords:
-                for kw, adjustment in self.keyword_threshold_adjustments.items():
-                    if kw in keyword:
-                        threshold += adjustment
-                        break
+                hits = matcher.find_all(keyword)
+                if hits:
+                    best = min(hits, key=lambda hit: priority[hit.category])
+                    threshold += adjustments[best.category]
 
         # 지역별 조정
         if region and region in self.region_threshold_adjustments:
@@ -11,6 +11,7 @@ Simple Search Service
 - 검색 품질 평가 지표
 """
 
+import threading
 import time
 import uuid
 from typing import Dict, Any, List, Optional, Tuple
@@ -24,7 +25,8 @@ from ..db.engine import get_db
 from ..vector_store import get_qdrant_manager, get_embedder, get_hybrid_searcher, HybridSearcher
 from ..config.logger import get_logger
 from ..config import get_settings
-from ..observability import trace_workflow, get_feature_tags
+from ..observability import trace_workflow, get_feature_tags, timed
+from ..observability.metrics import SEARCH_STAGE_SECONDS
 from ..web_search.clients.tavily_client import get_tavily_client
 from .search_config import get_search_config, SearchConfig, SearchMode
 
@@ -97,22 +99,32 @@ class SimpleSearchService:
     LLM 호출 없이 빠른 벡터 검색 수행
     """
 
-    def __init__(self, config: SearchConfig = None):
+    def __init__(
+        self,
+        config: SearchConfig = None,
+        qdrant_manager: Optional[Any] = None,
+        embedder: Optional[Any] = None,
+        hybrid_searcher: Optional[HybridSearcher] = None
+    ):
         """
         초기화
 
         Args:
             config: 검색 설정 (None이면 기본 설정 사용)
+            qdrant_manager: 벡터 검색기 (기본값: get_qdrant_manager(), 오프라인 평가 시 메모리 인덱스)
+            embedder: 임베더 (기본값: get_embedder())
+            hybrid_searcher: 하이브리드 결합기 (기본값: 설정 기반 싱글톤)
         """
         self.config = config or get_search_config()
-        self.qdrant_manager = get_qdrant_manager()
-        self.embedder = get_embedder()
-        self.hybrid_searcher = get_hybrid_searcher(
+        self.qdrant_manager = qdrant_manager if qdrant_manager is not None else get_qdrant_manager()
+        self.embedder = embedder if embedder is not None else get_embedder()
+        self.hybrid_searcher = hybrid_searcher if hybrid_searcher is not None else get_hybrid_searcher(
             dense_weight=self.config.dense_weight,
             sparse_weight=self.config.sparse_weight,
             use_rrf=self.config.use_rrf
         )
         self._bm25_index_built = False
+        self._bm25_lock = threading.Lock()
 
     @trace_workflow(
         name="simple_search",
@@ -466,6 +478,21 @@ class SimpleSearchService:
         if self._bm25_index_built:
             return
 
+        with self._bm25_lock:
+            if not self._bm25_index_built:
+                self._build_bm25_index()
+
+    def warmup(self) -> bool:
+        """
+        시작 웜업: BM25 인덱스를 첫 검색 전에 미리 구축
+
+        Returns:
+            bool: 인덱스 구축 여부 (실패 시 Dense 검색만 사용)
+        """
+        self._build_bm25_index_if_needed()
+        return self._bm25_index_built
+
+    def _build_bm25_index(self) -> None:
         logger.info("Building BM25 index for hybrid search")
 
         try:
@@ -504,85 +531,132 @@ class SimpleSearchService:
             # 인덱스 구축 실패 시 Dense 검색만 사용
             self._bm25_index_built = False
 
-    def _hybrid_search(
+    def rank_candidates(
         self,
         query: str,
-        region: Optional[str],
-        category: Optional[str],
-        target_group: Optional[str],
-        score_threshold: float,
-        metrics: SearchMetrics
-    ) -> Tuple[List[Dict[str, Any]], List[SearchEvidence]]:
+        region: Optional[str] = None,
+        category: Optional[str] = None,
+        score_threshold: Optional[float] = None,
+        mode: str = "hybrid"
+    ) -> Tuple[List[Tuple[int, float, str]], Dict[int, str]]:
         """
-        하이브리드 검색 수행 (Dense + Sparse)
+        정책 후보 순위 계산 (MySQL 상세 조회 전 단계)
+
+        하이브리드 검색과 오프라인 검색 벤치마크(app.evaluation.retrieval_bench)가 같은 경로를 사용합니다.
+        hybrid 모드의 결합 방식(RRF/가중합)은 hybrid_searcher.use_rrf를 따릅니다.
 
         Args:
             query: 검색 쿼리
-            region: 지역 필터
-            category: 카테고리 필터
-            target_group: 대상 그룹 필터
-            score_threshold: 유사도 임계값
-            metrics: 검색 지표 (업데이트됨)
+            region: 지역 필터 (Dense만 적용)
+            category: 카테고리 필터 (Dense만 적용)
+            score_threshold: Dense 유사도 임계값
+            mode: dense | sparse | hybrid
 
         Returns:
-            Tuple[List[Dict], List[SearchEvidence]]: (검색 결과, 검색 근거)
+            Tuple[List[Tuple[int, float, str]], Dict[int, str]]:
+                ([(policy_id, score, match_type), ...] 점수 내림차순, policy_id → 최고 점수 청크 내용)
+
+        Raises:
+            ValueError: 알 수 없는 mode
         """
+        if mode not in ("dense", "sparse", "hybrid"):
+            raise ValueError(f"Unknown search mode: {mode}")
+
         # BM25 인덱스 구축 (처음 한 번만)
-        self._build_bm25_index_if_needed()
+        if mode != "dense":
+            self._build_bm25_index_if_needed()
 
         # 1. Dense 검색 (벡터)
-        query_vector = self.embedder.embed_text(query)
+        dense_policy_scores: List[Tuple[int, float]] = []
+        policy_contents: Dict[int, str] = {}
 
-        qdrant_filter = {}
-        if region:
-            qdrant_filter["region"] = region
-        if category:
-            qdrant_filter["category"] = category
+        if mode != "sparse":
+            with timed(SEARCH_STAGE_SECONDS, stage="embed"):
+                query_vector = self.embedder.embed_text(query)
 
-        dense_results = self.qdrant_manager.search(
-            query_vector=query_vector,
-            limit=self.config.qdrant_limit,
-            score_threshold=score_threshold,
-            filter_dict=qdrant_filter if qdrant_filter else None
-        )
+            qdrant_filter = {}
+            if region:
+                qdrant_filter["region"] = region
+            if category:
+                qdrant_filter["category"] = category
+
+            with timed(SEARCH_STAGE_SECONDS, stage="qdrant"):
+                dense_results = self.qdrant_manager.search(
+                    query_vector=query_vector,
+                    limit=self.config.qdrant_limit,
+                    score_threshold=score_threshold,
+                    filter_dict=qdrant_filter if qdrant_filter else None
+                )
 
-        # Dense 결과를 (policy_id, score) 형태로 변환
-        dense_policy_scores: List[Tuple[int, float]] = []
-        policy_contents: Dict[int, str] = {}
+            # Dense 결과를 (policy_id, score) 형태로 변환
+            # 같은 policy_id가 여러 번 나올 수 있으므로 최고 점수만 유지 (처음 나온 순서 유지)
+            best: Dict[int, float] = {}
+            for result in dense_results:
+                payload = result.get("payload", {})
+                policy_id = payload.get("policy_id")
+                score = result.get("score", 0.0)
 
-        for result in dense_results:
-            payload = result.get("payload", {})
-            policy_id = payload.get("policy_id")
-            score = result.get("score", 0.0)
-            content = payload.get("content", "")
+                if policy_id and (policy_id not in best or score > best[policy_id]):
+                    best[policy_id] = score
+                    policy_contents[policy_id] = payload.get("content", "")
+            dense_policy_scores = list(best.items())
 
-            if policy_id:
-                # 같은 policy_id가 여러 번 나올 수 있으므로 최고 점수만 유지
-                existing = next((i for i, (pid, _) in enumerate(dense_policy_scores) if pid == policy_id), None)
-                if existing is not None:
-                    if score > dense_policy_scores[existing][1]:
-                        dense_policy_scores[existing] = (policy_id, score)
-                        policy_contents[policy_id] = content
-                else:
-                    dense_policy_scores.append((policy_id, score))
-                    policy_contents[policy_id] = content
+            if mode == "dense":
+                return [(pid, score, "dense") for pid, score in dense_policy_scores], policy_contents
 
         # 2. Sparse 검색 (BM25)
         sparse_policy_scores: List[Tuple[int, float]] = []
 
         if self.hybrid_searcher.bm25_index:
-            sparse_results = self.hybrid_searcher.bm25_index.search(
-                query=query,
-                top_k=self.config.qdrant_limit,
-                min_score=self.config.sparse_min_score
-            )
-            sparse_policy_scores = sparse_results
+            with timed(SEARCH_STAGE_SECONDS, stage="bm25"):
+                sparse_policy_scores = self.hybrid_searcher.bm25_index.search(
+                    query=query,
+                    top_k=self.config.qdrant_limit,
+                    min_score=self.config.sparse_min_score
+                )
+
+        if mode == "sparse":
+            return [(pid, score, "sparse") for pid, score in sparse_policy_scores], policy_contents
 
         # 3. 하이브리드 결합
-        combined_results = self.hybrid_searcher.combine_results(
-            dense_results=dense_policy_scores,
-            sparse_results=sparse_policy_scores,
-            normalize=True
+        with timed(SEARCH_STAGE_SECONDS, stage="fuse"):
+            combined_results = self.hybrid_searcher.combine_results(
+                dense_results=dense_policy_scores,
+                sparse_results=sparse_policy_scores,
+                normalize=True
+            )
+
+        return combined_results, policy_contents
+
+    def _hybrid_search(
+        self,
+        query: str,
+        region: Optional[str],
+        category: Optional[str],
+        target_group: Optional[str],
+        score_threshold: float,
+        metrics: SearchMetrics
+    ) -> Tuple[List[Dict[str, Any]], List[SearchEvidence]]:
+        """
+        하이브리드 검색 수행 (Dense + Sparse)
+
+        Args:
+            query: 검색 쿼리
+            region: 지역 필터
+            category: 카테고리 필터
+            target_group: 대상 그룹 필터
+            score_threshold: 유사도 임계값
+            metrics: 검색 지표 (업데이트됨)
+
+        Returns:
+            Tuple[List[Dict], List[SearchEvidence]]: (검색 결과, 검색 근거)
+        """
+        combined_results, policy_contents = self.rank_candidates(
+            query=query,
+            region=region,
+            category=category,
+            score_threshold=score_threshold,
+            mode="hybrid"
         )
 
         # 매칭 타입별 카운트
@@ -597,8 +671,8 @@ class SimpleSearchService:
         logger.info(
             "Hybrid search completed",
             extra={
-                "dense_count": len(dense_policy_scores),
-                "sparse_count": len(sparse_policy_scores),
+                "dense_count": metrics.dense_count + metrics.hybrid_count,
+                "sparse_count": metrics.sparse_count + metrics.hybrid_count,
                 "combined_count": len(combined_results),
                 "hybrid_matches": metrics.hybrid_count
             }
@@ -616,7 +690,7 @@ class SimpleSearchService:
         retrieved_docs = []
         evidence_list: List[SearchEvidence] = []
 
-        with get_db() as db:
+        with get_db() as db, timed(SEARCH_STAGE_SECONDS, stage="hydrate"):
             policies = db.query(Policy).filter(Policy.id.in_(policy_ids)).all()
 
             # 필터링 적용
@@ -702,7 +776,8 @@ class SimpleSearchService:
             Tuple[List[Dict], List[SearchEvidence]]: (검색 결과, 검색 근거)
         """
         # 쿼리 임베딩 생성
-        query_vector = self.embedder.embed_text(query)
+        with timed(SEARCH_STAGE_SECONDS, stage="embed"):
+            query_vector = self.embedder.embed_text(query)
 
         # Qdrant 필터 구성
         qdrant_filter = {}
@@ -712,12 +787,13 @@ class SimpleSearchService:
             qdrant_filter["category"] = category
 
         # Qdrant 검색
-        results = self.qdrant_manager.search(
-            query_vector=query_vector,
-            limit=self.config.qdrant_limit,
-            score_threshold=score_threshold,
-            filter_dict=qdrant_filter if qdrant_filter else None
-        )
+        with timed(SEARCH_STAGE_SECONDS, stage="qdrant"):
+            results = self.qdrant_manager.search(
+                query_vector=query_vector,
+                limit=self.config.qdrant_limit,
+                score_threshold=score_threshold,
+                filter_dict=qdrant_filter if qdrant_filter else None
+            )
 
         # 정책 ID별 최고 점수 및 콘텐츠 추적
         policy_scores: Dict[int, float] = {}
@@ -749,7 +825,7 @@ class SimpleSearchService:
 
         # MySQL에서 정책 상세 정보 조회
         retrieved_docs = []
-        with get_db() as db:
+        with get_db() as db, timed(SEARCH_STAGE_SECONDS, stage="hydrate"):
             policy_ids = list(policy_scores.keys())
             policies = db.query(Policy).filter(Policy.id.in_(policy_ids)).all()
 
@@ -836,8 +912,7 @@ class SimpleSearchService:
             tavily_client = get_tavily_client()
             results = tavily_client.search(
                 query=search_query,
-                max_results=self.config.web_search_max_results,
-                search_depth="advanced"
+                max_results=self.config.web_search_max_results
             )
 
             web_sources = []
@@ -916,6 +991,7 @@ class SimpleSearchService:
 
 # 싱글톤 인스턴스
 _simple_search_service: Optional[SimpleSearchService] = None
+_simple_search_lock = threading.Lock()
 
 
 def get_simple_search_service() -> SimpleSearchService:
@@ -927,5 +1003,7 @@ def get_simple_search_service() -> SimpleSearchService:
     """
     global _simple_search_service
     if _simple_search_service is None:
-        _simple_search_service = SimpleSearchService()
+        with _simple_search_lock:
+            if _simple_search_service is None:
+                _simple_search_service = SimpleSearchService()
     return _simple_search_service
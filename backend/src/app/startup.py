@@ -0,0 +1,277 @@
+"""
+Startup State
+워커 시작 상태 머신 + 웜업 (readiness 판단 근거)
+
+    starting → warming → ready | degraded | failed → stopping
+    (웜업 비활성화 시 starting → ready)
+
+웜업은 임베딩 모델 로드 + 더미 인코딩, Qdrant 연결, BM25 인덱스 구축,
+질문 분류기 학습, LangGraph 그래프 컴파일, HTTP 연결 풀 생성을 순서대로 수행합니다.
+필수 단계가 실패하면 failed(트래픽 받지 않음), 선택 단계만 실패하면 degraded(트래픽 받음,
+해당 기능은 첫 요청 시 지연 초기화)입니다. 단계별 소요 시간과 RSS 증가량을 기록합니다.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from .config import get_settings
+from .config.logger import get_logger
+
+logger = get_logger()
+
+# Phases
+STARTING = "starting"
+WARMING = "warming"
+READY = "ready"
+DEGRADED = "degraded"
+FAILED = "failed"
+STOPPING = "stopping"
+
+_TRANSITIONS = {
+    STARTING: {WARMING, READY, STOPPING},
+    WARMING: {READY, DEGRADED, FAILED, STOPPING},
+    READY: {STOPPING},
+    DEGRADED: {STOPPING},
+    FAILED: {STOPPING},
+    STOPPING: set(),
+}
+
+# Step status
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+SKIPPED = "skipped"
+
+
+def _rss_mb() -> Optional[float]:
+    """현재 프로세스 RSS (MB, /proc 없는 환경에서는 None)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def _warm_embedder() -> None:
+    from .vector_store import get_embedder
+    get_embedder().warmup()
+
+
+def _warm_qdrant() -> None:
+    from .vector_store import get_qdrant_manager
+    get_qdrant_manager().get_collection_info()
+
+
+def _warm_bm25() -> None:
+    from .services.simple_search_service import get_simple_search_service
+    if not get_simple_search_service().warmup():
+        raise RuntimeError("BM25 index not built (dense-only search)")
+
+
+def _warm_query_classifier() -> bool:
+    if not get_settings().query_classifier_enabled:
+        return False
+    from .agent.query_classifier import get_query_classifier
+    if get_query_classifier() is None:
+        raise RuntimeError("query classifier unavailable")
+    return True
+
+
+def _warm_workflows() -> None:
+    from .agent.workflows import get_qa_app
+    from .agent.workflows.eligibility_workflow import get_eligibility_start_app
+    get_qa_app()
+    get_eligibility_start_app()
+
+
+def _warm_clients() -> None:
+    from .llm import get_openai_client
+    from .web_search.clients import get_tavily_client
+    get_openai_client()
+    get_tavily_client()
+
+
+@dataclass(frozen=True)
+class WarmupStep:
+    """
+    웜업 단계
+
+    Attributes:
+        name: 단계 이름
+        run: 실행 함수 (False 반환 시 skipped)
+        required: 실패 시 readiness 실패 여부
+    """
+    name: str
+    run: Callable[[], Optional[bool]]
+    required: bool = True
+
+
+WARMUP_STEPS: List[WarmupStep] = [
+    WarmupStep("embedder", _warm_embedder, required=True),
+    WarmupStep("qdrant", _warm_qdrant, required=True),
+    WarmupStep("bm25", _warm_bm25, required=False),
+    WarmupStep("query_classifier", _warm_query_classifier, required=False),
+    WarmupStep("workflows", _warm_workflows, required=True),
+    WarmupStep("clients", _warm_clients, required=False),
+]
+
+
+class StartupState:
+    """
+    워커 시작 상태 (프로세스 내 공유)
+
+    Attributes:
+        phase: 현재 단계 (starting/warming/ready/degraded/failed/stopping)
+        steps: 웜업 단계별 {"status", "required", "duration_ms", "rss_delta_mb", "error"}
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.phase = STARTING
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self._started = time.monotonic()
+        self._phase_changed: Dict[str, float] = {STARTING: 0.0}
+
+    def transition(self, phase: str) -> bool:
+        """
+        단계 전환 (허용되지 않는 전환은 무시)
+
+        Args:
+            phase: 다음 단계
+
+        Returns:
+            bool: 전환 여부
+        """
+        with self._lock:
+            if phase not in _TRANSITIONS[self.phase]:
+                return False
+            previous, self.phase = self.phase, phase
+            self._phase_changed[phase] = round(time.monotonic() - self._started, 3)
+
+        logger.info("Startup phase changed", extra={"from_phase": previous, "to_phase": phase})
+        return True
+
+    def update_step(self, name: str, **fields: Any) -> None:
+        with self._lock:
+            self.steps.setdefault(name, {}).update(fields)
+
+    @property
+    def is_ready(self) -> bool:
+        return self.phase in (READY, DEGRADED)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "phase": self.phase,
+                "ready": self.phase in (READY, DEGRADED),
+                "uptime_seconds": round(time.monotonic() - self._started, 1),
+                "phase_changed_at": dict(self._phase_changed),
+                "rss_mb": _rss_mb(),
+                "steps": {name: dict(step) for name, step in self.steps.items()},
+            }
+
+
+_state = StartupState()
+
+
+def run_warmup(steps: Optional[List[WarmupStep]] = None) -> Dict[str, Any]:
+    """
+    웜업 실행 후 ready/degraded/failed로 전환 (블로킹, 워커 스레드에서 호출)
+
+    RSS 증가량은 같은 시간 다른 요청의 할당도 포함하는 근사치입니다.
+
+    Args:
+        steps: 웜업 단계 목록 (기본값: WARMUP_STEPS)
+
+    Returns:
+        Dict: 시작 상태 스냅샷
+    """
+    steps = steps if steps is not None else WARMUP_STEPS
+    if not _state.transition(WARMING):
+        return _state.snapshot()
+
+    for step in steps:
+        _state.update_step(step.name, status=PENDING, required=step.required)
+
+    failed_required: List[str] = []
+    failed_optional: List[str] = []
+    for step in steps:
+        if _state.phase == STOPPING:
+            break
+
+        _state.update_step(step.name, status=RUNNING)
+        started = time.perf_counter()
+        rss_before = _rss_mb()
+        try:
+            status = SKIPPED if step.run() is False else DONE
+            error = None
+        except Exception as e:
+            status, error = FAILED, str(e)
+            (failed_required if step.required else failed_optional).append(step.name)
+            logger.warning(
+                "Warm-up step failed",
+                extra={"step": step.name, "required": step.required, "error": error},
+                exc_info=True
+            )
+        rss_after = _rss_mb()
+        _state.update_step(
+            step.name,
+            status=status,
+            error=error,
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+            rss_delta_mb=round(rss_after - rss_before, 1) if rss_before is not None and rss_after is not None else None,
+        )
+
+    if failed_required:
+        _state.transition(FAILED)
+    elif failed_optional:
+        _state.transition(DEGRADED)
+    else:
+        _state.transition(READY)
+
+    snapshot = _state.snapshot()
+    logger.info(
+        "Warm-up completed",
+        extra={
+            "phase": snapshot["phase"],
+            "failed_steps": failed_required + failed_optional,
+            "rss_mb": snapshot["rss_mb"],
+            "steps": {name: step.get("duration_ms") for name, step in snapshot["steps"].items()},
+        }
+    )
+    return snapshot
+
+
+def mark_started(warmup: bool) -> None:
+    """
+    lifespan 시작 완료 (웜업을 하지 않으면 바로 ready)
+
+    Args:
+        warmup: 웜업 예정 여부
+    """
+    if not warmup:
+        _state.transition(READY)
+
+
+def mark_stopping() -> None:
+    """종료 시작 (readiness 실패로 전환하여 새 트래픽 차단)"""
+    _state.transition(STOPPING)
+
+
+def is_ready() -> bool:
+    """트래픽을 받을 수 있는지 (ready 또는 degraded)"""
+    return _state.is_ready
+
+
+def get_startup_status() -> Dict[str, Any]:
+    """
+    시작 상태 조회 (헬스체크/모니터링용)
+
+    Returns:
+        Dict: phase/ready/uptime_seconds/phase_changed_at/rss_mb/steps
+    """
+    return _state.snapshot()
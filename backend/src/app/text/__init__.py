@@ -0,0 +1,27 @@
+"""
+Text Processing Module
+공용 텍스트 처리 유틸리티 (키워드 매칭, BM25 토크나이저 등)
+"""
+
+from .keyword_matcher import KeywordHit, KeywordMatcher, StreamScanner, get_keyword_matcher
+from .keywords import KEYWORD_GROUPS
+from .tokenizers import (
+    BaseTokenizer,
+    MorphemeTokenizer,
+    NgramTokenizer,
+    WhitespaceTokenizer,
+    create_tokenizer,
+)
+
+__all__ = [
+    "KeywordHit",
+    "KeywordMatcher",
+    "StreamScanner",
+    "get_keyword_matcher",
+    "KEYWORD_GROUPS",
+    "BaseTokenizer",
+    "MorphemeTokenizer",
+    "NgramTokenizer",
+    "WhitespaceTokenizer",
+    "create_tokenizer",
+]
@@ -0,0 +1,234 @@
+"""
+Keyword Matcher
+Aho-Corasick 기반 다중 키워드 매처
+
+여러 카테고리의 키워드를 하나의 오토마톤으로 컴파일하여
+텍스트를 한 번만 훑으면서 모든 매칭(키워드, 카테고리, 위치)을 찾습니다.
+스트리밍 텍스트는 StreamScanner로 청크 단위 증분 매칭합니다 (새로 들어온 글자만 처리).
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Container, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """키워드 매칭 결과"""
+    keyword: str
+    category: str
+    start: int
+    end: int
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick 오토마톤
+
+    Attributes:
+        ignore_case: 대소문자 무시 여부
+        keywords: (키워드, 카테고리) 목록 (등록 순서 = 우선순위)
+    """
+
+    def __init__(self, groups: Mapping[str, Iterable[str]], ignore_case: bool = True):
+        """
+        Initialize matcher
+
+        Args:
+            groups: 카테고리 → 키워드 목록
+            ignore_case: 대소문자 무시 여부
+        """
+        self.ignore_case = ignore_case
+        self.keywords: List[Tuple[str, str]] = []
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        self._lengths: List[int] = []
+
+        for category, words in groups.items():
+            for word in words:
+                self._add(word, category)
+        self._build_failure_links()
+
+    def _normalize(self, text: str) -> str:
+        if not self.ignore_case:
+            return text
+        lowered = text.lower()
+        # 소문자 변환으로 길이가 바뀌는 문자(예: 'İ')가 있으면 위치 보존을 위해 원문 유지
+        return lowered if len(lowered) == len(text) else text
+
+    def _add(self, word: str, category: str) -> None:
+        key = self._normalize(word)
+        if not key:
+            return
+
+        state = 0
+        for ch in key:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+
+        self._out[state] += (len(self.keywords),)
+        self.keywords.append((word, category))
+        self._lengths.append(len(key))
+
+    def _build_failure_links(self) -> None:
+        """BFS로 실패 링크 계산 및 출력 병합"""
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for ch, child in goto[state].items():
+                queue.append(child)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                out[child] += out[fail[child]]
+
+    def _scan(self, text: str, state: int, offset: int, hits: Optional[List[KeywordHit]], stop_at_first: bool = False) -> int:
+        """
+        오토마톤 상태에서 이어서 텍스트 스캔
+
+        Returns:
+            int: 마지막 상태
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+
+        for i, ch in enumerate(self._normalize(text)):
+            while True:
+                nxt = goto[state].get(ch)
+                if nxt is not None:
+                    state = nxt
+                    break
+                if state == 0:
+                    break
+                state = fail[state]
+
+            if out[state] and hits is not None:
+                end = offset + i + 1
+                for idx in out[state]:
+                    word, category = self.keywords[idx]
+                    hits.append(KeywordHit(word, category, end - self._lengths[idx], end))
+                if stop_at_first:
+                    break
+
+        return state
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """
+        모든 매칭 찾기 (한 번의 스캔)
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            List[KeywordHit]: 끝 위치 순 매칭 목록
+        """
+        hits: List[KeywordHit] = []
+        if text:
+            self._scan(text, 0, 0, hits)
+        return hits
+
+    def categories(self, text: str) -> Set[str]:
+        """
+        텍스트에 등장한 카테고리 집합
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            Set[str]: 카테고리 집합
+        """
+        return {hit.category for hit in self.find_all(text)}
+
+    def contains(self, text: str) -> bool:
+        """
+        키워드가 하나라도 있는지 (첫 매칭에서 중단)
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            bool: 매칭 여부
+        """
+        hits: List[KeywordHit] = []
+        if text:
+            self._scan(text, 0, 0, hits, stop_at_first=True)
+        return bool(hits)
+
+    def stream(self, categories: Optional[Container[str]] = None) -> "StreamScanner":
+        """
+        스트리밍 텍스트용 증분 스캐너 생성
+
+        Args:
+            categories: 관심 카테고리 (None이면 전체)
+
+        Returns:
+            StreamScanner: 스캐너
+        """
+        return StreamScanner(self, categories)
+
+
+class StreamScanner:
+    """
+    청크 단위 증분 매칭 (청크 경계에 걸친 키워드도 감지)
+
+    Attributes:
+        hits: 지금까지의 매칭 목록 (관심 카테고리만)
+        length: 지금까지 입력된 글자 수
+    """
+
+    def __init__(self, matcher: KeywordMatcher, categories: Optional[Container[str]] = None):
+        self.matcher = matcher
+        self.categories = categories
+        self.hits: List[KeywordHit] = []
+        self.length = 0
+        self._state = 0
+
+    def feed(self, chunk: str) -> List[KeywordHit]:
+        """
+        새 청크 처리
+
+        Args:
+            chunk: 새로 들어온 텍스트
+
+        Returns:
+            List[KeywordHit]: 이 청크에서 새로 완성된 매칭 (위치는 전체 텍스트 기준)
+        """
+        if not chunk:
+            return []
+
+        new_hits: List[KeywordHit] = []
+        self._state = self.matcher._scan(chunk, self._state, self.length, new_hits)
+        self.length += len(chunk)
+
+        if self.categories is not None:
+            new_hits = [hit for hit in new_hits if hit.category in self.categories]
+        self.hits.extend(new_hits)
+        return new_hits
+
+    @property
+    def matched(self) -> bool:
+        """관심 카테고리 키워드가 한 번이라도 나왔는지"""
+        return bool(self.hits)
+
+
+@lru_cache(maxsize=1)
+def get_keyword_matcher() -> KeywordMatcher:
+    """
+    기본 키워드 그룹(keywords.KEYWORD_GROUPS)으로 빌드한 매처 반환 (프로세스당 1회 빌드)
+
+    Returns:
+        KeywordMatcher: 매처
+    """
+    from .keywords import KEYWORD_GROUPS
+    return KeywordMatcher(KEYWORD_GROUPS)
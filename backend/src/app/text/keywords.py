@@ -0,0 +1,45 @@
+"""
+Keyword Groups
+카테고리별 키워드 설정
+
+기본 KeywordMatcher는 이 설정으로 한 번만 빌드됩니다.
+키워드를 추가/수정할 때는 이 파일만 변경하면 됩니다.
+"""
+
+from typing import Dict, List
+
+# 카테고리 이름
+WEB_ONLY = "web_only"
+POLICY_QA = "policy_qa"
+INSUFFICIENT_ANSWER = "insufficient_answer"
+
+KEYWORD_GROUPS: Dict[str, List[str]] = {
+    # 링크/홈페이지 요청 → 웹 검색만 수행
+    WEB_ONLY: [
+        "링크", "url", "홈페이지", "사이트", "웹사이트",
+        "어디서 신청", "신청 방법", "신청하는 방법",
+        "신청서 다운로드", "양식 다운로드",
+        "접수", "접수처", "공고문",
+    ],
+    # 정책 내용 질문 (빠른 경로)
+    POLICY_QA: [
+        "지원금", "지원 금액", "지원", "금액", "얼마",
+        "대상", "자격", "조건", "요건",
+        "신청 기간", "기간", "언제", "마감",
+        "방법", "어떻게", "절차",
+        "혜택", "내용", "뭐", "무엇", "설명",
+    ],
+    # 문서만으로 답변하지 못했다는 표현 (스트리밍 답변에서 감지 → 웹 검색)
+    INSUFFICIENT_ANSWER: [
+        "정보가 포함되어 있지 않습니다",
+        "확인이 어렵습니다",
+        "정보가 부족",
+        "문서로는",
+        "찾을 수 없습니다",
+        "명시되어 있지 않",
+        "명시되지 않",
+        "포함되어 있지 않",
+        "제공되지 않",
+        "나와 있지 않",
+    ],
+}
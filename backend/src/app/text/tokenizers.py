@@ -0,0 +1,297 @@
+"""
+Tokenizers
+BM25용 한국어 토크나이저 (외부 형태소 분석기 없이 순수 Python)
+
+- whitespace: 소문자화 + 특수문자 제거 + 공백 분리 (기존 방식)
+- morpheme: 조사/어미 제거 + 사전 기반 최장일치 복합명사 분해
+            ("청년창업지원금을" → 청년창업지원금, 청년, 창업, 지원금)
+- ngram: 조사/어미 제거 후 음절 bigram
+
+문서 토큰화는 인덱스 구축 시 한 번만 수행하고(tokenize),
+질의 토큰화는 인스턴스별 LRU 캐시를 거칩니다(tokenize_query).
+morpheme은 인덱스 구축 시 코퍼스에서 자주 단독으로 쓰이는 어간을 사전에 추가합니다(fit).
+"""
+
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Type
+
+STOPWORDS = frozenset({
+    # 조사
+    "은", "는", "이", "가", "을", "를", "의", "에", "에서", "로", "으로",
+    "와", "과", "도", "만", "뿐", "부터", "까지", "에게", "한테", "께",
+    # 접속사/부사
+    "그리고", "그러나", "하지만", "또한", "또", "및", "등",
+    # 일반적인 동사/형용사 어미
+    "하다", "되다", "있다", "없다", "같다", "위한", "통한", "대한",
+    # 기타
+    "것", "수", "등", "중", "내", "외"
+})
+
+# 조사 (긴 것부터 매칭)
+JOSA = tuple(sorted({
+    "에서부터", "으로부터", "로부터", "에게서", "에서는", "에서도", "에서의", "으로는", "으로도", "으로서",
+    "으로써", "이라도", "이라는", "이라면", "에게는", "까지는", "부터는", "에는", "에도", "에의",
+    "에서", "에게", "한테", "께서", "으로", "부터", "까지", "처럼", "보다", "마다", "이나", "이며",
+    "이고", "이란", "라는", "로서", "로써", "와", "과", "은", "는", "이", "가", "을", "를", "의",
+    "에", "로", "도", "만", "나", "랑",
+}, key=len, reverse=True))
+
+# 용언 활용 어미 (명사형 어간만 남김: "지원하는" → "지원")
+PREDICATE_SUFFIXES = tuple(sorted({
+    "하였습니다", "되었습니다", "합니다", "됩니다", "입니다", "하였으며", "하였고", "하여야", "되어야",
+    "하는", "하고", "하여", "해야", "하며", "한다", "하면", "하기", "했다", "하지", "해서",
+    "되는", "되고", "되어", "되며", "된다", "되면", "되기", "됐다", "이다", "였다",
+    "한", "할", "된", "될",
+}, key=len, reverse=True))
+
+# 복합명사 분해용 기본 사전 (정책/지원사업 도메인)
+DOMAIN_NOUNS = frozenset({
+    "청년", "창업", "지원", "지원금", "보조금", "사업", "사업화", "자금", "중소기업", "소상공인", "기업",
+    "기술", "혁신", "연구", "개발", "연구개발", "특허", "수출", "고용", "채용", "교육", "컨설팅", "인증",
+    "스타트업", "예비", "창업자", "예비창업자", "신청", "접수", "대상", "선정", "평가", "협약", "지역",
+    "마케팅", "시제품", "제작", "지식재산권", "출원", "등록", "법인", "개인", "사업자", "융자", "대출",
+    "보증", "투자", "바우처", "인력", "일자리", "근로자", "장애인", "여성", "농업", "어업", "제조",
+    "판로", "해외", "공장", "스마트", "디지털", "환경", "에너지", "문화", "관광", "콘텐츠", "벤처",
+    "재도전", "운영", "경영", "안정", "시설", "장비", "프로그램", "멘토링", "훈련", "전환", "개선",
+    "확대", "육성", "사업비", "지원사업", "설립", "등기", "매출", "규모", "소득", "주택", "임대",
+    "보험", "보험료", "인건비", "비용", "전문", "역량", "강화", "판매", "유통", "온라인", "플랫폼",
+})
+
+_TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-z0-9]+(?:&[a-z0-9]+)*")
+_HANGUL = re.compile(r"^[가-힣]+$")
+_MAX_WORD = 8
+
+
+def whitespace_tokenize(text: str) -> List[str]:
+    """기존 방식: 소문자화 → 특수문자 제거 → 공백 분리 → 불용어/1글자 제거"""
+    text = re.sub(r'[^\w\s가-힣]', ' ', text.lower())
+    return [token for token in text.split() if token not in STOPWORDS and len(token) > 1]
+
+
+class BaseTokenizer:
+    """
+    토크나이저 기본 클래스
+
+    Attributes:
+        name: 토크나이저 이름 (설정값)
+    """
+
+    name = "base"
+
+    def __init__(self, cache_size: int = 4096):
+        """
+        Args:
+            cache_size: 질의 토큰화 LRU 캐시 크기
+        """
+        self._cached = lru_cache(maxsize=cache_size)(self._tokenize_tuple)
+
+    def _tokenize(self, text: str) -> List[str]:
+        raise NotImplementedError
+
+    def _tokenize_tuple(self, text: str) -> Tuple[str, ...]:
+        return tuple(self._tokenize(text))
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        문서 토큰화 (캐시 없음, 인덱스 구축 시 1회)
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            List[str]: 토큰 리스트
+        """
+        return self._tokenize(text) if text else []
+
+    def tokenize_query(self, text: str) -> List[str]:
+        """
+        질의 토큰화 (LRU 캐시)
+
+        Args:
+            text: 질의 텍스트
+
+        Returns:
+            List[str]: 토큰 리스트
+        """
+        return list(self._cached(text)) if text else []
+
+    def fit(self, texts: Iterable[str]) -> None:
+        """코퍼스 기반 준비 (기본: 없음)"""
+
+    def cache_info(self):
+        return self._cached.cache_info()
+
+
+class WhitespaceTokenizer(BaseTokenizer):
+    """공백 분리 토크나이저 (기존 KoreanTokenizer 동작)"""
+
+    name = "whitespace"
+
+    def _tokenize(self, text: str) -> List[str]:
+        return whitespace_tokenize(text)
+
+
+class MorphemeTokenizer(BaseTokenizer):
+    """
+    조사/어미 제거 + 사전 기반 복합명사 분해
+
+    Attributes:
+        lexicon: 분해 사전 (기본 도메인 명사 + fit으로 학습한 어간)
+        min_count: fit 시 사전에 추가할 최소 단독 출현 수
+    """
+
+    name = "morpheme"
+
+    def __init__(self, cache_size: int = 4096, lexicon: Optional[Iterable[str]] = None, min_count: int = 3):
+        super().__init__(cache_size)
+        self._base_lexicon: FrozenSet[str] = frozenset(lexicon) if lexicon is not None else DOMAIN_NOUNS
+        self.lexicon: Set[str] = set(self._base_lexicon)
+        self.min_count = min_count
+
+    def strip_suffix(self, word: str) -> str:
+        """
+        조사/어미 제거 (사전 단어는 그대로, 1글자 조사는 남는 어간이 사전 단어이거나 3글자 이상일 때만)
+
+        Args:
+            word: 한글 어절
+
+        Returns:
+            str: 어간
+        """
+        if word in self.lexicon:
+            return word
+
+        for suffixes in (PREDICATE_SUFFIXES, JOSA):
+            for suffix in suffixes:
+                if len(word) > len(suffix) and word.endswith(suffix):
+                    stem = word[:-len(suffix)]
+                    if len(suffix) > 1 and len(stem) >= 2 or stem in self.lexicon or len(stem) >= 3:
+                        return stem
+        return word
+
+    def split_compound(self, stem: str) -> List[str]:
+        """
+        최장일치 사전 분해 (사전 단어가 하나도 없으면 빈 리스트)
+
+        Args:
+            stem: 어간
+
+        Returns:
+            List[str]: 분해된 단어 (사전에 없는 2글자 이상 나머지 포함)
+        """
+        parts: List[str] = []
+        unknown_start = None
+        found = False
+        i = 0
+        while i < len(stem):
+            for size in range(min(_MAX_WORD, len(stem) - i), 1, -1):
+                if stem[i:i + size] in self.lexicon:
+                    if unknown_start is not None and i - unknown_start >= 2:
+                        parts.append(stem[unknown_start:i])
+                    unknown_start = None
+                    parts.append(stem[i:i + size])
+                    found = True
+                    i += size
+                    break
+            else:
+                if unknown_start is None:
+                    unknown_start = i
+                i += 1
+        if unknown_start is not None and len(stem) - unknown_start >= 2:
+            parts.append(stem[unknown_start:])
+        return parts if found else []
+
+    def _tokenize(self, text: str) -> List[str]:
+        tokens: List[str] = []
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            if not _HANGUL.match(token):
+                if len(token) > 1 or token.isdigit():
+                    tokens.append(token)
+                continue
+
+            stem = self.strip_suffix(token)
+            if stem in STOPWORDS or len(stem) < 2:
+                continue
+            tokens.append(stem)
+            if len(stem) >= 4 and stem not in self._base_lexicon:
+                parts = self.split_compound(stem)
+                if len(parts) > 1:
+                    tokens.extend(part for part in parts if part not in STOPWORDS)
+        return tokens
+
+    def fit(self, texts: Iterable[str]) -> None:
+        """
+        코퍼스에서 단독 어절로 min_count회 이상 쓰인 2~6글자 어간을 사전에 추가
+
+        Args:
+            texts: 문서 텍스트 목록
+        """
+        counts: Counter = Counter()
+        for text in texts:
+            for token in _TOKEN_PATTERN.findall((text or "").lower()):
+                if _HANGUL.match(token):
+                    stem = self.strip_suffix(token)
+                    if 2 <= len(stem) <= 6 and stem not in STOPWORDS:
+                        counts[stem] += 1
+
+        self.lexicon = set(self._base_lexicon)
+        self.lexicon.update(stem for stem, count in counts.items() if count >= self.min_count)
+        self._cached.cache_clear()
+
+
+class NgramTokenizer(MorphemeTokenizer):
+    """조사/어미 제거 후 음절 bigram (사전 불필요, 재현율 우선)"""
+
+    name = "ngram"
+
+    def _tokenize(self, text: str) -> List[str]:
+        tokens: List[str] = []
+        for token in _TOKEN_PATTERN.findall(text.lower()):
+            if not _HANGUL.match(token):
+                if len(token) > 1 or token.isdigit():
+                    tokens.append(token)
+                continue
+
+            stem = self.strip_suffix(token)
+            if stem in STOPWORDS or len(stem) < 2:
+                continue
+            tokens.extend(stem[i:i + 2] for i in range(len(stem) - 1))
+        return tokens
+
+    def fit(self, texts: Iterable[str]) -> None:
+        """bigram은 사전을 쓰지 않음 (조사 판정용 기본 사전만 사용)"""
+
+
+TOKENIZERS: Dict[str, Type[BaseTokenizer]] = {
+    WhitespaceTokenizer.name: WhitespaceTokenizer,
+    MorphemeTokenizer.name: MorphemeTokenizer,
+    NgramTokenizer.name: NgramTokenizer,
+}
+
+
+def create_tokenizer(name: Optional[str] = None, cache_size: Optional[int] = None) -> BaseTokenizer:
+    """
+    토크나이저 생성 (인덱스마다 새 인스턴스: fit 결과와 캐시가 인덱스별로 분리됨)
+
+    Args:
+        name: whitespace | morpheme | ngram (기본값: settings.bm25_tokenizer)
+        cache_size: 질의 캐시 크기 (기본값: settings.bm25_query_cache_size)
+
+    Returns:
+        BaseTokenizer: 토크나이저
+
+    Raises:
+        ValueError: 알 수 없는 이름
+    """
+    if name is None or cache_size is None:
+        from ..config import get_settings
+        settings = get_settings()
+        name = name or settings.bm25_tokenizer
+        cache_size = cache_size if cache_size is not None else settings.bm25_query_cache_size
+
+    tokenizer_cls = TOKENIZERS.get(name)
+    if tokenizer_cls is None:
+        raise ValueError(f"Unknown tokenizer: {name} (choose from {', '.join(TOKENIZERS)})")
+    return tokenizer_cls(cache_size=cache_size)
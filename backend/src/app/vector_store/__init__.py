@@ -1,19 +1,42 @@
-"""Vector store module"""
-
-from .qdrant_client import QdrantManager, get_qdrant_manager
-from .embedder_bge_m3 import BGEm3Embedder, get_embedder
-from .chunker import TextChunker, chunk_text
-from .sparse_search import HybridSearcher, get_hybrid_searcher, BM25Index
-
-__all__ = [
-    "QdrantManager",
-    "get_qdrant_manager",
-    "BGEm3Embedder",
-    "get_embedder",
-    "TextChunker",
-    "chunk_text",
-    "HybridSearcher",
-    "get_hybrid_searcher",
-    "BM25Index",
-]
+"""Vector store module
 
+하위 모듈은 속성에 처음 접근할 때 import합니다 (PEP 562).
+`from ..vector_store.sparse_search import ...`처럼 가벼운 모듈만 쓰는 곳에서
+qdrant_client / sentence_transformers(torch)까지 끌려오지 않도록 하기 위함입니다.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .qdrant_client import QdrantManager, get_qdrant_manager
+    from .embedder_bge_m3 import BGEm3Embedder, get_embedder
+    from .chunker import TextChunker, chunk_text
+    from .sparse_search import HybridSearcher, get_hybrid_searcher, BM25Index
+
+_LAZY_ATTRS = {
+    "QdrantManager": ".qdrant_client",
+    "get_qdrant_manager": ".qdrant_client",
+    "BGEm3Embedder": ".embedder_bge_m3",
+    "get_embedder": ".embedder_bge_m3",
+    "TextChunker": ".chunker",
+    "chunk_text": ".chunker",
+    "HybridSearcher": ".sparse_search",
+    "get_hybrid_searcher": ".sparse_search",
+    "BM25Index": ".sparse_search",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # 이후 접근은 일반 속성 조회
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
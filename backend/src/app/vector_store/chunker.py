@@ -1,10 +1,22 @@
 """
 Text Chunking
 텍스트를 벡터 검색에 적합한 크기로 분할
+
+- 크기 단위: 임베딩 모델(BGE-M3) 토크나이저 토큰 수 (transformers 미설치 시 근사치)
+- 문서당 토크나이저 호출 1회 (offset mapping) 후 문장 구간별 토큰 수는 이진 탐색으로 계산
+- 문장/청크는 원문 (start, end) 오프셋으로만 다루고, 청크 내용은 마지막에 한 번만 잘라냄
+- 청크 metadata에 원문 기준 char_start/char_end 기록 (근거 하이라이트용)
+- 여러 문서는 chunk_documents로 프로세스 풀에서 병렬 처리
 """
 
-from typing import List, Dict, Any
+import math
+import os
 import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import get_context
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from ..config import get_settings
 from ..config.logger import get_logger
@@ -12,31 +24,104 @@ from ..config.logger import get_logger
 logger = get_logger()
 settings = get_settings()
 
+# 문장 경계: 종결 부호 뒤 공백/끝 (소수점 "1.5억", URL은 분리하지 않음) 또는 줄바꿈
+_SENTENCE_BOUNDARY = re.compile(r"[.!?。]+(?=\s|$)|\n+")
+_INLINE_SPACES = re.compile(r"[^\S\n]+")
+_NEWLINE_RUNS = re.compile(r" ?\n\s*")
+
+Span = Tuple[int, int]
+
+
+# ============================================================
+# Token Counting
+# ============================================================
+
+@lru_cache(maxsize=2)
+def _get_tokenizer(model_name: str):
+    """임베딩 모델 토크나이저 로드 (프로세스당 1회, 실패 시 None → 근사치 사용)"""
+    try:
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+        from transformers import AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        return tokenizer if tokenizer.is_fast else None
+    except Exception as e:
+        logger.warning(
+            "Embedding tokenizer unavailable, using estimated token counts",
+            extra={"model": model_name, "error": str(e)}
+        )
+        return None
+
+
+class _TokenIndex:
+    """
+    문서 1개의 토큰 위치 색인
+
+    span_tokens(start, end): [start, end) 구간에서 시작하는 토큰 수
+    """
+
+    def __init__(self, text: str, tokenizer=None):
+        self._text: Optional[str] = None
+        self._starts: List[int] = []
+        if tokenizer is not None:
+            offsets = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)["offset_mapping"]
+            self._starts = [start for start, end in offsets if end > start]
+        else:
+            self._text = text
+
+    def span_tokens(self, start: int, end: int) -> int:
+        if self._text is not None:
+            # 근사치: 비ASCII(한글 등) 1자 ≈ 1토큰, 공백 제외 ASCII 4자 ≈ 1토큰
+            segment = self._text[start:end]
+            non_ascii = len(segment) - len(segment.encode("ascii", "ignore"))
+            ascii_chars = len("".join(segment.split()).encode("ascii", "ignore"))
+            return non_ascii + math.ceil(ascii_chars / 4)
+        return bisect_left(self._starts, end) - bisect_left(self._starts, start)
+
+    def advance(self, start: int, end: int, max_tokens: int) -> int:
+        """
+        start부터 max_tokens 이내로 갈 수 있는 가장 먼 위치 (최소 1글자 전진)
+
+        Returns:
+            int: 끝 오프셋 (start < 반환값 <= end)
+        """
+        lo, hi = start + 1, end
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.span_tokens(start, mid) <= max_tokens:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
 
 class TextChunker:
     """
     텍스트 청킹 클래스
-    
+
     Attributes:
-        chunk_size: 청크 크기 (문자 수)
-        chunk_overlap: 청크 겹침 (문자 수)
+        chunk_size: 청크 크기 (토큰 수)
+        chunk_overlap: 청크 겹침 (토큰 수, 문장 단위로 맞춤)
+        model_name: 토큰 수를 잴 토크나이저 모델
     """
-    
+
     def __init__(
         self,
         chunk_size: int = None,
-        chunk_overlap: int = None
+        chunk_overlap: int = None,
+        model_name: Optional[str] = None
     ):
         """
         Initialize chunker
-        
+
         Args:
             chunk_size: 청크 크기 (기본값: settings.chunk_size)
             chunk_overlap: 청크 겹침 (기본값: settings.chunk_overlap)
+            model_name: 토크나이저 모델 (기본값: settings.embedding_model)
         """
         self.chunk_size = chunk_size or settings.chunk_size
-        self.chunk_overlap = chunk_overlap or settings.chunk_overlap
-        
+        self.chunk_overlap = chunk_overlap if chunk_overlap is not None else settings.chunk_overlap
+        self.model_name = model_name or settings.embedding_model
+
         logger.debug(
             "Text chunker initialized",
             extra={
@@ -44,7 +129,7 @@ class TextChunker:
                 "chunk_overlap": self.chunk_overlap
             }
         )
-    
+
     def split_text(
         self,
         text: str,
@@ -52,61 +137,29 @@ class TextChunker:
     ) -> List[Dict[str, Any]]:
         """
         텍스트를 청크로 분할
-        
+
         Args:
             text: 분할할 텍스트
-            metadata: 메타데이터 (각 청크에 포함됨)
-        
+            metadata: 메타데이터 (각 청크에 복사되어 포함됨)
+
         Returns:
-            List[Dict]: 청크 리스트 (content, metadata 포함)
+            List[Dict]: 청크 리스트 (content, metadata, chunk_index)
+                metadata에는 char_start/char_end(원문 오프셋), token_count가 추가됨
         """
         if not text or not text.strip():
             logger.warning("Empty text provided for chunking")
             return []
-        
-        # Clean text
-        text = self._clean_text(text)
-        
-        # Split into sentences first (한국어 문장 분리)
-        sentences = self._split_into_sentences(text)
-        
-        # Combine sentences into chunks
+
+        index = _TokenIndex(text, _get_tokenizer(self.model_name))
+
         chunks = []
-        current_chunk = ""
-        current_length = 0
-        
-        for sentence in sentences:
-            sentence_length = len(sentence)
-            
-            # If adding this sentence exceeds chunk_size
-            if current_length + sentence_length > self.chunk_size and current_chunk:
-                # Save current chunk
-                chunks.append({
-                    "content": current_chunk.strip(),
-                    "metadata": metadata or {},
-                    "chunk_index": len(chunks)
-                })
-                
-                # Start new chunk with overlap
-                overlap_text = self._get_overlap_text(current_chunk)
-                current_chunk = overlap_text + " " + sentence
-                current_length = len(current_chunk)
-            else:
-                # Add sentence to current chunk
-                if current_chunk:
-                    current_chunk += " " + sentence
-                else:
-                    current_chunk = sentence
-                current_length += sentence_length
-        
-        # Add last chunk
-        if current_chunk.strip():
+        for start, end, tokens in self.split_spans(text, index):
             chunks.append({
-                "content": current_chunk.strip(),
-                "metadata": metadata or {},
+                "content": self._clean_text(text[start:end]),
+                "metadata": {**(metadata or {}), "char_start": start, "char_end": end, "token_count": tokens},
                 "chunk_index": len(chunks)
             })
-        
+
         logger.debug(
             "Text chunked",
             extra={
@@ -114,63 +167,106 @@ class TextChunker:
                 "num_chunks": len(chunks)
             }
         )
-        
+
         return chunks
-    
-    def _clean_text(self, text: str) -> str:
+
+    def split_spans(self, text: str, index: "_TokenIndex") -> List[Tuple[int, int, int]]:
         """
-        텍스트 정제
-        
+        청크 구간 계산 (문자열 복사 없음)
+
+        문장을 순서대로 chunk_size까지 채우고, 다음 청크는 이전 청크 끝 문장들 중
+        chunk_overlap 이내 분량을 겹쳐서 시작합니다. chunk_size보다 긴 문장은 토큰 경계에서 자릅니다.
+
         Args:
             text: 원본 텍스트
-        
+            index: 토큰 위치 색인
+
         Returns:
-            str: 정제된 텍스트
+            List[Tuple[int, int, int]]: (char_start, char_end, token_count)
         """
-        # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove multiple newlines
-        text = re.sub(r'\n+', '\n', text)
-        
-        return text.strip()
-    
-    def _split_into_sentences(self, text: str) -> List[str]:
+        sentences: List[Tuple[int, int, int]] = []
+        for start, end in self._split_into_sentences(text):
+            tokens = index.span_tokens(start, end)
+            while tokens > self.chunk_size:
+                cut = index.advance(start, end, self.chunk_size)
+                sentences.append((start, cut, index.span_tokens(start, cut)))
+                start = self._skip_spaces(text, cut, end)
+                tokens = index.span_tokens(start, end)
+            if start < end:
+                sentences.append((start, end, tokens))
+
+        spans: List[Tuple[int, int, int]] = []
+        first = 0
+        while first < len(sentences):
+            # chunk_size까지 문장 추가 (최소 1문장)
+            last = first
+            total = sentences[first][2]
+            while last + 1 < len(sentences) and total + sentences[last + 1][2] <= self.chunk_size:
+                last += 1
+                total += sentences[last][2]
+
+            spans.append((sentences[first][0], sentences[last][1], total))
+            if last + 1 >= len(sentences):
+                break
+
+            # 겹침: 끝에서부터 chunk_overlap 이내 문장들 (진행 보장을 위해 first 이후에서만)
+            next_first = last + 1
+            overlap = 0
+            while next_first - 1 > first and overlap + sentences[next_first - 1][2] <= self.chunk_overlap:
+                next_first -= 1
+                overlap += sentences[next_first][2]
+            first = next_first
+
+        return spans
+
+    @staticmethod
+    def _skip_spaces(text: str, pos: int, end: int) -> int:
+        while pos < end and text[pos].isspace():
+            pos += 1
+        return pos
+
+    def _clean_text(self, text: str) -> str:
         """
-        텍스트를 문장으로 분리 (한국어 지원)
-        
+        텍스트 정제
+
         Args:
             text: 원본 텍스트
-        
+
         Returns:
-            List[str]: 문장 리스트
+            str: 정제된 텍스트 (줄 안의 연속 공백 → 공백 1개, 연속 줄바꿈 → 줄바꿈 1개)
         """
-        # 한국어 문장 종결 부호: . ! ? 。
-        sentence_endings = r'[.!?。]'
-        
-        # Split by sentence endings
-        sentences = re.split(sentence_endings, text)
-        
-        # Clean and filter empty sentences
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        return sentences
-    
-    def _get_overlap_text(self, text: str) -> str:
+        if "  " in text or "\t" in text or "\n" in text or "\r" in text:
+            text = _INLINE_SPACES.sub(" ", text)
+            text = _NEWLINE_RUNS.sub("\n", text)
+        return text.strip()
+
+    def _split_into_sentences(self, text: str) -> List[Span]:
         """
-        청크 겹침 텍스트 추출
-        
+        텍스트를 문장 구간으로 분리 (한국어 지원, 종결 부호 포함)
+
         Args:
             text: 원본 텍스트
-        
+
         Returns:
-            str: 겹침 텍스트
+            List[Tuple[int, int]]: 앞뒤 공백을 제외한 (start, end) 목록
         """
-        if len(text) <= self.chunk_overlap:
-            return text
-        
-        # Get last chunk_overlap characters
-        return text[-self.chunk_overlap:]
+        spans: List[Span] = []
+        start = 0
+        for match in _SENTENCE_BOUNDARY.finditer(text):
+            end = match.start() if text[match.start()] == "\n" else match.end()
+            self._append_span(text, start, end, spans)
+            start = match.end()
+        self._append_span(text, start, len(text), spans)
+        return spans
+
+    @staticmethod
+    def _append_span(text: str, start: int, end: int, spans: List[Span]) -> None:
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        if start < end:
+            spans.append((start, end))
 
 
 def chunk_text(
@@ -181,16 +277,52 @@ def chunk_text(
 ) -> List[Dict[str, Any]]:
     """
     텍스트 청킹 헬퍼 함수
-    
+
     Args:
         text: 분할할 텍스트
-        chunk_size: 청크 크기 (선택)
-        chunk_overlap: 청크 겹침 (선택)
+        chunk_size: 청크 크기 (선택, 토큰)
+        chunk_overlap: 청크 겹침 (선택, 토큰)
         metadata: 메타데이터 (선택)
-    
+
     Returns:
         List[Dict]: 청크 리스트
     """
     chunker = TextChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
     return chunker.split_text(text, metadata=metadata)
 
+
+def _chunk_one(args: Tuple[str, Optional[Dict[str, Any]], Optional[int], Optional[int]]) -> List[Dict[str, Any]]:
+    text, metadata, chunk_size, chunk_overlap = args
+    return chunk_text(text, chunk_size=chunk_size, chunk_overlap=chunk_overlap, metadata=metadata)
+
+
+def chunk_documents(
+    documents: Iterable[Tuple[str, Optional[Dict[str, Any]]]],
+    chunk_size: int = None,
+    chunk_overlap: int = None,
+    workers: Optional[int] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    여러 문서 청킹 (프로세스 풀)
+
+    워커마다 토크나이저를 한 번만 로드합니다. torch가 이미 로드된 부모 프로세스를
+    fork하지 않도록 spawn 컨텍스트를 사용합니다.
+
+    Args:
+        documents: (텍스트, 메타데이터) 목록
+        chunk_size: 청크 크기 (선택, 토큰)
+        chunk_overlap: 청크 겹침 (선택, 토큰)
+        workers: 프로세스 수 (기본값: CPU 수, 1 이하면 현재 프로세스에서 처리)
+
+    Returns:
+        List[List[Dict]]: 입력 순서대로 문서별 청크 리스트
+    """
+    jobs: Sequence[Tuple[str, Optional[Dict[str, Any]], Optional[int], Optional[int]]] = [
+        (text, metadata, chunk_size, chunk_overlap) for text, metadata in documents
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [_chunk_one(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+        return list(executor.map(_chunk_one, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
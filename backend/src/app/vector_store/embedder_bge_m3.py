@@ -1,12 +1,12 @@
 """
 BGE-M3 Embedder
 한국어 특화 임베딩 모델 (BAAI/bge-m3)
-"""
 
-from typing import List, Union
-from functools import lru_cache
+sentence_transformers(torch)는 모델 생성 시점에 import합니다.
+"""
 
-from sentence_transformers import SentenceTransformer
+import threading
+from typing import List, Optional, Union
 
 from ..config import get_settings
 from ..config.logger import get_logger
@@ -36,6 +36,8 @@ class BGEm3Embedder:
                 extra={"model": self.model_name}
             )
             
+            from sentence_transformers import SentenceTransformer
+            
             self.model = SentenceTransformer(
                 self.model_name,
                 device="cpu"  # GPU 사용 시 "cuda"로 변경
@@ -153,13 +155,30 @@ class BGEm3Embedder:
         }
 
 
-@lru_cache()
+    def warmup(self) -> None:
+        """더미 인코딩 1회 (첫 요청의 지연 초기화 비용을 시작 시점으로 이동)"""
+        self.model.encode(["웜업"], normalize_embeddings=True, show_progress_bar=False)
+
+
+_embedder: Optional[BGEm3Embedder] = None
+_embedder_lock = threading.Lock()
+
+
 def get_embedder() -> BGEm3Embedder:
     """
     Get cached embedder instance
     
+    시작 웜업 스레드와 첫 요청이 동시에 호출해도 모델은 한 번만 로드합니다.
+    
     Returns:
         BGEm3Embedder: Cached embedder instance
     """
-    return BGEm3Embedder()
+    global _embedder
+    
+    if _embedder is None:
+        with _embedder_lock:
+            if _embedder is None:
+                _embedder = BGEm3Embedder()
+    
+    return _embedder
 
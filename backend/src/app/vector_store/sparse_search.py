@@ -5,7 +5,6 @@ Sparse Search (BM25)
 Dense 검색과 결합하여 하이브리드 검색 지원
 """
 
-import re
 import math
 from typing import List, Dict, Any, Optional, Tuple
 from collections import Counter
@@ -13,6 +12,7 @@ from dataclasses import dataclass
 from functools import lru_cache
 
 from ..config.logger import get_logger
+from ..text.tokenizers import STOPWORDS, BaseTokenizer, create_tokenizer, whitespace_tokenize
 
 logger = get_logger()
 
@@ -29,21 +29,13 @@ class KoreanTokenizer:
     """
     간단한 한국어 토크나이저
 
-    형태소 분석기 없이 규칙 기반으로 토큰화
+    형태소 분석기 없이 규칙 기반으로 토큰화 (공백 분리).
+    BM25Index는 설정된 토크나이저(app.text.tokenizers)를 사용하며,
+    이 클래스는 키워드 추출 등 기존 호출부 호환용입니다.
     """
 
     # 불용어 리스트
-    STOPWORDS = {
-        # 조사
-        "은", "는", "이", "가", "을", "를", "의", "에", "에서", "로", "으로",
-        "와", "과", "도", "만", "뿐", "부터", "까지", "에게", "한테", "께",
-        # 접속사/부사
-        "그리고", "그러나", "하지만", "또한", "또", "및", "등",
-        # 일반적인 동사/형용사 어미
-        "하다", "되다", "있다", "없다", "같다", "위한", "통한", "대한",
-        # 기타
-        "것", "수", "등", "중", "내", "외"
-    }
+    STOPWORDS = STOPWORDS
 
     # 중요 키워드 (가중치 부여용)
     IMPORTANT_KEYWORDS = {
@@ -66,22 +58,7 @@ class KoreanTokenizer:
         if not text:
             return []
 
-        # 소문자 변환
-        text = text.lower()
-
-        # 특수문자 제거 (한글, 영문, 숫자만 유지)
-        text = re.sub(r'[^\w\s가-힣]', ' ', text)
-
-        # 공백으로 분리
-        tokens = text.split()
-
-        # 불용어 제거 및 최소 길이 필터링
-        tokens = [
-            token for token in tokens
-            if token not in cls.STOPWORDS and len(token) > 1
-        ]
-
-        return tokens
+        return whitespace_tokenize(text)
 
     @classmethod
     def tokenize_with_ngrams(cls, text: str, n: int = 2) -> List[str]:
@@ -111,17 +88,19 @@ class BM25Index:
     BM25 인덱스
 
     문서 컬렉션에 대한 BM25 점수 계산
+    문서는 build_index에서 한 번만 토큰화하고, 쿼리 토큰화는 토크나이저 LRU 캐시를 거침
     """
 
-    def __init__(self, config: BM25Config = None):
+    def __init__(self, config: BM25Config = None, tokenizer: Optional[BaseTokenizer] = None):
         """
         초기화
 
         Args:
             config: BM25 설정
+            tokenizer: 토크나이저 (기본값: settings.bm25_tokenizer)
         """
         self.config = config or BM25Config()
-        self.tokenizer = KoreanTokenizer()
+        self.tokenizer = tokenizer or create_tokenizer()
 
         # 인덱스 데이터
         self.doc_count = 0
@@ -143,6 +122,9 @@ class BM25Index:
         self.doc_count = len(documents)
         total_length = 0
 
+        # 코퍼스 기반 사전 학습 (morpheme)
+        self.tokenizer.fit(doc.get("content", "") for doc in documents)
+
         for doc in documents:
             doc_id = doc.get("id") or doc.get("policy_id")
             content = doc.get("content", "")
@@ -179,7 +161,8 @@ class BM25Index:
         logger.info(
             f"BM25 index built: {self.doc_count} docs, "
             f"{len(self.inverted_index)} terms, "
-            f"avg_length={self.avg_doc_length:.1f}"
+            f"avg_length={self.avg_doc_length:.1f}, "
+            f"tokenizer={self.tokenizer.name}"
         )
 
     def _compute_idf(self, term: str) -> float:
@@ -209,7 +192,8 @@ class BM25Index:
         self,
         term: str,
         doc_id: int,
-        term_freq: int
+        term_freq: int,
+        idf: Optional[float] = None
     ) -> float:
         """
         단일 term에 대한 BM25 점수 계산
@@ -218,11 +202,13 @@ class BM25Index:
             term: 검색어
             doc_id: 문서 ID
             term_freq: 문서 내 term 빈도
+            idf: 미리 계산한 IDF (쿼리 term당 1회 계산용)
 
         Returns:
             float: BM25 점수
         """
-        idf = self._compute_idf(term)
+        if idf is None:
+            idf = self._compute_idf(term)
         doc_length = self.doc_lengths.get(doc_id, 0)
 
         if doc_length == 0 or self.avg_doc_length == 0:
@@ -253,7 +239,7 @@ class BM25Index:
         Returns:
             List[Tuple[int, float]]: [(doc_id, score), ...] 점수 내림차순
         """
-        query_tokens = self.tokenizer.tokenize(query)
+        query_tokens = self.tokenizer.tokenize_query(query)
 
         if not query_tokens:
             return []
@@ -267,9 +253,10 @@ class BM25Index:
 
             # 중요 키워드 가중치
             term_weight = 1.5 if term in KoreanTokenizer.IMPORTANT_KEYWORDS else 1.0
+            idf = self._compute_idf(term)
 
             for doc_id, term_freq in self.inverted_index[term].items():
-                score = self._compute_term_score(term, doc_id, term_freq) * term_weight
+                score = self._compute_term_score(term, doc_id, term_freq, idf) * term_weight
 
                 if doc_id not in doc_scores:
                     doc_scores[doc_id] = 0.0
@@ -300,7 +287,7 @@ class BM25Index:
         Returns:
             List[str]: 매칭된 term 리스트
         """
-        query_tokens = set(self.tokenizer.tokenize(query))
+        query_tokens = set(self.tokenizer.tokenize_query(query))
         doc_tokens = set(self.doc_tokens.get(doc_id, []))
 
         return list(query_tokens & doc_tokens)
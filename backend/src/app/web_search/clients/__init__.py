@@ -1,8 +1,12 @@
 """Web Search Clients"""
 
-from .tavily_client import TavilySearchClient
+from .tavily_client import TavilySearchClient, get_tavily_client, close_tavily_client
+from .circuit_breaker import CircuitBreaker
 
 __all__ = [
     "TavilySearchClient",
+    "get_tavily_client",
+    "close_tavily_client",
+    "CircuitBreaker",
 ]
 
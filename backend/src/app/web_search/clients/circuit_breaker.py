@@ -0,0 +1,113 @@
+"""
+Circuit Breaker
+외부 API 연속 실패 시 일정 시간 호출을 차단
+
+closed → (연속 실패 failure_threshold회) → open → (reset_timeout 경과) → half_open
+half_open에서 시험 호출 1건이 성공하면 closed, 실패하면 다시 open.
+시험 호출이 결과 없이 끝나면(취소 등) reset_timeout 후 다음 시험 호출을 허용합니다.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커 (스레드/코루틴 공용)
+
+    Attributes:
+        failure_threshold: open으로 전환할 연속 실패 횟수 (0 이하면 비활성화)
+        reset_timeout: open 유지 시간 (초)
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize breaker
+
+        Args:
+            failure_threshold: open으로 전환할 연속 실패 횟수
+            reset_timeout: open 유지 시간 (초)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"opened": 0, "rejected": 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        호출 허용 여부 (half_open에서는 시험 호출 1건만 허용)
+
+        Returns:
+            bool: 호출 가능 여부
+        """
+        if self.failure_threshold <= 0:
+            return True
+
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and (not self._trial_in_flight or now - self._trial_started >= self.reset_timeout):
+                self._trial_in_flight = True
+                self._trial_started = now
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def record_success(self) -> None:
+        """성공 기록 (closed로 복귀)"""
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """실패 기록 (임계치 도달 또는 시험 호출 실패 시 open)"""
+        if self.failure_threshold <= 0:
+            return
+
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self._stats["opened"] += 1
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        상태 통계
+
+        Returns:
+            Dict: state/consecutive_failures/opened/rejected
+        """
+        with self._lock:
+            return {
+                "state": self._current_state(time.monotonic()),
+                "consecutive_failures": self._failures,
+                **self._stats,
+            }
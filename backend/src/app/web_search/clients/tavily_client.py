@@ -1,63 +1,134 @@
 """
 Tavily Web Search Client
 Tavily API를 사용한 웹 검색 클라이언트
+
+Tavily Search API를 httpx로 직접 호출합니다.
+- 연결 풀: 동기/비동기 클라이언트 keep-alive 재사용
+- 결과 캐시: (쿼리, 결과 수, 깊이, 도메인, 기간) 키 TTL 캐시
+- single-flight: 동시에 들어온 동일 검색은 요청 1건만 보내고 결과 공유
+  (대표 요청이 실패·취소되면 대기자가 직접 다시 요청)
+- 타임아웃: 호출별 전체 시간 예산
+- 서킷 브레이커: 연속 실패 시 일정 시간 호출하지 않고 빈 결과 반환
+
+tavily_base_url만 바꾸면 로컬 스텁 서버로 테스트할 수 있습니다.
 """
 
-from typing import List, Dict, Any, Optional
-from tavily import TavilyClient
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import httpx
 
 from ...config import get_settings
 from ...config.logger import get_logger
-from ...observability import trace_tool
+from ...observability import record_cache_lookup, timed, trace_tool
+from ...observability.metrics import SEARCH_STAGE_SECONDS
+from .circuit_breaker import CircuitBreaker
 
 logger = get_logger()
 settings = get_settings()
 
+SearchKey = Tuple[Any, ...]
+
+# 대표 요청 실패/취소 시 대기자가 다시 합류하는 최대 횟수
+FLIGHT_ATTEMPTS = 2
+
+
+class FlightAborted(Exception):
+    """single-flight 대표 요청이 결과 없이 끝남 (실패/취소) → 대기자는 직접 다시 시도"""
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    """닫힌 이벤트 루프에 묶였던 AsyncClient 정리 (소켓 해제, 오류는 무시)"""
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.debug("Failed to close stale async client", extra={"error": str(e)})
+
 
 class TavilySearchClient:
     """
-    Tavily 웹 검색 클라이언트
-    
+    Tavily 웹 검색 클라이언트 (프로세스당 1개 공유, get_tavily_client 사용)
+
     Tavily는 LLM에 최적화된 웹 검색 API로,
     고품질의 관련성 높은 결과를 제공합니다.
+
+    Attributes:
+        base_url: Tavily API base URL
+        search_depth: 기본 검색 깊이 ("basic" 또는 "advanced")
+        timeout: 기본 호출 타임아웃 (초)
+        breaker: 서킷 브레이커
     """
-    
-    def __init__(self, api_key: Optional[str] = None):
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
         """
         Initialize Tavily client
-        
+
         Args:
             api_key: Tavily API 키 (없으면 settings에서 가져옴)
+            base_url: API base URL (기본값: settings.tavily_base_url)
         """
         self.api_key = api_key or settings.tavily_api_key
+        self.base_url = (base_url or settings.tavily_base_url).rstrip("/")
+        self.search_depth = settings.tavily_search_depth
+        self.timeout = settings.tavily_timeout
+        self.cache_ttl = settings.tavily_cache_ttl_seconds
+        self.cache_max_entries = max(1, settings.tavily_cache_max_entries)
+
+        self._limits = httpx.Limits(
+            max_connections=settings.tavily_max_connections,
+            max_keepalive_connections=settings.tavily_max_connections
+        )
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+        # httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로 루프별로 생성 (닫힌 루프의 클라이언트는 정리)
+        self._async_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._closing_tasks: Set[asyncio.Task] = set()
+
+        self._cache: "OrderedDict[SearchKey, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # 진행 중인 검색 (스레드/코루틴 모두 기다릴 수 있도록 concurrent.futures.Future 사용)
+        self._inflight: Dict[SearchKey, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        self.breaker = CircuitBreaker(settings.tavily_breaker_failures, settings.tavily_breaker_reset_seconds)
+        self._stats = {"requests": 0, "cache_hits": 0, "coalesced": 0, "errors": 0, "timeouts": 0}
+
         if not self.api_key:
             logger.warning("Tavily API key not configured")
-            self.client = None
         else:
-            self.client = TavilyClient(api_key=self.api_key)
-            logger.info("Tavily client initialized")
-    
+            logger.info(
+                "Tavily client initialized",
+                extra={"base_url": self.base_url, "search_depth": self.search_depth}
+            )
+
     @trace_tool(name="tavily_search", tags=["web_search", "tavily"])
+    @timed(SEARCH_STAGE_SECONDS, stage="web")
     def search(
         self,
         query: str,
         max_results: int = 5,
-        search_depth: str = "advanced",
+        search_depth: Optional[str] = None,
         include_domains: Optional[List[str]] = None,
         exclude_domains: Optional[List[str]] = None,
-        days: int = 90  # 최근 90일 이내 결과만
+        days: Optional[int] = 90,  # 최근 90일 이내 결과만
+        timeout: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """
-        Tavily 웹 검색 실행
-        
+        Tavily 웹 검색 실행 (워커 스레드용, 이벤트 루프에서는 asearch 사용)
+
         Args:
             query: 검색 쿼리
             max_results: 최대 결과 수
-            search_depth: 검색 깊이 ("basic" 또는 "advanced")
+            search_depth: 검색 깊이 ("basic" 또는 "advanced", 기본값: settings.tavily_search_depth)
             include_domains: 포함할 도메인 리스트
             exclude_domains: 제외할 도메인 리스트
-            days: 최근 N일 이내 결과만 (기본값: 90일)
-        
+            days: 최근 N일 이내 결과만 (None이면 제한 없음)
+            timeout: 호출 타임아웃 (초, 기본값: settings.tavily_timeout)
+
         Returns:
             List[Dict]: 검색 결과 리스트
                 - title: 제목
@@ -66,122 +137,433 @@ class TavilySearchClient:
                 - score: 관련성 점수
                 - published_date: 게시 날짜
         """
-        if not self.client:
+        if not self.api_key:
             logger.error("Tavily client not initialized")
             return []
-        
+
+        timeout = timeout or self.timeout
+        payload = self._payload(query, max_results, search_depth, include_domains, exclude_domains, days)
+        key = self._search_key(payload)
+
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        for _ in range(FLIGHT_ATTEMPTS):
+            future, leader = self._join_flight(key)
+            if leader:
+                break
+            try:
+                return list(future.result(timeout=timeout))
+            except FlightAborted:
+                continue
+            except Exception:
+                return []
+        else:
+            return []
+
+        results: Optional[List[Dict[str, Any]]] = None
         try:
-            logger.info(
-                "Executing Tavily search",
-                extra={
-                    "query": query,
-                    "max_results": max_results,
-                    "search_depth": search_depth,
-                    "days_filter": days
-                }
-            )
-            
-            # Execute search
-            response = self.client.search(
-                query=query,
-                max_results=max_results,
-                search_depth=search_depth,
-                include_domains=include_domains,
-                exclude_domains=exclude_domains,
-                include_answer=True,  # Get AI-generated answer
-                include_raw_content=False,  # Don't include full HTML
-                days=days  # 최근 N일 이내 결과만
-            )
-            
-            # Parse results
-            results = []
-            for item in response.get("results", []):
-                results.append({
-                    "title": item.get("title", ""),
-                    "url": item.get("url", ""),
-                    "content": item.get("content", ""),
-                    "score": item.get("score", 0.0),
-                    "published_date": item.get("published_date")
-                })
-            
-            # Add AI answer if available
-            ai_answer = response.get("answer")
-            if ai_answer:
-                logger.info(
-                    "Tavily AI answer received",
-                    extra={"answer_length": len(ai_answer)}
-                )
-            
-            logger.info(
-                "Tavily search completed",
-                extra={
-                    "query": query,
-                    "results_count": len(results),
-                    "has_ai_answer": bool(ai_answer)
-                }
-            )
-            
-            return results
-            
-        except Exception as e:
-            logger.error(
-                "Tavily search failed",
-                extra={"query": query, "error": str(e)},
-                exc_info=True
-            )
+            data = self._post_sync(payload, timeout)
+            if data is not None:
+                results = self._parse_response(query, data)
+                self._cache_set(key, results)
+            return list(results or [])
+        finally:
+            self._leave_flight(key, future, results)
+
+    @trace_tool(name="tavily_search_async", tags=["web_search", "tavily", "async"])
+    @timed(SEARCH_STAGE_SECONDS, stage="web")
+    async def asearch(
+        self,
+        query: str,
+        max_results: int = 5,
+        search_depth: Optional[str] = None,
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
+        days: Optional[int] = 90,
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Tavily 웹 검색 실행 (비동기, 이벤트 루프를 막지 않음)
+
+        Args:
+            query: 검색 쿼리
+            max_results: 최대 결과 수
+            search_depth: 검색 깊이 ("basic" 또는 "advanced", 기본값: settings.tavily_search_depth)
+            include_domains: 포함할 도메인 리스트
+            exclude_domains: 제외할 도메인 리스트
+            days: 최근 N일 이내 결과만 (None이면 제한 없음)
+            timeout: 호출 타임아웃 (초, 기본값: settings.tavily_timeout)
+
+        Returns:
+            List[Dict]: 검색 결과 리스트 (search()와 동일 형식)
+        """
+        if not self.api_key:
+            logger.error("Tavily client not initialized")
             return []
-    
+
+        timeout = timeout or self.timeout
+        payload = self._payload(query, max_results, search_depth, include_domains, exclude_domains, days)
+        key = self._search_key(payload)
+
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        for _ in range(FLIGHT_ATTEMPTS):
+            future, leader = self._join_flight(key)
+            if leader:
+                break
+            try:
+                # shield: 대기 측 타임아웃/취소가 공유 Future를 취소하지 않도록
+                return list(await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout))
+            except FlightAborted:
+                continue
+            except Exception:
+                return []
+        else:
+            return []
+
+        results: Optional[List[Dict[str, Any]]] = None
+        try:
+            data = await self._post_async(payload, timeout)
+            if data is not None:
+                results = self._parse_response(query, data)
+                self._cache_set(key, results)
+            return list(results or [])
+        finally:
+            self._leave_flight(key, future, results)
+
     @trace_tool(name="tavily_qna_search", tags=["web_search", "tavily", "qna"])
     def qna_search(self, query: str) -> Optional[str]:
         """
         Tavily Q&A 검색 (직접 답변 반환)
-        
+
         Args:
             query: 질문
-        
+
         Returns:
             str: AI 생성 답변 (없으면 None)
         """
-        if not self.client:
+        if not self.api_key:
             logger.error("Tavily client not initialized")
             return None
-        
+
+        logger.info("Executing Tavily Q&A search", extra={"query": query})
+
+        payload = self._payload(query, 5, "advanced", None, None, None)
+        data = self._post_sync(payload, self.timeout)
+        answer = (data or {}).get("answer")
+
+        logger.info(
+            "Tavily Q&A search completed",
+            extra={"query": query, "has_answer": bool(answer)}
+        )
+        return answer
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        클라이언트 통계 (모니터링용)
+
+        Returns:
+            Dict: requests/cache_hits/coalesced/errors/timeouts/cache_entries/breaker
+        """
+        with self._cache_lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["cache_entries"] = len(self._cache)
+        stats["breaker"] = self.breaker.get_stats()
+        return stats
+
+    def close(self) -> None:
+        """동기 연결 풀 종료"""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        """비동기/동기 연결 풀 종료 (현재 루프 + 닫힌 루프의 클라이언트)"""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+        for stale in self._pop_stale_async_clients():
+            await _aclose_quietly(stale)
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Request helpers
+    # ------------------------------------------------------------------
+
+    def _payload(
+        self,
+        query: str,
+        max_results: int,
+        search_depth: Optional[str],
+        include_domains: Optional[List[str]],
+        exclude_domains: Optional[List[str]],
+        days: Optional[int]
+    ) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "api_key": self.api_key,
+            "query": query.strip(),
+            "max_results": max_results,
+            "search_depth": search_depth or self.search_depth,
+            "include_answer": True,  # Get AI-generated answer
+            "include_raw_content": False,  # Don't include full HTML
+            "include_domains": sorted(include_domains or []),
+            "exclude_domains": sorted(exclude_domains or []),
+        }
+        if days is not None:
+            payload["days"] = days  # 최근 N일 이내 결과만
+        return payload
+
+    @staticmethod
+    def _search_key(payload: Dict[str, Any]) -> SearchKey:
+        return (
+            payload["query"],
+            payload["max_results"],
+            payload["search_depth"],
+            tuple(payload["include_domains"]),
+            tuple(payload["exclude_domains"]),
+            payload.get("days"),
+        )
+
+    def _log_request(self, payload: Dict[str, Any]) -> None:
+        with self._cache_lock:
+            self._stats["requests"] += 1
+        logger.info(
+            "Executing Tavily search",
+            extra={
+                "query": payload["query"],
+                "max_results": payload["max_results"],
+                "search_depth": payload["search_depth"],
+                "days_filter": payload.get("days")
+            }
+        )
+
+    def _record_error(self, payload: Dict[str, Any], e: Exception) -> None:
+        self.breaker.record_failure()
+        with self._cache_lock:
+            self._stats["errors"] += 1
+            self._stats["timeouts"] += int(isinstance(e, (httpx.TimeoutException, asyncio.TimeoutError)))
+        logger.error(
+            "Tavily search failed",
+            extra={"query": payload["query"], "error": str(e) or type(e).__name__}
+        )
+
+    def _breaker_rejects(self, payload: Dict[str, Any]) -> bool:
+        if self.breaker.allow():
+            return False
+        logger.warning(
+            "Tavily circuit open, skipping web search",
+            extra={"query": payload["query"]}
+        )
+        return True
+
+    def _post_sync(self, payload: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        /search 호출 (동기)
+
+        Returns:
+            Optional[Dict]: 응답 JSON (실패/차단 시 None)
+        """
+        if self._breaker_rejects(payload):
+            return None
+
+        self._log_request(payload)
         try:
-            logger.info("Executing Tavily Q&A search", extra={"query": query})
-            
-            response = self.client.qna_search(query=query)
-            
-            logger.info(
-                "Tavily Q&A search completed",
-                extra={"query": query, "has_answer": bool(response)}
-            )
-            
-            return response
-            
+            response = self._get_client().post("/search", json=payload, timeout=timeout)
+            response.raise_for_status()
+            data = response.json()
         except Exception as e:
-            logger.error(
-                "Tavily Q&A search failed",
-                extra={"query": query, "error": str(e)},
-                exc_info=True
+            self._record_error(payload, e)
+            return None
+
+        self.breaker.record_success()
+        return data
+
+    async def _post_async(self, payload: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        /search 호출 (비동기, timeout은 연결~본문 수신 전체 예산)
+
+        Returns:
+            Optional[Dict]: 응답 JSON (실패/차단 시 None)
+        """
+        if self._breaker_rejects(payload):
+            return None
+
+        self._log_request(payload)
+        try:
+            response = await asyncio.wait_for(
+                self._get_async_client().post("/search", json=payload, timeout=timeout),
+                timeout
             )
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            self._record_error(payload, e)
             return None
 
+        self.breaker.record_success()
+        return data
+
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout, limits=self._limits)
+        return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            # 루프가 바뀌었으면 이전(닫힌) 루프의 클라이언트를 현재 루프에서 닫도록 예약
+            for stale in self._pop_stale_async_clients():
+                task = loop.create_task(_aclose_quietly(stale))
+                self._closing_tasks.add(task)
+                task.add_done_callback(self._closing_tasks.discard)
+            client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout, limits=self._limits)
+            self._async_clients[loop] = client
+        return client
+
+    def _pop_stale_async_clients(self) -> List[httpx.AsyncClient]:
+        """닫힌 이벤트 루프에 묶인 AsyncClient 분리"""
+        stale = []
+        for loop in list(self._async_clients):
+            if loop.is_closed():
+                client = self._async_clients.pop(loop, None)
+                if client is not None:
+                    stale.append(client)
+        return stale
+
+    # ------------------------------------------------------------------
+    # Cache / single-flight
+    # ------------------------------------------------------------------
+
+    def _cache_get(self, key: SearchKey) -> Optional[List[Dict[str, Any]]]:
+        if self.cache_ttl <= 0:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._cache[key]
+                entry = None
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self._stats["cache_hits"] += 1
+        record_cache_lookup("tavily", hit=entry is not None)
+        return list(entry[1]) if entry is not None else None
+
+    def _cache_set(self, key: SearchKey, results: List[Dict[str, Any]]) -> None:
+        # 빈 결과는 일시적 문제일 수 있으므로 캐시하지 않음
+        if self.cache_ttl <= 0 or not results:
+            return
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, results)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
+
+    def _join_flight(self, key: SearchKey) -> Tuple[Future, bool]:
+        """
+        진행 중인 동일 검색에 합류
+
+        Returns:
+            Tuple[Future, bool]: (결과 Future, 직접 요청해야 하는지 여부)
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                with self._cache_lock:
+                    self._stats["coalesced"] += 1
+                return future, False
+            future = Future()
+            self._inflight[key] = future
+            return future, True
+
+    def _leave_flight(self, key: SearchKey, future: Future, results: Optional[List[Dict[str, Any]]]) -> None:
+        """
+        요청 완료 시 대기자에게 결과 전달
+
+        실패·취소(results=None)는 빈 결과로 공유하지 않고 FlightAborted로 알려
+        대기자가 직접 다시 요청하게 합니다.
+        """
+        with self._inflight_lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+        if future.done():
+            return
+        if results is None:
+            future.set_exception(FlightAborted(key[0] if key else ""))
+        else:
+            future.set_result(results)
+
+    def _parse_response(self, query: str, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Tavily 응답을 결과 리스트로 변환
+
+        Args:
+            query: 검색 쿼리 (로그용)
+            response: Tavily API 응답
+
+        Returns:
+            List[Dict]: 검색 결과 리스트
+        """
+        results = []
+        for item in response.get("results", []):
+            results.append({
+                "title": item.get("title", ""),
+                "url": item.get("url", ""),
+                "content": item.get("content", ""),
+                "score": item.get("score", 0.0),
+                "published_date": item.get("published_date")
+            })
+
+        # Add AI answer if available
+        ai_answer = response.get("answer")
+        if ai_answer:
+            logger.info(
+                "Tavily AI answer received",
+                extra={"answer_length": len(ai_answer)}
+            )
+
+        logger.info(
+            "Tavily search completed",
+            extra={
+                "query": query,
+                "results_count": len(results),
+                "has_ai_answer": bool(ai_answer)
+            }
+        )
+
+        return results
+
 
 # Singleton instance
 _tavily_client: Optional[TavilySearchClient] = None
+_tavily_lock = threading.Lock()
 
 
 def get_tavily_client() -> TavilySearchClient:
     """
     Get Tavily client singleton
-    
+
     Returns:
         TavilySearchClient: Tavily 클라이언트 인스턴스
     """
     global _tavily_client
-    
+
     if _tavily_client is None:
-        _tavily_client = TavilySearchClient()
-    
+        with _tavily_lock:
+            if _tavily_client is None:
+                _tavily_client = TavilySearchClient()
+
     return _tavily_client
 
+
+async def close_tavily_client() -> None:
+    """생성된 클라이언트가 있으면 연결 풀 종료 (애플리케이션 종료 시)"""
+    if _tavily_client is not None:
+        await _tavily_client.aclose()
@@ -0,0 +1,16 @@
+"""
+pytest 공통 설정
+
+src를 import 경로에 추가하고, 외부 서비스 없이 Settings가 로드되도록
+필수 환경 변수의 기본값을 채웁니다.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("QDRANT_URL", "http://localhost:6333")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
@@ -0,0 +1,120 @@
+"""
+In-process Redis fake
+
+RedisCacheBackend가 사용하는 redis-py 명령만 구현한 프로세스 내 가짜 클라이언트입니다.
+값은 bytes로 저장하고(decode_responses=False와 동일), 만료는 주입한 clock 기준으로 처리합니다.
+"""
+
+import fnmatch
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class FakeRedis:
+    """redis.Redis 호환 최소 구현 (GET/MGET/SET EX/DEL/EXPIRE/RPUSH/LRANGE/SCAN, 파이프라인)"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._lock = threading.Lock()
+        # key -> (value, expires_at | None), value는 bytes 또는 List[bytes]
+        self._data: Dict[str, Tuple[Any, Optional[float]]] = {}
+
+    def _live(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        entry = self._data.get(key)
+        if entry is not None and entry[1] is not None and self.clock() >= entry[1]:
+            del self._data[key]
+            return None
+        return entry
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode("utf-8")
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._live(key)
+        return entry[0] if entry else None
+
+    def mget(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+        with self._lock:
+            self._data[key] = (self._encode(value), self.clock() + ex if ex else None)
+        return True
+
+    def delete(self, *keys: str) -> int:
+        deleted = 0
+        with self._lock:
+            for key in keys:
+                if self._live(key) is not None:
+                    del self._data[key]
+                    deleted += 1
+        return deleted
+
+    def expire(self, key: str, seconds: int) -> bool:
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                return False
+            self._data[key] = (entry[0], self.clock() + seconds)
+            return True
+
+    def ttl(self, key: str) -> int:
+        with self._lock:
+            entry = self._live(key)
+        if entry is None:
+            return -2
+        if entry[1] is None:
+            return -1
+        return int(entry[1] - self.clock())
+
+    def rpush(self, key: str, *values: Any) -> int:
+        with self._lock:
+            entry = self._live(key)
+            items = list(entry[0]) if entry else []
+            items.extend(self._encode(value) for value in values)
+            self._data[key] = (items, entry[1] if entry else None)
+            return len(items)
+
+    def lrange(self, key: str, start: int, end: int) -> List[bytes]:
+        with self._lock:
+            entry = self._live(key)
+        if entry is None:
+            return []
+        items = entry[0]
+        return list(items[start:] if end == -1 else items[start:end + 1])
+
+    def scan_iter(self, match: str = "*", count: int = 10) -> Iterator[bytes]:
+        with self._lock:
+            keys = [key for key in list(self._data) if self._live(key) is not None]
+        for key in keys:
+            if fnmatch.fnmatchcase(key, match):
+                yield key.encode("utf-8")
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """명령을 모았다가 execute()에서 순서대로 실행"""
+
+    def __init__(self, client: FakeRedis):
+        self._client = client
+        self._commands: List[Tuple[str, tuple]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., "FakePipeline"]:
+        getattr(self._client, name)  # 없는 명령이면 AttributeError
+
+        def queue(*args: Any) -> "FakePipeline":
+            self._commands.append((name, args))
+            return self
+
+        return queue
+
+    def execute(self) -> List[Any]:
+        commands, self._commands = self._commands, []
+        return [getattr(self._client, name)(*args) for name, args in commands]
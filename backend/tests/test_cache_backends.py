@@ -0,0 +1,128 @@
+"""
+캐시 백엔드 테스트 (메모리 / Redis 프로토콜 - 프로세스 내 fake)
+"""
+
+import threading
+import types
+
+import pytest
+
+from app.cache import backends
+from app.cache.backends import InMemoryCacheBackend, RedisCacheBackend
+from app.cache.chat_cache import ChatCache
+
+from fake_redis import FakeRedis
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    # 메모리 백엔드만 가짜 시계를 보도록 모듈의 time 참조만 교체
+    monkeypatch.setattr(backends, "time", types.SimpleNamespace(monotonic=clock))
+    return clock
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request, clock):
+    if request.param == "memory":
+        return InMemoryCacheBackend()
+    return RedisCacheBackend(client=FakeRedis(clock=clock), namespace="test:")
+
+
+def test_get_set_roundtrip(backend):
+    value = {"policy_id": 1, "docs": [{"content": "청년 창업", "score": 1.0}]}
+    backend.set("ctx:a", value)
+
+    assert backend.get("ctx:a") == value
+    assert backend.get("ctx:missing") is None
+    assert backend.get_many(["ctx:a", "ctx:missing"]) == {"ctx:a": value}
+
+
+def test_ttl_expires_in_store(backend, clock):
+    backend.set("ctx:a", "v", ttl=10)
+    clock.advance(9)
+    assert backend.get("ctx:a") == "v"
+
+    clock.advance(1)
+    assert backend.get("ctx:a") is None
+    assert backend.scan_keys("ctx:") == []
+
+
+def test_expire_refreshes_ttl(backend, clock):
+    backend.set("ctx:a", "v", ttl=10)
+    clock.advance(5)
+    assert backend.expire("ctx:a", 10)
+
+    clock.advance(9)
+    assert backend.get("ctx:a") == "v"
+    assert not backend.expire("ctx:missing", 10)
+
+
+def test_list_append_extend(backend, clock):
+    backend.append("chat:s", {"role": "user", "content": "안녕"}, ttl=60)
+    backend.extend("chat:s", [{"role": "assistant", "content": "네"}], ttl=60)
+
+    assert backend.get_list("chat:s") == (
+        {"role": "user", "content": "안녕"},
+        {"role": "assistant", "content": "네"},
+    )
+    assert backend.get_list("chat:missing") == ()
+
+    clock.advance(60)
+    assert backend.get_list("chat:s") == ()
+
+
+def test_scan_and_delete_prefix(backend):
+    for key in ("chat:a", "chat:b", "policy:a"):
+        backend.set(key, key)
+
+    assert sorted(backend.scan_keys("chat:")) == ["chat:a", "chat:b"]
+    assert backend.delete_prefix("chat:") == 2
+    assert backend.scan_keys("chat:") == []
+    assert backend.delete("policy:a")
+    assert not backend.delete("policy:a")
+
+
+def test_concurrent_appends_are_not_lost(backend):
+    threads = [
+        threading.Thread(target=lambda n=n: [backend.append(f"chat:{n % 2}", i) for i in range(200)])
+        for n in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(backend.get_list("chat:0")) == 800
+    assert len(backend.get_list("chat:1")) == 800
+
+
+def test_redis_backend_namespaces_keys(clock):
+    client = FakeRedis(clock=clock)
+    backend = RedisCacheBackend(client=client, namespace="app:")
+    backend.set("chat_warmed:s", True, ttl=30)
+
+    assert client.ttl("app:chat_warmed:s") == 30
+    assert backend.scan_keys("chat_warmed:") == ["chat_warmed:s"]
+
+
+def test_chat_cache_shares_redis_store_across_instances(clock):
+    client = FakeRedis(clock=clock)
+    worker_a = ChatCache(backend=RedisCacheBackend(client=client), persist=False)
+    worker_b = ChatCache(backend=RedisCacheBackend(client=client), persist=False)
+
+    worker_a.add_message("s1", "user", "지원 대상이 누구인가요?")
+
+    history = worker_b.get_chat_history("s1")
+    assert [(m["role"], m["content"]) for m in history] == [("user", "지원 대상이 누구인가요?")]
@@ -0,0 +1,60 @@
+"""
+일괄 자격 판정 테스트
+"""
+
+import pytest
+
+from app.agent import eligibility_batch
+from app.agent.eligibility_batch import normalize_profile, screen_policies
+
+CONDITIONS = {
+    1: [
+        {"type": "Financial Status", "name": "매출", "value": "연 매출 10억원 이하", "description": ""},
+        {"type": "Compliance & Tax", "name": "체납", "value": "국세·지방세 체납 사실이 없는 자", "description": ""},
+    ],
+    2: [
+        {"type": "Financial Status", "name": "매출", "value": "연 매출 5천만원 이하", "description": ""},
+    ],
+    3: [
+        {"type": "Compliance & Tax", "name": "4대보험", "value": "4대보험 가입 사업장", "description": ""},
+    ],
+    4: [
+        {"type": "Business Type", "name": "업종", "value": "제조업", "description": "제조업"},
+    ],
+}
+
+
+class FakeConditionStore:
+    def get_many(self, policies):
+        return {
+            pid: {"conditions": CONDITIONS[pid], "extra_requirements": None}
+            for pid, _ in policies if pid in CONDITIONS
+        }
+
+
+@pytest.fixture(autouse=True)
+def condition_store(monkeypatch):
+    monkeypatch.setattr(eligibility_batch, "get_condition_store", FakeConditionStore)
+
+
+def screen(profile):
+    results = screen_policies(profile, [(pid, f"정책 {pid}", "신청 대상") for pid in CONDITIONS])
+    return {result.policy_id: result for result in results}
+
+
+def test_round_won_revenue_is_not_zero():
+    assert normalize_profile({"financial_status": "100000000원"})["financial_status"] == 100_000_000
+
+    results = screen({"financial_status": "100000000원", "compliance_tax": "아니오"})
+    assert results[1].status == "PASS"
+    assert results[2].status == "FAIL"
+
+
+def test_condition_specific_yes_no_needs_review():
+    results = screen({"compliance_tax": "예", "business_type": "예"})
+
+    assert results[1].status == "FAIL"  # 체납 있음
+    for pid in (3, 4):
+        assert results[pid].status == "UNKNOWN"
+        assert results[pid].needs_review
+        assert results[pid].missing_slots == []
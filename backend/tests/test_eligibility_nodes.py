@@ -0,0 +1,61 @@
+"""
+자격 확인 노드 테스트 (답변 슬롯 키, 규칙/LLM 판정 경로)
+"""
+
+import pytest
+
+from app.agent.nodes import eligibility_nodes
+from app.agent.nodes.eligibility_nodes import (
+    _judge_with_slot,
+    check_existing_slots_node,
+    condition_answer_key,
+    process_answer_node,
+)
+
+SOFTWARE = {"type": "Business Type", "name": "업종", "value": "소프트웨어", "description": "소프트웨어 개발업"}
+MANUFACTURING = {"type": "Business Type", "name": "업종", "value": "제조업", "description": "제조업"}
+AGE = {"type": "Age", "name": "연령", "value": "39세 이하", "description": "만 39세 이하"}
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+
+    def fake_judge(condition, user_answer):
+        calls.append((condition.get("value"), user_answer))
+        return "UNKNOWN", "LLM 판정"
+
+    monkeypatch.setattr(eligibility_nodes, "_judge_with_llm", fake_judge)
+    return calls
+
+
+def test_slot_question_answers_are_shared():
+    assert condition_answer_key(AGE) == "age"
+    assert condition_answer_key({**AGE, "value": "34세 이하", "description": ""}) == "age"
+
+
+def test_yes_no_answer_is_keyed_per_condition(llm_calls):
+    state = {
+        "conditions": [dict(SOFTWARE), dict(MANUFACTURING)],
+        "current_condition_index": 0,
+        "user_answer": "예",
+        "user_slots": {},
+    }
+    state = process_answer_node(state)
+
+    assert state["conditions"][0]["status"] == "PASS"
+    assert condition_answer_key(SOFTWARE) in state["user_slots"]
+    assert "business_type" not in state["user_slots"]
+
+    state = check_existing_slots_node(state)
+    assert state["conditions"][1]["status"] == "UNKNOWN"
+    assert llm_calls == []
+
+
+def test_yes_no_rule_needs_template_question(llm_calls):
+    long_description = "최근 3년 이내 중앙부처 또는 지자체 창업지원사업에 선정되어 협약을 체결한 이력이 없는 자"
+    condition = {"type": "Experience", "name": "수혜 이력", "value": "", "description": long_description}
+    user_slots = {condition_answer_key(condition): "예"}
+
+    assert _judge_with_slot(condition, user_slots) == ("UNKNOWN", "LLM 판정")
+    assert llm_calls == [("", "예")]
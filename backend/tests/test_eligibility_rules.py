@@ -0,0 +1,89 @@
+"""
+자격 조건 규칙 엔진 테스트
+"""
+
+import pytest
+
+from app.agent.eligibility_rules import (
+    RangeRule,
+    RegionRule,
+    YesNoRule,
+    compile_condition,
+    judge_with_rules,
+    normalize_money,
+    parse_korean_amount,
+)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("3억 5천만원", 350_000_000),
+    ("3억5천만원", 350_000_000),
+    ("1억2천", 120_000_000),
+    ("1억 2천만원", 120_000_000),
+    ("1,200만원", 12_000_000),
+    ("2.5억", 250_000_000),
+    ("연 매출 약 3억원", 300_000_000),
+    ("5천만원 정도", 50_000_000),
+    ("100000000원", 100_000_000),
+    ("5,000,000원", 5_000_000),
+    ("30원", 30),
+    ("매출 없음", 0),
+    ("매출은 없어요", 0),
+    ("아직 매출 없습니다", 0),
+    ("0원", 0),
+    ("매출 0원", 0),
+])
+def test_normalize_money(text, expected):
+    assert normalize_money(text) == expected
+
+
+@pytest.mark.parametrize("text", ["5000", "잘 모르겠어요", ""])
+def test_normalize_money_ambiguous(text):
+    assert normalize_money(text) is None
+
+
+def test_parse_korean_amount_elided_unit():
+    assert parse_korean_amount("1조 5천") == 1_500_000_000_000
+    assert parse_korean_amount("1억 2천5백") == 125_000_000
+
+
+@pytest.mark.parametrize("ctype, value", [
+    ("Location", "부산 소재 센터 입주기업"),
+    ("Age", "만 39세 이하 (군 복무기간 최대 6년 가산)"),
+    ("Financial Status", "투자 유치액 1억 이상"),
+    ("Employment Status", "타 직장 미재직/겸직 금지"),
+    ("Location", "서울 강남구"),
+])
+def test_compile_defers_qualified_conditions(ctype, value):
+    assert compile_condition({"type": ctype, "value": value, "description": value}) is None
+
+
+def test_compile_defers_when_description_has_unsafe_marker():
+    condition = {"type": "Financial Status", "value": "1억 이상", "description": "투자 유치액 1억 이상"}
+    assert compile_condition(condition) is None
+    assert judge_with_rules(condition, "3억원") is None
+
+
+@pytest.mark.parametrize("ctype, value, expected", [
+    ("Age", "만 39세 이하 청년", RangeRule(slot="age", high=39.0, label="만 39세 이하 청년")),
+    ("Employment Status", "상시근로자 5인 이상", RangeRule(slot="employment_status", low=5.0, label="상시근로자 5인 이상")),
+    ("Business Age", "업력 7년 이내", RangeRule(slot="business_age", low=0.0, high=7.0, label="업력 7년 이내")),
+    ("Location", "서울특별시 소재 기업", RegionRule(slot="location", regions=frozenset({"서울"}), label="서울특별시 소재 기업")),
+])
+def test_compile_plain_conditions(ctype, value, expected):
+    assert compile_condition({"type": ctype, "value": value, "description": ""}) == expected
+
+
+@pytest.mark.parametrize("value", ["국세·지방세 체납 사실이 없는 자", "금융기관 연체 없음"])
+def test_compliance_arrears_condition_passes_on_no(value):
+    condition = {"type": "Compliance & Tax", "value": value, "description": ""}
+    assert compile_condition(condition) == YesNoRule(slot="compliance_tax", pass_on_yes=False, label=value)
+    assert judge_with_rules(condition, "아니요")[0] == "PASS"
+    assert judge_with_rules(condition, "네")[0] == "FAIL"
+
+
+@pytest.mark.parametrize("value", ["4대보험 가입 사업장", "국세 완납자"])
+def test_compliance_positive_requirement_is_not_inverted(value):
+    condition = {"type": "Compliance & Tax", "value": value, "description": ""}
+    assert compile_condition(condition) is None
+    assert judge_with_rules(condition, "예") is None
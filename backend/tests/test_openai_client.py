@@ -0,0 +1,27 @@
+"""
+OpenAI 클라이언트 비동기 연결 풀 테스트
+"""
+
+import asyncio
+
+from app.llm.openai_client import OpenAIClient
+
+
+def test_async_client_from_closed_loop_is_closed():
+    client = OpenAIClient(api_key="test-key")
+
+    async def get_client():
+        return client._get_async_client()
+
+    first = asyncio.run(get_client())
+
+    async def switch_loop():
+        second = client._get_async_client()
+        await asyncio.gather(*client._closing_tasks)
+        await client.aclose()
+        return second
+
+    second = asyncio.run(switch_loop())
+    assert second is not first
+    assert first.is_closed and second.is_closed
+    assert client._async_clients == {}
@@ -0,0 +1,43 @@
+"""
+자격 확인 질문 뱅크 테스트
+"""
+
+import pytest
+
+from app.agent.question_bank import TYPE_QUESTION_TEMPLATES, attach_questions, template_question
+
+
+@pytest.mark.parametrize("ctype, value", [
+    ("Financial Status", "연 매출 10억원 이하"),
+    ("Employment Status", "상시근로자 5인 이상"),
+    ("Age", "만 39세 이하"),
+    ("Compliance & Tax", "국세·지방세 체납 사실이 없는 자"),
+])
+def test_slot_template_for_rule_backed_condition(ctype, value):
+    assert template_question({"type": ctype, "value": value}) == TYPE_QUESTION_TEMPLATES[ctype]
+
+
+@pytest.mark.parametrize("ctype, value", [
+    ("Financial Status", "투자 유치액 1억 이상"),
+    ("Employment Status", "타 직장 미재직/겸직 금지"),
+    ("Location", "부산 소재 센터 입주기업"),
+    ("Compliance & Tax", "4대보험 가입 사업장"),
+    ("Compliance & Tax", "국세 완납 증명서 제출 가능자"),
+])
+def test_no_slot_template_for_other_information(ctype, value):
+    assert template_question({"type": ctype, "value": value}) is None
+
+
+def test_attach_questions_skips_template_conditions(monkeypatch):
+    monkeypatch.setattr(
+        "app.agent.question_bank.generate_question_with_llm",
+        lambda condition, policy_name="": f"LLM:{condition['value']}"
+    )
+    conditions = [
+        {"type": "Age", "value": "만 39세 이하"},
+        {"type": "Financial Status", "value": "투자 유치액 1억 이상"},
+    ]
+
+    assert attach_questions(conditions, policy_name="테스트") == 1
+    assert "question" not in conditions[0]
+    assert conditions[1]["question"] == "LLM:투자 유치액 1억 이상"
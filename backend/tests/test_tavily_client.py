@@ -0,0 +1,107 @@
+"""
+Tavily 클라이언트 single-flight / 비동기 연결 풀 테스트 (네트워크 없이 _post_async 대체)
+"""
+
+import asyncio
+
+import pytest
+
+from app.web_search.clients.tavily_client import TavilySearchClient
+
+RESPONSE = {"results": [{"title": "공고", "url": "https://example.com", "content": "내용", "score": 0.9}]}
+
+
+@pytest.fixture
+def client():
+    client = TavilySearchClient(api_key="test-key")
+    client.cache_ttl = 0
+    return client
+
+
+def run_coalesced(client, leader_behaviour):
+    """첫 호출(대표)은 leader_behaviour, 이후 호출은 정상 응답"""
+    calls = []
+    leader_started = asyncio.Event()
+
+    async def fake_post(payload, timeout):
+        calls.append(payload["query"])
+        if len(calls) == 1:
+            leader_started.set()
+            return await leader_behaviour()
+        return RESPONSE
+
+    client._post_async = fake_post
+
+    async def scenario():
+        leader = asyncio.create_task(client.asearch("청년 창업 지원"))
+        await leader_started.wait()
+        waiter = asyncio.create_task(client.asearch("청년 창업 지원"))
+        await asyncio.sleep(0)
+        return leader, waiter
+
+    return calls, scenario
+
+
+def test_waiter_retries_when_leader_is_cancelled(client):
+    async def hang():
+        await asyncio.sleep(60)
+
+    calls, scenario = run_coalesced(client, hang)
+
+    async def main():
+        leader, waiter = await scenario()
+        leader.cancel()
+        return await waiter
+
+    results = asyncio.run(main())
+    assert [r["title"] for r in results] == ["공고"]
+    assert len(calls) == 2
+
+
+def test_waiter_retries_when_leader_fails(client):
+    async def fail():
+        await asyncio.sleep(0.01)
+        return None
+
+    calls, scenario = run_coalesced(client, fail)
+
+    async def main():
+        leader, waiter = await scenario()
+        return await leader, await waiter
+
+    leader_results, waiter_results = asyncio.run(main())
+    assert leader_results == []
+    assert [r["title"] for r in waiter_results] == ["공고"]
+    assert len(calls) == 2
+
+
+def test_empty_result_is_shared_without_retry(client):
+    async def empty():
+        await asyncio.sleep(0.01)
+        return {"results": []}
+
+    calls, scenario = run_coalesced(client, empty)
+
+    async def main():
+        leader, waiter = await scenario()
+        return await leader, await waiter
+
+    assert asyncio.run(main()) == ([], [])
+    assert len(calls) == 1
+
+
+def test_async_client_from_closed_loop_is_closed(client):
+    async def get_client():
+        return client._get_async_client()
+
+    first = asyncio.run(get_client())
+
+    async def switch_loop():
+        second = client._get_async_client()
+        await asyncio.gather(*client._closing_tasks)
+        return second
+
+    second = asyncio.run(switch_loop())
+    assert second is not first
+    assert first.is_closed
+    assert list(client._async_clients.values()) == [second]
@@ -0,0 +1,48 @@
+"""
+Write-behind 저장기 수명 주기 테스트 (DB 없이 _flush 대체)
+"""
+
+import threading
+
+from app.db.write_behind import WriteBehindWriter
+
+
+class RecordingWriter(WriteBehindWriter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.flushed = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def _flush(self, batch):
+        self.release.wait()
+        self.flushed.extend(item for _, item in batch)
+
+
+def test_stop_flushes_and_rejects_later_items():
+    writer = RecordingWriter(flush_interval=60)
+    assert writer.enqueue_slot("s1", "age", "만 29세")
+    writer.stop()
+
+    assert [item["slot_value"] for item in writer.flushed] == ["만 29세"]
+    assert not writer.enqueue_slot("s1", "location", "서울")
+    assert writer._thread is None
+    assert writer.get_stats()["dropped"] == 1
+
+
+def test_stop_timeout_keeps_flushing_thread():
+    writer = RecordingWriter(batch_size=1, flush_interval=60)
+    writer.release.clear()
+    writer.enqueue_slot("s1", "age", "만 29세")
+
+    writer.stop(timeout=0.05)
+    old_thread = writer._thread
+    assert old_thread is not None and old_thread.is_alive()
+
+    # 재시작해도 flush 중인 스레드 옆에 두 번째 writer를 띄우지 않음
+    writer.start()
+    assert writer._thread is old_thread
+
+    writer.release.set()
+    old_thread.join(timeout=5)
+    assert [item["slot_value"] for item in writer.flushed] == ["만 29세"]
@@ -153,6 +153,24 @@ CREATE TABLE IF NOT EXISTS chat_history (
     INDEX idx_created_at (created_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='채팅 이력';
 
+-- ============================================================
+-- Table 8: policy_conditions (사전 파싱된 자격 조건)
+-- ============================================================
+CREATE TABLE IF NOT EXISTS policy_conditions (
+    id INT AUTO_INCREMENT PRIMARY KEY COMMENT '조건 세트 고유 ID',
+    policy_id INT NOT NULL COMMENT '정책 ID',
+    content_hash VARCHAR(64) NOT NULL COMMENT 'apply_target 원문 해시 (SHA-256)',
+    prompt_version VARCHAR(32) NOT NULL COMMENT '파싱 프롬프트 버전',
+    conditions JSON NOT NULL COMMENT '조건 리스트 (14대 표준 스키마)',
+    extra_requirements TEXT COMMENT '정량화되지 않은 추가 요구사항',
+    model VARCHAR(100) COMMENT '파싱에 사용한 LLM 모델',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '생성일',
+    
+    FOREIGN KEY (policy_id) REFERENCES policies(id) ON DELETE CASCADE,
+    INDEX idx_policy_id (policy_id),
+    UNIQUE KEY unique_policy_condition_version (policy_id, content_hash, prompt_version)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='사전 파싱된 자격 조건';
+
 -- ============================================================
 -- Sample data (for testing - optional)
 -- ============================================================